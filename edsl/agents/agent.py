@@ -350,6 +350,7 @@ class Agent(Base):
         """Set the traits presentation template and mark it as explicitly set."""
         self._traits_presentation_template = value
         self.set_traits_presentation_template = True
+        self._invalidate_hash()
 
     @property
     def invigilator(self):
@@ -1162,6 +1163,7 @@ class Agent(Base):
             self.traits_manager.remove_function()
         else:
             self.traits_manager.initialize_dynamic_function(function)
+        self._invalidate_hash()
 
     @property
     def dynamic_traits_function_name(self) -> str:
@@ -1339,21 +1341,27 @@ class Agent(Base):
 
         return AgentSerialization.data(self)
 
-    def __hash__(self) -> int:
+    def _compute_hash(self) -> int:
         """Return a hash of the agent.
 
+        The hash is cached by ``Base.__hash__`` and invalidated when traits,
+        name, codebook or instructions change.
+
         Returns:
             A hash value for the agent
 
         Example:
             >>> hash(Agent.example())
             2067581884874391607
+            >>> a = Agent.example()
+            >>> a.traits["age"] = 11
+            >>> hash(a) == 2067581884874391607
+            False
         """
-        # Cache the hash to avoid expensive to_dict() calls on every hash lookup
-        # This is safe because agents should be immutable after creation
-        if not hasattr(self, "_cached_hash"):
-            self._cached_hash = dict_hash(self.to_dict(add_edsl_version=False))
-        return self._cached_hash
+        return dict_hash(self.to_dict(add_edsl_version=False))
+
+    # Defining __eq__ in this class would otherwise reset __hash__ to None
+    __hash__ = Base.__hash__
 
     def to_dict(
         self, add_edsl_version: bool = True, full_dict: bool = False
@@ -46,40 +46,46 @@ class AgentListJoiner:
             [agent.name is not None for agent in other.data]
         ), "Other agents must have names to join."
 
-        inner_list = []
-        left_list = []
-        right_list = []
-
-        for agent in self._agent_list.data:
-            for other_agent in other.data:
-                if agent.name == other_agent.name:
-                    new_agent = agent + other_agent
-                    inner_list.append(new_agent)
-                    left_list.append(agent)
-                    right_list.append(other_agent)
-                else:
-                    right_list.append(other_agent)
-                    left_list.append(agent)
-
-        if len(inner_list) != len(right_list) and len(inner_list) != len(left_list):
-            warnings.warn(
-                f"The number of agents in the left list is {len(left_list)} and the number of agents in the right list is {len(right_list)}."
-            )
-            warnings.warn(
-                f"The number of agents in the inner list is {len(inner_list)}."
-            )
-            warnings.warn(
-                f"The number of agents in the left list is {len(left_list)} and the number of agents in the right list is {len(right_list)}."
-            )
+        if join_type not in ("inner", "left", "right"):
+            raise ValueError(f"Invalid join type: {join_type}")
 
-        if join_type == "inner":
-            return AgentList(inner_list)
-        elif join_type == "left":
-            return AgentList(left_list)
-        elif join_type == "right":
-            return AgentList(right_list)
+        # Hash join: index one side by name once and probe it with each agent
+        # of the other side. The probe side (the left list, or the right list
+        # for a right join) keeps its order in the result.
+        if join_type == "right":
+            probe, build = other.data, self._agent_list.data
         else:
-            raise ValueError(f"Invalid join type: {join_type}")
+            probe, build = self._agent_list.data, other.data
+        index: dict = {}
+        for agent in build:
+            index.setdefault(agent.name, []).append(agent)
+
+        joined = []
+        n_unmatched = 0
+        for agent in probe:
+            matches = index.get(agent.name)
+            if matches is None:
+                n_unmatched += 1
+                if join_type != "inner":
+                    joined.append(agent)
+            elif join_type == "right":
+                joined.extend(match + agent for match in matches)
+            else:
+                joined.extend(agent + match for match in matches)
+
+        if join_type == "inner":
+            probe_names = {agent.name for agent in probe}
+            n_unmatched_other = sum(
+                1 for agent in build if agent.name not in probe_names
+            )
+            if n_unmatched or n_unmatched_other:
+                warnings.warn(
+                    f"{n_unmatched} agent(s) in the left list and "
+                    f"{n_unmatched_other} agent(s) in the right list have no "
+                    f"match and were dropped from the inner join."
+                )
+
+        return AgentList(joined)
 
     def join(self, other: "AgentList", join_type: str = "inner") -> "AgentList":
         """Join this AgentList with another AgentList.
@@ -98,6 +104,12 @@ class AgentListJoiner:
             >>> joined = al1.join(al2)
             >>> joined[0].traits
             {'age': 30, 'height': 180}
+
+            A left join keeps agents without a match:
+
+            >>> al3 = AgentList([Agent(name="Jane", traits={"age": 25})])
+            >>> [a.traits for a in (al1 + al3).join(al2, join_type="left")]
+            [{'age': 30, 'height': 180}, {'age': 25}]
         """
         return self._join(other, join_type=join_type)
 
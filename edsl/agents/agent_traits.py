@@ -106,6 +106,7 @@ class AgentTraits(MutableMapping):
         """
         self._guard()
         self._store[key] = value
+        self._parent._invalidate_hash()
 
     def __delitem__(self, key: str) -> None:
         """Delete a trait by key.
@@ -125,6 +126,7 @@ class AgentTraits(MutableMapping):
         """
         self._guard()
         del self._store[key]
+        self._parent._invalidate_hash()
 
     def __iter__(self):
         """Iterate over trait keys.
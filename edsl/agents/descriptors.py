@@ -25,6 +25,7 @@ class NameDescriptor:
     def __set__(self, instance, name: Optional[Union[str, int]]) -> None:
         """Set the value of the attribute."""
         instance.__dict__[self.name] = convert_agent_name(name)
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
@@ -57,6 +58,7 @@ class TraitsDescriptor:
                 )
 
         instance.__dict__[self.name] = traits_dict
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
@@ -132,6 +134,7 @@ class CodebookDescriptor:
             codebook_dict: Dictionary mapping trait keys to descriptions
         """
         instance.__dict__[self.name] = Codebook(codebook_dict)
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute in the instance's dictionary.
@@ -154,6 +157,7 @@ class InstructionDescriptor:
         """Set the value of the attribute."""
         instance.__dict__[self.name] = instruction
         instance.set_instructions = instruction != instance.default_instruction
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
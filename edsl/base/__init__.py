@@ -27,6 +27,7 @@ from edsl.base.exceptions import (
     BaseKeyError,
     BaseFileError,
     BaseTypeError,
+    BaseStaleHashError,
 )
 
 from edsl.base.enums import (
@@ -72,6 +73,7 @@ __all__ = [
     "BaseKeyError",
     "BaseFileError",
     "BaseTypeError",
+    "BaseStaleHashError",
     # Enums
     "EnumWithChecks",
     "InferenceServiceLiteral",
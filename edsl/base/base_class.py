@@ -872,7 +872,9 @@ class RegisterSubclassesMeta(ABCMeta):
     This metaclass maintains a registry of all classes that inherit from Base,
     allowing for dynamic discovery of available classes and capabilities like
     automatic deserialization. When a new class is defined with Base as its
-    parent, this metaclass automatically adds it to the registry.
+    parent, this metaclass automatically adds it to the registry, unless its
+    own body sets ``_register_subclass = False`` (for internal variants of a
+    registered class that serialize as that class).
     """
 
     _registry = {}
@@ -886,7 +888,7 @@ class RegisterSubclassesMeta(ABCMeta):
             nmspc: The namespace of the class being created
         """
         super(RegisterSubclassesMeta, cls).__init__(name, bases, nmspc)
-        if cls.__name__ != "Base":
+        if cls.__name__ != "Base" and nmspc.get("_register_subclass", True):
             RegisterSubclassesMeta._registry[cls.__name__] = cls
 
     @staticmethod
@@ -1122,9 +1124,33 @@ class HashingMixin:
     This mixin implements __hash__ and __eq__ methods to enable using EDSL objects
     in sets and as dictionary keys. The hash is based on the object's serialized content,
     so two objects with identical content will be considered equal.
+
+    The content hash is computed once and cached on the object. Classes that hold
+    mutable data call ``_invalidate_hash()`` from their mutation hooks so the next
+    ``hash()`` recomputes it. Setting ``EDSL_VERIFY_CACHED_HASHES=True`` (or
+    ``HashingMixin.verify_cached_hashes = True``) recomputes the hash on every
+    cache hit and raises ``BaseStaleHashError`` if a mutation was missed.
     """
 
+    verify_cached_hashes: bool = (
+        os.environ.get("EDSL_VERIFY_CACHED_HASHES", "").lower() == "true"
+    )
+
     def __hash__(self) -> int:
+        """Return the cached content hash, computing it on first use.
+
+        Returns:
+            int: A hash value for the object
+        """
+        cached = self.__dict__.get("_cached_hash")
+        if cached is None:
+            cached = self._compute_hash()
+            self.__dict__["_cached_hash"] = cached
+        elif HashingMixin.verify_cached_hashes:
+            self._verify_cached_hash(cached)
+        return cached
+
+    def _compute_hash(self) -> int:
         """Generate a hash value for this object based on its content.
 
         The hash is computed from the serialized dictionary representation of the object,
@@ -1141,6 +1167,21 @@ class HashingMixin:
 
         return dict_hash(d)
 
+    def _invalidate_hash(self) -> None:
+        """Drop the cached content hash after the object's data has changed."""
+        self.__dict__.pop("_cached_hash", None)
+
+    def _verify_cached_hash(self, cached: int) -> None:
+        """Raise if the cached hash no longer matches the object's content."""
+        from .exceptions import BaseStaleHashError
+
+        current = self._compute_hash()
+        if current != cached:
+            raise BaseStaleHashError(
+                f"{self.__class__.__name__} was mutated without invalidating its "
+                f"cached hash (cached {cached}, recomputed {current})."
+            )
+
     def get_hash(self) -> str:
         """Get a string hash representation of this object based on its content.
 
@@ -85,6 +85,25 @@ class BaseFileError(BaseException):
         super().__init__(message, **kwargs)
 
 
+class BaseStaleHashError(BaseException):
+    """
+    Exception raised when a cached content hash no longer matches the object.
+
+    This exception is only raised when cached hash verification is enabled
+    (``EDSL_VERIFY_CACHED_HASHES=True``). It means the object was mutated through
+    a path that does not invalidate its cached hash.
+
+    Examples:
+        - Mutating a nested value in place, e.g. ``scenario["items"].append(1)``
+        - Setting a private attribute directly instead of through its descriptor
+    """
+
+    relevant_doc = "https://docs.expectedparrot.com/en/latest/base"
+
+    def __init__(self, message="Cached hash is stale", **kwargs):
+        super().__init__(message, **kwargs)
+
+
 class MissingOptionalDependencyError(BaseException):
     """
     A required optional dependency is not installed.
@@ -7,12 +7,12 @@ API rate limits are respected while allowing models from the same service to
 share the same rate limit buckets.
 """
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List
 from collections import UserDict
 from threading import RLock
 
 # Import the synchronized_class decorator directly
-from ..jobs.decorators import synchronized_class
+from ..jobs.decorators import lock_free, synchronized_class
 
 from .token_bucket import TokenBucket
 from .model_buckets import ModelBuckets
@@ -252,6 +252,30 @@ class BucketCollection(UserDict):
                         )
                     self.services_to_buckets[service].tokens_bucket = new_tokens_bucket
 
+    @lock_free
+    def metrics(self) -> Dict[str, Dict[str, dict]]:
+        """
+        Return a snapshot of every service's bucket metrics.
+
+        Like TokenBucket.metrics, this takes no lock, so it can be polled
+        while a job is running.
+
+        Returns:
+            A dict mapping each service name to ModelBuckets.metrics()
+
+        Example:
+            >>> from edsl import Model
+            >>> collection = BucketCollection()
+            >>> collection.add_model(Model('test'))
+            >>> m = collection.metrics()
+            >>> list(m), sorted(m['test'])
+            (['test'], ['requests', 'tokens'])
+        """
+        return {
+            service: buckets.metrics()
+            for service, buckets in list(self.services_to_buckets.items())
+        }
+
 
 
 # Examples and doctests
@@ -6,7 +6,7 @@ and tokens-per-minute rate limits for language model API services. Each ModelBuc
 instance contains two TokenBucket instances - one for requests and one for tokens.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 if TYPE_CHECKING:
     from .token_bucket import TokenBucket
@@ -147,6 +147,23 @@ class ModelBuckets:
             ),
         )
 
+    def metrics(self) -> Dict[str, dict]:
+        """
+        Return the metrics of both buckets.
+
+        Returns:
+            A dict with the requests and tokens buckets' TokenBucket.metrics()
+
+        Example:
+            >>> buckets = ModelBuckets.infinity_bucket()
+            >>> sorted(buckets.metrics())
+            ['requests', 'tokens']
+        """
+        return {
+            "requests": self.requests_bucket.metrics(),
+            "tokens": self.tokens_bucket.metrics(),
+        }
+
     def __repr__(self) -> str:
         """
         Generate a string representation of the ModelBuckets instance.
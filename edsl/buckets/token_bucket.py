@@ -1,9 +1,10 @@
-from typing import Union, List, Any, Optional
+from typing import Union, Any, Optional
+from collections import deque
 import asyncio
 import time
 from threading import RLock
 
-from ..jobs.decorators import synchronized_class
+from ..jobs.decorators import lock_free, synchronized_class
 from .exceptions import TokenLimitError
 
 
@@ -18,8 +19,8 @@ class TokenBucket:
     Features:
     - Thread-safe implementation
     - Configurable capacity and refill rates
-    - Ability to track usage patterns
-    - Visualization of token usage over time
+    - Ability to track usage patterns, with a bounded log of token levels
+    - A ``metrics()`` snapshot that is read without taking the bucket's lock
     - Turbo mode for temporarily bypassing rate limits
 
     Typical use cases:
@@ -48,6 +49,7 @@ class TokenBucket:
         bucket_type: str,
         capacity: Union[int, float],
         refill_rate: Union[int, float],
+        log_size: Optional[int] = 1000,
     ):
         """Initialize a new token bucket instance.
 
@@ -58,11 +60,13 @@ class TokenBucket:
             bucket_type: Type of the bucket (e.g., 'api', 'database', etc.)
             capacity: Maximum number of tokens the bucket can hold
             refill_rate: Rate at which tokens are refilled (tokens per second)
+            log_size: Number of most recent token levels kept in the log
+                      (None keeps all of them)
 
         Note:
             - The bucket starts full (tokens = capacity)
             - The target_rate is calculated in tokens per minute
-            - A log of token levels over time is maintained for visualization
+            - A log of recent token levels is maintained for visualization
 
         Example:
             >>> bucket = TokenBucket(bucket_name="test-init", bucket_type="api", capacity=50, refill_rate=5)
@@ -86,7 +90,7 @@ class TokenBucket:
         self.refill_rate = refill_rate  # Rate at which tokens are refilled
         self._old_refill_rate = refill_rate
         self.last_refill = time.monotonic()  # Last refill time
-        self.log: List[Any] = []
+        self.log: deque = deque(maxlen=log_size)
         self.turbo_mode = False
 
         self.creation_time = time.monotonic()
@@ -94,6 +98,8 @@ class TokenBucket:
         self.num_requests = 0
         self.num_released = 0
         self.tokens_returned = 0
+        self.num_waits = 0  # get_tokens calls that had to wait
+        self.wait_seconds = 0.0  # time those calls spent waiting
 
     def turbo_mode_on(self) -> None:
         """Enable turbo mode to bypass rate limiting.
@@ -326,6 +332,7 @@ class TokenBucket:
                 self._old_capacity = self.capacity
 
         # Loop until we have enough tokens
+        waited = 0.0
         while True:
             self.refill()  # Refill based on elapsed time
             if self.tokens >= amount:
@@ -334,18 +341,24 @@ class TokenBucket:
 
             wait_time = self.wait_time(amount)
             if wait_time > 0:
+                waited += wait_time
                 await asyncio.sleep(wait_time)
 
+        if waited:
+            self.num_waits += 1
+            self.wait_seconds += waited
         self.num_released += amount
         now = time.monotonic()
         self.log.append((now, self.tokens))
         return None
 
+    @lock_free
     def get_log(self) -> list[tuple]:
         """Return the token level log for analysis or visualization.
 
         Returns:
-            A list of (timestamp, token_level) tuples representing the token history
+            A list of (timestamp, token_level) tuples representing the most
+            recent token history (at most ``log_size`` entries)
 
         Example:
             >>> bucket = TokenBucket(bucket_name="test", bucket_type="test", capacity=10, refill_rate=1)
@@ -356,9 +369,15 @@ class TokenBucket:
             True
             >>> isinstance(log[0], tuple) and len(log[0]) == 2  # Each entry should be a (timestamp, tokens) tuple
             True
+            >>> small = TokenBucket(bucket_name="test", bucket_type="test", capacity=10, refill_rate=1, log_size=3)
+            >>> for _ in range(5):
+            ...     asyncio.run(small.get_tokens(1))
+            >>> len(small.get_log())
+            3
         """
-        return self.log
+        return list(self.log)
 
+    @lock_free
     def get_throughput(self, time_window: Optional[float] = None) -> float:
         """Calculate the empirical bucket throughput in tokens per minute.
 
@@ -405,6 +424,46 @@ class TokenBucket:
 
         return (self.num_released / elapsed_time) * 60
 
+    @lock_free
+    def metrics(self) -> dict[str, Any]:
+        """Return a snapshot of the bucket's counters for monitoring.
+
+        The snapshot is read without taking the bucket's lock, so polling it
+        (e.g. from a progress display or a metrics exporter) never delays
+        callers waiting for tokens. Values are each current, but are not read
+        atomically as a group.
+
+        Returns:
+            A flat dict of the bucket's settings, current level and counters;
+            ``throughput`` is in tokens per minute
+
+        Example:
+            >>> bucket = TokenBucket(bucket_name="api", bucket_type="requests", capacity=10, refill_rate=1)
+            >>> import asyncio
+            >>> asyncio.run(bucket.get_tokens(4))
+            >>> m = bucket.metrics()
+            >>> m["bucket_type"], m["num_requests"], m["num_released"], m["num_waits"]
+            ('requests', 4, 4, 0)
+            >>> sorted(m)  # doctest: +NORMALIZE_WHITESPACE
+            ['bucket_name', 'bucket_type', 'capacity', 'num_released', 'num_requests',
+             'num_waits', 'refill_rate', 'throughput', 'tokens', 'tokens_returned',
+             'turbo_mode', 'wait_seconds']
+        """
+        return {
+            "bucket_name": self.bucket_name,
+            "bucket_type": self.bucket_type,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+            "tokens": self.tokens,
+            "turbo_mode": self.turbo_mode,
+            "num_requests": self.num_requests,
+            "num_released": self.num_released,
+            "tokens_returned": self.tokens_returned,
+            "num_waits": self.num_waits,
+            "wait_seconds": self.wait_seconds,
+            "throughput": self.get_throughput(),
+        }
+
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,449 @@
+"""
+Non-blocking SQLite backend for the cache's hot fetch/store path.
+
+SQLiteDict runs every lookup and insert synchronously on one shared connection
+and commits after each insert, so when thousands of interviews hit the cache
+from the event loop they queue up behind blocking disk I/O. AsyncSQLiteDict
+keeps the same dictionary interface but moves the I/O off the loop:
+
+- Writes are queued to a dedicated writer thread that commits everything that
+  has accumulated in a single transaction (group commit).
+- Reads run on a pool of connections in a thread pool, so awaiting a lookup
+  never blocks other coroutines. Lookups awaited in the same event loop tick
+  are coalesced into one ``IN`` query.
+- The database runs in WAL mode, so readers do not block the writer and the
+  writer does not block readers.
+
+Entries that have been queued but not yet committed are served from memory,
+so a stored value is visible to readers immediately.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Generator, Optional, Union
+
+from .cache_entry import CacheEntry
+from .sql_dict import SQLiteDict
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class _GroupCommitWriter:
+    """
+    The writer thread and the writes it has not committed yet.
+
+    Kept apart from AsyncSQLiteDict so that the running thread does not keep
+    the dictionary alive: when the dictionary is closed, garbage collected or
+    the interpreter exits, its finalizer drains the queue through ``stop``.
+    """
+
+    def __init__(self, path: str, max_batch_size: int):
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.pending: Dict[str, CacheEntry] = {}
+        self.pending_lock = threading.Lock()
+        self.queue: queue.Queue = queue.Queue()
+        self.stats = {"writes": 0, "commits": 0}
+        # First failed commit that no caller has been told about
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(
+            target=self._loop, name="edsl-cache-writer", daemon=True
+        )
+        self.thread.start()
+
+    def _loop(self) -> None:
+        conn = _connect(self.path)
+        try:
+            stop = False
+            while not stop:
+                item = self.queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < self.max_batch_size:
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                self._commit_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: list) -> None:
+        writes = [item for item in batch if item[0] is not None]
+        error = None
+        try:
+            if writes:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO data (key, value) VALUES (?, ?)",
+                    [(key, value) for key, value, _, _ in writes],
+                )
+                conn.commit()
+        except Exception as e:
+            conn.rollback()
+            error = e
+        with self.pending_lock:
+            # Failed entries are dropped too, rather than served from memory
+            # as if they had been stored
+            for key, _, entry, _ in writes:
+                if self.pending.get(key) is entry:
+                    del self.pending[key]
+            if error is None:
+                self.stats["writes"] += len(writes)
+                self.stats["commits"] += 1 if writes else 0
+            elif any(waiter is None for _, _, _, waiter in writes):
+                logger.error(
+                    "Failed to commit %d cache entries: %s", len(writes), error
+                )
+                if self.error is None:
+                    self.error = error
+        self._notify_waiters([waiter for _, _, _, waiter in writes], error)
+        # flush() markers only wait for the batch; write errors reach the
+        # flushing caller through raise_error()
+        self._notify_waiters(
+            [waiter for key, _, _, waiter in batch if key is None], None
+        )
+
+    @staticmethod
+    def _notify_waiters(waiters: list, error: Optional[Exception]) -> None:
+        # Event loop waiters are woken with one call per loop rather than one
+        # thread-safe callback per write.
+        by_loop: Dict[asyncio.AbstractEventLoop, list] = {}
+        for waiter in waiters:
+            if waiter is None:
+                continue
+            if isinstance(waiter, Future):
+                if error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(None)
+            else:
+                loop, future = waiter
+                by_loop.setdefault(loop, []).append(future)
+
+        def resolve(futures: list) -> None:
+            for future in futures:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+
+        for loop, futures in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(resolve, futures)
+            except RuntimeError:
+                pass  # the loop has been closed; nobody is waiting
+
+    def raise_error(self) -> None:
+        """Raise, once, a commit failure of writes that nobody awaited."""
+        with self.pending_lock:
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def enqueue(self, key: str, value: CacheEntry, waiter: Any = None) -> None:
+        with self.pending_lock:
+            self.pending[key] = value
+        self.queue.put((key, json.dumps(value.to_dict()), value, waiter))
+
+    def flush(self) -> None:
+        future: Future = Future()
+        self.queue.put((None, None, None, future))
+        future.result()
+
+    def stop(self) -> None:
+        """Commit everything queued and stop the thread."""
+        self.queue.put(None)
+        self.thread.join()
+
+
+def _shutdown(
+    writer: _GroupCommitWriter,
+    read_executor: ThreadPoolExecutor,
+    read_pool: queue.Queue,
+) -> None:
+    writer.stop()
+    read_executor.shutdown(wait=True)
+    while not read_pool.empty():
+        read_pool.get_nowait().close()
+
+
+class AsyncSQLiteDict(SQLiteDict):
+    """
+    SQLiteDict with a background writer thread, group commit and pooled reads.
+
+    The synchronous dictionary methods keep working, and ``async_get`` /
+    ``async_set`` are provided for callers running inside an event loop. A file
+    path is required, since the writer and readers use separate connections.
+
+    Queued writes are committed by ``close()``, and also when the dictionary
+    is garbage collected or the interpreter exits. If a commit fails, the
+    writes in it are dropped; ``async_set`` raises the error, and writes made
+    without awaiting raise it from the next ``set``, ``flush`` or ``close``.
+
+    Example:
+        >>> temp_db_path = AsyncSQLiteDict._get_temp_path()
+        >>> d = AsyncSQLiteDict(temp_db_path)
+        >>> entry = CacheEntry.example()
+        >>> d[entry.key] = entry
+        >>> d[entry.key] == entry
+        True
+        >>> asyncio.run(d.async_get(entry.key)) == entry
+        True
+        >>> d.close()
+        >>> import os; os.unlink(temp_db_path)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        read_pool_size: int = 4,
+        max_batch_size: int = 1000,
+    ):
+        super().__init__(db_path)
+        self._raw_path = self.db_path[len("sqlite:///") :]
+        if self._raw_path in ("", ":memory:"):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                "AsyncSQLiteDict needs a database file; use SQLiteDict for in-memory databases."
+            )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.commit()
+
+        self._read_pool: queue.Queue = queue.Queue()
+        for _ in range(read_pool_size):
+            self._read_pool.put(_connect(self._raw_path))
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=read_pool_size, thread_name_prefix="edsl-cache-read"
+        )
+        self._read_batches: Dict[int, list] = {}
+
+        self._writer = _GroupCommitWriter(self._raw_path, max_batch_size)
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._writer, self._read_executor, self._read_pool
+        )
+        self._closed = False
+
+    def _enqueue(self, key: str, value: CacheEntry, waiter: Any = None) -> None:
+        if not isinstance(value, CacheEntry):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                f"Value must be a CacheEntry object (got {type(value)})."
+            )
+        self._writer.raise_error()
+        self._writer.enqueue(key, value, waiter)
+
+    def flush(self) -> None:
+        """Block until every queued write has been committed."""
+        if self._closed:
+            return
+        self._writer.flush()
+        self._writer.raise_error()
+
+    def write_stats(self) -> dict:
+        """Return the number of rows written, commits made and writes pending.
+
+        Several writes per commit means group commit is amortizing disk syncs.
+        """
+        with self._writer.pending_lock:
+            return {**self._writer.stats, "pending": len(self._writer.pending)}
+
+    ####################
+    # Reads
+    ####################
+
+    def _read(self, key: str) -> Optional[str]:
+        conn = self._read_pool.get()
+        try:
+            row = conn.execute(
+                "SELECT value FROM data WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            self._read_pool.put(conn)
+        return row[0] if row else None
+
+    def _read_many(self, keys: list, chunk_size: int = 500) -> Dict[str, str]:
+        conn = self._read_pool.get()
+        try:
+            found = {}
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start : start + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    conn.execute(
+                        f"SELECT key, value FROM data WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        finally:
+            self._read_pool.put(conn)
+        return found
+
+    def get_many(self, keys: list, chunk_size: int = 500) -> Dict[str, CacheEntry]:
+        found = {}
+        to_read = []
+        for key in keys:
+            entry = self._pending_entry(key)
+            if entry is _MISSING:
+                to_read.append(key)
+            else:
+                found[key] = entry
+        for key, value in self._read_many(to_read, chunk_size).items():
+            found[key] = CacheEntry.from_dict(json.loads(value))
+        return found
+
+    def _dispatch_reads(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._read_batches.pop(id(loop), [])
+        keys = list({key for key, _ in batch})
+        read = loop.run_in_executor(self._read_executor, self._read_many, keys)
+
+        def resolve(read: asyncio.Future) -> None:
+            error = read.exception()
+            for key, future in batch:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(read.result().get(key))
+
+        read.add_done_callback(resolve)
+
+    def _pending_entry(self, key: str) -> Any:
+        with self._writer.pending_lock:
+            return self._writer.pending.get(key, _MISSING)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Union[CacheEntry, Any]:
+        entry = self._pending_entry(key)
+        if entry is not _MISSING:
+            return entry
+        value = self._read(key)
+        if value is None:
+            return default
+        return CacheEntry.from_dict(json.loads(value))
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        entry = self.get(key, _MISSING)
+        if entry is _MISSING:
+            from .exceptions import CacheKeyError
+
+            raise CacheKeyError(f"Key '{key}' not found.")
+        return entry
+
+    def __contains__(self, key: str) -> bool:
+        if self._pending_entry(key) is not _MISSING:
+            return True
+        return self._read(key) is not None
+
+    def __setitem__(self, key: str, value: CacheEntry) -> None:
+        self._enqueue(key, value)
+
+    def set_many(self, entries: Dict[str, CacheEntry]) -> None:
+        for key, value in entries.items():
+            self._enqueue(key, value)
+
+    async def async_get(
+        self, key: str, default: Optional[Any] = None
+    ) -> Union[CacheEntry, Any]:
+        """Look up ``key`` on the read pool without blocking the event loop."""
+        entry = self._pending_entry(key)
+        if entry is not _MISSING:
+            return entry
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._read_batches.setdefault(id(loop), [])
+        if not batch:
+            loop.call_soon(self._dispatch_reads, loop)
+        batch.append((key, future))
+        value = await future
+        if value is None:
+            return default
+        return CacheEntry.from_dict(json.loads(value))
+
+    async def async_set(self, key: str, value: CacheEntry) -> None:
+        """Queue ``value`` for writing and wait until its group commit lands."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._enqueue(key, value, (loop, future))
+        await future
+
+    async def async_set_many(self, entries: Dict[str, CacheEntry]) -> None:
+        """Queue all ``entries`` at once and wait until they are committed."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for key, value in entries.items():
+            future = loop.create_future()
+            self._enqueue(key, value, (loop, future))
+            futures.append(future)
+        await asyncio.gather(*futures)
+
+    ####################
+    # Bulk operations see all queued writes first
+    ####################
+
+    def update(
+        self,
+        new_d: Union[Dict[str, CacheEntry], SQLiteDict],
+        overwrite: bool = False,
+        max_batch_size: int = 100,
+    ) -> None:
+        self.flush()
+        super().update(new_d, overwrite=overwrite, max_batch_size=max_batch_size)
+
+    def values(self) -> Generator[CacheEntry, None, None]:
+        self.flush()
+        return super().values()
+
+    def items(self) -> Generator[tuple[str, CacheEntry], None, None]:
+        self.flush()
+        return super().items()
+
+    def __iter__(self) -> Generator[str, None, None]:
+        self.flush()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.flush()
+        return super().__len__()
+
+    def __delitem__(self, key: str) -> None:
+        self.flush()
+        super().__delitem__(key)
+
+    def close(self):
+        """Commit queued writes, stop the writer and close all connections."""
+        if getattr(self, "_closed", True):
+            return super().close()
+        self._closed = True
+        self._finalizer()
+        super().close()
+        self._writer.raise_error()
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
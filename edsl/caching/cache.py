@@ -24,7 +24,8 @@ Cache objects can be used:
 Implementation Notes:
 - Cache uses CacheEntry objects as its values
 - Keys are hash-based identifiers of the input parameters
-- Multiple storage backends are supported (dict, SQLiteDict)
+- Multiple storage backends are supported (dict, SQLiteDict, and LRUCacheDict,
+  a bounded memory tier in front of SQLite)
 """
 
 from __future__ import annotations
@@ -37,6 +38,7 @@ from ..base import Base
 from ..utilities import remove_edsl_version, dict_hash
 from .exceptions import CacheError
 from .sql_dict import SQLiteDict
+from .cache_file import CACHE_FILE_EXTENSION
 import requests
 
 if TYPE_CHECKING:
@@ -124,6 +126,8 @@ class Cache(Base):
         self.new_entries_to_write_later = {}
         self.coop = None
         self.verbose = verbose
+        # Entries bulk-loaded by prefetch(), consulted before self.data
+        self._hot = {}
 
         self.filename = filename
         if filename and data:
@@ -144,8 +148,13 @@ class Cache(Base):
             elif filename.endswith(".db"):
                 if os.path.exists(filename):
                     self.add_from_sqlite(filename)
+            elif filename.endswith(CACHE_FILE_EXTENSION):
+                if os.path.exists(filename):
+                    self.add_from_cache_file(filename)
             else:
-                raise CacheError("Invalid file extension. Must be .jsonl or .db")
+                raise CacheError(
+                    f"Invalid file extension. Must be .jsonl, .db or {CACHE_FILE_EXTENSION}"
+                )
 
         self._perform_checks()
 
@@ -213,6 +222,57 @@ class Cache(Base):
     ####################
     # READ/WRITE
     ####################
+    def prefetch(self, keys) -> int:
+        """Bulk-load the entries for ``keys`` into an in-memory hot tier.
+
+        Backends that support ``get_many`` (SQLiteDict) load all keys with one
+        query per chunk instead of one point lookup per fetch. Later fetches
+        of these keys are served from memory. Returns the number of keys found.
+
+        Examples:
+            >>> c = Cache.example()
+            >>> c.prefetch(c.keys() + ["missing"])
+            1
+            >>> c.is_prefetched(c.keys()[0])
+            True
+        """
+        keys = [key for key in dict.fromkeys(keys) if key not in self._hot]
+        if hasattr(self.data, "get_many"):
+            found = self.data.get_many(keys)
+        else:
+            found = {key: self.data[key] for key in keys if key in self.data}
+        self._hot.update(found)
+        return len(found)
+
+    def is_prefetched(self, key: str) -> bool:
+        """Return True if ``key`` was loaded into the hot tier by ``prefetch``."""
+        return key in self._hot
+
+    def clear_prefetched(self, keys=None) -> None:
+        """Drop ``keys`` from the hot tier filled by ``prefetch``, or empty it.
+
+        Examples:
+            >>> c = Cache.example()
+            >>> _ = c.prefetch(c.keys())
+            >>> c.clear_prefetched(["other"])
+            >>> c.is_prefetched(c.keys()[0])
+            True
+            >>> c.clear_prefetched()
+            >>> c.is_prefetched(c.keys()[0])
+            False
+        """
+        if keys is None:
+            self._hot.clear()
+            return
+        for key in keys:
+            self._hot.pop(key, None)
+
+    def _get_entry(self, key: str) -> Optional["CacheEntry"]:
+        entry = self._hot.get(key)
+        if entry is None:
+            entry = self.data.get(key, None)
+        return entry
+
     def _fetch_from_remote_cache(self, cache_key: str) -> Optional["CacheEntry"]:
         """Fetch a cache entry from the remote cache endpoint.
 
@@ -331,7 +391,7 @@ class Cache(Base):
             user_prompt=user_prompt,
             iteration=iteration,
         )
-        entry = self.data.get(key, None)
+        entry = self._get_entry(key)
         if entry is not None:
             if self.verbose:
                 print(f"Local cache hit for key: {key}")
@@ -356,6 +416,59 @@ class Cache(Base):
 
         return None if entry is None else entry.output, key
 
+    async def async_fetch(
+        self,
+        *,
+        model: str,
+        parameters: dict,
+        system_prompt: str,
+        user_prompt: str,
+        iteration: int,
+        validated: bool = False,
+        remote_fetch: bool = False,
+    ) -> tuple(Union[None, str], str):
+        """Awaitable version of ``fetch`` for use inside the event loop.
+
+        Backends that provide ``async_get`` (such as AsyncSQLiteDict) are read
+        without blocking the loop; remote lookups run in a worker thread.
+
+        Examples:
+            >>> import asyncio
+            >>> c = Cache()
+            >>> asyncio.run(c.async_fetch(model="gpt-3", parameters="default",
+            ...         system_prompt="Hello", user_prompt="Hi", iteration=1))[0] is None
+            True
+        """
+        import asyncio
+        from .cache_entry import CacheEntry
+
+        key = CacheEntry.gen_key(
+            model=model,
+            parameters=parameters,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            iteration=iteration,
+        )
+        entry = self._hot.get(key)
+        if entry is None:
+            if hasattr(self.data, "async_get"):
+                entry = await self.data.async_get(key)
+            else:
+                entry = self.data.get(key, None)
+        if entry is not None:
+            if self.verbose:
+                print(f"Local cache hit for key: {key}")
+            self.fetched_data[key] = entry
+        else:
+            if self.verbose:
+                print(f"Local cache miss for key: {key}")
+            if self.coop is not None and remote_fetch:
+                entry = await asyncio.to_thread(self._fetch_from_remote_cache, key)
+                if entry is not None:
+                    self.fetched_data[key] = entry
+
+        return None if entry is None else entry.output, key
+
     def store(
         self,
         model: str,
@@ -422,12 +535,64 @@ class Cache(Base):
         )
         key = entry.key
         self.new_entries[key] = entry
+        self._hot.pop(key, None)
         if self.immediate_write:
             self.data[key] = entry
         else:
             self.new_entries_to_write_later[key] = entry
         return key
 
+    async def async_store(
+        self,
+        model: str,
+        parameters: str,
+        system_prompt: str,
+        user_prompt: str,
+        response: dict,
+        iteration: int,
+        service: str,
+        validated: bool = False,
+    ) -> str:
+        """Awaitable version of ``store`` for use inside the event loop.
+
+        With a backend that provides ``async_set`` the write is queued for the
+        backend's writer and awaited, so many concurrent stores share one
+        commit instead of each blocking the loop on its own.
+
+        Examples:
+            >>> import asyncio
+            >>> c = Cache()
+            >>> params = {"temperature": 0.5}
+            >>> key = asyncio.run(c.async_store(model="gpt-3", parameters=params,
+            ...         system_prompt="Hello", user_prompt="Hi", response={"a": 1},
+            ...         iteration=1, service="openai"))
+            >>> c.fetch(model="gpt-3", parameters=params, system_prompt="Hello",
+            ...         user_prompt="Hi", iteration=1) == ('{"a": 1}', key)
+            True
+        """
+        from .cache_entry import CacheEntry
+
+        entry = CacheEntry(
+            model=model,
+            parameters=parameters,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            output=json.dumps(response),
+            iteration=iteration,
+            service=service,
+            validated=validated,
+        )
+        key = entry.key
+        self.new_entries[key] = entry
+        self._hot.pop(key, None)
+        if not self.immediate_write:
+            self.new_entries_to_write_later[key] = entry
+        elif hasattr(self.data, "async_set"):
+            await self.data.async_set(key, entry)
+        else:
+            self.data[key] = entry
+        return key
+
     def add_from_dict(
         self, new_data: dict[str, "CacheEntry"], write_now: Optional[bool] = True
     ) -> None:
@@ -471,6 +636,21 @@ class Cache(Base):
             new_data[key] = CacheEntry(**value)
         self.add_from_dict(new_data=new_data, write_now=write_now)
 
+    def add_from_cache_file(self, filename: str, write_now: Optional[bool] = True):
+        """Add entries to the cache from a compressed cache file."""
+        from .cache_file import CacheFile
+
+        with CacheFile(filename) as f:
+            self.add_from_dict(new_data=f.to_dict(), write_now=write_now)
+
+    @classmethod
+    def from_cache_file(cls, filename: str) -> Cache:
+        """Construct a Cache from a compressed cache file (see ``cache_file``)."""
+        from .cache_file import CacheFile
+
+        with CacheFile(filename) as f:
+            return cls(data=f.to_dict())
+
     @classmethod
     def from_sqlite_db(cls, db_path: str) -> Cache:
         """Construct a Cache from a SQLite database."""
@@ -554,8 +734,23 @@ class Cache(Base):
             self.write_jsonl(filename)
         elif filename.endswith(".db"):
             self.write_sqlite_db(filename)
+        elif filename.endswith(CACHE_FILE_EXTENSION):
+            self.write_cache_file(filename)
         else:
-            raise CacheError("Invalid file extension. Must be .jsonl or .db")
+            raise CacheError(
+                f"Invalid file extension. Must be .jsonl, .db or {CACHE_FILE_EXTENSION}"
+            )
+
+    def write_cache_file(self, filename: str, codec: Optional[str] = None) -> None:
+        """Write the cache as a compressed cache file with a sorted key index.
+
+        Cache files are much smaller than JSONL, support key lookup without
+        loading the whole file, and can be merged with
+        ``edsl.caching.cache_file.merge_cache_files``.
+        """
+        from .cache_file import write_cache_file
+
+        write_cache_file(filename, self.data, codec=codec)
 
     def write_jsonl(self, filename: str) -> None:
         """Write the cache to a CAS-format JSONL file."""
@@ -588,13 +783,12 @@ class Cache(Base):
           - Line 1: header with ``__header__: true`` and metadata
           - Lines 2–N+1: one ``{"key": "...", "entry": {...}}`` per CacheEntry
         """
-        content = "\n".join(self.to_jsonl_rows()) + "\n"
-
         if filename is not None:
             with open(filename, "w") as f:
-                f.write(content)
+                for row in self.to_jsonl_rows():
+                    f.write(row + "\n")
             return None
-        return content
+        return "\n".join(self.to_jsonl_rows()) + "\n"
 
 
     def to_scenario_list(self):
@@ -644,7 +838,8 @@ class Cache(Base):
         if not isinstance(other, Cache):
             raise CacheError("Can only compare two caches")
 
-        diff_data = {k: v for k, v in self.data.items() if k not in other.data}
+        diff_keys = [k for k in self.data.keys() if k not in other.data]
+        diff_data = self.subset(diff_keys).data
         return Cache(data=diff_data, immediate_write=self.immediate_write)
 
     @classmethod
@@ -931,8 +1126,15 @@ class Cache(Base):
     def subset(self, keys: list[str]) -> Cache:
         """
         Return a subset of the Cache with the specified keys.
+
+        Only the requested entries are read; backends with ``get_many``
+        (SQLiteDict, CacheFile) load them in bulk.
         """
-        new_data = {k: v for k, v in self.data.items() if k in keys}
+        keys = list(dict.fromkeys(keys))
+        if hasattr(self.data, "get_many"):
+            new_data = self.data.get_many(keys)
+        else:
+            new_data = {k: self.data[k] for k in keys if k in self.data}
         return Cache(data=new_data)
 
     def view(self) -> None:
@@ -1032,7 +1234,21 @@ class Cache(Base):
             {"user_prompt": user_prompts},
             {"output": outputs},
         ]
-        return [("Cache", Dataset(data))]
+        sections = [("Cache", Dataset(data))]
+        if hasattr(self.data, "stats"):
+            stats = self.data.stats()
+            sections.append(
+                (
+                    "Memory tier",
+                    Dataset(
+                        [
+                            {"statistic": list(stats.keys())},
+                            {"value": [str(v) for v in stats.values()]},
+                        ]
+                    ),
+                )
+            )
+        return sections
 
     def _summary_repr(self) -> str:
         """Generate a summary representation of the Cache as a Rich table."""
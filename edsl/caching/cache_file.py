@@ -0,0 +1,485 @@
+"""
+Compact on-disk cache format with a sorted key index.
+
+JSONL stores every CacheEntry as a full JSON object, so loading, merging or
+subsetting a large cache means parsing every entry. A cache file
+(``.edslcache``) instead stores entries sorted by key in compressed columnar
+blocks:
+
+- Entry blocks hold up to ``block_size`` entries, one list per field. Columnar
+  layout lets repeated values (model, service, parameters) compress well.
+- System and user prompts are deduplicated by content hash into separate
+  compressed string blocks, so a prompt shared by many entries is stored once.
+- A fixed-width, uncompressed index of the sorted keys sits at the end of the
+  file. The reader memory-maps the file and binary-searches the index, so a
+  lookup decompresses only the block holding the entry.
+
+Because entries are stored in key order, several cache files can be merged
+with a streaming k-way merge (``merge_cache_files``) that holds only one block
+per input in memory.
+
+Blocks are compressed with zstd when the ``zstandard`` package is installed
+and with zlib otherwise; the codec is recorded in the file.
+
+File layout::
+
+    MAGIC
+    entry and string blocks (compressed JSON, in write order)
+    key index (n_entries * key_width bytes, NUL-padded UTF-8, sorted)
+    footer (zlib-compressed JSON: codec, block offsets, index offset, ...)
+    trailer (footer offset and length as two little-endian uint64) MAGIC
+"""
+
+from __future__ import annotations
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, Optional, Union
+
+from .cache_entry import CacheEntry
+from .exceptions import CacheKeyError, CacheValueError
+
+if TYPE_CHECKING:
+    from .cache import Cache
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+CACHE_FILE_EXTENSION = ".edslcache"
+
+MAGIC = b"EDSLCF1\n"
+_TRAILER = struct.Struct("<QQ")
+_PROMPT_FIELDS = ("system_prompt", "user_prompt")
+_FIELDS = (
+    "model",
+    "parameters",
+    "system_prompt",
+    "user_prompt",
+    "output",
+    "iteration",
+    "timestamp",
+    "service",
+    "validated",
+)
+
+
+def default_codec() -> str:
+    """Return the best available compression codec."""
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise CacheValueError(
+                "This cache file is zstd-compressed; install the 'zstandard' package to read it."
+            )
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class CacheFileWriter:
+    """
+    Streaming writer for cache files.
+
+    Entries must be added in ascending key order; ``write_cache_file`` sorts
+    an arbitrary mapping first. Only the current block, the prompt hash table
+    and the key count are held in memory; keys are spooled to a temporary
+    file until the index is written on ``close``.
+
+    Example:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "example.edslcache")
+        >>> entry = CacheEntry.example()
+        >>> with CacheFileWriter(path) as writer:
+        ...     writer.add(entry.key, entry)
+        >>> with CacheFile(path) as f:
+        ...     f[entry.key] == entry
+        True
+    """
+
+    def __init__(
+        self,
+        path: str,
+        block_size: int = 1000,
+        strings_per_block: int = 1000,
+        codec: Optional[str] = None,
+    ):
+        self.path = str(path)
+        self.block_size = block_size
+        self.strings_per_block = strings_per_block
+        self.codec = codec or default_codec()
+        if self.codec not in ("zstd", "zlib"):
+            raise CacheValueError(f"Unknown cache file codec: {self.codec!r}")
+        if self.codec == "zstd" and zstandard is None:
+            raise CacheValueError("The zstd codec needs the 'zstandard' package.")
+
+        self._file = open(self.path, "wb")
+        self._file.write(MAGIC)
+        self._blocks: list = []
+        self._string_blocks: list = []
+        self._columns: Dict[str, list] = {field: [] for field in _FIELDS}
+        self._strings: list = []
+        self._string_ids: Dict[bytes, int] = {}
+        self._n_strings = 0
+        self._keys = tempfile.TemporaryFile()
+        self._key_width = 1
+        self._n_entries = 0
+        self._last_key: Optional[str] = None
+        self._closed = False
+
+    def __enter__(self) -> "CacheFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+
+    def _write_block(self, payload: Any) -> list:
+        data = _compress(json.dumps(payload).encode(), self.codec)
+        offset = self._file.tell()
+        self._file.write(data)
+        return [offset, len(data)]
+
+    def _string_id(self, s: str) -> int:
+        digest = hashlib.blake2b(s.encode(), digest_size=16).digest()
+        string_id = self._string_ids.get(digest)
+        if string_id is None:
+            string_id = self._string_ids[digest] = self._n_strings
+            self._n_strings += 1
+            self._strings.append(s)
+            if len(self._strings) == self.strings_per_block:
+                self._flush_strings()
+        return string_id
+
+    def _flush_strings(self) -> None:
+        if self._strings:
+            self._string_blocks.append(self._write_block(self._strings))
+            self._strings = []
+
+    def _flush_entries(self) -> None:
+        if self._columns["model"]:
+            self._blocks.append(self._write_block(self._columns))
+            self._columns = {field: [] for field in _FIELDS}
+
+    def add(self, key: str, entry: Union[CacheEntry, dict]) -> None:
+        """Append an entry; ``key`` must sort after every key added so far."""
+        if self._last_key is not None and key <= self._last_key:
+            raise CacheValueError(
+                f"Cache file keys must be added in ascending order ({key!r} after {self._last_key!r})."
+            )
+        row = entry.to_dict() if isinstance(entry, CacheEntry) else entry
+        for field in _FIELDS:
+            value = row.get(field)
+            if field in _PROMPT_FIELDS:
+                value = self._string_id(value or "")
+            self._columns[field].append(value)
+        encoded = key.encode()
+        self._keys.write(encoded + b"\n")
+        self._key_width = max(self._key_width, len(encoded))
+        self._last_key = key
+        self._n_entries += 1
+        if len(self._columns["model"]) == self.block_size:
+            self._flush_entries()
+
+    def close(self) -> None:
+        """Write the remaining blocks, the key index, footer and trailer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_entries()
+        self._flush_strings()
+
+        index_offset = self._file.tell()
+        self._keys.seek(0)
+        for line in self._keys:
+            self._file.write(line.rstrip(b"\n").ljust(self._key_width, b"\0"))
+        self._keys.close()
+
+        footer = {
+            "version": 1,
+            "codec": self.codec,
+            "n_entries": self._n_entries,
+            "block_size": self.block_size,
+            "strings_per_block": self.strings_per_block,
+            "key_width": self._key_width,
+            "index_offset": index_offset,
+            "blocks": self._blocks,
+            "string_blocks": self._string_blocks,
+        }
+        footer_data = zlib.compress(json.dumps(footer).encode())
+        footer_offset = self._file.tell()
+        self._file.write(footer_data)
+        self._file.write(_TRAILER.pack(footer_offset, len(footer_data)) + MAGIC)
+        self._file.close()
+
+    def _abort(self) -> None:
+        self._closed = True
+        self._keys.close()
+        self._file.close()
+        os.unlink(self.path)
+
+
+class CacheFile:
+    """
+    Read-only, memory-mapped view of a cache file.
+
+    Supports the read side of the dictionary interface used for Cache data
+    (``get``, ``[]``, ``in``, ``len``, ``keys``, ``items``, ``values``) plus
+    ``get_many`` and ``subset``, which decompress only the blocks holding the
+    requested keys. Iteration yields entries in key order.
+    """
+
+    def __init__(self, path: str, block_cache_size: int = 8):
+        self.path = str(path)
+        if not os.path.exists(self.path):
+            from .exceptions import CacheFileNotFoundError
+
+            raise CacheFileNotFoundError(f"File {self.path} not found")
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise CacheValueError(f"{self.path} is not a cache file (empty).")
+        tail = len(MAGIC) + _TRAILER.size
+        if (
+            len(self._mm) < len(MAGIC) + tail
+            or self._mm[: len(MAGIC)] != MAGIC
+            or self._mm[-len(MAGIC) :] != MAGIC
+        ):
+            self.close()
+            raise CacheValueError(f"{self.path} is not a cache file.")
+        footer_offset, footer_length = _TRAILER.unpack(
+            self._mm[-tail : -len(MAGIC)]
+        )
+        footer = json.loads(
+            zlib.decompress(self._mm[footer_offset : footer_offset + footer_length])
+        )
+        self.codec = footer["codec"]
+        self._n = footer["n_entries"]
+        self._block_size = footer["block_size"]
+        self._strings_per_block = footer["strings_per_block"]
+        self._key_width = footer["key_width"]
+        self._index_offset = footer["index_offset"]
+        self._blocks = footer["blocks"]
+        self._string_blocks = footer["string_blocks"]
+        self._block_cache_size = block_cache_size
+        self._block_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    def __enter__(self) -> "CacheFile":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        if not self._file.closed:
+            self._file.close()
+
+    ####################
+    # Index and blocks
+    ####################
+
+    def _key_bytes(self, i: int) -> bytes:
+        start = self._index_offset + i * self._key_width
+        return self._mm[start : start + self._key_width]
+
+    def _key_at(self, i: int) -> str:
+        return self._key_bytes(i).rstrip(b"\0").decode()
+
+    def _position(self, key: str) -> int:
+        """Binary-search the memory-mapped index; return -1 if absent."""
+        target = key.encode()
+        if len(target) > self._key_width:
+            return -1
+        target = target.ljust(self._key_width, b"\0")
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n and self._key_bytes(lo) == target:
+            return lo
+        return -1
+
+    def _load(self, kind: str, i: int) -> Any:
+        cache_key = (kind, i)
+        block = self._block_cache.get(cache_key)
+        if block is not None:
+            self._block_cache.move_to_end(cache_key)
+            return block
+        offset, length = (self._blocks if kind == "e" else self._string_blocks)[i]
+        block = json.loads(_decompress(self._mm[offset : offset + length], self.codec))
+        self._block_cache[cache_key] = block
+        if len(self._block_cache) > self._block_cache_size:
+            self._block_cache.popitem(last=False)
+        return block
+
+    def _string(self, string_id: int) -> str:
+        block = self._load("s", string_id // self._strings_per_block)
+        return block[string_id % self._strings_per_block]
+
+    def _row(self, i: int) -> dict:
+        columns = self._load("e", i // self._block_size)
+        r = i % self._block_size
+        row = {field: columns[field][r] for field in _FIELDS}
+        for field in _PROMPT_FIELDS:
+            row[field] = self._string(row[field])
+        return row
+
+    def iter_rows(self) -> Generator[tuple[str, dict], None, None]:
+        """Yield ``(key, entry dict)`` pairs in key order without building CacheEntry objects."""
+        for i in range(self._n):
+            yield self._key_at(i), self._row(i)
+
+    ####################
+    # Dictionary interface
+    ####################
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self._position(key) >= 0
+
+    def get(self, key: str, default: Optional[Any] = None) -> Union[CacheEntry, Any]:
+        i = self._position(key)
+        if i < 0:
+            return default
+        return CacheEntry.from_dict(self._row(i))
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        i = self._position(key)
+        if i < 0:
+            raise CacheKeyError(f"Key '{key}' not found.")
+        return CacheEntry.from_dict(self._row(i))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Look up many keys, decompressing each needed block once."""
+        positions = sorted(
+            (i, key) for key in dict.fromkeys(keys) if (i := self._position(key)) >= 0
+        )
+        return {key: CacheEntry.from_dict(self._row(i)) for i, key in positions}
+
+    def keys(self) -> Generator[str, None, None]:
+        for i in range(self._n):
+            yield self._key_at(i)
+
+    def __iter__(self) -> Generator[str, None, None]:
+        return self.keys()
+
+    def items(self) -> Generator[tuple[str, CacheEntry], None, None]:
+        for key, row in self.iter_rows():
+            yield key, CacheEntry.from_dict(row)
+
+    def values(self) -> Generator[CacheEntry, None, None]:
+        for _, entry in self.items():
+            yield entry
+
+    def to_dict(self) -> Dict[str, CacheEntry]:
+        return dict(self.items())
+
+    def subset(self, keys: Iterable[str]) -> "Cache":
+        """Return a Cache holding only ``keys``, without reading other blocks."""
+        from .cache import Cache
+
+        return Cache(data=self.get_many(keys))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, n_entries={self._n})"
+
+
+def write_cache_file(
+    path: str,
+    data: Any,
+    block_size: int = 1000,
+    codec: Optional[str] = None,
+    chunk_size: int = 500,
+) -> None:
+    """
+    Write a mapping of keys to CacheEntry objects as a cache file.
+
+    Keys are sorted first. Backends with ``get_many`` (SQLiteDict, CacheFile)
+    are read in chunks of ``chunk_size`` keys rather than entry by entry.
+    """
+    keys = sorted(data.keys())
+    with CacheFileWriter(path, block_size=block_size, codec=codec) as writer:
+        if hasattr(data, "get_many"):
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start : start + chunk_size]
+                found = data.get_many(chunk)
+                for key in chunk:
+                    writer.add(key, found[key])
+        else:
+            for key in keys:
+                writer.add(key, data[key])
+
+
+def _numbered_rows(n: int, reader: "CacheFile") -> Generator[tuple, None, None]:
+    """Yield ``(key, n, row)`` for each row of ``reader``, in key order."""
+    for key, row in reader.iter_rows():
+        yield key, n, row
+
+
+def merge_cache_files(
+    sources: list,
+    destination: str,
+    block_size: int = 1000,
+    codec: Optional[str] = None,
+) -> int:
+    """
+    Merge cache files into ``destination`` with a streaming k-way merge.
+
+    When a key appears in several sources the entry from the last source wins,
+    matching ``Cache.__add__``. Entries are copied as rows, without building
+    CacheEntry objects. Returns the number of entries written.
+    """
+    readers = [CacheFile(source) for source in sources]
+    written = 0
+    try:
+        streams = [_numbered_rows(n, reader) for n, reader in enumerate(readers)]
+        with CacheFileWriter(destination, block_size=block_size, codec=codec) as writer:
+            pending = None
+            for key, _, row in heapq.merge(*streams, key=lambda item: (item[0], item[1])):
+                if pending is not None and pending[0] != key:
+                    writer.add(*pending)
+                    written += 1
+                pending = (key, row)
+            if pending is not None:
+                writer.add(*pending)
+                written += 1
+    finally:
+        for reader in readers:
+            reader.close()
+    return written
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
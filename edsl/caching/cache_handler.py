@@ -75,9 +75,17 @@ class CacheHandler:
         if hasattr(CONFIG, "EDSL_SESSION_CACHE"):
             return CONFIG.EDSL_SESSION_CACHE
 
-        from .sql_dict import SQLiteDict
-
-        cache = Cache(data=SQLiteDict(self.CACHE_PATH))
+        from .async_sql_dict import AsyncSQLiteDict
+        from .lru_dict import LRUCacheDict
+
+        max_entries = int(CONFIG.get("EDSL_CACHE_MEMORY_MAX_ENTRIES"))
+        max_bytes = int(CONFIG.get("EDSL_CACHE_MEMORY_MAX_BYTES"))
+        data = LRUCacheDict(
+            AsyncSQLiteDict(self.CACHE_PATH),
+            max_entries=max_entries or None,
+            max_bytes=max_bytes or None,
+        )
+        cache = Cache(data=data)
         return cache
 
     def from_old_sqlite_cache(
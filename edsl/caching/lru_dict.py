@@ -0,0 +1,343 @@
+"""
+Bounded in-memory LRU tier in front of a persistent cache store.
+
+A Cache backed by a plain dict keeps every entry in memory for the whole
+session, while one backed by SQLiteDict goes to disk for every lookup.
+LRUCacheDict sits between the two: recently used entries are served from a
+memory tier bounded by entry count and/or approximate size in bytes, and
+everything else falls through to the backing store (SQLiteDict or
+AsyncSQLiteDict).
+
+New entries are written back to the backing store in batches rather than one
+at a time. A dirty entry is never dropped before it has been written, so
+evicting one flushes the pending batch first. From the event loop,
+``async_set`` awaits the backing store's group commit (AsyncSQLiteDict) for
+the batch instead of writing it synchronously.
+"""
+
+from __future__ import annotations
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Generator, Optional, Union
+
+from .cache_entry import CacheEntry
+
+_MISSING = object()
+
+# Pending writes must not be lost if the interpreter exits before close()
+_open_dicts: "weakref.WeakSet[LRUCacheDict]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_dicts() -> None:
+    for d in list(_open_dicts):
+        d.close()
+
+
+def _entry_size(entry: CacheEntry) -> int:
+    """Approximate the memory held by an entry from its string fields."""
+    return (
+        len(entry.output or "")
+        + len(entry.user_prompt or "")
+        + len(entry.system_prompt or "")
+        + 256
+    )
+
+
+class LRUCacheDict:
+    """
+    Dictionary-like cache store with a size-bounded LRU memory tier.
+
+    Args:
+        backing: The persistent store (SQLiteDict or AsyncSQLiteDict).
+        max_entries: Maximum number of entries held in memory (None: no limit).
+        max_bytes: Maximum approximate bytes held in memory (None: no limit).
+        write_batch_size: Number of new entries to accumulate before writing
+            them to the backing store in one batch.
+
+    Example:
+        >>> from .sql_dict import SQLiteDict
+        >>> d = LRUCacheDict(SQLiteDict.example(), max_entries=1, write_batch_size=10)
+        >>> a, b = CacheEntry.example(), CacheEntry.example(randomize=True)
+        >>> d[a.key] = a
+        >>> d[b.key] = b  # evicts a, writing it to the backing store first
+        >>> d[a.key] == a  # a miss, loaded back into memory (evicting b)
+        True
+        >>> d[a.key] == a  # a hit
+        True
+        >>> s = d.stats()
+        >>> (s["hits"], s["misses"], s["evictions"])
+        (1, 1, 2)
+    """
+
+    def __init__(
+        self,
+        backing: Any,
+        max_entries: Optional[int] = 100_000,
+        max_bytes: Optional[int] = None,
+        write_batch_size: int = 100,
+    ):
+        self.backing = backing
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.write_batch_size = write_batch_size
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._dirty: Dict[str, CacheEntry] = {}
+        self._lock = threading.RLock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "write_backs": 0,
+            "entries_written": 0,
+        }
+        _open_dicts.add(self)
+
+    @property
+    def db_path(self) -> Optional[str]:
+        return getattr(self.backing, "db_path", None)
+
+    ####################
+    # Memory tier
+    ####################
+
+    def _remember(
+        self, key: str, entry: CacheEntry, dirty: bool = False, write_back: bool = True
+    ) -> bool:
+        """Hold ``entry`` in memory; return True if a write-back batch is due.
+
+        With ``write_back`` the due batch is written here; ``async_set`` passes
+        False and awaits the write itself.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._bytes -= self._sizes[key]
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            self._sizes[key] = size = _entry_size(entry)
+            self._bytes += size
+            if dirty:
+                self._dirty[key] = entry
+            self._evict()
+            due = len(self._dirty) >= self.write_batch_size
+            if due and write_back:
+                self.flush()
+            return due
+
+    def _over_capacity(self) -> bool:
+        if self.max_entries is not None and len(self._memory) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        while self._memory and self._over_capacity():
+            key = next(iter(self._memory))
+            if key in self._dirty:
+                self.flush()
+            del self._memory[key]
+            self._bytes -= self._sizes.pop(key)
+            self._stats["evictions"] += 1
+
+    def _lookup(self, key: str) -> Any:
+        with self._lock:
+            entry = self._memory.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            return entry
+
+    def flush(self) -> None:
+        """Write all pending new entries to the backing store in one batch."""
+        with self._lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+            self.backing.set_many(dirty)
+            self._stats["write_backs"] += 1
+            self._stats["entries_written"] += len(dirty)
+
+    async def async_flush(self) -> None:
+        """Write pending new entries without blocking the event loop.
+
+        A backing store with ``async_set_many`` (AsyncSQLiteDict) queues the
+        batch for its writer thread and the flush awaits the group commit.
+        """
+        if not hasattr(self.backing, "async_set_many"):
+            self.flush()
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+            self._stats["write_backs"] += 1
+            self._stats["entries_written"] += len(dirty)
+        await self.backing.async_set_many(dirty)
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and the memory tier's occupancy."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._bytes,
+                "pending_writes": len(self._dirty),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    ####################
+    # Dictionary interface
+    ####################
+
+    def get(self, key: str, default: Optional[Any] = None) -> Union[CacheEntry, Any]:
+        entry = self._lookup(key)
+        if entry is not _MISSING:
+            return entry
+        entry = self.backing.get(key, None)
+        if entry is None:
+            return default
+        self._remember(key, entry)
+        return entry
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        entry = self.get(key, _MISSING)
+        if entry is _MISSING:
+            from .exceptions import CacheKeyError
+
+            raise CacheKeyError(f"Key '{key}' not found.")
+        return entry
+
+    def __setitem__(self, key: str, value: CacheEntry) -> None:
+        if not isinstance(value, CacheEntry):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                f"Value must be a CacheEntry object (got {type(value)})."
+            )
+        self._remember(key, value, dirty=True)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        return key in self.backing
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            self.flush()
+            if key in self._memory:
+                del self._memory[key]
+                self._bytes -= self._sizes.pop(key)
+        del self.backing[key]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def get_many(self, keys: list) -> Dict[str, CacheEntry]:
+        found = {}
+        missing = []
+        for key in keys:
+            entry = self._lookup(key)
+            if entry is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = entry
+        if missing:
+            loaded = self.backing.get_many(missing)
+            for key, entry in loaded.items():
+                self._remember(key, entry)
+            found.update(loaded)
+        return found
+
+    async def async_get(
+        self, key: str, default: Optional[Any] = None
+    ) -> Union[CacheEntry, Any]:
+        entry = self._lookup(key)
+        if entry is not _MISSING:
+            return entry
+        if hasattr(self.backing, "async_get"):
+            entry = await self.backing.async_get(key)
+        else:
+            entry = self.backing.get(key, None)
+        if entry is None:
+            return default
+        self._remember(key, entry)
+        return entry
+
+    async def async_set(self, key: str, value: CacheEntry) -> None:
+        if not isinstance(value, CacheEntry):
+            from .exceptions import CacheValueError
+
+            raise CacheValueError(
+                f"Value must be a CacheEntry object (got {type(value)})."
+            )
+        if self._remember(key, value, dirty=True, write_back=False):
+            await self.async_flush()
+
+    def update(
+        self, new_d: Union[Dict[str, CacheEntry], Any], overwrite: bool = False
+    ) -> None:
+        self.flush()
+        if isinstance(new_d, LRUCacheDict):
+            new_d.flush()
+            new_d = new_d.backing
+        self.backing.update(new_d, overwrite=overwrite)
+        if overwrite:
+            # Memory holds no unwritten entries after the flush, so dropping
+            # it is the cheapest way to avoid serving overwritten values.
+            with self._lock:
+                self._memory.clear()
+                self._sizes.clear()
+                self._bytes = 0
+
+    # Whole-store views read the backing store after flushing pending writes
+
+    def keys(self) -> Generator[str, None, None]:
+        self.flush()
+        return self.backing.keys()
+
+    def __iter__(self) -> Generator[str, None, None]:
+        self.flush()
+        return iter(self.backing)
+
+    def values(self) -> Generator[CacheEntry, None, None]:
+        self.flush()
+        return self.backing.values()
+
+    def items(self) -> Generator[tuple[str, CacheEntry], None, None]:
+        self.flush()
+        return self.backing.items()
+
+    def __len__(self) -> int:
+        self.flush()
+        return len(self.backing)
+
+    def to_dict(self) -> Dict[str, CacheEntry]:
+        return dict(self.items())
+
+    def close(self) -> None:
+        """Write pending entries and close the backing store."""
+        self.flush()
+        _open_dicts.discard(self)
+        if hasattr(self.backing, "close"):
+            self.backing.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(backing={self.backing!r}, "
+            f"max_entries={self.max_entries!r}, max_bytes={self.max_bytes!r})"
+        )
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
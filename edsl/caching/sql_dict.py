@@ -137,6 +137,30 @@ class SQLiteDict:
         )
         self._conn.commit()
 
+    def set_many(self, entries: Dict[str, CacheEntry]) -> None:
+        """
+        Stores many CacheEntry objects in a single transaction.
+
+        Example:
+            >>> d = SQLiteDict.example()
+            >>> d.set_many({"foo": CacheEntry.example()})
+            >>> d["foo"] == CacheEntry.example()
+            True
+        """
+        rows = []
+        for key, value in entries.items():
+            if not isinstance(value, CacheEntry):
+                from .exceptions import CacheValueError
+
+                raise CacheValueError(
+                    f"Value must be a CacheEntry object (got {type(value)})."
+                )
+            rows.append((key, json.dumps(value.to_dict())))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO data (key, value) VALUES (?, ?)", rows
+        )
+        self._conn.commit()
+
     def __getitem__(self, key: str) -> CacheEntry:
         """
         Retrieves a CacheEntry object for the specified key.
@@ -193,6 +217,30 @@ class SQLiteDict:
             return default
         return CacheEntry.from_dict(json.loads(row[0]))
 
+    def get_many(self, keys: list[str], chunk_size: int = 500) -> Dict[str, CacheEntry]:
+        """
+        Retrieves the entries for many keys with one query per chunk of keys.
+
+        Keys that are not found are left out of the returned dictionary.
+
+        Example:
+            >>> d = SQLiteDict.example()
+            >>> d["foo"] = CacheEntry.example()
+            >>> d.get_many(["foo", "bar"]) == {"foo": CacheEntry.example()}
+            True
+        """
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM data WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, value in rows:
+                found[key] = CacheEntry.from_dict(json.loads(value))
+        return found
+
     def __bool__(self) -> bool:
         """
         Always returns True for SQLiteDict instances.
@@ -126,6 +126,22 @@ CONFIG_MAP = {
         "default": "10",  # Change to a very low threshold (10 bytes) to test SQLite offloading
         "info": "This config var determines the memory threshold in bytes before Results' SQLList offloads data to SQLite.",
     },
+    "EDSL_CACHE_MEMORY_MAX_ENTRIES": {
+        "default": "100000",
+        "info": "This config var determines the maximum number of cache entries held in memory in front of the SQLite cache (0 for no limit).",
+    },
+    "EDSL_CACHE_MEMORY_MAX_BYTES": {
+        "default": "0",
+        "info": "This config var determines the approximate maximum number of bytes of cache entries held in memory in front of the SQLite cache (0 for no limit).",
+    },
+    "EDSL_COOP_POOL_SIZE": {
+        "default": "16",
+        "info": "This config var determines the number of pooled connections Coop keeps open per host, and how many requests it sends in parallel.",
+    },
+    "EDSL_COOP_COMPRESS_MIN_BYTES": {
+        "default": "0",
+        "info": "This config var determines the size in bytes above which Coop gzip-compresses JSON request bodies (0 to never compress).",
+    },
     "EDSL_MAX_PRICE_BEFORE_CONFIRM": {
         "default": "90",
         "info": "This config var determines the maximum price before a confirmation prompt is shown.",
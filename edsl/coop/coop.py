@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import (
     Any,
     Dict,
+    Iterator,
     Optional,
     Union,
     Literal,
@@ -26,6 +27,7 @@ from ..caching import CacheEntry
 from ..logger import get_logger
 
 if TYPE_CHECKING:
+    from .http_transport import CoopTransport
     from ..agents import AgentList
     from ..dataset import Dataset
     from ..jobs import Jobs
@@ -240,6 +242,13 @@ class Coop(CoopFunctionsMixin):
         """True if a non-empty API key is set (constructor arg, class default, or env/config)."""
         return bool(self.api_key)
 
+    @property
+    def _transport(self) -> "CoopTransport":
+        """The pooled HTTP transport shared by all Coop instances."""
+        from .http_transport import get_transport
+
+        return get_transport()
+
     @property
     def headers(self) -> dict:
         """
@@ -293,11 +302,11 @@ class Coop(CoopFunctionsMixin):
 
         try:
             if method in ["GET", "DELETE"]:
-                response = requests.request(
+                response = self._transport.request(
                     method, url, params=params, headers=self.headers, timeout=timeout
                 )
             elif method in ["POST", "PATCH", "PUT"]:
-                response = requests.request(
+                response = self._transport.request(
                     method,
                     url,
                     params=params,
@@ -1197,7 +1206,7 @@ class Coop(CoopFunctionsMixin):
 
                 raise CoopResponseError("No signed url was provided.")
 
-            response = requests.put(
+            response = self._transport.put(
                 signed_url, data=json_data.encode(), headers=headers
             )
             self._resolve_gcs_response(response)
@@ -1233,7 +1242,7 @@ class Coop(CoopFunctionsMixin):
                     byte_data = formatted_python_string.encode("utf-8")
                 else:
                     byte_data = base64.b64decode(object_dict["base64_string"])
-                response = requests.put(
+                response = self._transport.put(
                     file_store_upload_signed_url,
                     data=byte_data,
                     headers=headers,
@@ -1341,7 +1350,7 @@ class Coop(CoopFunctionsMixin):
         json_string = response.json().get("json_string")
         if "load_from:" in json_string[0:12]:
             load_link = json_string.split("load_from:")[1]
-            object_data = requests.get(load_link)
+            object_data = self._transport.get(load_link)
             self._resolve_gcs_response(object_data)
             json_string = object_data.text
         object_type = response.json().get("object_type")
@@ -1743,7 +1752,7 @@ class Coop(CoopFunctionsMixin):
         )
 
         # Upload to GCS using signed URL
-        gcs_response = requests.put(
+        gcs_response = self._transport.put(
             signed_url,
             data=json_content,
             headers={"Content-Type": "application/json"},
@@ -2158,7 +2167,7 @@ class Coop(CoopFunctionsMixin):
         job_dict = job.to_dict()
         job_dict = self._process_filestores_for_push(job_dict, original_object=job)
 
-        response = requests.put(
+        response = self._transport.put(
             upload_signed_url,
             data=json.dumps(
                 job_dict,
@@ -2468,6 +2477,32 @@ class Coop(CoopFunctionsMixin):
         self._resolve_server_response(response)
         return response.json()
 
+    def iter_remote_inference_results_pages(
+        self,
+        job_uuid: str,
+        page_count: int,
+        page_size: int = 100,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield every page of a job's results, in page order.
+
+        Pages are fetched in parallel over the pooled transport, at most
+        ``max_workers`` (default: the transport's pool size) at a time, while
+        the caller processes the pages already yielded. Only that many pages
+        are held in memory at once. An error fetching a page is raised when
+        that page is reached.
+        """
+        if page_count <= 0:
+            return
+        yield from self._transport.imap(
+            lambda page: self.remote_inference_results_page(
+                job_uuid, page=page, page_size=page_size
+            ),
+            range(page_count),
+            max_in_flight=max_workers,
+        )
+
     def new_remote_inference_get(
         self,
         job_uuid: Optional[str] = None,
@@ -2594,7 +2629,7 @@ class Coop(CoopFunctionsMixin):
                 job_json = json_string
 
             try:
-                response = requests.get(signed_url)
+                response = self._transport.get(signed_url)
                 self._resolve_gcs_response(response)
                 job_json = json.dumps(response.json())
             except Exception:
@@ -5092,7 +5127,9 @@ class Coop(CoopFunctionsMixin):
         else:
             data = {"json_string": json.dumps({"survey": survey, "email": ""})}
 
-        response_json = requests.post(url, headers=self.headers, data=json.dumps(data))
+        response_json = self._transport.post(
+            url, headers=self.headers, data=json.dumps(data)
+        )
 
         return response_json
 
@@ -5335,7 +5372,7 @@ class Coop(CoopFunctionsMixin):
             return self.get(url_or_uuid, expected_object_type)
 
         try:
-            response = requests.get(signed_url)
+            response = self._transport.get(signed_url)
 
             self._resolve_gcs_response(response)
 
@@ -5484,7 +5521,7 @@ class Coop(CoopFunctionsMixin):
 
             file_content = base64.b64decode(d["base64_string"])
 
-            upload_response = requests.put(
+            upload_response = self._transport.put(
                 upload_url,
                 data=file_content,
                 headers={
@@ -5675,7 +5712,7 @@ class Coop(CoopFunctionsMixin):
         # Decode base64 content and upload to GCS
         file_content = base64.b64decode(filestore.base64_string)
 
-        upload_response = requests.put(
+        upload_response = self._transport.put(
             upload_url,
             data=file_content,
             headers={
@@ -5856,7 +5893,7 @@ class Coop(CoopFunctionsMixin):
                     error_msg += f"\nObject type: {type(object_dict)}"
                     error_msg += f"\nObject class: {object.__class__.__name__}"
                 raise CoopSerializationError(error_msg) from e
-        response = requests.put(
+        response = self._transport.put(
             signed_url,
             data=json_data.encode(),
             headers={"Content-Type": "application/json"},
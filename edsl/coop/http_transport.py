@@ -0,0 +1,174 @@
+"""Pooled HTTP transport for Coop.
+
+Every Coop request used to go through the module-level ``requests`` helpers,
+which open a fresh session (and TCP/TLS connection) per call. ``CoopTransport``
+keeps one ``requests.Session`` per process with a connection pool sized for
+concurrent use, so consecutive and parallel requests to the same host reuse
+connections. JSON bodies above a configurable size can be gzip-compressed, and
+``map`` / ``imap`` send several independent requests in parallel over the
+shared pool.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import CONFIG
+
+
+class CoopTransport:
+    """A pooled, thread-safe ``requests.Session`` wrapper.
+
+    Args:
+        pool_size: Maximum number of connections kept open per host. This is
+                   also the number of requests ``map`` runs at once.
+        compress_min_bytes: JSON request bodies at least this large are sent
+                            gzip-compressed with ``Content-Encoding: gzip``.
+                            0 disables request compression. Responses are
+                            always requested compressed (``Accept-Encoding``).
+
+    Examples:
+        >>> transport = CoopTransport(pool_size=4, compress_min_bytes=10)
+        >>> body, headers = transport._encode_json({"a": "x" * 20})
+        >>> headers["Content-Encoding"], json.loads(gzip.decompress(body))["a"][:3]
+        ('gzip', 'xxx')
+        >>> transport._encode_json({"a": 1})
+        (b'{"a": 1}', {'Content-Type': 'application/json'})
+    """
+
+    def __init__(self, pool_size: int = 16, compress_min_bytes: int = 0):
+        self.pool_size = max(1, pool_size)
+        self.compress_min_bytes = compress_min_bytes
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared session, recreated after a fork."""
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+                self._pid = os.getpid()
+            return self._session
+
+    def _encode_json(self, payload: Any) -> tuple[bytes, dict]:
+        try:
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        except ValueError as e:
+            raise requests.exceptions.InvalidJSONError(e)
+        headers = {"Content-Type": "application/json"}
+        if self.compress_min_bytes and len(body) >= self.compress_min_bytes:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request over the pooled session.
+
+        Takes the same arguments as ``requests.request``. A ``json`` payload
+        is serialized here so it can be compressed.
+        """
+        if json is not None:
+            body, json_headers = self._encode_json(json)
+            headers = {**json_headers, **(headers or {})}
+            kwargs["data"] = body
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def imap(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Call ``func`` on each item in parallel and yield results in input order.
+
+        ``func`` is expected to make its requests through this transport. At
+        most ``max_in_flight`` calls (default and cap: ``pool_size``) run at
+        once, so every request gets a pooled connection and only that many
+        results are held before the caller consumes them. An exception raised
+        by a call is re-raised when its result is reached, and calls not yet
+        started are cancelled.
+        """
+        items = iter(items)
+        window = min(max_in_flight or self.pool_size, self.pool_size)
+        if window <= 1:
+            for item in items:
+                yield func(item)
+            return
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            pending: deque = deque()
+            try:
+                for item in items:
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                    pending.append(pool.submit(func, item))
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def map(self, calls: Sequence[tuple[str, str, dict]]) -> list[requests.Response]:
+        """Send ``(method, url, kwargs)`` calls in parallel, in input order.
+
+        At most ``pool_size`` requests are in flight, so every request gets a
+        pooled connection. The first exception raised by a call is re-raised.
+        """
+        return list(
+            self.imap(lambda call: self.request(call[0], call[1], **call[2]), calls)
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_transport: Optional[CoopTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> CoopTransport:
+    """Return the process-wide transport shared by all Coop instances."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = CoopTransport(
+                pool_size=int(CONFIG.get("EDSL_COOP_POOL_SIZE")),
+                compress_min_bytes=int(CONFIG.get("EDSL_COOP_COMPRESS_MIN_BYTES")),
+            )
+        return _transport
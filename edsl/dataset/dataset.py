@@ -183,7 +183,51 @@ class Dataset(UserList, DatasetOperationsMixin, PersistenceMixin, HashingMixin):
             >>> d.filter('y < 3').data
             [{'x': ['a', 'b']}, {'y': [1, 2]}]
         """
-        return self.to_scenario_list().filter(expression).to_dataset()
+        columns, n_rows = self._expression_columns()
+        mask = self._evaluate_columns(expression, columns, n_rows)
+        if mask is None:
+            return self.to_scenario_list().filter(expression).to_dataset()
+        positions = [i for i, keep in enumerate(mask) if keep]
+        if not positions:
+            return Dataset([])
+        return Dataset(
+            [{key: [values[i] for i in positions]} for key, values in columns.items()]
+        )
+
+    def _expression_columns(self) -> tuple[dict[str, list], int]:
+        """Columns as ``filter``/``mutate`` expressions see them.
+
+        Mirrors ``to_scenario_list()``: prefixes are removed (a later column
+        wins over an earlier one with the same name) and every column is cut
+        to the length of the shortest one.
+        """
+        columns = {}
+        n_rows = None
+        for entry in self:
+            key, values = list(entry.items())[0]
+            columns[key.split(".")[-1]] = values
+            n_rows = len(values) if n_rows is None else min(n_rows, len(values))
+        n_rows = n_rows or 0
+        return {key: values[:n_rows] for key, values in columns.items()}, n_rows
+
+    @staticmethod
+    def _evaluate_columns(
+        expression: str,
+        columns: dict[str, list],
+        n_rows: int,
+        functions_dict: Optional[dict[str, Callable]] = None,
+    ) -> Optional[list]:
+        """Evaluate an expression a column at a time, or return None.
+
+        None means the expression has to go through the ScenarioList
+        implementation, which evaluates it row by row and raises its errors.
+        """
+        from ..utilities import CompiledExpression
+
+        compiled = CompiledExpression(expression, functions=functions_dict)
+        return compiled.evaluate_columns(
+            lambda name, attr: columns.get(name) if attr is None else None, n_rows
+        )
 
     def mutate(
         self, new_var_string: str, functions_dict: Optional[dict[str, Callable]] = None
@@ -204,9 +248,26 @@ class Dataset(UserList, DatasetOperationsMixin, PersistenceMixin, HashingMixin):
             >>> d.mutate('y = x * 2').data
             [{'x': [1, 2, 3]}, {'y': [2, 4, 6]}]
         """
-        return (
-            self.to_scenario_list().mutate(new_var_string, functions_dict).to_dataset()
-        )
+        from ..utilities import is_valid_variable_name
+
+        raw_var_name, _, expression = new_var_string.partition("=")
+        var_name = raw_var_name.strip()
+        values = None
+        if expression and is_valid_variable_name(var_name):
+            columns, n_rows = self._expression_columns()
+            values = self._evaluate_columns(
+                expression, columns, n_rows, dict(functions_dict or {})
+            )
+        if values is None:
+            return (
+                self.to_scenario_list()
+                .mutate(new_var_string, functions_dict)
+                .to_dataset()
+            )
+        if n_rows == 0:
+            return Dataset([])
+        columns[var_name] = values
+        return Dataset([{key: values} for key, values in columns.items()])
 
     def collapse(self, field: str, separator: Optional[str] = None) -> "Dataset":
         """Collapse multiple values in a field into a single value using a separator.
@@ -757,35 +818,26 @@ class Dataset(UserList, DatasetOperationsMixin, PersistenceMixin, HashingMixin):
             >>> merged = d1.merge(d2, 'id', 'id')
             >>> len(merged.data[0]['id'])
             2
+            >>> merged.data
+            [{'id': [1, 2]}, {'name': ['Alice', 'Bob']}, {'age': [None, 25]}]
         """
-        # Convert self to list of row dicts
         left_keys = [list(d.keys())[0] for d in self.data]
-        n_left = len(self.data[0][left_keys[0]])
-        left_rows = []
-        for i in range(n_left):
-            row = {k: self.data[j][k][i] for j, k in enumerate(left_keys)}
-            left_rows.append(row)
-
-        # Build lookup from other keyed by by_y
         right_keys = [list(d.keys())[0] for d in other.data]
-        n_right = len(other.data[0][right_keys[0]])
-        right_lookup = {}
-        for i in range(n_right):
-            key_val = other.data[right_keys.index(by_y)][by_y][i]
-            right_lookup[key_val] = {k: other.data[j][k][i] for j, k in enumerate(right_keys) if k != by_y}
-
-        # Left join
-        result_keys = left_keys + [k for k in right_keys if k != by_y]
-        result = {k: [] for k in result_keys}
-        for row in left_rows:
-            match = right_lookup.get(row[by_x], {})
-            for k in left_keys:
-                result[k].append(row[k])
-            for k in right_keys:
-                if k != by_y:
-                    result[k].append(match.get(k))
-
-        return Dataset([{k: result[k]} for k in result_keys])
+        left_columns = {k: self.data[j][k] for j, k in enumerate(left_keys)}
+        right_columns = {k: other.data[j][k] for j, k in enumerate(right_keys)}
+
+        # Hash join: index the right key column once (the last row wins for
+        # duplicate keys), then probe it with each left key
+        right_index = {value: i for i, value in enumerate(right_columns[by_y])}
+        matches = [right_index.get(value) for value in left_columns[by_x]]
+
+        result = [{k: list(left_columns[k])} for k in left_keys]
+        for k in right_keys:
+            if k == by_y:
+                continue
+            column = right_columns[k]
+            result.append({k: [None if i is None else column[i] for i in matches]})
+        return Dataset(result)
 
     def to(self, survey_or_question: Union["Survey", "QuestionBase"]) -> "Job":
         """Transform the dataset using a survey or question.
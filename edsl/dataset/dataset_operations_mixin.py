@@ -33,6 +33,51 @@ if TYPE_CHECKING:
     from ..jobs import Job  # noqa: F401
 
 
+_SQLITE_INT_MIN, _SQLITE_INT_MAX = -(2**63), 2**63 - 1
+
+# Declared type of boolean columns. sqlite3 converters are registered
+# process-wide by type name, so the name is private to edsl rather than the
+# common BOOLEAN another library may have its own converter for.
+_SQL_BOOLEAN = "EDSL_BOOLEAN"
+_sql_boolean_registered = False
+
+
+def _register_sql_boolean() -> None:
+    """Register the converter that reads ``_SQL_BOOLEAN`` columns as bool."""
+    global _sql_boolean_registered
+    if not _sql_boolean_registered:
+        import sqlite3
+
+        sqlite3.register_converter(_SQL_BOOLEAN, lambda raw: raw != b"0")
+        _sql_boolean_registered = True
+
+
+def _sql_text(value):
+    """Return ``value`` as the text a CSV export would hold (None when empty)."""
+    if isinstance(value, str):
+        return value or None
+    return None if value is None else str(value)
+
+
+def _sql_value(value):
+    """Return ``value`` as a SQLite parameter, keeping numbers and booleans typed."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value if _SQLITE_INT_MIN <= value <= _SQLITE_INT_MAX else str(value)
+    if isinstance(value, float):
+        return value
+    return _sql_text(value)
+
+
+def _sql_column_type(values) -> str:
+    """Declared SQLite type for a column: _SQL_BOOLEAN for booleans, else none."""
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, bool) for value in present):
+        return _SQL_BOOLEAN
+    return ""
+
+
 class DataOperationsBase:
     """
     Base class providing common data operations for EDSL container objects.
@@ -442,6 +487,14 @@ class DataOperationsBase:
     def _db(self, remove_prefix: bool = True, shape: str = "wide"):
         """Create a SQLite database in memory and return the connection.
 
+        Columns are loaded straight from the dataset, keeping their Python
+        types: integers and floats are stored as numbers, strings as text
+        and a column holding only booleans reads back as ``bool``. Booleans
+        in a column that also holds other values are stored as 1 and 0 and
+        read back that way, so a column mixing True with integers returns 1.
+        Empty strings become NULL, and anything else (lists, dicts, other
+        objects) is stored as its string form, as in a CSV export.
+
         Args:
             remove_prefix: Whether to remove the prefix from the column names
             shape: The shape of the data in the database ("wide" or "long")
@@ -457,57 +510,51 @@ class DataOperationsBase:
             >>> conn = Results.example()._db(shape = "long")
             >>> len(conn.execute("SELECT * FROM self").fetchall())
             208
+
+            >>> from edsl.dataset import Dataset
+            >>> conn = Dataset([{'a.code': ['007', '1e5']}, {'a.n': [1, 2.5]}, {'a.ok': [True, None]}])._db()
+            >>> conn.execute("SELECT code, n, ok FROM self").fetchall()
+            [('007', 1, True), ('1e5', 2.5, None)]
+            >>> Dataset([{'a.mixed': [True, 2]}])._db().execute("SELECT mixed FROM self").fetchall()
+            [(1,), (2,)]
         """
-        import csv
         import sqlite3
 
-        # Use to_csv to serialize all data to strings (handles complex objects)
-        csv_string = self.to_csv(remove_prefix=(remove_prefix and shape == "wide")).text
-        reader = csv.reader(io.StringIO(csv_string))
-        columns = next(reader)
-        rows = list(reader)
+        header, rows = self.make_tabular(remove_prefix=False)
+        columns = list(zip(*rows)) if rows else [()] * len(header)
 
-        conn = sqlite3.connect(":memory:")
+        _register_sql_boolean()
+        conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
 
         if shape == "long":
             conn.execute(
                 "CREATE TABLE self (row_number INTEGER, key TEXT, value TEXT, data_type TEXT)"
             )
-            row_num = 1
-            for col_name in columns:
-                col_idx = columns.index(col_name)
-                if "." in col_name:
-                    data_type = col_name.split(".")[0]
-                    key = ".".join(col_name.split(".")[1:])
-                else:
-                    data_type = None
-                    key = col_name
-                for row in rows:
-                    val = row[col_idx] if row[col_idx] != "" else None
-                    conn.execute(
-                        "INSERT INTO self VALUES (?, ?, ?, ?)",
-                        (row_num, key, val, data_type),
-                    )
-                    row_num += 1
-        else:
-            quoted_cols = [f'"{c}"' for c in columns]
-            conn.execute(f"CREATE TABLE self ({', '.join(quoted_cols)})")
-            placeholders = ", ".join(["?"] * len(columns))
-            for row in rows:
-                # Try to convert numeric strings back to numbers
-                typed_row = []
-                for val in row:
-                    if val == "":
-                        typed_row.append(None)
+
+            def long_rows():
+                row_num = 1
+                for col_name, values in zip(header, columns):
+                    if "." in col_name:
+                        data_type, key = col_name.split(".", 1)
                     else:
-                        try:
-                            typed_row.append(int(val))
-                        except ValueError:
-                            try:
-                                typed_row.append(float(val))
-                            except ValueError:
-                                typed_row.append(val)
-                conn.execute(f"INSERT INTO self VALUES ({placeholders})", typed_row)
+                        data_type, key = None, col_name
+                    for value in values:
+                        yield row_num, key, _sql_text(value), data_type
+                        row_num += 1
+
+            conn.executemany("INSERT INTO self VALUES (?, ?, ?, ?)", long_rows())
+        else:
+            definitions = []
+            for name, values in zip(header, columns):
+                if remove_prefix:
+                    name = name.split(".")[-1]
+                definitions.append(f'"{name}" {_sql_column_type(values)}'.rstrip())
+            conn.execute(f"CREATE TABLE self ({', '.join(definitions)})")
+            placeholders = ", ".join(["?"] * len(header))
+            conn.executemany(
+                f"INSERT INTO self VALUES ({placeholders})",
+                ([_sql_value(value) for value in row] for row in rows),
+            )
 
         conn.commit()
         return conn
@@ -525,8 +572,8 @@ class DataOperationsBase:
 
         This powerful method allows you to use SQL to query and transform your data,
         combining the expressiveness of SQL with EDSL's data structures. It works by
-        creating an in-memory SQLite database from your data and executing the query
-        against it.
+        loading your data into an in-memory SQLite database, with numbers, text and
+        booleans kept as typed values, and executing the query against it.
 
         Parameters:
             query: SQL query string to execute
@@ -545,6 +592,7 @@ class DataOperationsBase:
             - In wide format, column names include their type prefix unless remove_prefix=True
             - In long format, the data is melted into columns: row_number, key, value, data_type
             - Complex objects like lists and dictionaries are converted to strings
+            - Strings are never reinterpreted as numbers, so '007' stays '007'
 
         Examples:
             >>> from edsl import Results
@@ -595,10 +643,10 @@ class DataOperationsBase:
             return Dataset(result_entries)
 
         # Standard (non-transpose) case
-        result_entries = []
-        for i, col in enumerate(col_names):
-            result_entries.append({col: [row[i] for row in rows]})
-        return Dataset(result_entries)
+        columns = zip(*rows) if rows else [()] * len(col_names)
+        return Dataset(
+            [{col: list(values)} for col, values in zip(col_names, columns)]
+        )
 
     def to_pandas_for_display(self):
         """Convert to a pandas DataFrame for notebook display."""
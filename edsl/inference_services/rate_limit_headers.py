@@ -0,0 +1,199 @@
+"""
+Rate-limit state reported in inference provider response headers.
+
+Most providers say on every response how much of the caller's quota is left,
+and on a 429 how long to wait before retrying:
+
+- OpenAI and OpenAI-compatible services: ``x-ratelimit-limit-requests``,
+  ``x-ratelimit-remaining-requests`` and the same for ``-tokens``
+- Anthropic: ``anthropic-ratelimit-requests-limit``,
+  ``anthropic-ratelimit-requests-remaining`` and the same for ``-tokens``
+- ``retry-after`` (seconds or an HTTP date) and ``retry-after-ms``
+
+Services pass the headers of each live response, and of failed responses,
+to ``record_rate_limit_headers``. They are delivered to the innermost
+``collect_rate_limits`` block around the call; the Runner's execution
+workers open one per task and apply what they collect to the task's queue.
+Outside such a block recording does nothing, so services can call it
+unconditionally.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import inspect
+from typing import Any, Iterator, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class RateLimitHeaders:
+    """Quota figures from one provider response. Missing headers are None."""
+
+    limit_requests: Optional[float] = None
+    remaining_requests: Optional[float] = None
+    limit_tokens: Optional[float] = None
+    remaining_tokens: Optional[float] = None
+    retry_after: Optional[float] = None  # seconds
+
+
+_HEADER_FIELDS = {
+    "x-ratelimit-limit-requests": "limit_requests",
+    "x-ratelimit-remaining-requests": "remaining_requests",
+    "x-ratelimit-limit-tokens": "limit_tokens",
+    "x-ratelimit-remaining-tokens": "remaining_tokens",
+    "anthropic-ratelimit-requests-limit": "limit_requests",
+    "anthropic-ratelimit-requests-remaining": "remaining_requests",
+    "anthropic-ratelimit-tokens-limit": "limit_tokens",
+    "anthropic-ratelimit-tokens-remaining": "remaining_tokens",
+}
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Seconds to wait from a ``retry-after`` value.
+
+    >>> parse_retry_after("20")
+    20.0
+    >>> parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")
+    0.0
+    >>> parse_retry_after("soon") is None
+    True
+    """
+    seconds = _to_float(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_headers(
+    headers: Optional[Mapping[str, Any]],
+) -> Optional[RateLimitHeaders]:
+    """Read the rate-limit headers of a response, or None if it has none.
+
+    >>> parse_rate_limit_headers({
+    ...     "X-RateLimit-Limit-Requests": "500",
+    ...     "x-ratelimit-remaining-requests": "499",
+    ...     "x-ratelimit-remaining-tokens": "29000",
+    ... })
+    RateLimitHeaders(limit_requests=500.0, remaining_requests=499.0, limit_tokens=None, remaining_tokens=29000.0, retry_after=None)
+    >>> parse_rate_limit_headers({"retry-after-ms": "1500"}).retry_after
+    1.5
+    >>> parse_rate_limit_headers({"content-type": "application/json"}) is None
+    True
+    """
+    if not headers:
+        return None
+    lowered = {str(key).lower(): value for key, value in headers.items()}
+
+    values = {}
+    for header, field in _HEADER_FIELDS.items():
+        if header in lowered:
+            number = _to_float(lowered[header])
+            if number is not None:
+                values[field] = number
+
+    if "retry-after-ms" in lowered:
+        ms = _to_float(lowered["retry-after-ms"])
+        if ms is not None:
+            values["retry_after"] = max(0.0, ms / 1000.0)
+    elif "retry-after" in lowered:
+        retry_after = parse_retry_after(lowered["retry-after"])
+        if retry_after is not None:
+            values["retry_after"] = retry_after
+
+    return RateLimitHeaders(**values) if values else None
+
+
+_collector: ContextVar[Optional[list]] = ContextVar(
+    "rate_limit_collector", default=None
+)
+
+
+@contextmanager
+def collect_rate_limits() -> Iterator[list]:
+    """Collect the rate-limit headers recorded by calls made inside the block.
+
+    The collector is shared with tasks started inside the block (such as the
+    task ``asyncio.wait_for`` runs a model call in), so headers recorded there
+    are seen too.
+
+    >>> with collect_rate_limits() as observed:
+    ...     record_rate_limit_headers({"x-ratelimit-remaining-requests": "7"})
+    >>> observed[0].remaining_requests
+    7.0
+    >>> record_rate_limit_headers({"x-ratelimit-remaining-requests": "6"})
+    >>> len(observed)
+    1
+    """
+    observed: list = []
+    token = _collector.set(observed)
+    try:
+        yield observed
+    finally:
+        _collector.reset(token)
+
+
+def record_rate_limit_headers(headers: Optional[Mapping[str, Any]]) -> None:
+    """Record a response's rate-limit headers for the enclosing collector."""
+    observed = _collector.get()
+    if observed is None:
+        return
+    parsed = parse_rate_limit_headers(headers)
+    if parsed is not None:
+        observed.append(parsed)
+
+
+def record_error_rate_limit_headers(error: BaseException) -> None:
+    """Record the rate-limit headers of a failed response, if the error has one.
+
+    Provider SDK errors for HTTP status codes (OpenAI's and Anthropic's
+    ``APIStatusError``) keep the response as ``error.response``.
+    """
+    response = getattr(error, "response", None)
+    record_rate_limit_headers(getattr(response, "headers", None))
+
+
+async def create_with_rate_limits(resource, **params) -> Any:
+    """Call ``resource.create`` and record the response's rate-limit headers.
+
+    ``resource`` is an SDK resource such as ``client.chat.completions`` or
+    ``client.messages``. The call goes through its ``with_raw_response``
+    variant to see the headers, and the parsed response is returned as the
+    plain method would return it. Resources without that variant (such as
+    stand-in clients) are called directly. The headers of an error response
+    are recorded before the error is re-raised.
+    """
+    raw_resource = getattr(resource, "with_raw_response", None)
+    try:
+        if raw_resource is None:
+            return await resource.create(**params)
+        raw_response = await raw_resource.create(**params)
+    except Exception as e:
+        record_error_rate_limit_headers(e)
+        raise
+    record_rate_limit_headers(raw_response.headers)
+    # parse() is a coroutine on some SDKs' async raw responses
+    parsed = raw_response.parse()
+    if inspect.isawaitable(parsed):
+        parsed = await parsed
+    return parsed
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
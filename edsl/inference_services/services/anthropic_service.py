@@ -5,6 +5,7 @@ from anthropic import AsyncAnthropic
 
 from ..inference_service_abc import InferenceServiceABC
 from ..decorators import report_errors_async
+from ..rate_limit_headers import create_with_rate_limits
 from .message_builder import MessageBuilder
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
@@ -138,6 +139,54 @@ class AnthropicService(InferenceServiceABC):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, **kwargs)
 
+            def _messages_create_kwargs(
+                self,
+                system_prompt: str,
+                messages: List[dict],
+                response_schema: Optional[dict] = None,
+            ) -> dict[str, Any]:
+                """Build the keyword arguments for ``messages.create``."""
+                create_kwargs = dict(
+                    model=model_name,
+                    max_tokens=self.max_tokens,
+                    system=system_prompt,  # note that the Anthropic API uses "system" parameter rather than put it in the message
+                    messages=messages,
+                )
+                # Fable 5 / Opus 4.7+ / Sonnet 5 reject `temperature` entirely; omit it.
+                if not cls._temperature_unsupported(model_name):
+                    create_kwargs["temperature"] = cls._api_temperature(
+                        model_name, self.temperature
+                    )
+                if self.thinking is not None:
+                    create_kwargs["thinking"] = self.thinking
+                if self.output_config is not None:
+                    create_kwargs["output_config"] = self.output_config
+                if response_schema is not None:
+                    # Structured output: constrain the reply to the JSON schema
+                    create_kwargs["output_config"] = {
+                        **(self.output_config or {}),
+                        "format": {"type": "json_schema", "schema": response_schema},
+                    }
+                return create_kwargs
+
+            def batch_request_body(
+                self,
+                user_prompt: str,
+                system_prompt: str = "",
+                response_schema: Optional[dict] = None,
+                response_schema_name: Optional[str] = None,
+            ) -> dict[str, Any]:
+                """Return the request params used for this prompt in a batch job."""
+                messages = [
+                    {
+                        "role": "user",
+                        "content": [{"type": "text", "text": user_prompt}],
+                    }
+                ]
+                return self._messages_create_kwargs(
+                    system_prompt, messages, response_schema=response_schema
+                )
+
             @report_errors_async
             async def async_execute_model_call(
                 self,
@@ -145,6 +194,8 @@ class AnthropicService(InferenceServiceABC):
                 system_prompt: str = "",
                 files_list: Optional[List["Files"]] = None,
                 cache_key: Optional[str] = None,  # Cache key for tracking
+                response_schema: Optional[dict] = None,
+                response_schema_name: Optional[str] = None,
             ) -> dict[str, Any]:
                 """Calls the Anthropic API and returns the API response.
 
@@ -153,6 +204,9 @@ class AnthropicService(InferenceServiceABC):
                     system_prompt: The system message or context
                     files_list: Optional list of files to include
                     cache_key: Optional cache key for tracking
+                    response_schema: Optional JSON schema for structured output
+                    response_schema_name: Optional name of the schema (unused;
+                        Anthropic's structured output takes the schema only)
                 """
 
                 messages = [
@@ -224,24 +278,13 @@ class AnthropicService(InferenceServiceABC):
                                 }
                             )
                 client = AsyncAnthropic(api_key=self.api_token)
-
-                create_kwargs = dict(
-                    model=model_name,
-                    max_tokens=self.max_tokens,
-                    system=system_prompt,  # note that the Anthropic API uses "system" parameter rather than put it in the message
-                    messages=messages,
+                create_kwargs = self._messages_create_kwargs(
+                    system_prompt, messages, response_schema=response_schema
                 )
-                # Fable 5 / Opus 4.7+ / Sonnet 5 reject `temperature` entirely; omit it.
-                if not cls._temperature_unsupported(model_name):
-                    create_kwargs["temperature"] = cls._api_temperature(
-                        model_name, self.temperature
-                    )
-                if self.thinking is not None:
-                    create_kwargs["thinking"] = self.thinking
-                if self.output_config is not None:
-                    create_kwargs["output_config"] = self.output_config
 
-                response = await client.messages.create(**create_kwargs)
+                response = await create_with_rate_limits(
+                    client.messages, **create_kwargs
+                )
                 response_model = response.model_dump()
                 return response_model
 
@@ -5,6 +5,7 @@ import os
 from ..inference_service_abc import InferenceServiceABC
 from .message_builder import MessageBuilder
 from ..decorators import report_errors_async
+from ..rate_limit_headers import create_with_rate_limits
 from .service_enums import OPENAI_REASONING_MODELS, openai_requires_temperature_one
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
@@ -289,36 +290,15 @@ class OpenAIService(InferenceServiceABC):
 
                 return params
 
-            @report_errors_async
-            async def async_execute_model_call(
+            def _chat_completion_params(
                 self,
                 user_prompt: str,
                 system_prompt: str = "",
-                question_name: Optional[str] = None,
                 files_list: Optional[List["Files"]] = None,
-                invigilator: Optional[
-                    "InvigilatorAI"
-                ] = None,  # TBD - can eventually be used for function-calling
-                cache_key: Optional[str] = None,  # Cache key for tracking
                 response_schema: Optional[dict] = None,
                 response_schema_name: Optional[str] = None,
             ) -> dict[str, Any]:
-                """Calls the OpenAI API and returns the API response.
-
-                Args:
-                    user_prompt: The user's message or input
-                    system_prompt: System context or instructions
-                    question_name: Optional name of the question being asked
-                    files_list: Optional list of files to include
-                    invigilator: Optional invigilator for additional context
-                    cache_key: Optional cache key for tracking
-                    response_schema: Optional JSON schema for structured output (Pydantic model schema)
-                    response_schema_name: Optional name of the Pydantic model for the schema
-
-                Returns:
-                    dict: The model's response as a dictionary
-                """
-
+                """Build the chat completions request body for a prompt."""
                 # Use MessageBuilder to construct messages
                 supports_files_api = getattr(cls, "_supports_files_api_", True)
                 message_builder = MessageBuilder(
@@ -329,9 +309,8 @@ class OpenAIService(InferenceServiceABC):
                     omit_system_prompt_if_empty=self.omit_system_prompt_if_empty,
                     supports_files_api=supports_files_api,
                 )
-
-                client = self.async_client()
-                messages = message_builder.get_messages(sync_client=self.sync_client())
+                sync_client = self.sync_client() if files_list else None
+                messages = message_builder.get_messages(sync_client=sync_client)
 
                 # Use OpenAIParameterBuilder to construct parameters
                 params = OpenAIParameterBuilder.build_params(
@@ -360,9 +339,65 @@ class OpenAIService(InferenceServiceABC):
                     }
 
                 # Apply service-specific parameter filtering
-                params = self._filter_parameters_for_service(params)
+                return self._filter_parameters_for_service(params)
+
+            def batch_request_body(
+                self,
+                user_prompt: str,
+                system_prompt: str = "",
+                response_schema: Optional[dict] = None,
+                response_schema_name: Optional[str] = None,
+            ) -> dict[str, Any]:
+                """Return the request body used for this prompt in a batch job."""
+                return self._chat_completion_params(
+                    user_prompt,
+                    system_prompt,
+                    response_schema=response_schema,
+                    response_schema_name=response_schema_name,
+                )
+
+            @report_errors_async
+            async def async_execute_model_call(
+                self,
+                user_prompt: str,
+                system_prompt: str = "",
+                question_name: Optional[str] = None,
+                files_list: Optional[List["Files"]] = None,
+                invigilator: Optional[
+                    "InvigilatorAI"
+                ] = None,  # TBD - can eventually be used for function-calling
+                cache_key: Optional[str] = None,  # Cache key for tracking
+                response_schema: Optional[dict] = None,
+                response_schema_name: Optional[str] = None,
+            ) -> dict[str, Any]:
+                """Calls the OpenAI API and returns the API response.
+
+                Args:
+                    user_prompt: The user's message or input
+                    system_prompt: System context or instructions
+                    question_name: Optional name of the question being asked
+                    files_list: Optional list of files to include
+                    invigilator: Optional invigilator for additional context
+                    cache_key: Optional cache key for tracking
+                    response_schema: Optional JSON schema for structured output (Pydantic model schema)
+                    response_schema_name: Optional name of the Pydantic model for the schema
 
-                response = await client.chat.completions.create(**params)
+                Returns:
+                    dict: The model's response as a dictionary
+                """
+
+                client = self.async_client()
+                params = self._chat_completion_params(
+                    user_prompt,
+                    system_prompt,
+                    files_list=files_list,
+                    response_schema=response_schema,
+                    response_schema_name=response_schema_name,
+                )
+
+                response = await create_with_rate_limits(
+                    client.chat.completions, **params
+                )
 
                 return response.model_dump()
 
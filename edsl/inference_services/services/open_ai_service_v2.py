@@ -7,6 +7,7 @@ logger = logging.getLogger(__name__)
 
 from ..inference_service_abc import InferenceServiceABC
 from ..decorators import report_errors_async
+from ..rate_limit_headers import create_with_rate_limits
 from .service_enums import OPENAI_REASONING_MODELS, openai_requires_temperature_one
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
@@ -353,7 +354,9 @@ class OpenAIServiceV2(InferenceServiceABC):
                     f"is_reasoning={is_reasoning_model}, "
                     f"base_url={getattr(client, 'base_url', 'N/A')}"
                 )
-                response = await client.responses.create(**params)
+                response = await create_with_rate_limits(
+                    client.responses, **params
+                )
                 logger.info(
                     f"[OpenAI_V2] Response received: model={params.get('model')}, "
                     f"status={getattr(response, 'status', 'N/A')}"
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
 
 from .open_ai_service import OpenAIService
 from ..decorators import report_errors_async
+from ..rate_limit_headers import create_with_rate_limits
 
 if TYPE_CHECKING:
     from ...scenarios.file_store import FileStore as Files
@@ -170,7 +171,9 @@ class PerplexityService(OpenAIService):
                     # "top_logprobs": self.top_logprobs if self.logprobs else None,
                 }
                 print("calling the model", flush=True)
-                response = await client.chat.completions.create(**params)
+                response = await create_with_rate_limits(
+                    client.chat.completions, **params
+                )
                 return response.model_dump()
 
         LLM.__name__ = "LanguageModel"
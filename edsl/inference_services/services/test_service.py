@@ -78,7 +78,12 @@ class TestService(InferenceServiceABC):
                 question_name: Optional[str] = None,
                 cache_key: Optional[str] = None,  # Cache key for tracking
             ) -> dict[str, Any]:
-                await asyncio.sleep(0.1)
+                # ``latency`` may be a number of seconds or a callable taking the
+                # user prompt, which lets benchmarks inject per-call latency skew
+                latency = getattr(self, "latency", None)
+                if callable(latency):
+                    latency = latency(user_prompt)
+                await asyncio.sleep(0.1 if latency is None else latency)
 
                 if hasattr(self, "throw_exception") and self.throw_exception:
                     if hasattr(self, "exception_probability"):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Dict, Any, Optional, TYPE_CHECKING, Literal
 from functools import cached_property
+import copy
 import logging
 import re
 import time as _time
@@ -545,7 +546,7 @@ class PromptConstructor:
             current_answers: The dictionary of current answers to add
 
         Returns:
-            dict[str, QuestionBase]: The updated dictionary with answers added
+            dict[str, QuestionBase]: A new dictionary of shallow question copies with answers added
 
         Examples:
             >>> from edsl import QuestionFreeText
@@ -554,6 +555,10 @@ class PromptConstructor:
             >>> PromptConstructor._add_answers(d, current_answers)['q0'].answer
             'LOVE IT!'
         """
+        # Drawn surveys share question objects across interviews, so answers are
+        # written onto shallow copies rather than the survey's own questions.
+        answer_dict = {name: copy.copy(q) for name, q in answer_dict.items()}
+
         # Use singleton placeholders to avoid creating millions of objects
         pa = PromptConstructor._PLACEHOLDER_ANSWER
         pc = PromptConstructor._PLACEHOLDER_COMMENT
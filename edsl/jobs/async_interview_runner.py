@@ -6,8 +6,7 @@ with controlled concurrency, supporting both error handling and result collectio
 
 from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
-from typing import List, Generator, Tuple, TYPE_CHECKING, Optional
-from dataclasses import dataclass
+from typing import Iterable, Generator, Set, Tuple, TYPE_CHECKING, Optional
 import asyncio
 
 from .data_structures import RunConfig
@@ -25,35 +24,13 @@ if TYPE_CHECKING:
     from ..interviews import Interview
 
 
-@dataclass
-class InterviewBatch:
-    """Container for a batch of interviews being processed."""
-
-    chunks: List[Tuple[int, "Interview"]]
-    results: List[Tuple["Result", "Interview", int]]
-    failed: List[Tuple[int, "Interview", Exception]]
-
-    @classmethod
-    def create(cls, chunks: List[Tuple[int, "Interview"]]) -> "InterviewBatch":
-        """Create a new InterviewBatch with empty results and failed lists.
-
-        Args:
-        ----
-            chunks: List of tuples containing interview indices and Interview objects
-
-        Returns:
-        -------
-            A new InterviewBatch instance
-
-        """
-        return cls(chunks=chunks, results=[], failed=[])
-
-
 class AsyncInterviewRunner:
     """Runs interviews asynchronously with controlled concurrency.
 
     This class manages the parallel execution of multiple interviews while
-    respecting concurrency limits and handling errors appropriately.
+    respecting concurrency limits and handling errors appropriately. Interviews
+    are scheduled through a sliding window: a new interview starts as soon as
+    any in-flight one finishes, rather than waiting for a whole batch.
 
     Examples
     --------
@@ -83,9 +60,23 @@ class AsyncInterviewRunner:
         self.run_config = run_config
         self._initialized = asyncio.Event()
         self._logger = get_logger(__name__)
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of interviews currently running."""
+        return self._in_flight
+
+    @property
+    def peak_in_flight(self) -> int:
+        """Largest number of interviews that were running at the same time."""
+        return self._peak_in_flight
 
     @asynccontextmanager
-    async def _manage_tasks(self, tasks: List[asyncio.Task]) -> AsyncIterator[None]:
+    async def _manage_tasks(
+        self, tasks: Iterable[asyncio.Task]
+    ) -> AsyncIterator[None]:
         """Context manager for handling task lifecycle and cleanup."""
         try:
             yield
@@ -95,67 +86,97 @@ class AsyncInterviewRunner:
                     task.cancel()
 
     @asynccontextmanager
-    async def _interview_batch_processor(
+    async def _interview_window_processor(
         self,
     ) -> AsyncIterator[AsyncGenerator[tuple["Result", "Interview", int], None]]:
-        """Context manager for processing batches of interviews.
+        """Context manager for processing interviews through a sliding window.
 
-        Handles initialization, cleanup, and error management for the entire
-        interview processing lifecycle.
+        Keeps up to MAX_CONCURRENT interviews in flight. As soon as any
+        interview finishes, the next one is pulled from the generator, so a
+        single slow interview never holds back the rest of the job.
         """
         self._initialized.set()
         self._current_idx = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
         interview_generator = self._expand_interviews()
+        pending: Set[asyncio.Task] = set()
 
         try:
 
-            async def process_batches() -> (
+            async def process_window() -> (
                 AsyncGenerator[tuple["Result", "Interview", int], None]
             ):
-                import time
+                self._fill_window(interview_generator, pending)
 
-                batch_count = 0
-                while True:
-                    chunk = self._get_next_chunk(interview_generator)
-                    if not chunk:
-                        break
+                # Yield control to event loop to allow HTTP requests to process
+                await asyncio.sleep(0)
 
-                    batch_count += 1
-                    batch_start = time.time()
-                    self._logger.info(
-                        f"Processing batch {batch_count} with {len(chunk)} interviews"
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
                     )
+                    pending.difference_update(done)
+                    self._in_flight = len(pending)
 
-                    async with self._process_chunk(chunk) as results:
-                        for result_tuple in results:
-                            # Yield the full tuple (result, interview, idx)
-                            yield result_tuple
+                    # Refill before yielding so new interviews start while the
+                    # consumer is handling the finished ones
+                    self._fill_window(interview_generator, pending)
 
-                    batch_time = time.time() - batch_start
-                    self._logger.info(
-                        f"Batch {batch_count} completed in {batch_time:.3f}s "
-                        f"({batch_time/len(chunk):.3f}s per interview)"
-                    )
+                    for task in done:
+                        result_tuple = task.result()
+                        if result_tuple is None:
+                            continue
+                        yield result_tuple
 
-                    # Clean up chunk to help with garbage collection
-                    for idx, interview in chunk:
-                        # Explicitly clear any interview references when done with the chunk
+                        interview = result_tuple[1]
                         if hasattr(interview, "clear_references"):
                             interview.clear_references()
-                    del chunk
+                        del result_tuple
 
-                self._logger.info(f"All {batch_count} batches processed")
+                self._logger.info(
+                    f"All {self._current_idx} interviews processed "
+                    f"(peak concurrency: {self._peak_in_flight})"
+                )
 
-            yield process_batches()
+            async with self._manage_tasks(pending):
+                yield process_window()
 
         finally:
             # Cleanup code to help garbage collection
             self._current_idx = 0
+            self._in_flight = 0
             self._initialized.clear()
             # Clear the generator to avoid references
             if "interview_generator" in locals():
                 del interview_generator
 
+    def _fill_window(
+        self,
+        gen: Generator["Interview", None, None],
+        pending: Set[asyncio.Task],
+    ) -> int:
+        """Start interviews from the generator until MAX_CONCURRENT are in flight.
+
+        Returns the number of interviews started.
+        """
+        started = 0
+        while len(pending) < self.MAX_CONCURRENT:
+            try:
+                interview = next(gen)
+            except StopIteration:
+                break
+            pending.add(
+                asyncio.create_task(
+                    self._run_single_interview(interview, self._current_idx)
+                )
+            )
+            self._current_idx += 1
+            started += 1
+        self._in_flight = len(pending)
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        return started
+
     async def _run_single_interview(
         self, interview: "Interview", idx: int
     ) -> Optional[Tuple["Result", "Interview", int]]:
@@ -186,43 +207,6 @@ class AsyncInterviewRunner:
             # Could log the error here if needed
             return None
 
-    @asynccontextmanager
-    async def _process_chunk(
-        self, chunk: List[Tuple[int, "Interview"]]
-    ) -> AsyncIterator[List[Tuple["Result", "Interview", int]]]:
-        """Process a chunk of interviews concurrently."""
-        tasks = [
-            asyncio.create_task(self._run_single_interview(interview, idx))
-            for idx, interview in chunk
-        ]
-
-        # Yield control to event loop to allow HTTP requests to process
-        await asyncio.sleep(0)
-
-        async with self._manage_tasks(tasks):
-            results = await asyncio.gather(
-                *tasks,
-                return_exceptions=not self.run_config.parameters.stop_on_exception,
-            )
-            # Filter out None results and yield a new list to avoid keeping the original tuple references
-            valid_results = []
-            for r in results:
-                if r is not None:
-                    result, interview, idx = r
-                    # Create a new tuple to break reference to the original
-                    new_tuple = (result, interview, idx)
-                    valid_results.append(new_tuple)
-
-                    # Clear original tuple to help GC
-                    del r
-
-            yield valid_results
-
-            # Manually clean up the valid_results list and its contents to help garbage collection
-            for tup in valid_results:
-                del tup
-            del valid_results
-
     def _expand_interviews(self) -> Generator["Interview", None, None]:
         """Create multiple copies of each interview based on the run configuration.
 
@@ -258,26 +242,12 @@ class AsyncInterviewRunner:
                     interview.cache = self.run_config.environment.cache
                     yield interview
 
-    def _get_next_chunk(
-        self, gen: Generator["Interview", None, None]
-    ) -> List[Tuple[int, "Interview"]]:
-        """Take interviews from the generator up to MAX_CONCURRENT."""
-        chunk = []
-        while len(chunk) < self.MAX_CONCURRENT:
-            try:
-                interview = next(gen)
-                chunk.append((self._current_idx, interview))
-                self._current_idx += 1
-            except StopIteration:
-                break
-        return chunk
-
     async def run(self) -> AsyncGenerator[tuple["Result", "Interview", int], None]:
         """Run all interviews asynchronously and yield results as they complete.
 
         This method orchestrates the parallel execution of interviews while
-        maintaining controlled concurrency. Results are yielded as soon as
-        they become available.
+        maintaining controlled concurrency. Results are yielded in completion
+        order as soon as they become available.
 
         Yields
         ------
@@ -298,7 +268,7 @@ class AsyncInterviewRunner:
             f"Starting async interview runner with max concurrency: {self.MAX_CONCURRENT}"
         )
 
-        async with self._interview_batch_processor() as processor:
+        async with self._interview_window_processor() as processor:
             async for result_tuple in processor:
                 # For each result tuple in the processor
                 result, interview, idx = result_tuple
@@ -91,6 +91,13 @@ class RunParameters(Base):
         results_description (str, optional): Description for the initial results object created by remote inference. Only used with offloaded execution.
         task_timeout (int, optional): Maximum seconds allowed for each remotely
             executed interview. The service may impose an upper bound.
+        execution_mode (str): "live" to call model APIs directly, or "batch" to run
+            locally through the providers' batch APIs, one wave per dependency
+            level (default is "live")
+        batch_poll_interval (float): Seconds between batch status polls in batch
+            mode, default is 30
+        batch_timeout (float, optional): Seconds to wait for a provider batch before
+            failing in batch mode; None waits indefinitely
     """
 
     n: int = 1
@@ -129,6 +136,9 @@ class RunParameters(Base):
     results_description: Optional[str] = None
     task_timeout: Optional[int] = None
     max_concurrency: Optional[int] = None
+    execution_mode: str = "live"
+    batch_poll_interval: float = 30.0
+    batch_timeout: Optional[float] = None
 
     def to_dict(self, add_edsl_version=False) -> dict:
         d = asdict(self)
@@ -72,8 +72,21 @@ def with_config(f: Callable[P, T]) -> Callable[P, T]:
     return cast(Callable[P, T], wrapper)
 
 
+def lock_free(method: Callable[P, T]) -> Callable[P, T]:
+    """Exempt a method from ``synchronized_class``.
+
+    For methods that only read state, such as telemetry snapshots, which
+    should not wait on (or hold up) the instance lock.
+    """
+    method._lock_free = True
+    return method
+
+
 def synchronized_class(wrapped_class):
-    """Class decorator that makes all methods thread-safe."""
+    """Class decorator that makes all methods thread-safe.
+
+    Methods marked with ``lock_free`` are left as they are.
+    """
 
     # Add a lock to the class
     setattr(wrapped_class, "_lock", RLock())
@@ -87,6 +100,8 @@ def synchronized_class(wrapped_class):
             "__delitem__",
         ]:
             continue
+        if getattr(method, "_lock_free", False):
+            continue
 
         # Create synchronized version of the method
         def create_synchronized_method(method):
@@ -536,15 +536,24 @@ class Jobs(Base):
             system_prompt, user_prompt, price_lookup, inference_service, model
         )
 
-    def estimate_job_cost(self, iterations: int = 1) -> dict:
+    def estimate_job_cost(
+        self, iterations: int = 1, sample_size: Optional[int] = None
+    ) -> dict:
         """Estimate the cost of running the job.
 
         :param iterations: the number of iterations to run
+        :param sample_size: if set, estimate from a stratified sample of about
+            this many interviews instead of rendering every interview's prompts
         """
-        return JobsPrompts.from_jobs(self).estimate_job_cost(iterations)
+        return JobsPrompts.from_jobs(self, sample_size=sample_size).estimate_job_cost(
+            iterations
+        )
 
     def estimate_job_cost_from_external_prices(
-        self, price_lookup: dict, iterations: int = 1
+        self,
+        price_lookup: dict,
+        iterations: int = 1,
+        sample_size: Optional[int] = None,
     ) -> dict:
         """Estimate the cost of running the job using external price lookup.
 
@@ -552,6 +561,9 @@ class Jobs(Base):
         ----
             price_lookup: Dictionary containing price information.
             iterations: Number of iterations to run.
+            sample_size: If set, estimate from a stratified sample of about
+                this many interviews (per-model totals are scaled up from the
+                sample) instead of rendering every interview's prompts.
 
         Returns:
         -------
@@ -559,7 +571,7 @@ class Jobs(Base):
 
         """
         # Create JobsPrompts object
-        jobs_prompts = JobsPrompts.from_jobs(self)
+        jobs_prompts = JobsPrompts.from_jobs(self, sample_size=sample_size)
 
         # Call the actual estimation method
         result = jobs_prompts.estimate_job_cost_from_external_prices(
@@ -1508,6 +1520,13 @@ class Jobs(Base):
             f"Object validation completed in {time.time() - setup_start:.3f}s"
         )
 
+        # Batch mode submits provider batches from this machine with the user's keys
+        if self.run_config.parameters.execution_mode == "batch":
+            self.run_config.parameters.offload_execution = False
+            self.run_config.parameters.use_api_proxy = False
+            self.run_config.parameters.disable_remote_inference = True
+            self._logger.info("execution_mode='batch' - running locally via batch APIs")
+
         # Handle mutual exclusivity between use_api_proxy and offload_execution
         # If user explicitly sets use_api_proxy=True, it takes priority and disables offload_execution
         if self.run_config.parameters.use_api_proxy:
@@ -1821,6 +1840,9 @@ class Jobs(Base):
             cache=self.run_config.environment.cache,
             stop_on_exception=self.run_config.parameters.stop_on_exception,
             stream_to_cas=True,
+            execution_mode=self.run_config.parameters.execution_mode,
+            batch_poll_interval=self.run_config.parameters.batch_poll_interval,
+            batch_timeout=self.run_config.parameters.batch_timeout,
         )
         return handle.results(
             show_progress=self.run_config.parameters.progress_bar,
@@ -1895,6 +1917,16 @@ class Jobs(Base):
         results_description : str, optional
             Description for the initial results object. Only used with remote inference
             (offloaded execution).
+        execution_mode : str, optional
+            "live" (default) calls model APIs as interviews progress. "batch" runs
+            locally and sends each wave of prompts (one per level of the survey's
+            dependency graph) through the provider's batch API; responses are stored
+            in the cache and results are built as usual. Supported for OpenAI and
+            Anthropic models; other models and prompts with files run live.
+        batch_poll_interval : float, optional
+            Seconds between batch status polls in batch mode (default: 30)
+        batch_timeout : float, optional
+            Seconds to wait for each provider batch before failing (default: None)
 
         Returns
         -------
@@ -39,7 +39,6 @@ class InterviewsConstructor:
 
         """
         import time
-        from ..interviews import Interview
 
         global _create_interviews_timing
         method_start = time.time()
@@ -76,20 +75,7 @@ class InterviewsConstructor:
             _create_interviews_timing["survey_draw"] += time.time() - t5
 
             t6 = time.time()
-            interview = Interview(
-                survey=drawn_survey,
-                agent=agent,
-                scenario=scenario,
-                model=model,
-                cache=self.cache,
-                skip_retry=self.jobs.run_config.parameters.skip_retry,
-                raise_validation_errors=self.jobs.run_config.parameters.raise_validation_errors,
-                indices={
-                    "agent": agent._position_index,
-                    "model": model._position_index,
-                    "scenario": scenario._position_index,
-                },
-            )
+            interview = self._build_interview(drawn_survey, agent, scenario, model)
             _create_interviews_timing["interview_creation"] += time.time() - t6
 
             yield interview
@@ -97,6 +83,82 @@ class InterviewsConstructor:
         _create_interviews_timing["product_iteration"] += time.time() - t3
         _create_interviews_timing["total"] += time.time() - method_start
 
+    def create_sampled_interviews(
+        self, sample_size: int, seed: int = 0
+    ) -> Generator[tuple["Interview", float], None, None]:
+        """Generates a sample of the job's interviews with their weights.
+
+        The sample is stratified by model: for each model, at most
+        ``ceil(sample_size / n_models)`` (agent, scenario) pairs are drawn
+        without replacement, and each sampled interview is weighted by the
+        number of interviews it stands for. Summing a per-interview quantity
+        times its weight estimates the job total. Only the sampled
+        interviews are built, so the cost does not grow with the number of
+        agents and scenarios.
+
+        Include expressions are not supported; callers should use
+        create_interviews for filtered jobs.
+
+        >>> from edsl.jobs import Jobs
+        >>> j = Jobs.example()
+        >>> j.replace_missing_objects()
+        >>> sampled = list(InterviewsConstructor(j, cache=None).create_sampled_interviews(2))
+        >>> [weight for _, weight in sampled]
+        [2.0, 2.0]
+        >>> len(list(InterviewsConstructor(j, cache=None).create_sampled_interviews(10)))
+        4
+        """
+        import math
+        import random
+
+        agents, scenarios, models = (
+            self.jobs.agents,
+            self.jobs.scenarios,
+            self.jobs.models,
+        )
+        per_model = len(agents) * len(scenarios)
+        if per_model == 0 or not models:
+            return
+        k = max(1, math.ceil(sample_size / len(models)))
+        rng = random.Random(seed)
+
+        for model_index, model in enumerate(models):
+            model._position_index = model_index
+            if per_model <= k:
+                picks = range(per_model)
+            else:
+                picks = sorted(rng.sample(range(per_model), k))
+            weight = per_model / len(picks)
+            for pick in picks:
+                agent_index, scenario_index = divmod(pick, len(scenarios))
+                agent = agents[agent_index]
+                scenario = scenarios[scenario_index]
+                agent._position_index = agent_index
+                scenario._position_index = scenario_index
+                interview = self._build_interview(
+                    self.jobs.survey.draw(), agent, scenario, model
+                )
+                yield interview, weight
+
+    def _build_interview(self, survey, agent, scenario, model) -> "Interview":
+        """Create the Interview for one (agent, scenario, model) combination."""
+        from ..interviews import Interview
+
+        return Interview(
+            survey=survey,
+            agent=agent,
+            scenario=scenario,
+            model=model,
+            cache=self.cache,
+            skip_retry=self.jobs.run_config.parameters.skip_retry,
+            raise_validation_errors=self.jobs.run_config.parameters.raise_validation_errors,
+            indices={
+                "agent": agent._position_index,
+                "model": model._position_index,
+                "scenario": scenario._position_index,
+            },
+        )
+
 
 if __name__ == "__main__":
     # test_gc()
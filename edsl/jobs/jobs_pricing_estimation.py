@@ -1,7 +1,7 @@
 import logging
 import math
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .jobs import Jobs
@@ -109,28 +109,74 @@ class JobsPrompts:
     """
 
     @classmethod
-    def from_jobs(cls, jobs: "Jobs"):
-        """Construct a JobsPrompts object from a Jobs object."""
-        interviews = jobs.interviews()
+    def from_jobs(
+        cls, jobs: "Jobs", sample_size: Optional[int] = None, seed: int = 0
+    ):
+        """Construct a JobsPrompts object from a Jobs object.
+
+        If *sample_size* is given and the job has more interviews than that,
+        only a stratified sample of about *sample_size* interviews is built
+        (see ``InterviewsConstructor.create_sampled_interviews``), each
+        weighted by the number of interviews it stands for. Jobs with an
+        include_when filter or pre-built interviews are never sampled.
+
+        >>> from edsl.jobs import Jobs
+        >>> jp = JobsPrompts.from_jobs(Jobs.example(), sample_size=2)
+        >>> len(jp.interviews), jp.interview_weights
+        (2, [2.0, 2.0])
+        """
+        interview_weights = None
+        if sample_size is not None and cls._can_sample(jobs, sample_size):
+            from .jobs_interview_constructor import InterviewsConstructor
+
+            constructor = InterviewsConstructor(
+                jobs, cache=jobs.run_config.environment.cache
+            )
+            sampled = list(
+                constructor.create_sampled_interviews(sample_size, seed=seed)
+            )
+            interviews = [interview for interview, _ in sampled]
+            interview_weights = [weight for _, weight in sampled]
+        else:
+            interviews = jobs.interviews()
         agents = jobs.agents
         scenarios = jobs.scenarios
         survey = jobs.survey
         return cls(
-            interviews=interviews, agents=agents, scenarios=scenarios, survey=survey
+            interviews=interviews,
+            agents=agents,
+            scenarios=scenarios,
+            survey=survey,
+            interview_weights=interview_weights,
         )
 
+    @staticmethod
+    def _can_sample(jobs: "Jobs", sample_size: int) -> bool:
+        """Whether the job is an unfiltered product larger than *sample_size*."""
+        if getattr(jobs, "_interviews", None) or jobs._include_expression:
+            return False
+        jobs.replace_missing_objects()
+        n_interviews = len(jobs.agents) * len(jobs.scenarios) * len(jobs.models)
+        return n_interviews > sample_size
+
     def __init__(
         self,
         interviews: List["Interview"],
         agents: "AgentList",
         scenarios: "ScenarioList",
         survey: "Survey",
+        interview_weights: Optional[List[float]] = None,
     ):
-        """Initialize with extracted components rather than a Jobs object."""
+        """Initialize with extracted components rather than a Jobs object.
+
+        *interview_weights*, if given, holds the number of job interviews
+        each interview stands for when the interviews are a sample.
+        """
         self.interviews = interviews
         self.agents = agents
         self.scenarios = scenarios
         self.survey = survey
+        self.interview_weights = interview_weights
         self._price_lookup = None
 
         self._agent_lookup = {agent: idx for idx, agent in enumerate(self.agents)}
@@ -310,11 +356,21 @@ class JobsPrompts:
         Key assumptions:
         - 1 token = 4 characters.
         - For each prompt, output tokens = input tokens * 0.75, rounded up to the nearest integer.
+
+        If the interviews are a weighted sample (see ``from_jobs``), each
+        prompt's tokens and cost count once per interview it stands for, and
+        the output also reports ``sampled_interviews`` and
+        ``total_interviews``.
         """
         # Collect all prompt data
         data = []
 
         for interview_idx, interview in enumerate(self.interviews):
+            weight = (
+                self.interview_weights[interview_idx]
+                if self.interview_weights is not None
+                else 1
+            )
             invigilators = [
                 FetchInvigilator(interview)(question)
                 for question in self.survey.questions
@@ -336,11 +392,12 @@ class JobsPrompts:
                     "estimated_output_price_per_million_tokens": prompt_cost[
                         "output_price_per_million_tokens"
                     ],
-                    "estimated_input_tokens": prompt_cost["input_tokens"],
-                    "estimated_output_tokens": prompt_cost["output_tokens"],
-                    "estimated_input_cost_usd": prompt_cost["input_cost_usd"],
-                    "estimated_output_cost_usd": prompt_cost["output_cost_usd"],
-                    "estimated_cost_usd": prompt_cost["cost_usd"],
+                    "estimated_input_tokens": prompt_cost["input_tokens"] * weight,
+                    "estimated_output_tokens": prompt_cost["output_tokens"] * weight,
+                    "estimated_input_cost_usd": prompt_cost["input_cost_usd"] * weight,
+                    "estimated_output_cost_usd": prompt_cost["output_cost_usd"]
+                    * weight,
+                    "estimated_cost_usd": prompt_cost["cost_usd"] * weight,
                 }
                 data.append(
                     {
@@ -365,6 +422,8 @@ class JobsPrompts:
         for group in detailed_groups.values():
             group["tokens"] *= iterations
             group["cost_usd"] *= iterations
+            if self.interview_weights is not None:
+                group["tokens"] = round(group["tokens"])
             detailed_costs.append(group)
 
         # Convert to credits
@@ -395,6 +454,9 @@ class JobsPrompts:
             "estimated_total_output_tokens": estimated_total_output_tokens,
             "detailed_costs": detailed_costs,
         }
+        if self.interview_weights is not None:
+            output["sampled_interviews"] = len(self.interviews)
+            output["total_interviews"] = round(sum(self.interview_weights))
 
         return output
 
@@ -237,26 +237,24 @@ class JobsRunnerStatusBase(ABC):
                 model_name = model.model
                 model_queues[model_name] = {
                     "language_model_name": model_name,
-                    "requests_bucket": {
-                        "completed": bucket.requests_bucket.num_released,
-                        "requested": bucket.requests_bucket.num_requests,
-                        "tokens_returned": bucket.requests_bucket.tokens_returned,
-                        "target_rate": round(bucket.requests_bucket.target_rate, 1),
-                        "current_rate": round(
-                            bucket.requests_bucket.get_throughput(), 1
-                        ),
-                    },
-                    "tokens_bucket": {
-                        "completed": bucket.tokens_bucket.num_released,
-                        "requested": bucket.tokens_bucket.num_requests,
-                        "tokens_returned": bucket.tokens_bucket.tokens_returned,
-                        "target_rate": round(bucket.tokens_bucket.target_rate, 1),
-                        "current_rate": round(bucket.tokens_bucket.get_throughput(), 1),
-                    },
+                    "requests_bucket": self._bucket_status(bucket.requests_bucket),
+                    "tokens_bucket": self._bucket_status(bucket.tokens_bucket),
                 }
         status_dict["language_model_queues"] = model_queues
         return status_dict
 
+    @staticmethod
+    def _bucket_status(bucket) -> dict:
+        """Progress fields for one token bucket, from its metrics snapshot."""
+        metrics = bucket.metrics()
+        return {
+            "completed": metrics["num_released"],
+            "requested": metrics["num_requests"],
+            "tokens_returned": metrics["tokens_returned"],
+            "target_rate": round(bucket.target_rate, 1),
+            "current_rate": round(metrics["throughput"], 1),
+        }
+
     def add_completed_question(self, model_name: str, question_name: str):
         """Records a single completed question for real-time progress tracking."""
         self.stats_tracker.questions_answered += 1
@@ -1,5 +1,6 @@
 from typing import Optional, Union, Literal, TYPE_CHECKING, NewType, Callable, Any
 from dataclasses import dataclass
+import json
 import time
 from datetime import datetime
 
@@ -14,12 +15,36 @@ Seconds = NewType("Seconds", float)
 JobUUID = NewType("JobUUID", str)
 
 if TYPE_CHECKING:
-    from ..results import Results
+    from ..results import Result, Results
     from .jobs import Jobs
     from ..coop.utils import VisibilityType
     from ..coop.coop import RemoteInferenceResponse, RemoteInferenceCreationInfo
 
 
+class _InternedObjects:
+    """Deserialize each distinct agent, scenario and model dict only once.
+
+    Interviews of a job share a handful of agents, scenarios and models, and
+    every results page repeats their dicts. Equal dicts map to one shared
+    object, as they would in Results built by a local run.
+
+    >>> interned = _InternedObjects()
+    >>> a = interned.get("scenario", {"x": 1, "y": 2}, dict)
+    >>> a is interned.get("scenario", {"y": 2, "x": 1}, dict)
+    True
+    """
+
+    def __init__(self):
+        self._objects: dict = {}
+
+    def get(self, kind: str, data: dict, from_dict: Callable[[dict], Any]) -> Any:
+        key = (kind, json.dumps(data, sort_keys=True, default=str))
+        obj = self._objects.get(key)
+        if obj is None:
+            obj = self._objects[key] = from_dict(data)
+        return obj
+
+
 class RemoteJobConstants:
     """Constants for remote job handling."""
 
@@ -698,10 +723,7 @@ class JobsRemoteInferenceHandler:
         and builds Result objects locally.
         """
         from ..coop import Coop
-        from ..results import Results, Result
-        from ..agents import Agent
-        from ..scenarios import Scenario
-        from ..language_models import LanguageModel
+        from ..results import Results
 
         coop = Coop(api_key=self.api_key)
 
@@ -718,118 +740,20 @@ class JobsRemoteInferenceHandler:
             else JobsStatus.PARTIALLY_FAILED,
         )
 
-        # Step 2: Fetch pages and build Result objects locally
+        # Step 2: Fetch pages in parallel and build Result objects locally as
+        # they arrive
+        survey = self.jobs.survey if self.jobs else None
+        interned = _InternedObjects()
         result_list = []
         fetched = 0
 
-        for page_num in range(page_count):
-            page_data = coop.remote_inference_results_page(
-                job_info.job_uuid, page=page_num, page_size=page_size
-            )
-
+        for page_data in coop.iter_remote_inference_results_pages(
+            job_info.job_uuid, page_count, page_size=page_size
+        ):
             for interview in page_data.get("interviews", []):
-                # Deserialize EDSL objects from raw dicts
-                agent_data = interview.get("agent") or {}
-                scenario_data = interview.get("scenario") or {}
-                model_data = interview.get("model") or {}
-                iteration = interview.get("iteration", 0)
-                answers_raw = interview.get("answers", [])
-
-                agent = Agent.from_dict(agent_data) if agent_data else Agent()
-                scenario = (
-                    Scenario.from_dict(scenario_data) if scenario_data else Scenario()
-                )
-                model = LanguageModel.from_dict(model_data) if model_data else None
-
-                # Build answer dicts matching EDSL Result structure
-                answer_dict = {}
-                prompt_dict = {}
-                raw_model_response_dict = {}
-                generated_tokens_dict = {}
-                comments_dict = {}
-                reasoning_summaries_dict = {}
-                cache_used_dict = {}
-                cache_keys = {}
-                validated_dict = {}
-
-                for a in answers_raw:
-                    qname = a["question_name"]
-                    # Answers cross the wire as JSON, so EDSL-object answers
-                    # (image_generation returns a FileStore) arrive as dicts and
-                    # have to be rebuilt into live objects.
-                    answer_dict[qname] = _decode_answer_value(a.get("answer"))
-                    prompt_dict[f"{qname}_user_prompt"] = Prompt(
-                        text=a.get("user_prompt") or ""
-                    )
-                    prompt_dict[f"{qname}_system_prompt"] = Prompt(
-                        text=a.get("system_prompt") or ""
-                    )
-                    raw_model_response_dict[f"{qname}_raw_model_response"] = a.get(
-                        "raw_model_response"
-                    )
-                    raw_model_response_dict[f"{qname}_input_tokens"] = a.get(
-                        "input_tokens"
-                    )
-                    raw_model_response_dict[f"{qname}_output_tokens"] = a.get(
-                        "output_tokens"
-                    )
-                    raw_model_response_dict[f"{qname}_thinking_tokens"] = a.get(
-                        "thinking_tokens"
-                    )
-                    raw_model_response_dict[
-                        f"{qname}_input_price_per_million_tokens"
-                    ] = a.get("input_price_per_million_tokens")
-                    raw_model_response_dict[
-                        f"{qname}_output_price_per_million_tokens"
-                    ] = a.get("output_price_per_million_tokens")
-
-                    # Calculate cost (thinking tokens charged at output rate)
-                    total_cost = None
-                    input_tokens = a.get("input_tokens")
-                    output_tokens = a.get("output_tokens")
-                    thinking_tokens = a.get("thinking_tokens") or 0
-                    if input_tokens is not None and output_tokens is not None:
-                        input_price = a.get("input_price_per_million_tokens") or 0
-                        output_price = a.get("output_price_per_million_tokens") or 0
-                        total_cost = (input_price / 1_000_000 * input_tokens) + (
-                            output_price / 1_000_000 * (output_tokens + thinking_tokens)
-                        )
-                    raw_model_response_dict[f"{qname}_cost"] = total_cost
-                    one_usd_buys = (
-                        "NA"
-                        if total_cost is None or total_cost == 0
-                        else 1.0 / total_cost
-                    )
-                    raw_model_response_dict[f"{qname}_one_usd_buys"] = one_usd_buys
-
-                    generated_tokens_dict[f"{qname}_generated_tokens"] = a.get(
-                        "generated_tokens"
-                    )
-                    comments_dict[f"{qname}_comment"] = a.get("comment")
-                    reasoning_summaries_dict[f"{qname}_reasoning_summary"] = a.get(
-                        "reasoning_summary"
-                    )
-                    cache_used_dict[qname] = a.get("cached", False)
-                    cache_keys[qname] = a.get("cache_key")
-                    validated_dict[f"{qname}_validated"] = a.get("validated")
-
-                result = Result(
-                    agent=agent,
-                    scenario=scenario,
-                    model=model,
-                    iteration=iteration,
-                    answer=answer_dict,
-                    prompt=prompt_dict,
-                    raw_model_response=raw_model_response_dict,
-                    survey=self.jobs.survey if self.jobs else None,
-                    generated_tokens=generated_tokens_dict,
-                    comments_dict=comments_dict,
-                    reasoning_summaries_dict=reasoning_summaries_dict,
-                    cache_used_dict=cache_used_dict,
-                    cache_keys=cache_keys,
-                    validated_dict=validated_dict,
+                result_list.append(
+                    self._result_from_interview(interview, survey, interned)
                 )
-                result_list.append(result)
                 fetched += 1
 
             # Update progress
@@ -841,10 +765,7 @@ class JobsRemoteInferenceHandler:
             )
 
         # Step 3: Build the Results object
-        results = Results(
-            survey=self.jobs.survey if self.jobs else None,
-            data=result_list,
-        )
+        results = Results(survey=survey, data=result_list)
 
         # Runner streaming can finish before Coop assigns results_uuid; poll briefly.
         self._log_results_metadata(
@@ -913,6 +834,121 @@ class JobsRemoteInferenceHandler:
             results.results_uuid = results_uuid
         return results
 
+    def _result_from_interview(
+        self, interview: dict, survey, interned: "_InternedObjects"
+    ) -> "Result":
+        """Build a Result from one raw interview dict of a results page."""
+        from ..results import Result
+        from ..agents import Agent
+        from ..scenarios import Scenario
+        from ..language_models import LanguageModel
+
+        # Deserialize EDSL objects from raw dicts
+        agent_data = interview.get("agent") or {}
+        scenario_data = interview.get("scenario") or {}
+        model_data = interview.get("model") or {}
+        iteration = interview.get("iteration", 0)
+        answers_raw = interview.get("answers", [])
+
+        agent = (
+            interned.get("agent", agent_data, Agent.from_dict)
+            if agent_data
+            else Agent()
+        )
+        scenario = (
+            interned.get("scenario", scenario_data, Scenario.from_dict)
+            if scenario_data
+            else Scenario()
+        )
+        model = (
+            interned.get("model", model_data, LanguageModel.from_dict)
+            if model_data
+            else None
+        )
+
+        # Build answer dicts matching EDSL Result structure
+        answer_dict = {}
+        prompt_dict = {}
+        raw_model_response_dict = {}
+        generated_tokens_dict = {}
+        comments_dict = {}
+        reasoning_summaries_dict = {}
+        cache_used_dict = {}
+        cache_keys = {}
+        validated_dict = {}
+
+        for a in answers_raw:
+            qname = a["question_name"]
+            # Answers cross the wire as JSON, so EDSL-object answers
+            # (image_generation returns a FileStore) arrive as dicts and
+            # have to be rebuilt into live objects.
+            answer_dict[qname] = _decode_answer_value(a.get("answer"))
+            prompt_dict[f"{qname}_user_prompt"] = Prompt(
+                text=a.get("user_prompt") or ""
+            )
+            prompt_dict[f"{qname}_system_prompt"] = Prompt(
+                text=a.get("system_prompt") or ""
+            )
+            raw_model_response_dict[f"{qname}_raw_model_response"] = a.get(
+                "raw_model_response"
+            )
+            raw_model_response_dict[f"{qname}_input_tokens"] = a.get("input_tokens")
+            raw_model_response_dict[f"{qname}_output_tokens"] = a.get("output_tokens")
+            raw_model_response_dict[f"{qname}_thinking_tokens"] = a.get(
+                "thinking_tokens"
+            )
+            raw_model_response_dict[f"{qname}_input_price_per_million_tokens"] = a.get(
+                "input_price_per_million_tokens"
+            )
+            raw_model_response_dict[f"{qname}_output_price_per_million_tokens"] = a.get(
+                "output_price_per_million_tokens"
+            )
+
+            # Calculate cost (thinking tokens charged at output rate)
+            total_cost = None
+            input_tokens = a.get("input_tokens")
+            output_tokens = a.get("output_tokens")
+            thinking_tokens = a.get("thinking_tokens") or 0
+            if input_tokens is not None and output_tokens is not None:
+                input_price = a.get("input_price_per_million_tokens") or 0
+                output_price = a.get("output_price_per_million_tokens") or 0
+                total_cost = (input_price / 1_000_000 * input_tokens) + (
+                    output_price / 1_000_000 * (output_tokens + thinking_tokens)
+                )
+            raw_model_response_dict[f"{qname}_cost"] = total_cost
+            one_usd_buys = (
+                "NA" if total_cost is None or total_cost == 0 else 1.0 / total_cost
+            )
+            raw_model_response_dict[f"{qname}_one_usd_buys"] = one_usd_buys
+
+            generated_tokens_dict[f"{qname}_generated_tokens"] = a.get(
+                "generated_tokens"
+            )
+            comments_dict[f"{qname}_comment"] = a.get("comment")
+            reasoning_summaries_dict[f"{qname}_reasoning_summary"] = a.get(
+                "reasoning_summary"
+            )
+            cache_used_dict[qname] = a.get("cached", False)
+            cache_keys[qname] = a.get("cache_key")
+            validated_dict[f"{qname}_validated"] = a.get("validated")
+
+        return Result(
+            agent=agent,
+            scenario=scenario,
+            model=model,
+            iteration=iteration,
+            answer=answer_dict,
+            prompt=prompt_dict,
+            raw_model_response=raw_model_response_dict,
+            survey=survey,
+            generated_tokens=generated_tokens_dict,
+            comments_dict=comments_dict,
+            reasoning_summaries_dict=reasoning_summaries_dict,
+            cache_used_dict=cache_used_dict,
+            cache_keys=cache_keys,
+            validated_dict=validated_dict,
+        )
+
     def _attempt_fetch_job(
         self,
         job_info: RemoteJobInfo,
@@ -65,6 +65,7 @@ from ..key_management import KeyLookupCollection
 
 from .registry import RegisterLanguageModelsMeta
 from .raw_response_handler import RawResponseHandler
+from .single_flight import single_flight
 
 _INTERNAL_KWARGS = frozenset(
     {
@@ -79,6 +80,7 @@ _INTERNAL_KWARGS = frozenset(
         "throw_exception",
         "exception_probability",
         "func",
+        "latency",
         "fail_at_number",
         "never_ending",
         "prompt_plan",
@@ -835,6 +837,66 @@ class LanguageModel(
             raw_response, is_free_text=is_free_text
         )
 
+    def add_prefetched_responses(self, responses: dict[str, dict]) -> None:
+        """Register raw responses obtained outside a live call, keyed by cache key.
+
+        On a cache miss for one of these keys the registered response is used
+        instead of calling the API, and then stored and parsed as usual. The
+        batch execution mode uses this to feed provider batch output back
+        through the normal response path.
+
+        >>> from edsl import Cache
+        >>> from edsl.caching import CacheEntry
+        >>> m = LanguageModel.example(test_model=True, canned_response="Hi")
+        >>> key = CacheEntry.gen_key(**m._cache_call_params("Hello", "sys"))
+        >>> m.add_prefetched_responses({key: {"message": [{"text": "Batched"}]}})
+        >>> m._get_intended_model_call_outcome(user_prompt="Hello", system_prompt="sys", cache=Cache()).response
+        {'message': [{'text': 'Batched'}]}
+        >>> m.clear_prefetched_responses()
+        """
+        self.__dict__.setdefault("_prefetched_responses", {}).update(responses)
+
+    def clear_prefetched_responses(self) -> None:
+        """Drop responses registered with ``add_prefetched_responses``."""
+        self.__dict__.pop("_prefetched_responses", None)
+
+    def _cache_call_params(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        iteration: int = 0,
+        files_list: Optional[List["FileStore"]] = None,
+    ) -> dict:
+        """Return the keyword arguments identifying this call in a Cache.
+
+        These are the arguments ``Cache.fetch`` and ``Cache.store`` expect, so
+        callers that obtain responses outside of a live model call (e.g. the
+        batch execution mode) store them under the same key.
+
+        >>> m = LanguageModel.example(test_model=True, canned_response="Hi")
+        >>> sorted(m._cache_call_params("Hello", "sys"))
+        ['iteration', 'model', 'parameters', 'system_prompt', 'user_prompt']
+        >>> "canned_response" in m._cache_call_params("Hello", "sys")["parameters"]
+        False
+        """
+        # Add file hashes to the prompt if files are provided
+        if files_list:
+            files_hash = "+".join(sorted([str(hash(file)) for file in files_list]))
+            user_prompt_with_hashes = user_prompt + f" {files_hash}"
+        else:
+            user_prompt_with_hashes = user_prompt
+        # Prepare parameters for cache lookup
+        cache_parameters = self.parameters.copy()
+        if self.model == "test":
+            cache_parameters.pop("canned_response", None)
+        return {
+            "model": str(self.model),
+            "parameters": cache_parameters,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt_with_hashes,
+            "iteration": iteration,
+        }
+
     async def _async_get_intended_model_call_outcome(
         self,
         user_prompt: str,
@@ -855,7 +917,7 @@ class LanguageModel(
         the complete workflow of:
         1. Creating a cache key from the prompts and parameters
         2. Checking if the response is already in the cache
-        3. Making the API call if needed
+        3. Making the API call if needed, or awaiting an identical call already in flight
         4. Storing new responses in the cache
         5. Adding metadata like cost and cache status
 
@@ -876,23 +938,9 @@ class LanguageModel(
             >>> m._get_intended_model_call_outcome(user_prompt="Hello", system_prompt="hello", cache=Cache())
             ModelResponse(...)
         """
-        # Add file hashes to the prompt if files are provided
-        if files_list:
-            files_hash = "+".join(sorted([str(hash(file)) for file in files_list]))
-            user_prompt_with_hashes = user_prompt + f" {files_hash}"
-        else:
-            user_prompt_with_hashes = user_prompt
-        # Prepare parameters for cache lookup
-        cache_parameters = self.parameters.copy()
-        if self.model == "test":
-            cache_parameters.pop("canned_response", None)
-        cache_call_params = {
-            "model": str(self.model),
-            "parameters": cache_parameters,
-            "system_prompt": system_prompt,
-            "user_prompt": user_prompt_with_hashes,
-            "iteration": iteration,
-        }
+        cache_call_params = self._cache_call_params(
+            user_prompt, system_prompt, iteration, files_list
+        )
         # Try to fetch from cache
         # This if figuring out if we need to go back to a remote
         # server and get a cache response because the question contains
@@ -908,7 +956,7 @@ class LanguageModel(
         else:
             remote_fetch = False
 
-        cached_response, cache_key = cache.fetch(
+        cached_response, cache_key = await cache.async_fetch(
             **cache_call_params, remote_fetch=remote_fetch
         )
 
@@ -977,14 +1025,49 @@ class LanguageModel(
             # Get timeout from configuration
             TIMEOUT = self._compute_timeout(files_list)
 
-            # Execute the model call with timeout
-            response = await asyncio.wait_for(f(**params), timeout=TIMEOUT)
+            prefetched = self.__dict__.get("_prefetched_responses") or {}
 
-            # Store the response in the cache
-            new_cache_key = cache.store(
-                **cache_call_params, response=response, service=self._inference_service_
-            )
-            assert new_cache_key == cache_key  # Verify cache key integrity
+            async def call_and_store():
+                if cache_key in prefetched:
+                    # Response already obtained, e.g. from a provider batch
+                    response = prefetched[cache_key]
+                else:
+                    # Execute the model call with timeout
+                    response = await asyncio.wait_for(f(**params), timeout=TIMEOUT)
+
+                # Store the response in the cache
+                new_cache_key = await cache.async_store(
+                    **cache_call_params,
+                    response=response,
+                    service=self._inference_service_,
+                )
+                assert new_cache_key == cache_key  # Verify cache key integrity
+                return response
+
+            # Identical calls already in flight are awaited rather than
+            # repeated, but only where waiting stands in for a cache hit: on
+            # the same cache, one that serves what it stores (cache=False runs
+            # defer every write), and for the same per-interview inputs that
+            # test and scripted models answer from.
+            if getattr(cache, "immediate_write", True):
+                flight_key = (cache_key, id(cache)) + tuple(
+                    (name, params[name])
+                    for name in ("agent_name", "question_name")
+                    if name in params
+                )
+                if "invigilator" in params:
+                    flight_key += (
+                        ("agent", id(invigilator.agent)),
+                        ("question_name", invigilator.question.question_name),
+                    )
+                response, deduplicated = await single_flight(
+                    flight_key, call_and_store
+                )
+                if deduplicated:
+                    cache_used = True
+                    cached_response = json.dumps(response)
+            else:
+                response = await call_and_store()
 
         # Calculate cost for the response
         cost = self.cost(response)
@@ -0,0 +1,111 @@
+"""Single-flight deduplication of identical in-flight model calls.
+
+When two interviews build the same cache key at the same time, both miss the
+cache and both would pay for the API call. ``single_flight`` lets the first
+caller (the leader) make the call while later callers with the same key await
+the leader's result instead. Failures raised by the leader are re-raised in
+every follower, so callers see the same exceptions they would have seen had
+they made the call themselves.
+
+The registry is process-wide and keyed by the caller's key (the
+``CacheEntry.gen_key`` value, plus whatever else the call's answer depends on)
+and the running event loop, since asyncio futures cannot be awaited across
+loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+_single_flight_lock = threading.Lock()
+_in_flight: Dict[Tuple[int, Hashable], "asyncio.Future"] = {}
+_single_flight_stats = {
+    "calls": 0,
+    "deduplicated": 0,
+    "shared_failures": 0,
+}
+
+
+def reset_single_flight_stats() -> None:
+    """Reset the counters returned by ``get_single_flight_stats``."""
+    with _single_flight_lock:
+        for k in _single_flight_stats:
+            _single_flight_stats[k] = 0
+
+
+def get_single_flight_stats() -> dict:
+    """Return counters for calls made and calls deduplicated.
+
+    >>> reset_single_flight_stats()
+    >>> get_single_flight_stats()
+    {'calls': 0, 'deduplicated': 0, 'shared_failures': 0}
+    """
+    with _single_flight_lock:
+        return dict(_single_flight_stats)
+
+
+async def single_flight(
+    key: Hashable, call: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """Run ``call`` once among concurrent callers sharing ``key``.
+
+    Returns a ``(result, deduplicated)`` tuple where ``deduplicated`` is True if
+    the result came from another caller's in-flight call. If the leader is
+    cancelled, waiting followers retry and one of them becomes the new leader.
+
+    >>> async def main():
+    ...     calls = []
+    ...     async def call():
+    ...         calls.append(1)
+    ...         await asyncio.sleep(0.01)
+    ...         return "answer"
+    ...     results = await asyncio.gather(*(single_flight("k", call) for _ in range(3)))
+    ...     return results, len(calls)
+    >>> asyncio.run(main())
+    ([('answer', False), ('answer', True), ('answer', True)], 1)
+    """
+    loop = asyncio.get_running_loop()
+    registry_key = (id(loop), key)
+
+    while True:
+        with _single_flight_lock:
+            future = _in_flight.get(registry_key)
+            if future is None:
+                future = loop.create_future()
+                _in_flight[registry_key] = future
+                _single_flight_stats["calls"] += 1
+                break
+
+        try:
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled():
+                continue  # the leader was cancelled, not us; try again
+            raise
+        except BaseException:
+            with _single_flight_lock:
+                _single_flight_stats["shared_failures"] += 1
+            raise
+        with _single_flight_lock:
+            _single_flight_stats["deduplicated"] += 1
+        return result, True
+
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved so an unobserved future doesn't log it
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result, False
+    finally:
+        with _single_flight_lock:
+            if _in_flight.get(registry_key) is future:
+                del _in_flight[registry_key]
@@ -10,14 +10,67 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from .exceptions import StaleBranchError
 
 
+def tree_blob_hashes(b, tree_obj: dict) -> List[str]:
+    """Return the ordered row blob hashes of a tree object.
+
+    A tree may be chunked: besides its own ``blobs`` it can name a
+    ``base`` tree that holds the rows before them (see
+    :class:`~edsl.object_store.streaming_writer.StreamingCASWriter`).
+    Base links are followed back to the first chunk.
+    """
+    segments = [tree_obj["blobs"]]
+    base = tree_obj.get("base")
+    while base:
+        base_obj = json.loads(b.read(f"trees/{base}.json"))
+        segments.append(base_obj["blobs"])
+        base = base_obj.get("base")
+    return [h for segment in reversed(segments) for h in segment]
+
+
+def tree_chain(b, tree_hash: str) -> List[str]:
+    """Return *tree_hash* followed by the hashes of the base trees it links to."""
+    chain = []
+    while tree_hash:
+        chain.append(tree_hash)
+        tree_hash = json.loads(b.read(f"trees/{tree_hash}.json")).get("base")
+    return chain
+
+
+def missing_keys(b, keys: Iterable[str]) -> Set[str]:
+    """Return the subset of *keys* that do not exist on backend *b*.
+
+    Uses the backend's ``missing_keys`` batch check when it has one,
+    otherwise calls ``exists`` per key.
+    """
+    keys = list(dict.fromkeys(keys))
+    if hasattr(b, "missing_keys"):
+        return set(b.missing_keys(keys))
+    return {key for key in keys if not b.exists(key)}
+
+
+def write_many(b, items: Dict[str, str]) -> None:
+    """Write every ``key -> content`` pair in *items* to backend *b*.
+
+    Uses the backend's ``write_many`` batch write when it has one,
+    otherwise calls ``write`` per key.
+    """
+    if not items:
+        return
+    if hasattr(b, "write_many"):
+        b.write_many(items)
+        return
+    for key, content in items.items():
+        b.write(key, content)
+
+
 def _reconstruct_content(b, tree_obj: dict) -> str:
     """Reconstruct the full JSONL string from a tree object."""
-    parts = [b.read(f"blobs/{h}.json") for h in tree_obj["blobs"]]
+    parts = [b.read(f"blobs/{h}.json") for h in tree_blob_hashes(b, tree_obj)]
     return "\n".join(parts) + "\n"
 
 
@@ -114,14 +167,12 @@ class CASRepository:
         else:
             current_branch = branch or "main"
 
-        # One blob per row — deduplicated by content hash
-        blob_hashes = []
-        for row in rows:
-            h = self._hash(row)
-            key = f"blobs/{h}.json"
-            if not b.exists(key):
-                b.write(key, row)
-            blob_hashes.append(h)
+        # One blob per row — deduplicated by content hash.  Existence is
+        # checked and new blobs are written in one batch per save.
+        blob_hashes = [self._hash(row) for row in rows]
+        blobs = {f"blobs/{h}.json": row for h, row in zip(blob_hashes, rows)}
+        new_keys = missing_keys(b, blobs)
+        write_many(b, {key: row for key, row in blobs.items() if key in new_keys})
 
         # tree — ordered list of blob hashes
         tree_obj = {"blobs": blob_hashes}
@@ -160,8 +211,8 @@ class CASRepository:
         b.write(ref_key, commit_hash + "\n")
         b.write("HEAD", current_branch + "\n")
 
-        # overwrite readable snapshot
-        b.write("current.jsonl", _reconstruct_content(b, tree_obj))
+        # overwrite readable snapshot (blobs hold the rows verbatim)
+        b.write("current.jsonl", "\n".join(rows) + "\n")
 
         return {
             "commit": commit_hash,
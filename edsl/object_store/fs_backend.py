@@ -16,10 +16,16 @@ class FileSystemBackend:
         >>> backend.write("a/b.txt", "hello")
         >>> backend.read("a/b.txt")
         'hello'
+        >>> backend.append("a/b.txt", " world")
+        >>> backend.read("a/b.txt")
+        'hello world'
         >>> backend.exists("a/b.txt")
         True
+        >>> backend.write_many({"a/c.txt": "x", "d/e.txt": "y"})
+        >>> backend.read("d/e.txt")
+        'y'
         >>> list(backend.list_prefix("a/"))
-        ['a/b.txt']
+        ['a/b.txt', 'a/c.txt']
         >>> backend.delete("a/b.txt")
         >>> backend.exists("a/b.txt")
         False
@@ -39,6 +45,23 @@ class FileSystemBackend:
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_text(content)
 
+    def write_many(self, items: dict[str, str]) -> None:
+        """Write every ``key -> content`` pair, creating each directory once."""
+        made: set[Path] = set()
+        for key, content in items.items():
+            p = self.root / key
+            if p.parent not in made:
+                p.parent.mkdir(parents=True, exist_ok=True)
+                made.add(p.parent)
+            p.write_text(content)
+
+    def append(self, key: str, content: str) -> None:
+        """Append *content* to the file at *key*, creating it if needed."""
+        p = self.root / key
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("a") as f:
+            f.write(content)
+
     def exists(self, key: str) -> bool:
         return (self.root / key).exists()
 
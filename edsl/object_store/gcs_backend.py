@@ -5,7 +5,11 @@ Requires ``google-cloud-storage`` (install with ``pip install edsl[gcp]``).
 
 from __future__ import annotations
 
-from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+# Concurrent requests used by the batch methods
+_BATCH_WORKERS = 16
 
 
 class GCSBackend:
@@ -51,6 +55,18 @@ class GCSBackend:
         """Return ``True`` if *key* exists."""
         return self._blob(key).exists()
 
+    def missing_keys(self, keys: Iterable[str]) -> set[str]:
+        """Return the keys that do not exist, checking them concurrently."""
+        keys = list(keys)
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as pool:
+            found = list(pool.map(self.exists, keys))
+        return {key for key, exists in zip(keys, found) if not exists}
+
+    def write_many(self, items: dict[str, str]) -> None:
+        """Upload every ``key -> content`` pair concurrently."""
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as pool:
+            list(pool.map(lambda kv: self.write(*kv), items.items()))
+
     def delete(self, key: str) -> None:
         """Delete *key*.  No-op if not found."""
         from google.cloud.exceptions import NotFound
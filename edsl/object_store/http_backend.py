@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError
 
@@ -24,6 +25,9 @@ from urllib.error import HTTPError
 _CAS_KEY_RE = re.compile(r"^(blobs|trees|commits)/([0-9a-f]+)\.json$")
 _REF_KEY_RE = re.compile(r"^refs/(.+)$")
 
+# Concurrent requests used by ``missing_keys``
+_BATCH_WORKERS = 16
+
 
 def _parse_cas_key(key: str) -> tuple[str, str]:
     """Parse a CAS key like ``blobs/abc123.json`` into ``("blobs", "abc123")``.
@@ -57,6 +61,9 @@ class HttpBackend:
         >>> # HttpBackend("http://localhost:8000", "some-uuid")
     """
 
+    # The service derives current.jsonl from the pushed commit
+    derives_snapshot = True
+
     def __init__(self, base_url: str, uuid: str, token: Optional[str] = None) -> None:
         self.base_url = base_url.rstrip("/")
         self.uuid = uuid
@@ -193,6 +200,30 @@ class HttpBackend:
         except KeyError:
             return False
 
+    def missing_keys(self, keys: Iterable[str]) -> set[str]:
+        """Return the keys that do not exist on the remote.
+
+        Objects still waiting in the write buffer count as present; the
+        rest are checked concurrently.
+        """
+        pending = {
+            "blobs": self._pending_blobs,
+            "trees": self._pending_trees,
+            "commits": self._pending_commits,
+        }
+        to_check = []
+        for key in keys:
+            try:
+                kind, hash_hex = _parse_cas_key(key)
+                if hash_hex in pending[kind]:
+                    continue
+            except KeyError:
+                pass
+            to_check.append(key)
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as pool:
+            found = list(pool.map(self.exists, to_check))
+        return {key for key, exists in zip(to_check, found) if not exists}
+
     # ------------------------------------------------------------------
     # Delete
     # ------------------------------------------------------------------
@@ -14,6 +14,19 @@ class StorageBackend(Protocol):
     """Protocol for blob/file storage.
 
     Keys are relative paths like ``"blobs/abc123.json"`` or ``"refs/main"``.
+
+    Backends may also provide batch methods, which callers use when
+    present (see :func:`~edsl.object_store.cas_repository.missing_keys`
+    and :func:`~edsl.object_store.cas_repository.write_many`):
+
+    - ``missing_keys(keys) -> set[str]``: the subset of *keys* that do
+      not exist, checked in as few round trips as possible.
+    - ``write_many(items: dict[str, str]) -> None``: write several keys.
+    - ``append(key, content) -> None``: extend *key* with *content*.
+
+    A backend whose ``current.jsonl`` snapshot is derived from the commit
+    by the store itself sets ``derives_snapshot = True``; writers then do
+    not build the snapshot at all.
     """
 
     def read(self, key: str) -> str:
@@ -12,7 +12,13 @@ from typing import Callable, Optional, Type
 
 import platformdirs
 
-from .cas_repository import CASRepository
+from .cas_repository import (
+    CASRepository,
+    missing_keys,
+    tree_blob_hashes,
+    tree_chain,
+    write_many,
+)
 from .exceptions import AmbiguousUUIDError
 from .fs_backend import FileSystemBackend
 from .sqlite_metadata_index import SQLiteMetadataIndex
@@ -130,22 +136,25 @@ def _sync_commit(source, dest, commit_hash: str, skip_exists: bool = False) -> d
     commit_content = source.read(commit_key)
     commit_obj = json.loads(commit_content)
 
-    # Copy tree
-    tree_key = f"trees/{commit_obj['tree']}.json"
-    if skip_exists or not dest.exists(tree_key):
-        dest.write(tree_key, source.read(tree_key))
-        copied["trees"] += 1
+    # Copy tree, and the base trees of a chunked tree
+    for tree_hash in tree_chain(source, commit_obj["tree"]):
+        tree_key = f"trees/{tree_hash}.json"
+        if skip_exists or not dest.exists(tree_key):
+            dest.write(tree_key, source.read(tree_key))
+            copied["trees"] += 1
 
     # Copy all row blobs referenced by the tree
-    tree_obj = json.loads(source.read(tree_key))
+    tree_obj = json.loads(source.read(f"trees/{commit_obj['tree']}.json"))
+    blobs = {}
     rows = []
-    for blob_hash in tree_obj["blobs"]:
+    for blob_hash in tree_blob_hashes(source, tree_obj):
         blob_key = f"blobs/{blob_hash}.json"
         row = source.read(blob_key)
         rows.append(row)
-        if skip_exists or not dest.exists(blob_key):
-            dest.write(blob_key, row)
-            copied["blobs"] += 1
+        blobs[blob_key] = row
+    new_keys = set(blobs) if skip_exists else missing_keys(dest, blobs)
+    write_many(dest, {key: row for key, row in blobs.items() if key in new_keys})
+    copied["blobs"] += len(new_keys)
 
     # Discover FileStore blob references embedded in row content
     content = "\n".join(rows) + "\n"
@@ -180,7 +189,7 @@ def _update_dest_refs(dest, branch: str, tip: str) -> None:
     # Reconstruct current.jsonl from the tip commit
     tip_commit = json.loads(dest.read(f"commits/{tip}.json"))
     tip_tree = json.loads(dest.read(f"trees/{tip_commit['tree']}.json"))
-    rows = [dest.read(f"blobs/{h}.json") for h in tip_tree["blobs"]]
+    rows = [dest.read(f"blobs/{h}.json") for h in tree_blob_hashes(dest, tip_tree)]
     dest.write("current.jsonl", "\n".join(rows) + "\n")
 
 
@@ -2,7 +2,8 @@
 
 Builds a CAS object progressively — each append creates a new commit
 whose tree contains all rows written so far.  Every intermediate commit
-is a valid, loadable JSONL object.
+is a valid, loadable JSONL object, and ``finalize`` ends the object on a
+commit in the plain tree format.
 """
 
 from __future__ import annotations
@@ -19,17 +20,36 @@ class StreamingCASWriter:
     """Incrementally build a CAS object by appending JSONL rows.
 
     Each append writes one blob and creates a new commit whose tree
-    is [preamble blobs...] + [result blobs so far...].  Every commit
+    covers [preamble blobs...] + [result blobs so far...].  Every commit
     is a valid, loadable JSONL object.
 
-    Row content is cached in memory so that ``current.jsonl`` can be
-    rebuilt by appending rather than re-reading every blob from disk.
+    The cost of an append does not grow with the number of rows already
+    written:
+
+    - Trees are chunked.  Every ``chunk_size`` rows the open chunk is
+      sealed into a tree ``{"base": <previous chunk>, "blobs": [...]}``,
+      and each commit's tree only lists the rows since the last sealed
+      chunk plus a ``base`` link to it.
+    - ``current.jsonl`` is extended with the new rows instead of being
+      rewritten, when the backend has an ``append`` method, and row
+      content is not kept in memory.  Other backends get the snapshot
+      rewritten from rows kept in memory, never read back, and backends
+      that derive the snapshot themselves (``derives_snapshot``, such as
+      :class:`~edsl.object_store.http_backend.HttpBackend`) get none.
+
+    Chunked trees are an internal format of the objects being written:
+    readers that do not follow ``base`` links (older edsl releases, the
+    remote object service) would only see the rows of the last chunk.
+    ``finalize`` therefore commits a flat tree listing every row, and
+    the object should be finalized before it is read or synced.
 
     Examples:
         >>> import tempfile
+        >>> from edsl.object_store.cas_repository import CASRepository
         >>> from edsl.object_store.fs_backend import FileSystemBackend
-        >>> backend = FileSystemBackend(tempfile.mkdtemp())
-        >>> w = StreamingCASWriter(backend)
+        >>> root = tempfile.mkdtemp()
+        >>> backend = FileSystemBackend(root)
+        >>> w = StreamingCASWriter(backend, chunk_size=2)
         >>> w.write_preamble(['{"__header__": true}', '{"n_survey_lines": 0}'])
         >>> w.n_results
         0
@@ -41,41 +61,82 @@ class StreamingCASWriter:
         >>> w.append_results_batch(['{"answer": "a"}', '{"answer": "b"}'])
         >>> w.n_results
         3
+        >>> repo = CASRepository(root)
+        >>> repo.load().splitlines()[2:]
+        ['{"answer": "hello"}', '{"answer": "a"}', '{"answer": "b"}']
+        >>> backend.read("current.jsonl") == repo.load()
+        True
+        >>> w.finalize()
+        >>> tip_tree = json.loads(backend.read(f"commits/{w.tip}.json"))["tree"]
+        >>> tree = json.loads(backend.read(f"trees/{tip_tree}.json"))
+        >>> "base" in tree, len(tree["blobs"])
+        (False, 5)
+        >>> repo.load() == backend.read("current.jsonl")
+        True
+        >>> len(repo.log())
+        4
     """
 
-    def __init__(self, backend: StorageBackend, branch: str = "main"):
+    def __init__(
+        self, backend: StorageBackend, branch: str = "main", chunk_size: int = 256
+    ):
         self._backend = backend
         self._branch = branch
-        self._preamble_hashes: list[str] = []
-        self._result_hashes: list[str] = []
+        self._chunk_size = max(1, chunk_size)
+        self._n_preamble = 0
+        self._n_results = 0
         self._tip: Optional[str] = None
-        # In-memory cache: hash -> row content (avoids re-reading blobs)
-        self._row_cache: dict[str, str] = {}
+        # Last sealed chunk tree, and the row hashes written since
+        self._base: Optional[str] = None
+        self._open_chunk: list[str] = []
+        # How current.jsonl is kept: "append", "rewrite" or not at all
+        if getattr(backend, "derives_snapshot", False):
+            self._snapshot_mode: Optional[str] = None
+        elif hasattr(backend, "append"):
+            self._snapshot_mode = "append"
+        else:
+            self._snapshot_mode = "rewrite"
+        # Rows not yet added to current.jsonl ("append"), or every row
+        # written ("rewrite")
+        self._snapshot_rows: list[str] = []
+        # Every row hash, for the flat tree of the final commit
+        self._row_hashes: list[str] = []
+        self._finalized_tip: Optional[str] = None
 
     def write_preamble(self, rows: list[str], message: str = "Job started"):
         """Write header + manifest + survey rows as blobs, create initial commit."""
         for row in rows:
-            h = self._write_blob(row)
-            self._preamble_hashes.append(h)
+            self._add_row(row)
+        self._n_preamble += len(rows)
         self._commit(message)
 
     def append_result(self, result_json_row: str, message: str = ""):
         """Append one Result row and create a new commit."""
-        h = self._write_blob(result_json_row)
-        self._result_hashes.append(h)
-        self._commit(message or f"Result {len(self._result_hashes)}")
+        self._add_row(result_json_row)
+        self._n_results += 1
+        self._commit(message or f"Result {self._n_results}")
 
     def append_results_batch(self, rows: list[str], message: str = ""):
         """Append multiple Result rows in a single commit."""
         for row in rows:
-            h = self._write_blob(row)
-            self._result_hashes.append(h)
-        if self._result_hashes or self._preamble_hashes:
+            self._add_row(row)
+        self._n_results += len(rows)
+        if self._n_results or self._n_preamble:
             self._commit(message or f"Batch: {len(rows)} results")
 
+    def finalize(self, message: str = "Finalized"):
+        """Commit a flat tree of every row written.
+
+        Does nothing if nothing has been committed since the last call.
+        """
+        if self._tip is None or self._tip == self._finalized_tip:
+            return
+        self._commit(message, tree_hash=self._write_tree(self._row_hashes, base=None))
+        self._finalized_tip = self._tip
+
     @property
     def n_results(self) -> int:
-        return len(self._result_hashes)
+        return self._n_results
 
     @property
     def tip(self) -> Optional[str]:
@@ -89,26 +150,42 @@ class StreamingCASWriter:
     def _hash(content: str) -> str:
         return hashlib.sha256(content.encode()).hexdigest()
 
-    def _write_blob(self, content: str) -> str:
+    def _add_row(self, content: str) -> None:
+        """Write a row blob and add it to the open chunk, sealing it when full."""
         h = self._hash(content)
-        self._row_cache[h] = content
         key = f"blobs/{h}.json"
         if not self._backend.exists(key):
             self._backend.write(key, content)
-        return h
+        self._open_chunk.append(h)
+        self._row_hashes.append(h)
+        if self._snapshot_mode is not None:
+            self._snapshot_rows.append(content)
+        if len(self._open_chunk) >= self._chunk_size:
+            self._base = self._write_tree(self._open_chunk, self._base)
+            self._open_chunk = []
+
+    def _write_tree(self, blob_hashes: list[str], base: Optional[str]) -> str:
+        """Write a tree of *blob_hashes* on top of the *base* tree, if any."""
+        tree_obj: dict = {"blobs": blob_hashes}
+        if base is not None:
+            tree_obj["base"] = base
+        tree_content = json.dumps(tree_obj, sort_keys=True)
+        tree_hash = self._hash(tree_content)
+        tree_key = f"trees/{tree_hash}.json"
+        if not self._backend.exists(tree_key):
+            self._backend.write(tree_key, tree_content)
+        return tree_hash
 
-    def _commit(self, message: str):
+    def _commit(self, message: str, tree_hash: Optional[str] = None):
         """Build tree, create commit, advance ref."""
         b = self._backend
 
-        # Tree
-        all_hashes = self._preamble_hashes + self._result_hashes
-        tree_obj = {"blobs": all_hashes}
-        tree_content = json.dumps(tree_obj, sort_keys=True)
-        tree_hash = self._hash(tree_content)
-        tree_key = f"trees/{tree_hash}.json"
-        if not b.exists(tree_key):
-            b.write(tree_key, tree_content)
+        # Tree: the sealed chunk itself when no rows are open
+        if tree_hash is None:
+            if self._open_chunk or self._base is None:
+                tree_hash = self._write_tree(self._open_chunk, self._base)
+            else:
+                tree_hash = self._base
 
         # Commit
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -126,9 +203,16 @@ class StreamingCASWriter:
         b.write(f"refs/{self._branch}", commit_hash + "\n")
         b.write("HEAD", self._branch + "\n")
 
-        # Update current.jsonl from in-memory cache (no blob re-reads)
-        parts = [self._row_cache[h] for h in all_hashes]
-        b.write("current.jsonl", "\n".join(parts) + "\n")
+        # Bring current.jsonl up to date with the rows committed
+        rows = "".join(row + "\n" for row in self._snapshot_rows)
+        if self._snapshot_mode == "rewrite" or (
+            self._snapshot_mode == "append" and self._tip is None
+        ):
+            b.write("current.jsonl", rows)
+        elif self._snapshot_mode == "append":
+            b.append("current.jsonl", rows)
+        if self._snapshot_mode == "append":
+            self._snapshot_rows = []
 
         self._tip = commit_hash
 
@@ -57,6 +57,10 @@ class BaseDescriptor(ABC):
             instance.__dict__[self.name] = new_value
         else:
             instance.__dict__[self.name] = value
+        # Drop a cached content hash (see HashingMixin); plain owners have none
+        invalidate_hash = getattr(instance, "_invalidate_hash", None)
+        if invalidate_hash is not None:
+            invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
@@ -47,6 +47,7 @@ Technical Details:
 """
 
 from __future__ import annotations
+import itertools
 from abc import ABC
 from typing import (
     Any,
@@ -68,7 +69,13 @@ from .question_base_prompts_mixin import QuestionBasePromptsMixin
 from .question_base_gen_mixin import QuestionBaseGenMixin
 from .exceptions import QuestionSerializationError
 
-from ..base import PersistenceMixin, RepresentationMixin, BaseDiff, BaseDiffCollection
+from ..base import (
+    PersistenceMixin,
+    RepresentationMixin,
+    HashingMixin,
+    BaseDiff,
+    BaseDiffCollection,
+)
 from ..utilities import remove_edsl_version, is_valid_variable_name
 
 if TYPE_CHECKING:
@@ -77,6 +84,9 @@ if TYPE_CHECKING:
 # Define VisibilityType for type annotations
 VisibilityType = Literal["private", "public", "unlisted"]
 
+# Advanced whenever any question's cached hash is dropped (see Survey.__hash__)
+_hash_generations = itertools.count(1)
+
 if TYPE_CHECKING:
     from ..agents import Agent
     from ..scenarios import Scenario
@@ -93,6 +103,7 @@ if TYPE_CHECKING:
 class QuestionBase(
     PersistenceMixin,
     RepresentationMixin,
+    HashingMixin,
     SimpleAskMixin,
     QuestionBasePromptsMixin,
     QuestionBaseGenMixin,
@@ -427,13 +438,14 @@ class QuestionBase(
         selected = set(answer) if isinstance(answer, (list, tuple, set)) else {answer}
         return [o for o in options if o not in selected]
 
-    def __hash__(self) -> int:
+    def _compute_hash(self) -> int:
         """
         Calculate a hash value for this question instance.
 
         This method returns a deterministic hash based on the serialized dictionary
         representation of the question. This allows questions to be used in sets and
-        as dictionary keys.
+        as dictionary keys. The hash is cached by ``Base.__hash__`` and invalidated
+        whenever a question descriptor is set.
 
         Returns:
             int: A hash value for this question.
@@ -449,6 +461,18 @@ class QuestionBase(
 
         return dict_hash(self.to_dict(add_edsl_version=False))
 
+    # Defining __eq__ in this class would otherwise reset __hash__ to None
+    __hash__ = HashingMixin.__hash__
+
+    # Changes whenever any question may have changed, so a survey can keep its
+    # cached hash without rehashing its questions until then
+    _hash_generation: int = 0
+
+    def _invalidate_hash(self) -> None:
+        """Drop the cached hash and mark the question's surveys for a recheck."""
+        super()._invalidate_hash()
+        QuestionBase._hash_generation = next(_hash_generations)
+
     @property
     def data(self) -> dict:
         """Return a dictionary of question attributes **except** for question_type.
@@ -468,6 +492,7 @@ class QuestionBase(
             "_is_thinking_question",  # serialized via from_dict detection
             "_probabilistic_seed_context",  # runtime-only resolution identity
             "_item_randomization_seed",  # runtime-only row randomization seed
+            "_cached_hash",  # content hash cache, see Base.__hash__
         ]
         only_if_not_na_list = [
             "_answering_instructions",
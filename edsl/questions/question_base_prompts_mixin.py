@@ -1,3 +1,6 @@
+import json
+import threading
+from collections import OrderedDict
 from importlib import resources
 from typing import Any, Optional, TYPE_CHECKING
 from functools import lru_cache
@@ -36,6 +39,82 @@ class TemplateManager:
 template_manager = TemplateManager()
 
 
+class ResponseModelCache:
+    """Interns response models built by ``create_response_model``.
+
+    Building a pydantic model (and its compiled validator) costs about a
+    millisecond, and every interview renders its own copy of each
+    question, so the same model used to be rebuilt for every answer.
+    Models are keyed by question class and the question's attributes,
+    minus the ones that only affect prompts, so rendered copies of a
+    question that differ only in their text share one model.
+
+    >>> from edsl import QuestionMultipleChoice as Q
+    >>> q1, q2 = Q.example(), Q.example()
+    >>> q2.question_text = "How are you, {{ name }}?"
+    >>> q1.response_model is q2.response_model
+    True
+    >>> q2.question_options = ["Yes", "No"]
+    >>> q1.response_model is q2.response_model
+    False
+    """
+
+    # Attributes that only change the prompt, never the response model
+    prompt_only_attributes = frozenset(
+        {
+            "_question_text",
+            "_answering_instructions",
+            "_question_presentation",
+            "_model_instructions",
+            "_cached_hash",
+        }
+    )
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._models: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, question) -> Optional[tuple]:
+        """Return the cache key for *question*, or None if it has none.
+
+        Questions holding attributes that are not JSON-serializable (live
+        objects, user classes) are not interned.
+        """
+        state = {
+            k: v
+            for k, v in vars(question).items()
+            if k not in self.prompt_only_attributes
+        }
+        try:
+            return type(question), json.dumps(state, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, question) -> type["BaseModel"]:
+        key = self.key(question)
+        if key is None:
+            return question.create_response_model()
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+        model = question.create_response_model()
+        with self._lock:
+            self._models[key] = model
+            if len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+response_model_cache = ResponseModelCache()
+
+
 class QuestionBasePromptsMixin:
     @property
     def model_instructions(self) -> dict:
@@ -71,6 +150,7 @@ class QuestionBasePromptsMixin:
     def model_instructions(self, data: dict):
         """Set the model-specific instructions for the question."""
         self._model_instructions = data
+        self._invalidate_hash()
 
     def add_model_instructions(
         self, *, instructions: str, model: Optional[str] = None
@@ -108,6 +188,7 @@ class QuestionBasePromptsMixin:
             self._model_instructions.update({model: instructions})
         else:
             self._model_instructions.update({model: instructions})
+        self._invalidate_hash()
 
     @classmethod
     def path_to_folder(cls) -> str:
@@ -118,7 +199,7 @@ class QuestionBasePromptsMixin:
         if self._response_model is not None:
             return self._response_model
         else:
-            return self.create_response_model()
+            return response_model_cache.get(self)
 
     @property
     def use_code(self) -> bool:
@@ -129,6 +210,7 @@ class QuestionBasePromptsMixin:
     @use_code.setter
     def use_code(self, value: bool) -> None:
         self._use_code = value
+        self._invalidate_hash()
 
     @property
     def include_comment(self) -> bool:
@@ -139,6 +221,7 @@ class QuestionBasePromptsMixin:
     @include_comment.setter
     def include_comment(self, value: bool) -> None:
         self._include_comment = value
+        self._invalidate_hash()
 
     @classmethod
     def default_answering_instructions(cls) -> str:
@@ -168,6 +251,7 @@ class QuestionBasePromptsMixin:
     @answering_instructions.setter
     def answering_instructions(self, value) -> None:
         self._answering_instructions = value
+        self._invalidate_hash()
 
     @property
     def question_presentation(self):
@@ -178,6 +262,7 @@ class QuestionBasePromptsMixin:
     @question_presentation.setter
     def question_presentation(self, value):
         self._question_presentation = value
+        self._invalidate_hash()
 
     def prompt_preview(self, scenario=None, agent=None):
         enumeration = getattr(self, "_enumeration", None)
@@ -11,10 +11,7 @@ class ResponseValidatorFactory:
 
     @property
     def response_model(self) -> Type["BaseModel"]:
-        if self.question._response_model is not None:
-            return self.question._response_model
-        else:
-            return self.question.create_response_model()
+        return self.question.response_model
 
     @property
     def response_validator(self) -> "ResponseValidatorABC":
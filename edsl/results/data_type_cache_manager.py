@@ -44,6 +44,14 @@ class DataTypeCacheManager:
         self._fetch_list_cache = {}
         self._cache_dirty = True
 
+    @property
+    def _columnar(self):
+        """The results' ColumnarResultList, or None for list-backed Results."""
+        from .results_columnar import ColumnarResultList
+
+        data = self.results.data
+        return data if isinstance(data, ColumnarResultList) else None
+
     @property
     def key_to_data_type(self) -> dict[str, str]:
         """Return a mapping of keys to data types.
@@ -57,8 +65,11 @@ class DataTypeCacheManager:
         """
         if self._key_to_data_type_cache is None or self._cache_dirty:
             d: dict = {}
-            for result in self.results.data:
-                d.update(result.key_to_data_type)
+            if self._columnar is not None:
+                d.update(self._columnar.key_to_data_type())
+            else:
+                for result in self.results.data:
+                    d.update(result.key_to_data_type)
             for column in self.results.created_columns:
                 d[column] = "answer"
             self._key_to_data_type_cache = d
@@ -80,9 +91,13 @@ class DataTypeCacheManager:
         """
         if self._data_type_to_keys_cache is None or self._cache_dirty:
             d: dict = defaultdict(set)
-            for result in self.results.data:
-                for key, value in result.key_to_data_type.items():
-                    d[value].add(key)
+            if self._columnar is not None:
+                for data_type, keys in self._columnar.data_type_to_keys().items():
+                    d[data_type].update(keys)
+            else:
+                for result in self.results.data:
+                    for key, value in result.key_to_data_type.items():
+                        d[value].add(key)
             for column in self.results.created_columns:
                 d["answer"].add(column)
             self._data_type_to_keys_cache = d
@@ -116,9 +131,12 @@ class DataTypeCacheManager:
         """
         cache_key = (data_type, key)
         if cache_key not in self._fetch_list_cache:
-            returned_list = []
-            for row in self.results.data:
-                returned_list.append(row.sub_dicts[data_type].get(key, None))
+            if self._columnar is not None:
+                returned_list = self._columnar.fetch_list(data_type, key)
+            else:
+                returned_list = []
+                for row in self.results.data:
+                    returned_list.append(row.sub_dicts[data_type].get(key, None))
             self._fetch_list_cache[cache_key] = returned_list
 
         return self._fetch_list_cache[cache_key]
@@ -73,6 +73,7 @@ from .results_transformer import ResultsTransformer
 from .results_properties import ResultsProperties
 from .results_representation import ResultsRepresentation
 from .results_container import ResultsContainer
+from .results_columnar import ColumnarResultList
 from .results_grouper import ResultsGrouper
 from .results_transcript_generator import TranscriptsGenerator
 from .exceptions import (
@@ -172,6 +173,7 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         total_results: Optional[int] = None,
         task_history: Optional["TaskHistory"] = None,
         sort_by_iteration: bool = False,
+        columnar: bool = False,
     ):
         """Instantiate a Results object with a survey and a list of Result objects.
 
@@ -184,6 +186,9 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
             total_results: An integer representing the total number of results.
             task_history: A TaskHistory object containing information about the tasks.
             sort_by_iteration: Whether to sort data by iteration before initializing.
+            columnar: Store the data column by column (see results_columnar),
+                which uses far less memory for large Results. Passing a
+                ColumnarResultList as data also makes the Results columnar.
         """
         if survey is not None and isinstance(survey, str):
             pulled_results = Results.pull(survey)
@@ -211,7 +216,12 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
                 data = sorted(data, key=lambda x: x.data.get("iteration", 0))
 
         # Initialize data with the appropriate class
-        self.data = self._data_class(data or [])
+        if isinstance(data, ColumnarResultList):
+            self.data = data
+        elif columnar:
+            self.data = ColumnarResultList(data or [])
+        else:
+            self.data = self._data_class(data or [])
 
         from ..caching import Cache
         from ..tasks import TaskHistory
@@ -413,6 +423,37 @@ class Results(MutableSequence, ResultsOperationsMixin, Base):
         """Extend the Results list with items from another iterable."""
         return self._container.extend(other)
 
+    @property
+    def is_columnar(self) -> bool:
+        """Whether the data is held in a columnar store (see ``to_columnar``)."""
+        return isinstance(self.data, ColumnarResultList)
+
+    def to_columnar(self) -> "Results":
+        """Return a copy of these Results backed by a columnar store.
+
+        Agents, scenarios and models are stored once each and every
+        ``data_type.key`` column once, with rows handed out as lightweight
+        Result views. ``select``, ``filter``, ``tally``, ``to_pandas`` and
+        ``to_polars`` then read the columns directly.
+
+        Examples:
+            >>> r = Results.example().to_columnar()
+            >>> r.is_columnar
+            True
+            >>> r.select('how_feeling') == Results.example().select('how_feeling')
+            True
+        """
+        return Results(
+            survey=self.survey,
+            data=ColumnarResultList(self.data),
+            name=self.name,
+            created_columns=self.created_columns,
+            cache=self.cache,
+            job_uuid=self._job_uuid,
+            total_results=self._total_results,
+            task_history=self.task_history,
+        )
+
     @wraps(ResultsContainer.__add__)
     def __add__(self, other: Results) -> Results:
         return self._container.__add__(other)
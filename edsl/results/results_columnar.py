@@ -0,0 +1,597 @@
+"""Columnar backing store for Results objects.
+
+A regular Results holds one Result per row, each a dictionary of its agent,
+scenario, model and a dozen per-question dictionaries, and every Result
+builds its own sub-dictionaries when a column is selected. For large result
+sets ``ColumnarResultList`` stores the same data column by column instead:
+
+- agents, scenarios, models and question attributes are dictionary encoded:
+  each distinct payload is stored once and rows hold an integer code;
+- every per-question field (answers, prompts, raw model responses, token
+  counts, cache keys, ...) is one list per key, with prompt strings and short
+  string values interned;
+- Result objects are handed out on demand as lightweight ``ResultView`` rows.
+
+``DataTypeCacheManager`` and ``ResultsFilter`` read the columns directly, so
+``select``, ``filter``, ``tally``, ``to_pandas`` and ``to_polars`` never build
+per-row Result dictionaries.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import warnings
+from array import array
+from collections.abc import MutableSequence
+from typing import Any, Iterable, Iterator, Optional
+
+from .result import Result
+from .result_builder import QUESTION_FIELDS, ResultBuilder
+
+_MISSING = object()
+
+# Result.data fields stored once per distinct payload
+ENCODED_FIELDS = ("agent", "scenario", "model", "question_to_attributes")
+
+# Result.data fields holding one dictionary per row
+KEYED_FIELDS = (
+    "answer",
+    "prompt",
+    "raw_model_response",
+    "generated_tokens",
+    "comments_dict",
+    "reasoning_summaries_dict",
+    "cache_used_dict",
+    "cache_keys",
+    "validated_dict",
+    "distribution",
+    "resolution_draw",
+    "resolution_seed",
+    "resolution_method",
+)
+
+# Order of the entries of Result.data, as set by Result.__init__
+_DATA_ORDER = (
+    "agent",
+    "scenario",
+    "model",
+    "iteration",
+    "answer",
+    "prompt",
+    "raw_model_response",
+    "question_to_attributes",
+    "generated_tokens",
+    "comments_dict",
+    "reasoning_summaries_dict",
+    "cache_used_dict",
+    "cache_keys",
+    "validated_dict",
+    "distribution",
+    "resolution_draw",
+    "resolution_seed",
+    "resolution_method",
+)
+
+# Selectable data type -> (Result.data field, suffix added to each key)
+_KEYED_DATA_TYPES = {
+    "answer": ("answer", ""),
+    "prompt": ("prompt", ""),
+    "raw_model_response": ("raw_model_response", ""),
+    "generated_tokens": ("generated_tokens", ""),
+    "comment": ("comments_dict", ""),
+    "reasoning_summary": ("reasoning_summaries_dict", ""),
+    "validated": ("validated_dict", ""),
+    "cache_used": ("cache_used_dict", "_cache_used"),
+    "cache_keys": ("cache_keys", "_cache_key"),
+    "distribution": ("distribution", "_distribution"),
+    "resolution_draw": ("resolution_draw", "_resolution_draw"),
+    "resolution_seed": ("resolution_seed", "_resolution_seed"),
+    "resolution_method": ("resolution_method", "_resolution_method"),
+}
+
+_INDEXED_DATA_TYPES = ("agent", "scenario", "model")
+
+# Strings up to this length are interned; prompts are always interned
+_INTERN_MAX_LEN = 256
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class ResultsColumnStore:
+    """Column-oriented storage for the rows of a Results object.
+
+    Rows are only ever appended. ``ColumnarResultList`` maps its positions
+    to store rows, so slices and filtered subsets share one store.
+
+    Examples:
+        >>> from edsl.results import Result
+        >>> store = ResultsColumnStore()
+        >>> result = Result.example()
+        >>> store.append(result)
+        0
+        >>> store.append(result)
+        1
+        >>> len(store._payloads["agent"])
+        1
+        >>> store.column("answer", "how_feeling")
+        ['OK', 'OK']
+    """
+
+    def __init__(self):
+        self._n = 0
+        self._payloads: dict[str, list] = {f: [] for f in ENCODED_FIELDS}
+        self._payload_codes: dict[str, dict] = {f: {} for f in ENCODED_FIELDS}
+        self._codes: dict[str, array] = {f: array("l") for f in ENCODED_FIELDS}
+        self._columns: dict[str, dict[Any, list]] = {f: {} for f in KEYED_FIELDS}
+        self._iterations: list = []
+        self._indices: list = []  # (agent, scenario, model), a dict, or None
+        self._attributes: dict[int, dict] = {}  # row -> interview_hash / order
+        self._extra_data: dict[int, dict] = {}  # row -> unknown Result.data keys
+        self._strings: dict[tuple, str] = {}
+        self._sub_dicts: dict[str, list] = {dt: [] for dt in _INDEXED_DATA_TYPES}
+        self._schema: Optional[dict[str, dict[str, Any]]] = None
+        self._key_to_data_type: Optional[dict[str, str]] = None
+        self._resolved: dict[tuple[str, str], list] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, result: Result) -> int:
+        """Add a Result as a new row and return its row number."""
+        row = self._n
+        data = result.data
+
+        for field in ENCODED_FIELDS:
+            self._codes[field].append(self._encode(field, data.get(field)))
+
+        for field in KEYED_FIELDS:
+            columns = self._columns[field]
+            for key, value in (data.get(field) or {}).items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [_MISSING] * row
+                column.append(self._intern(field, value))
+            for column in columns.values():
+                if len(column) == row:
+                    column.append(_MISSING)
+
+        self._iterations.append(data.get("iteration"))
+        self._indices.append(self._pack_indices(result.indices))
+
+        attributes = {
+            name: getattr(result, name)
+            for name in ("interview_hash", "order")
+            if hasattr(result, name)
+        }
+        if attributes:
+            self._attributes[row] = attributes
+        extra = {k: v for k, v in data.items() if k not in _DATA_ORDER}
+        if extra:
+            self._extra_data[row] = extra
+
+        self._n += 1
+        self._schema = None
+        self._key_to_data_type = None
+        self._resolved.clear()
+        return row
+
+    def _encode(self, field: str, payload: Any) -> int:
+        """Return the code of a payload, adding it if it has not been seen."""
+        payloads = self._payloads[field]
+        codes = self._payload_codes[field]
+
+        code = codes.get(("id", id(payload)))
+        if code is not None and payloads[code] is payload:
+            return code
+
+        if payload is None:
+            key = ("none",)
+        elif field == "agent" and getattr(payload, "name", None) is None:
+            # Unnamed agents are named after their identity (see AgentNamer),
+            # so equal but distinct agents must stay distinct
+            key = ("id", id(payload))
+        elif field == "question_to_attributes":
+            key = ("json", json.dumps(payload, sort_keys=True, default=str))
+        else:
+            key = ("hash", hash(payload))
+
+        code = codes.get(key)
+        if code is None:
+            code = len(payloads)
+            payloads.append(payload)
+            codes[key] = code
+            codes[("id", id(payload))] = code
+        return code
+
+    def _intern(self, field: str, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if field != "prompt" and len(value) > _INTERN_MAX_LEN:
+            return value
+        if type(value) is not str and getattr(value, "captured_variables", None):
+            return value
+        return self._strings.setdefault((type(value), str(value)), value)
+
+    @staticmethod
+    def _pack_indices(indices: Optional[dict]) -> Any:
+        if not indices:
+            return indices
+        if indices.keys() == {"agent", "scenario", "model"}:
+            return (indices["agent"], indices["scenario"], indices["model"])
+        return dict(indices)
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    def row_data(self, row: int) -> dict[str, Any]:
+        """Rebuild the ``Result.data`` dictionary of a row."""
+        data: dict[str, Any] = {}
+        for name in _DATA_ORDER:
+            if name in self._payloads:
+                data[name] = self._payloads[name][self._codes[name][row]]
+            elif name == "iteration":
+                data[name] = self._iterations[row]
+            else:
+                data[name] = {
+                    key: column[row]
+                    for key, column in self._columns[name].items()
+                    if column[row] is not _MISSING
+                }
+        if row in self._extra_data:
+            data.update(self._extra_data[row])
+        return data
+
+    def indices(self, row: int) -> Optional[dict]:
+        packed = self._indices[row]
+        if isinstance(packed, tuple):
+            return dict(zip(_INDEXED_DATA_TYPES, packed))
+        return dict(packed) if packed else packed
+
+    def attributes(self, row: int) -> dict[str, Any]:
+        return self._attributes.get(row, {})
+
+    # ------------------------------------------------------------------
+    # Columns
+    # ------------------------------------------------------------------
+
+    def _subs(self, data_type: str) -> list[dict]:
+        """Sub-dictionaries of each distinct agent, scenario or model."""
+        subs = self._sub_dicts[data_type]
+        payloads = self._payloads[data_type]
+        for payload in payloads[len(subs) :]:
+            if payload is None:
+                subs.append({})
+            elif data_type == "agent":
+                subs.append(ResultBuilder._create_agent_sub_dict(payload)["agent"])
+            elif data_type == "model":
+                subs.append(ResultBuilder._create_model_sub_dict(payload)["model"])
+            else:
+                subs.append(payload)
+        return subs
+
+    def _has_indices(self) -> bool:
+        return any(self._indices)
+
+    def _raw_keys(self) -> dict[str, list]:
+        """Keys of every data type, before conflicting keys are renamed."""
+        keys: dict[str, list] = {}
+        for data_type in _INDEXED_DATA_TYPES:
+            seen: dict = {}
+            for sub in self._subs(data_type):
+                seen.update(dict.fromkeys(sub))
+            if self._has_indices():
+                seen[f"{data_type}_index"] = None
+            keys[data_type] = list(seen)
+        if self._n:
+            keys["iteration"] = ["iteration"]
+
+        answer_keys = list(self._columns["answer"])
+        for field in QUESTION_FIELDS:
+            seen = {}
+            for attributes in self._payloads["question_to_attributes"]:
+                for question_name in answer_keys:
+                    if field in ((attributes or {}).get(question_name) or {}):
+                        seen[f"{question_name}_{field}"] = None
+            keys[field] = list(seen)
+
+        for data_type, (field, suffix) in _KEYED_DATA_TYPES.items():
+            keys[data_type] = [f"{key}{suffix}" for key in self._columns[field]]
+        return keys
+
+    def schema(self) -> dict[str, dict[str, str]]:
+        """Map each data type to ``{column key: stored key}``.
+
+        Mirrors ResultBuilder's conflict handling: 'answer' keys win, and a key
+        already used by another data type is renamed to ``key_datatype``.
+        """
+        if self._schema is None:
+            raw = self._raw_keys()
+            data_types = sorted(raw)
+            data_types.remove("answer")
+            data_types.insert(0, "answer")
+
+            key_to_data_type: dict[str, str] = {}
+            schema: dict[str, dict[str, str]] = {}
+            for data_type in data_types:
+                mapping = {}
+                for key in raw[data_type]:
+                    if key in key_to_data_type:
+                        warnings.warn(
+                            f"Key '{key}' of data type '{data_type}' is already in use. "
+                            f"Renaming to {key}_{data_type}.\n"
+                            f"Conflicting data_type for this key at {key_to_data_type[key]}"
+                        )
+                        mapping[f"{key}_{data_type}"] = key
+                    else:
+                        key_to_data_type[key] = data_type
+                        mapping[key] = key
+                schema[data_type] = mapping
+
+            self._schema = schema
+            self._key_to_data_type = key_to_data_type
+        return self._schema
+
+    def key_to_data_type(self) -> dict[str, str]:
+        self.schema()
+        return self._key_to_data_type
+
+    def column(self, data_type: str, key: str) -> list:
+        """Values of ``data_type.key`` for every row (None where absent)."""
+        cache_key = (data_type, key)
+        if cache_key not in self._resolved:
+            self._resolved[cache_key] = self._resolve(data_type, key)
+        return self._resolved[cache_key]
+
+    def _resolve(self, data_type: str, key: str) -> list:
+        source = self.schema().get(data_type, {}).get(key, _MISSING)
+        if source is _MISSING:
+            return [None] * self._n
+
+        if data_type in _INDEXED_DATA_TYPES:
+            if source == f"{data_type}_index" and self._has_indices():
+                position = _INDEXED_DATA_TYPES.index(data_type)
+                return [
+                    packed[position]
+                    if isinstance(packed, tuple)
+                    else (packed or {}).get(data_type)
+                    for packed in self._indices
+                ]
+            per_payload = [sub.get(source) for sub in self._subs(data_type)]
+            return [per_payload[code] for code in self._codes[data_type]]
+
+        if data_type == "iteration":
+            return list(self._iterations)
+
+        if data_type in QUESTION_FIELDS:
+            question_name = source[: -len(data_type) - 1]
+            answers = self._columns["answer"].get(question_name)
+            if answers is None:
+                return [None] * self._n
+            per_payload = [
+                ((attributes or {}).get(question_name) or {}).get(data_type)
+                for attributes in self._payloads["question_to_attributes"]
+            ]
+            codes = self._codes["question_to_attributes"]
+            return [
+                None if answers[row] is _MISSING else per_payload[codes[row]]
+                for row in range(self._n)
+            ]
+
+        field, suffix = _KEYED_DATA_TYPES[data_type]
+        stored_key = source[: len(source) - len(suffix)] if suffix else source
+        column = self._columns[field].get(stored_key)
+        if column is None:
+            return [None] * self._n
+        return [None if value is _MISSING else value for value in column]
+
+
+class ResultView(Result):
+    """A Result row of a ResultsColumnStore.
+
+    The row's data is rebuilt from the store the first time it is accessed
+    and kept for the life of the view. Views are snapshots: changing one does
+    not change the Results it came from.
+    """
+
+    # Serializes as a Result; not a class of its own in the Base registry
+    _register_subclass = False
+
+    def __init__(self, store: ResultsColumnStore, row: int):
+        self._store = store
+        self._row = row
+        self._data = None
+        self.indices = store.indices(row)
+        self._rb = None
+        self._transformer = None
+        for name, value in store.attributes(row).items():
+            setattr(self, name, value)
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = self._store.row_data(self._row)
+        return self._data
+
+    @data.setter
+    def data(self, value: dict) -> None:
+        self._data = value
+
+
+class ColumnarResultList(MutableSequence):
+    """List of Results backed by a ResultsColumnStore.
+
+    Used as ``Results.data`` for columnar Results. Indexing returns
+    ``ResultView`` rows; slicing and ``take`` return lists sharing the store.
+
+    Examples:
+        >>> from edsl.results import Result
+        >>> rows = ColumnarResultList([Result.example(), Result.example()])
+        >>> len(rows), type(rows[0]).__name__
+        (2, 'ResultView')
+        >>> rows[0]["answer"]["how_feeling"]
+        'OK'
+        >>> len(rows[1:])
+        1
+    """
+
+    def __init__(
+        self,
+        results: Iterable[Result] = (),
+        store: Optional[ResultsColumnStore] = None,
+        rows: Optional[Iterable[int]] = None,
+    ):
+        self._shared = store is not None
+        self._store = store if store is not None else ResultsColumnStore()
+        self._rows = array("l", rows if rows is not None else ())
+        # True while position i is store row i, so columns need no gathering
+        self._identity = not self._shared or (
+            len(self._rows) == len(self._store)
+            and all(i == row for i, row in enumerate(self._rows))
+        )
+        for result in results:
+            self.append(result)
+
+    @property
+    def store(self) -> ResultsColumnStore:
+        return self._store
+
+    def _own(self) -> None:
+        """Copy the rows into a private store before it is written to."""
+        if not self._shared:
+            return
+        store = ResultsColumnStore()
+        for row in self._rows:
+            store.append(ResultView(self._store, row))
+        self._store = store
+        self._rows = array("l", range(len(store)))
+        self._shared = False
+        self._identity = True
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Result]:
+        for row in self._rows:
+            yield ResultView(self._store, row)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return ColumnarResultList(store=self._store, rows=self._rows[i])
+        return ResultView(self._store, self._rows[i])
+
+    def __setitem__(self, i, item) -> None:
+        self._own()
+        if isinstance(i, slice):
+            self._rows[i] = array("l", [self._store.append(r) for r in item])
+        else:
+            self._rows[i] = self._store.append(item)
+        self._identity = False
+
+    def __delitem__(self, i) -> None:
+        del self._rows[i]
+        self._identity = False
+
+    def insert(self, index: int, item: Result) -> None:
+        self._own()
+        self._rows.insert(index, self._store.append(item))
+        self._identity = False
+
+    def append(self, item: Result) -> None:
+        self._own()
+        self._rows.append(self._store.append(item))
+
+    def clear(self) -> None:
+        self._rows = array("l")
+        self._identity = False
+
+    def take(self, positions: Iterable[int]) -> "ColumnarResultList":
+        """Return the rows at the given positions, sharing this store."""
+        return ColumnarResultList(
+            store=self._store, rows=[self._rows[p] for p in positions]
+        )
+
+    # ------------------------------------------------------------------
+    # Column access, used by DataTypeCacheManager and ResultsFilter
+    # ------------------------------------------------------------------
+
+    def key_to_data_type(self) -> dict[str, str]:
+        return self._store.key_to_data_type()
+
+    def data_type_to_keys(self) -> dict[str, list[str]]:
+        data_type_to_keys: dict[str, list[str]] = {}
+        for key, data_type in self.key_to_data_type().items():
+            data_type_to_keys.setdefault(data_type, []).append(key)
+        return data_type_to_keys
+
+    def fetch_list(self, data_type: str, key: str) -> list:
+        column = self._store.column(data_type, key)
+        if self._identity:
+            return list(column)
+        return [column[row] for row in self._rows]
+
+    def problem_keys(self) -> list[str]:
+        """Data type names that are also keys (see Result.check_expression)."""
+        key_to_data_type = self.key_to_data_type()
+        return [dt for dt in self.data_type_to_keys() if dt in key_to_data_type]
+
+    def evaluation_names(self, expression: str) -> Iterator[dict[str, Any]]:
+        """Yield, per row, the names an expression can refer to.
+
+        Equivalent to each Result's ``combined_dict`` restricted to the
+        identifiers that appear in ``expression``, built from the columns.
+        """
+        identifiers = set(_IDENTIFIER.findall(expression))
+        key_to_data_type = self.key_to_data_type()
+        data_type_to_keys = self.data_type_to_keys()
+
+        flat = [
+            (key, self.fetch_list(key_to_data_type[key], key))
+            for key in identifiers
+            if key in key_to_data_type
+        ]
+        nested = [
+            (
+                data_type,
+                [
+                    (key, self.fetch_list(data_type, key))
+                    for key in keys
+                    if key in identifiers
+                ],
+            )
+            for data_type, keys in data_type_to_keys.items()
+            if data_type in identifiers
+        ]
+        for i in range(len(self)):
+            names = {key: column[i] for key, column in flat}
+            for data_type, columns in nested:
+                names[data_type] = {key: column[i] for key, column in columns}
+            yield names
+
+    def expression_column(self, name: str, attr: Optional[str] = None) -> Optional[list]:
+        """The column an expression name (``key``, or ``data_type.key``) refers to.
+
+        Follows the same lookup as ``evaluation_names``: a data type name
+        shadows a key of the same name. Returns ``None`` for a bare data type
+        or an unknown name.
+        """
+        data_type_to_keys = self.data_type_to_keys()
+        if attr is None:
+            if name in data_type_to_keys:
+                return None
+            data_type = self.key_to_data_type().get(name)
+            return None if data_type is None else self.fetch_list(data_type, name)
+        if attr in data_type_to_keys.get(name, ()):
+            return self.fetch_list(name, attr)
+        return None
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod(optionflags=doctest.ELLIPSIS)
@@ -196,7 +196,12 @@ class ResultsContainer:
                 "The created columns are not the same so they cannot be added together."
             )
 
-        combined_data = self._results._data_class()
+        if self._results.is_columnar:
+            from .results_columnar import ColumnarResultList
+
+            combined_data = ColumnarResultList()
+        else:
+            combined_data = self._results._data_class()
         combined_data.extend(self._results.data)
         combined_data.extend(other.data)
 
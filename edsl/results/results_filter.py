@@ -128,6 +128,28 @@ class ResultsFilter:
         )
         return "=" in cleaned
 
+    def _filter_columnar(self, expression: str):
+        """Evaluate the expression against the columns it references.
+
+        Returns a ColumnarResultList of the matching rows, sharing the
+        original column store.
+        """
+        from .exceptions import ResultsColumnNotFoundError
+        from .results_transformer import ResultsTransformer
+
+        data = self.results.data
+        for key in data.problem_keys():
+            if key in expression and key + "." not in expression:
+                raise ResultsColumnNotFoundError(
+                    f"Key by itself {key} is problematic. Use the full key {key + '.' + key} name instead."
+                )
+
+        compiled = ResultsTransformer._compile_expression(expression)
+        mask = compiled.evaluate_columns(data.expression_column, len(data))
+        if mask is None:
+            mask = [compiled.evaluate(names) for names in data.evaluation_names(expression)]
+        return data.take([position for position, keep in enumerate(mask) if keep])
+
     def filter(self, expression: str) -> "Results":
         """Filter results based on a boolean expression.
 
@@ -200,13 +222,34 @@ class ResultsFilter:
                 created_columns=self.results.created_columns,
             )
 
-            # Process one result at a time
-            for result in self.results.data:
-                from .results_transformer import ResultsTransformer
-
-                evaluator = ResultsTransformer._create_evaluator(result)
+            if self.results.is_columnar:
+                filtered_results = Results(
+                    survey=self.results.survey,
+                    data=self._filter_columnar(normalized_expression),
+                    created_columns=self.results.created_columns,
+                )
+                if len(filtered_results) == 0:
+                    hint = self._get_empty_filter_hint(normalized_expression)
+                    warnings.warn(
+                        f"No results remain after applying the filter: {expression}\n{hint}"
+                    )
+                return filtered_results
+
+            from .results_transformer import ResultsTransformer
+
+            # Parse the expression once; evaluate it a column at a time when
+            # possible, otherwise one result at a time
+            data = self.results.data
+            compiled = ResultsTransformer._compile_expression(normalized_expression)
+            for result in data:
                 result.check_expression(normalized_expression)  # check expression
-                if evaluator.eval(normalized_expression):
+            mask = compiled.evaluate_columns(
+                ResultsTransformer._column_resolver(data), len(data)
+            )
+            if mask is None:
+                mask = (compiled.evaluate(result.combined_dict) for result in data)
+            for result, keep in zip(data, mask):
+                if keep:
                     filtered_results.append(
                         result
                     )  # Use append method to add matching results
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from . import Results
     from .result import Result
     from simpleeval import EvalWithCompoundTypes
+    from ..utilities import CompiledExpression
 
 from .exceptions import (
     ResultsBadMutationstringError,
@@ -83,6 +84,45 @@ class ResultsTransformer:
         evaluator.functions.update(int=int, float=float)
         return evaluator
 
+    @staticmethod
+    def _compile_expression(
+        expression: str, functions_dict: Optional[dict] = None
+    ) -> "CompiledExpression":
+        """Compile an expression with the functions ``_create_evaluator`` provides.
+
+        Examples:
+            >>> expr = ResultsTransformer._compile_expression("int(how_feeling) > 1")
+            >>> expr.evaluate({'how_feeling': '2'})
+            True
+        """
+        from ..utilities import CompiledExpression
+
+        return CompiledExpression(
+            expression, functions={**(functions_dict or {}), "int": int, "float": float}
+        )
+
+    @staticmethod
+    def _column_resolver(data):
+        """Return the column lookup ``CompiledExpression.evaluate_columns`` needs.
+
+        Columnar data answers from its column store; a list of Results
+        collects the value of each name from every row's ``combined_dict``.
+        """
+        from .results_columnar import ColumnarResultList
+
+        if isinstance(data, ColumnarResultList):
+            return data.expression_column
+
+        def resolve(name: str, attr: Optional[str]) -> Optional[list]:
+            if attr is not None:
+                return None
+            try:
+                return [result.combined_dict[name] for result in data]
+            except KeyError:
+                return None
+
+        return resolve
+
     def _parse_column(self, column: str) -> tuple[str, str]:
         """Parse a column name into a data type and key.
 
@@ -160,18 +200,22 @@ class ResultsTransformer:
         if not is_valid_variable_name(var_name):
             raise ResultsInvalidNameError(f"{var_name} is not a valid variable name.")
 
-        # create the evaluator
-        functions_dict = functions_dict or {}
+        # compile the expression once for all rows
+        compiled = self._compile_expression(expression, functions_dict)
+        data = self.results.data
 
-        def new_result(old_result: "Result", var_name: str) -> "Result":
-            evaluator = self._create_evaluator(old_result, functions_dict)
-            value = evaluator.eval(expression)
+        def new_result(old_result: "Result", value) -> "Result":
             new_result = old_result.copy()
             new_result["answer"][var_name] = value
             return new_result
 
         try:
-            new_data = [new_result(result, var_name) for result in self.results.data]
+            values = compiled.evaluate_columns(self._column_resolver(data), len(data))
+            if values is None:
+                values = [compiled.evaluate(result.combined_dict) for result in data]
+            new_data = [
+                new_result(result, value) for result, value in zip(data, values)
+            ]
         except Exception as e:
             raise ResultsMutateError(f"Error in mutate. Exception:{e}")
 
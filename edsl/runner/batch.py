@@ -0,0 +1,287 @@
+"""
+Batch execution mode - Run LLM calls through provider batch APIs.
+
+With ``execution_mode="batch"`` the Runner renders one wave of ready tasks at
+a time (one wave per level of the survey's dependency graph), writes the
+prompts that miss the cache to a provider JSONL batch file, submits it and
+polls until it finishes. The responses are then registered on the model as
+prefetched responses, and the wave is enqueued through the normal execution
+path: each task's model call picks up its prefetched response instead of
+calling the API, stores it with ``Cache.store`` and builds its answer exactly
+as a live call would.
+
+Tasks that cannot be batched (file attachments, interview-type questions,
+services without a batch backend) and batch items that come back with an
+error are executed live.
+
+Usage:
+    backend = OpenAIBatchBackend(api_key="sk-...", base_url="http://localhost:8000/v1")
+    responses = backend.run([BatchRequest("key1", {"model": "gpt-4o", ...})])
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BatchExecutionError(Exception):
+    """Raised when a provider batch cannot be submitted or does not complete."""
+
+    def __init__(self, service: str, message: str, batch_id: str | None = None):
+        self.service = service
+        self.batch_id = batch_id
+        super().__init__(f"[{service} batch {batch_id or '-'}] {message}")
+
+
+@dataclass
+class BatchRequest:
+    """One request in a provider batch, identified by its cache key."""
+
+    custom_id: str
+    body: dict
+
+
+class BatchBackend(ABC):
+    """
+    Base class for provider batch APIs.
+
+    Subclasses implement ``_jsonl_line``, ``_submit``, ``_poll``,
+    ``_is_finished`` and ``_fetch_results``; ``run``
+    drives a batch from JSONL file to a ``{custom_id: response}`` mapping.
+    Items that failed are left out of the mapping.
+    """
+
+    service: str = ""
+    base_url_env: str = ""
+    default_base_url: str = ""
+
+    def __init__(
+        self,
+        api_key: str | None,
+        base_url: str | None = None,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        work_dir: str | Path | None = None,
+    ):
+        self.api_key = api_key
+        self.base_url = (
+            base_url or os.getenv(self.base_url_env) or self.default_base_url
+        ).rstrip("/")
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.work_dir = Path(work_dir or tempfile.mkdtemp(prefix="edsl_batch_"))
+
+    @classmethod
+    def for_model(cls, model: Any, **kwargs) -> "BatchBackend":
+        """Create a backend using the model's credentials and endpoint."""
+        api_key_env = getattr(model, "api_key_env", None)
+        api_key = os.getenv(api_key_env) if api_key_env else None
+        api_key = api_key or getattr(model, "api_token", None)
+        base_url = getattr(model, "base_url", None) or getattr(
+            model, "_base_url_", None
+        )
+        return cls(api_key=api_key, base_url=base_url, **kwargs)
+
+    def write_jsonl(self, requests: list[BatchRequest]) -> Path:
+        """Write the provider's JSONL input file and return its path."""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        path = self.work_dir / f"{self.service}_{time.time_ns()}.jsonl"
+        with open(path, "w") as f:
+            for request in requests:
+                f.write(json.dumps(self._jsonl_line(request)) + "\n")
+        return path
+
+    def run(self, requests: list[BatchRequest]) -> dict[str, dict]:
+        """Submit ``requests`` as one batch, wait for it and return the responses."""
+        if not requests:
+            return {}
+        path = self.write_jsonl(requests)
+        batch_id = self._submit(path, requests)
+        logger.info(
+            "Submitted %s batch %s with %d requests", self.service, batch_id, len(requests)
+        )
+        start = time.time()
+        while True:
+            batch = self._poll(batch_id)
+            if self._is_finished(batch):
+                break
+            if self.timeout is not None and time.time() - start > self.timeout:
+                raise BatchExecutionError(
+                    self.service, f"timed out after {self.timeout}s", batch_id
+                )
+            time.sleep(self.poll_interval)
+        return self._fetch_results(batch_id, batch)
+
+    # Provider-specific hooks
+
+    @abstractmethod
+    def _jsonl_line(self, request: BatchRequest) -> dict:
+        """Return the provider's JSONL input line for ``request``."""
+        pass
+
+    @abstractmethod
+    def _submit(self, path: Path, requests: list[BatchRequest]) -> str:
+        """Upload the JSONL file at ``path``, create the batch and return its id."""
+        pass
+
+    @abstractmethod
+    def _poll(self, batch_id: str) -> dict:
+        """Return the provider's current status object for the batch."""
+        pass
+
+    @abstractmethod
+    def _is_finished(self, batch: dict) -> bool:
+        """Return True once the batch has reached a terminal status."""
+        pass
+
+    @abstractmethod
+    def _fetch_results(self, batch_id: str, batch: dict) -> dict[str, dict]:
+        """Download the results as ``{custom_id: response}``, without failed items."""
+        pass
+
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        import requests
+
+        response = requests.request(
+            method, url, headers=self._headers(), timeout=60, **kwargs
+        )
+        if response.status_code >= 400:
+            raise BatchExecutionError(
+                self.service,
+                f"{method} {url} returned {response.status_code}: {response.text[:500]}",
+            )
+        return response
+
+    def _headers(self) -> dict:
+        return {}
+
+    @staticmethod
+    def _parse_jsonl(text: str) -> list[dict]:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API: upload a JSONL file, create a batch, download output."""
+
+    service = "openai"
+    base_url_env = "OPENAI_BASE_URL"
+    default_base_url = "https://api.openai.com/v1"
+    endpoint = "/v1/chat/completions"
+    terminal_statuses = {"completed", "failed", "expired", "cancelled"}
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _jsonl_line(self, request: BatchRequest) -> dict:
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": self.endpoint,
+            "body": request.body,
+        }
+
+    def _submit(self, path: Path, requests: list[BatchRequest]) -> str:
+        with open(path, "rb") as f:
+            uploaded = self._request(
+                "POST",
+                f"{self.base_url}/files",
+                data={"purpose": "batch"},
+                files={"file": (path.name, f, "application/jsonl")},
+            ).json()
+        batch = self._request(
+            "POST",
+            f"{self.base_url}/batches",
+            json={
+                "input_file_id": uploaded["id"],
+                "endpoint": self.endpoint,
+                "completion_window": "24h",
+            },
+        ).json()
+        return batch["id"]
+
+    def _poll(self, batch_id: str) -> dict:
+        return self._request("GET", f"{self.base_url}/batches/{batch_id}").json()
+
+    def _is_finished(self, batch: dict) -> bool:
+        return batch.get("status") in self.terminal_statuses
+
+    def _fetch_results(self, batch_id: str, batch: dict) -> dict[str, dict]:
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            raise BatchExecutionError(
+                self.service, f"finished with status {batch.get('status')!r}", batch_id
+            )
+        text = self._request(
+            "GET", f"{self.base_url}/files/{output_file_id}/content"
+        ).text
+        results = {}
+        for line in self._parse_jsonl(text):
+            response = line.get("response") or {}
+            if line.get("error") or response.get("status_code") != 200:
+                continue
+            results[line["custom_id"]] = response["body"]
+        return results
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API: create a batch, then stream its results."""
+
+    service = "anthropic"
+    base_url_env = "ANTHROPIC_BASE_URL"
+    default_base_url = "https://api.anthropic.com"
+    api_version = "2023-06-01"
+
+    def _headers(self) -> dict:
+        return {"x-api-key": self.api_key or "", "anthropic-version": self.api_version}
+
+    def _jsonl_line(self, request: BatchRequest) -> dict:
+        return {"custom_id": request.custom_id, "params": request.body}
+
+    def _submit(self, path: Path, requests: list[BatchRequest]) -> str:
+        lines = self._parse_jsonl(path.read_text())
+        batch = self._request(
+            "POST", f"{self.base_url}/v1/messages/batches", json={"requests": lines}
+        ).json()
+        return batch["id"]
+
+    def _poll(self, batch_id: str) -> dict:
+        return self._request(
+            "GET", f"{self.base_url}/v1/messages/batches/{batch_id}"
+        ).json()
+
+    def _is_finished(self, batch: dict) -> bool:
+        return batch.get("processing_status") == "ended"
+
+    def _fetch_results(self, batch_id: str, batch: dict) -> dict[str, dict]:
+        results_url = batch.get("results_url")
+        if not results_url:
+            raise BatchExecutionError(self.service, "ended without results", batch_id)
+        text = self._request("GET", results_url).text
+        results = {}
+        for line in self._parse_jsonl(text):
+            result = line.get("result") or {}
+            if result.get("type") == "succeeded":
+                results[line["custom_id"]] = result["message"]
+        return results
+
+
+BATCH_BACKENDS: dict[str, type[BatchBackend]] = {
+    OpenAIBatchBackend.service: OpenAIBatchBackend,
+    AnthropicBatchBackend.service: AnthropicBatchBackend,
+}
+
+
+def get_batch_backend(model: Any, **kwargs) -> BatchBackend | None:
+    """Return a batch backend for ``model``'s service, or None if unsupported."""
+    backend_cls = BATCH_BACKENDS.get(getattr(model, "_inference_service_", None))
+    if backend_cls is None or not hasattr(model, "batch_request_body"):
+        return None
+    return backend_cls.for_model(model, **kwargs)
@@ -101,9 +101,10 @@ class RunnerCASIntegration:
             self._flush()
 
     def finalize(self):
-        """Flush any remaining pending results."""
+        """Flush any remaining pending results and commit the final tree."""
         if self._pending_ids:
             self._flush()
+        self._writer.finalize()
 
     def _flush(self):
         """Serialize pending interviews and write to CAS."""
@@ -0,0 +1,265 @@
+"""
+AdaptiveConcurrencyController - AIMD sizing of the execution worker pool.
+
+Each worker holds up to its batch size of model calls in flight (one by
+default, see the Runner's ``worker_batch_size``), so the number of workers
+sets the job's concurrency. Too few workers leave rate-limit headroom unused;
+too many only produce 429s and queueing at the provider. The controller
+samples the pool once per ``interval`` and adjusts a target worker count:
+
+- Congestion (429 responses, or call latency rising well above the best
+  latency of the last ``latency_window`` steps) multiplies the target by
+  ``decrease_factor``. The baseline is a windowed minimum so that it
+  follows the provider when its latency shifts for good (longer prompts,
+  a slower model) instead of holding on to one fast early interval.
+- A backlog that every worker is busy with adds ``additive_step`` workers,
+  or doubles the target during slow start (until the first congestion
+  signal), so large jobs ramp up quickly.
+- When the local token buckets are what holds tasks back, more workers
+  cannot help and the target is held.
+
+A 429 decreases the target as soon as it is observed rather than at the next
+step, since a worker that keeps being rejected would otherwise burn through
+many requests within one interval. Only calls that started after the last
+decrease count as congestion, so one burst of 429s from requests already in
+flight causes one decrease rather than a cascade. Every change is recorded
+as a ConcurrencyDecision.
+"""
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Callable
+import logging
+import time
+
+if TYPE_CHECKING:
+    from .coordinator import ExecutionCoordinator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConcurrencyDecision:
+    """One control step: the signals observed and the target chosen."""
+
+    timestamp: float
+    action: str  # "increase", "decrease" or "hold"
+    reason: str
+    previous_target: int
+    target: int
+    queue_depth: int
+    in_flight: int
+    bucket_wait: float
+    mean_latency: float | None
+    completed: int
+    rate_limited: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class AdaptiveConcurrencyController:
+    """
+    Chooses how many execution workers to run from live signals.
+
+    Workers report every model call through ``observe``; ``step`` is called
+    periodically by ExecutionWorkerPool and returns the new target. When a
+    429 lowers the target between steps, ``on_target_change`` (if set) is
+    called with the new target.
+    """
+
+    def __init__(
+        self,
+        coordinator: "ExecutionCoordinator",
+        min_workers: int = 1,
+        max_workers: int = 400,
+        initial_workers: int | None = None,
+        interval: float = 0.25,
+        additive_step: int = 2,
+        decrease_factor: float = 0.7,
+        latency_tolerance: float = 3.0,
+        latency_window: int = 120,
+        history_size: int = 1000,
+    ):
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self._coordinator = coordinator
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.interval = interval
+        self.additive_step = additive_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self._target = min(
+            self.max_workers, max(self.min_workers, initial_workers or self.min_workers)
+        )
+        self._slow_start = True
+        self._last_decrease = 0.0
+        # Mean latency of each recent step that saw successful calls
+        self._step_latencies: deque[float] = deque(maxlen=max(1, latency_window))
+        self._base_latency: float | None = None
+
+        # Observations since the last step
+        self._latencies: list[float] = []
+        self._completed = 0
+        self._rate_limited = 0
+
+        self._decisions: deque[ConcurrencyDecision] = deque(maxlen=history_size)
+        self._totals = {"increase": 0, "decrease": 0, "hold": 0}
+        self._peak_target = self._target
+        self._total_rate_limited = 0
+        self.on_target_change: Callable[[int], None] | None = None
+
+    @property
+    def target(self) -> int:
+        return self._target
+
+    @property
+    def decisions(self) -> list[ConcurrencyDecision]:
+        return list(self._decisions)
+
+    def observe(
+        self, started_at: float, latency: float, error_type: str | None = None
+    ) -> None:
+        """Record one finished model call; a fresh 429 decreases the target."""
+        self._completed += 1
+        if error_type == "rate_limit":
+            self._total_rate_limited += 1
+            if started_at >= self._last_decrease:
+                self._rate_limited += 1
+                stats = self._coordinator.get_stats()
+                self._decrease(
+                    "rate-limited call",
+                    queue_depth=stats["total_depth"],
+                    in_flight=stats["in_flight_tasks"],
+                )
+                if self.on_target_change is not None:
+                    self.on_target_change(self._target)
+        elif error_type is None and started_at >= self._last_decrease:
+            self._latencies.append(latency)
+
+    def _decrease(self, reason: str, **signals) -> ConcurrencyDecision:
+        previous = self._target
+        self._target = max(self.min_workers, int(previous * self.decrease_factor))
+        self._slow_start = False
+        self._last_decrease = time.time()
+        return self._record("decrease", reason, previous, **signals)
+
+    def _record(
+        self,
+        action: str,
+        reason: str,
+        previous: int,
+        queue_depth: int,
+        in_flight: int,
+        bucket_wait: float = 0.0,
+        mean_latency: float | None = None,
+        completed: int = 0,
+        rate_limited: int = 0,
+    ) -> ConcurrencyDecision:
+        self._peak_target = max(self._peak_target, self._target)
+        self._totals[action] += 1
+        decision = ConcurrencyDecision(
+            timestamp=time.time(),
+            action=action,
+            reason=reason,
+            previous_target=previous,
+            target=self._target,
+            queue_depth=queue_depth,
+            in_flight=in_flight,
+            bucket_wait=bucket_wait,
+            mean_latency=mean_latency,
+            completed=completed,
+            rate_limited=rate_limited,
+        )
+        self._decisions.append(decision)
+        if action != "hold":
+            logger.debug(
+                "[CONCURRENCY] %s %d -> %d (%s)", action, previous, self._target, reason
+            )
+        return decision
+
+    def _bucket_wait(self) -> float:
+        """Longest token-bucket wait among queues that have tasks waiting."""
+        registry = self._coordinator.registry
+        wait = 0.0
+        for meta in registry.list_queues():
+            queue = registry.get_queue(meta.queue_id)
+            if queue.depth == 0:
+                continue
+            task = queue.peek()
+            estimated_tokens = task.get("estimated_tokens", 500) if task else 500
+            wait = max(wait, queue.time_until_available(estimated_tokens))
+        return wait
+
+    def step(self) -> ConcurrencyDecision:
+        """Run one control step and return the decision taken."""
+        stats = self._coordinator.get_stats()
+        depth = stats["total_depth"]
+        in_flight = stats["in_flight_tasks"]
+        bucket_wait = self._bucket_wait() if depth else 0.0
+
+        latencies, self._latencies = self._latencies, []
+        completed, self._completed = self._completed, 0
+        rate_limited, self._rate_limited = self._rate_limited, 0
+        mean_latency = sum(latencies) / len(latencies) if latencies else None
+        if mean_latency is not None:
+            self._step_latencies.append(mean_latency)
+            self._base_latency = min(self._step_latencies)
+        signals = dict(
+            queue_depth=depth,
+            in_flight=in_flight,
+            bucket_wait=bucket_wait,
+            mean_latency=mean_latency,
+            completed=completed,
+            rate_limited=rate_limited,
+        )
+
+        previous = self._target
+        if (
+            mean_latency is not None
+            and mean_latency > self.latency_tolerance * self._base_latency
+        ):
+            return self._decrease(
+                f"latency {mean_latency:.3f}s above {self.latency_tolerance:g}x "
+                f"recent best {self._base_latency:.3f}s",
+                **signals,
+            )
+        if rate_limited:
+            reason = "recovering from rate limiting"
+        elif depth == 0:
+            reason = "no backlog"
+        elif bucket_wait > 0:
+            reason = f"token bucket wait {bucket_wait:.3f}s"
+        elif in_flight < previous:
+            reason = "idle workers"
+        elif previous >= self.max_workers:
+            reason = "at max_workers"
+        else:
+            step = previous if self._slow_start else self.additive_step
+            # Never add more workers than there are tasks to hand them
+            self._target = max(
+                previous, min(self.max_workers, previous + step, in_flight + depth)
+            )
+            if self._target > previous:
+                return self._record(
+                    "increase", "backlog with all workers busy", previous, **signals
+                )
+            reason = "target covers backlog"
+        return self._record("hold", reason, previous, **signals)
+
+    def get_stats(self) -> dict:
+        """Return the controller's current state and decision counts."""
+        return {
+            "target": self._target,
+            "peak_target": self._peak_target,
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "slow_start": self._slow_start,
+            "base_latency": self._base_latency,
+            "increases": self._totals["increase"],
+            "decreases": self._totals["decrease"],
+            "holds": self._totals["hold"],
+            "rate_limited": self._total_rate_limited,
+        }
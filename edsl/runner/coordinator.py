@@ -19,6 +19,7 @@ from .queues import QueueRegistry
 from .render import RenderedPrompt
 
 if TYPE_CHECKING:
+    from ..inference_services.rate_limit_headers import RateLimitHeaders
     from .worker_registry import WorkerRegistry
 
 # Configure logging for coordinator operations
@@ -48,6 +49,7 @@ class WorkCompletion:
     output_tokens: int | None = None
     error_type: str | None = None
     error_message: str | None = None
+    rate_limits: "RateLimitHeaders | None" = None
 
 
 class ExecutionCoordinator:
@@ -83,6 +85,11 @@ class ExecutionCoordinator:
         self._cleanup_task: asyncio.Task | None = None
         self._running = False
 
+    @property
+    def registry(self) -> QueueRegistry:
+        """The queue registry tasks are dispatched from."""
+        return self._registry
+
     def enqueue(self, rendered: RenderedPrompt) -> str | None:
         """
         Add a rendered task to the appropriate queue.
@@ -109,17 +116,22 @@ class ExecutionCoordinator:
         service = rendered.service_name or "openai"
         model = rendered.model_name or "gpt-4o-mini"
 
-        logger.info(
-            f"[COORDINATOR ENQUEUE] task={rendered.task_id[:8]}... "
-            f"service={service} model={model} question={rendered.question_name} "
-            f"estimated_tokens={rendered.estimated_tokens}"
+        logger.debug(
+            "[COORDINATOR ENQUEUE] task=%s... service=%s model=%s question=%s "
+            "estimated_tokens=%s",
+            rendered.task_id[:8],
+            service,
+            model,
+            rendered.question_name,
+            rendered.estimated_tokens,
         )
 
         try:
             queue_id = self._registry.enqueue_task(task_dict, service, model)
-            logger.info(
-                f"[COORDINATOR ENQUEUE SUCCESS] task={rendered.task_id[:8]}... "
-                f"-> queue={queue_id[:8]}..."
+            logger.debug(
+                "[COORDINATOR ENQUEUE SUCCESS] task=%s... -> queue=%s...",
+                rendered.task_id[:8],
+                queue_id[:8],
             )
         except ValueError as e:
             logger.debug(
@@ -139,12 +151,31 @@ class ExecutionCoordinator:
 
         Returns WorkAssignment or None on timeout.
         """
+        assignments = self.request_work_batch(1, timeout=timeout)
+        return assignments[0] if assignments else None
+
+    def request_work_batch(
+        self,
+        max_tasks: int,
+        token_budget: int | None = None,
+        timeout: float = 30.0,
+    ) -> list[WorkAssignment]:
+        """
+        Worker requests up to ``max_tasks`` tasks at once.
+
+        Blocks until at least one task is available or timeout. All tasks in
+        a batch come from the same queue and their rate-limit tokens are
+        acquired in one pass. ``token_budget`` caps the summed
+        estimated_tokens of the batch (the first task is always allowed).
+
+        Returns a list of WorkAssignments, empty on timeout.
+        """
         deadline = time.time() + timeout
 
         while time.time() < deadline:
-            assignment = self._try_assign()
-            if assignment:
-                return assignment
+            assignments = self._try_assign_batch(max_tasks, token_budget)
+            if assignments:
+                return assignments
 
             # Wait for new work
             remaining = deadline - time.time()
@@ -153,10 +184,20 @@ class ExecutionCoordinator:
 
             time.sleep(min(0.1, remaining))
 
-        return None
+        return []
 
     async def async_request_work(self, timeout: float = 30.0) -> WorkAssignment | None:
         """Async version of request_work with event-based wake."""
+        assignments = await self.async_request_work_batch(1, timeout=timeout)
+        return assignments[0] if assignments else None
+
+    async def async_request_work_batch(
+        self,
+        max_tasks: int,
+        token_budget: int | None = None,
+        timeout: float = 30.0,
+    ) -> list[WorkAssignment]:
+        """Async version of request_work_batch with event-based wake."""
         deadline = time.time() + timeout
 
         # Create an event for this worker to wait on
@@ -168,9 +209,9 @@ class ExecutionCoordinator:
 
         try:
             while time.time() < deadline:
-                assignment = self._try_assign()
-                if assignment:
-                    return assignment
+                assignments = self._try_assign_batch(max_tasks, token_budget)
+                if assignments:
+                    return assignments
 
                 remaining = deadline - time.time()
                 if remaining <= 0:
@@ -183,22 +224,32 @@ class ExecutionCoordinator:
                 except asyncio.TimeoutError:
                     pass  # Timeout - loop and check again
 
-            return None
+            return []
         finally:
             # Unregister this worker
             with self._lock:
                 self._waiting_workers.pop(worker_id, None)
 
     def _try_assign(self) -> WorkAssignment | None:
+        """Try to assign a single task to a worker."""
+        assignments = self._try_assign_batch(1)
+        return assignments[0] if assignments else None
+
+    def _try_assign_batch(
+        self, max_tasks: int, token_budget: int | None = None
+    ) -> list[WorkAssignment]:
         """
-        Try to assign work to a worker.
+        Try to assign up to ``max_tasks`` tasks from one queue to a worker.
 
         Tries multiple queues if the first is rate-limited, rather than
         giving up immediately. This reduces contention when many workers
-        compete for work across multiple queues.
+        compete for work across multiple queues. Within the chosen queue,
+        tokens for the whole batch are acquired with one try_acquire_batch
+        call and the tasks are dequeued and tracked in one pass each.
         """
         heap = self._registry.dispatch_heap
         now = time.time()
+        max_tasks = max(1, max_tasks)
 
         # Track queues we tried but couldn't use (to put back later)
         tried_queues: list[tuple[str, float]] = []
@@ -226,32 +277,44 @@ class ExecutionCoordinator:
                 break
 
             queue = self._registry.get_queue(queue_id)
-            task = queue.peek()
-            if task is None:
+            candidates = queue.peek_many(max_tasks)
+            if not candidates:
                 # Queue is empty - don't put back, try next
                 logger.debug(
                     f"[COORDINATOR ASSIGN] queue={queue_id[:8]}... empty, trying next"
                 )
                 continue
 
-            estimated_tokens = task.get("estimated_tokens", 500)
-
-            # Try to acquire tokens
-            if queue.try_acquire(estimated_tokens):
+            estimates = [task.get("estimated_tokens", 500) for task in candidates]
+            if token_budget is not None:
+                budgeted, total = estimates[:1], estimates[0]
+                for estimate in estimates[1:]:
+                    total += estimate
+                    if total > token_budget:
+                        break
+                    budgeted.append(estimate)
+                estimates = budgeted
+
+            # Try to acquire tokens for as many of the candidates as fit
+            granted = queue.try_acquire_batch(estimates)
+            if granted:
                 # Success! Put back all queues we skipped
                 for skipped_id, skipped_time in tried_queues:
                     heap.push(skipped_id, skipped_time)
 
-                # Dequeue the task
-                task = queue.dequeue()
+                # Dequeue the tasks and track them as in-flight for recovery
+                tasks = queue.dequeue_many(granted)
+                self._track_in_flight_many(queue_id, tasks)
 
-                # Track as in-flight for recovery
-                self._track_in_flight(task["task_id"], queue_id, task)
-
-                logger.info(
-                    f"[COORDINATOR ASSIGN SUCCESS] task={task['task_id'][:8]}... "
-                    f"from queue={queue_id[:8]}... service={queue.service} model={queue.model} "
-                    f"(attempt {attempt + 1})"
+                logger.debug(
+                    "[COORDINATOR ASSIGN SUCCESS] tasks=%d first=%s... "
+                    "from queue=%s... service=%s model=%s (attempt %d)",
+                    len(tasks),
+                    tasks[0]["task_id"][:8],
+                    queue_id[:8],
+                    queue.service,
+                    queue.model,
+                    attempt + 1,
                 )
 
                 # Re-add queue to heap if more tasks
@@ -263,33 +326,18 @@ class ExecutionCoordinator:
                     next_avail = now + queue.time_until_available(next_estimated)
                     heap.push(queue_id, next_avail)
 
-                # Build RenderedPrompt from task dict
-                rendered = RenderedPrompt(
-                    task_id=task["task_id"],
-                    job_id=task["job_id"],
-                    interview_id=task["interview_id"],
-                    system_prompt=task["system_prompt"],
-                    user_prompt=task["user_prompt"],
-                    estimated_tokens=task["estimated_tokens"],
-                    cache_key=task["cache_key"],
-                    question_name=task.get("question_name"),
-                    question_id=task.get("question_id"),
-                    files_list=task.get("files_list"),
-                    model_id=task.get("model_id"),
-                    iteration=task.get("iteration", 0),
-                    agent_name=task.get("agent_name"),
-                    question_type=task.get("question_type"),
-                )
-
-                return WorkAssignment(
-                    task=rendered,
-                    queue_id=queue_id,
-                    api_key=queue.api_key,
-                    assigned_at=now,
-                )
+                return [
+                    WorkAssignment(
+                        task=self._rendered_from_task(task),
+                        queue_id=queue_id,
+                        api_key=queue.api_key,
+                        assigned_at=now,
+                    )
+                    for task in tasks
+                ]
             else:
                 # Rate limited - save with updated availability, try next queue
-                wait_time = queue.time_until_available(estimated_tokens)
+                wait_time = queue.time_until_available(estimates[0])
                 tried_queues.append((queue_id, now + wait_time))
                 logger.debug(
                     f"[COORDINATOR ASSIGN] queue={queue_id[:8]}... rate limited "
@@ -300,31 +348,78 @@ class ExecutionCoordinator:
         for queue_id, avail_time in tried_queues:
             heap.push(queue_id, avail_time)
 
-        return None
+        return []
+
+    @staticmethod
+    def _rendered_from_task(task: dict) -> RenderedPrompt:
+        """Build a RenderedPrompt from a queued task dict."""
+        return RenderedPrompt(
+            task_id=task["task_id"],
+            job_id=task["job_id"],
+            interview_id=task["interview_id"],
+            system_prompt=task["system_prompt"],
+            user_prompt=task["user_prompt"],
+            estimated_tokens=task["estimated_tokens"],
+            cache_key=task["cache_key"],
+            question_name=task.get("question_name"),
+            question_id=task.get("question_id"),
+            files_list=task.get("files_list"),
+            model_id=task.get("model_id"),
+            iteration=task.get("iteration", 0),
+            agent_name=task.get("agent_name"),
+            question_type=task.get("question_type"),
+        )
 
     def complete_work(self, completion: WorkCompletion) -> None:
         """Worker reports task completion."""
-        # Get estimated_tokens before untracking
-        estimated_tokens = 0
-        with self._in_flight_lock:
-            if completion.task_id in self._in_flight:
-                _, task_dict, _ = self._in_flight[completion.task_id]
-                estimated_tokens = task_dict.get("estimated_tokens", 0)
+        self.complete_work_batch([completion])
 
-        # Untrack from in-flight
-        self._untrack_in_flight(completion.task_id)
+    def complete_work_batch(self, completions: list[WorkCompletion]) -> None:
+        """
+        Worker reports several task completions at once.
 
-        # Reconcile estimated vs actual tokens in the queue
-        if completion.actual_tokens is not None and estimated_tokens > 0:
-            queue = self._registry.get_queue(completion.queue_id)
+        Untracks all tasks under one lock, then reconciles estimated against
+        actual tokens once per queue with the summed counts. Rate-limit
+        headers the provider sent back are applied to the task's queue.
+        """
+        # Get estimated_tokens while untracking from in-flight
+        estimated: dict[str, int] = {}
+        with self._in_flight_lock:
+            for completion in completions:
+                entry = self._in_flight.pop(completion.task_id, None)
+                if entry is not None:
+                    estimated[completion.task_id] = entry[1].get("estimated_tokens", 0)
+
+        # Reconcile estimated vs actual tokens, summed per queue
+        totals: dict[str, list] = {}
+        for completion in completions:
+            estimated_tokens = estimated.get(completion.task_id, 0)
+            if completion.actual_tokens is None or estimated_tokens <= 0:
+                continue
+            total = totals.setdefault(completion.queue_id, [0, 0, None, None])
+            total[0] += estimated_tokens
+            total[1] += completion.actual_tokens
+            if completion.input_tokens is not None:
+                total[2] = (total[2] or 0) + completion.input_tokens
+            if completion.output_tokens is not None:
+                total[3] = (total[3] or 0) + completion.output_tokens
+
+        for queue_id, (est, actual, input_tokens, output_tokens) in totals.items():
+            queue = self._registry.get_queue(queue_id)
             if queue is not None:
                 queue.reconcile(
-                    estimated_tokens,
-                    completion.actual_tokens,
-                    input_tokens=completion.input_tokens,
-                    output_tokens=completion.output_tokens,
+                    est,
+                    actual,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
                 )
 
+        for completion in completions:
+            if completion.rate_limits is not None:
+                queue = self._registry.get_queue(completion.queue_id)
+                if queue is not None:
+                    queue.apply_rate_limits(completion.rate_limits)
+
     def _wake_workers(self) -> None:
         """Signal waiting workers that work is available."""
         with self._lock:
@@ -355,6 +450,13 @@ class ExecutionCoordinator:
         with self._in_flight_lock:
             self._in_flight[task_id] = (queue_id, task_dict, time.time())
 
+    def _track_in_flight_many(self, queue_id: str, tasks: list[dict]) -> None:
+        """Track several tasks from one queue as in-flight under one lock."""
+        now = time.time()
+        with self._in_flight_lock:
+            for task in tasks:
+                self._in_flight[task["task_id"]] = (queue_id, task, now)
+
     def _untrack_in_flight(self, task_id: str) -> None:
         """Remove task from in-flight tracking."""
         with self._in_flight_lock:
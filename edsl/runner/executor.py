@@ -9,15 +9,22 @@ import logging
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 import asyncio
+import time
 
 logger = logging.getLogger(__name__)
 
+from .concurrency import AdaptiveConcurrencyController
 from .coordinator import ExecutionCoordinator, WorkAssignment, WorkCompletion
+from .render import RenderedPrompt
 from .service import JobService
 from .models import TaskStatus, generate_id
 
 # EDSL imports - relative since this module lives inside edsl package
 from ..caching import Cache
+from ..inference_services.rate_limit_headers import (
+    RateLimitHeaders,
+    collect_rate_limits,
+)
 from ..agents import Agent
 from ..questions import QuestionBase
 from ..questions.exceptions import QuestionAnswerValidationError
@@ -61,6 +68,8 @@ class ExecutionResult:
     resolution_draw: Any = None
     resolution_seed: int | None = None
     resolution_method: str | None = None
+    # Rate-limit headers from the provider's last response, if any
+    rate_limits: RateLimitHeaders | None = None
 
 
 class ExecutionWorker:
@@ -76,6 +85,11 @@ class ExecutionWorker:
     6. Update job service with result
     7. Unregister on shutdown
 
+    With ``batch_size > 1`` the worker takes up to that many tasks per
+    request, runs them concurrently, and reports them to the coordinator
+    and job service in one batch each. This amortizes per-task coordinator
+    and storage overhead when model calls are cheap (e.g. cache hits).
+
     For distributed execution, provide a WorkerRegistry to enable:
     - Worker registration and discovery
     - Heartbeat monitoring for failure detection
@@ -91,12 +105,17 @@ class ExecutionWorker:
         worker_registry: "WorkerRegistry | None" = None,
         worker_id: str | None = None,
         heartbeat_interval: float = 10.0,
+        controller: AdaptiveConcurrencyController | None = None,
+        batch_size: int = 1,
     ):
         self._coordinator = coordinator
         self._job_service = job_service
         self._idle_timeout = idle_timeout
+        self._batch_size = max(1, batch_size)
         self._cache = cache  # Optional EDSL Cache object
+        self._controller = controller  # Receives latency and error observations
         self._running = False
+        self._stop_requested = False
 
         # Distributed execution support
         self._worker_registry = worker_registry
@@ -109,7 +128,8 @@ class ExecutionWorker:
     async def run(self) -> None:
         """Main worker loop."""
 
-        self._running = True
+        # A worker stopped before its task was scheduled never starts
+        self._running = not self._stop_requested
 
         # Register with worker registry if distributed
         if self._worker_registry:
@@ -118,16 +138,16 @@ class ExecutionWorker:
         try:
             while self._running:
                 # Request work
-                assignment = await self._coordinator.async_request_work(
-                    timeout=self._idle_timeout
+                assignments = await self._coordinator.async_request_work_batch(
+                    self._batch_size, timeout=self._idle_timeout
                 )
 
-                if assignment is None:
+                if not assignments:
                     continue
 
                 # Track current task for heartbeat
-                self._current_task_id = assignment.task.task_id
-                self._current_job_id = assignment.task.job_id
+                self._current_task_id = assignments[0].task.task_id
+                self._current_job_id = assignments[0].task.job_id
                 if self._heartbeat_manager:
                     self._heartbeat_manager.update_task(
                         self._current_task_id,
@@ -135,12 +155,22 @@ class ExecutionWorker:
                     )
 
                 # Set task status to RUNNING
-                self._job_service._tasks.set_status(
-                    assignment.task.task_id, TaskStatus.RUNNING
-                )
+                if len(assignments) == 1:
+                    self._job_service._tasks.set_status(
+                        assignments[0].task.task_id, TaskStatus.RUNNING
+                    )
+                else:
+                    self._job_service._tasks.set_statuses_batch(
+                        [a.task.task_id for a in assignments], TaskStatus.RUNNING
+                    )
 
                 # Execute
-                result = await self._execute(assignment)
+                if len(assignments) == 1:
+                    results = [await self._execute_observed(assignments[0])]
+                else:
+                    results = await asyncio.gather(
+                        *(self._execute_observed(a) for a in assignments)
+                    )
 
                 # Clear current task
                 self._current_task_id = None
@@ -149,59 +179,146 @@ class ExecutionWorker:
                     self._heartbeat_manager.update_task(None, None)
 
                 # Report completion
-                actual_tokens = (result.input_tokens or 0) + (result.output_tokens or 0)
-                completion = WorkCompletion(
-                    task_id=result.task_id,
-                    queue_id=assignment.queue_id,
-                    success=result.success,
-                    answer=result.answer,
-                    actual_tokens=actual_tokens,
-                    input_tokens=result.input_tokens,
-                    output_tokens=result.output_tokens,
-                    error_type=result.error_type,
-                    error_message=result.error_message,
+                self._coordinator.complete_work_batch(
+                    [
+                        self._completion(assignment, result)
+                        for assignment, result in zip(assignments, results)
+                    ]
                 )
-                self._coordinator.complete_work(completion)
 
                 # Update job service
-                if result.success:
-                    self._job_service.on_task_completed(
-                        job_id=result.job_id,
-                        interview_id=result.interview_id,
-                        task_id=result.task_id,
-                        answer_value=result.answer,
-                        comment=result.comment,
-                        input_tokens=result.input_tokens,
-                        output_tokens=result.output_tokens,
-                        raw_model_response=result.raw_model_response,
-                        generated_tokens=result.generated_tokens,
-                        cached=result.cached,
-                        system_prompt=result.system_prompt,
-                        user_prompt=result.user_prompt,
-                        input_price_per_million_tokens=result.input_price_per_million_tokens,
-                        output_price_per_million_tokens=result.output_price_per_million_tokens,
-                        thinking_tokens=result.thinking_tokens,
-                        cache_key=result.cache_key,
-                        validated=result.validated,
-                        reasoning_summary=result.reasoning_summary,
-                        distribution=result.distribution,
-                        resolution_draw=result.resolution_draw,
-                        resolution_seed=result.resolution_seed,
-                        resolution_method=result.resolution_method,
-                    )
-                else:
-                    self._job_service.on_task_failed(
-                        job_id=result.job_id,
-                        interview_id=result.interview_id,
-                        task_id=result.task_id,
-                        error_type=result.error_type or "unknown",
-                        error_message=result.error_message or "Unknown error",
-                    )
+                self._record_results(results)
         finally:
             # Unregister on shutdown
             if self._worker_registry:
                 await self._unregister()
 
+    async def _execute_observed(self, assignment: WorkAssignment) -> ExecutionResult:
+        """
+        Execute a task and report its latency to the concurrency controller.
+
+        Rate-limit headers the model call records are attached to the result,
+        so the coordinator can apply them to the task's queue.
+        """
+        started_at = time.time()
+        with collect_rate_limits() as rate_limits:
+            result = await self._execute(assignment)
+        if rate_limits:
+            result.rate_limits = rate_limits[-1]
+        if self._controller is not None and not result.cached:
+            self._controller.observe(
+                started_at, time.time() - started_at, result.error_type
+            )
+        return result
+
+    @staticmethod
+    def _completion(
+        assignment: WorkAssignment, result: ExecutionResult
+    ) -> WorkCompletion:
+        """Build the coordinator's completion report for a task."""
+        actual_tokens = (result.input_tokens or 0) + (result.output_tokens or 0)
+        return WorkCompletion(
+            task_id=result.task_id,
+            queue_id=assignment.queue_id,
+            success=result.success,
+            answer=result.answer,
+            actual_tokens=actual_tokens,
+            input_tokens=result.input_tokens,
+            output_tokens=result.output_tokens,
+            error_type=result.error_type,
+            error_message=result.error_message,
+            rate_limits=result.rate_limits,
+        )
+
+    def _record_results(self, results: list[ExecutionResult]) -> None:
+        """Report several outcomes, batching successes per job."""
+        if len(results) == 1:
+            self._record_result(results[0])
+            return
+
+        successes: dict[str, list[dict]] = {}
+        for result in results:
+            if not result.success:
+                self._record_result(result)
+                continue
+            successes.setdefault(result.job_id, []).append(
+                {
+                    "interview_id": result.interview_id,
+                    "task_id": result.task_id,
+                    "answer_value": result.answer,
+                    "comment": result.comment,
+                    "input_tokens": result.input_tokens,
+                    "output_tokens": result.output_tokens,
+                    "raw_model_response": result.raw_model_response,
+                    "generated_tokens": result.generated_tokens,
+                    "cached": result.cached,
+                    "system_prompt": result.system_prompt,
+                    "user_prompt": result.user_prompt,
+                    "input_price_per_million_tokens": result.input_price_per_million_tokens,
+                    "output_price_per_million_tokens": result.output_price_per_million_tokens,
+                    "thinking_tokens": result.thinking_tokens,
+                    "cache_key": result.cache_key,
+                    "validated": result.validated,
+                    "reasoning_summary": result.reasoning_summary,
+                    "distribution": result.distribution,
+                    "resolution_draw": result.resolution_draw,
+                    "resolution_seed": result.resolution_seed,
+                    "resolution_method": result.resolution_method,
+                }
+            )
+        for job_id, tasks in successes.items():
+            self._job_service.on_tasks_completed_batch(job_id, tasks)
+
+    def _record_result(self, result: ExecutionResult) -> None:
+        """Report a task's outcome to the job service."""
+        if result.success:
+            self._job_service.on_task_completed(
+                job_id=result.job_id,
+                interview_id=result.interview_id,
+                task_id=result.task_id,
+                answer_value=result.answer,
+                comment=result.comment,
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                raw_model_response=result.raw_model_response,
+                generated_tokens=result.generated_tokens,
+                cached=result.cached,
+                system_prompt=result.system_prompt,
+                user_prompt=result.user_prompt,
+                input_price_per_million_tokens=result.input_price_per_million_tokens,
+                output_price_per_million_tokens=result.output_price_per_million_tokens,
+                thinking_tokens=result.thinking_tokens,
+                cache_key=result.cache_key,
+                validated=result.validated,
+                reasoning_summary=result.reasoning_summary,
+                distribution=result.distribution,
+                resolution_draw=result.resolution_draw,
+                resolution_seed=result.resolution_seed,
+                resolution_method=result.resolution_method,
+            )
+        else:
+            self._job_service.on_task_failed(
+                job_id=result.job_id,
+                interview_id=result.interview_id,
+                task_id=result.task_id,
+                error_type=result.error_type or "unknown",
+                error_message=result.error_message or "Unknown error",
+            )
+
+    async def execute_directly(self, task: RenderedPrompt) -> ExecutionResult:
+        """Execute a rendered task without going through the coordinator.
+
+        Used for tasks whose responses are already cached, which need neither
+        a queue slot nor rate-limit tokens.
+        """
+        self._job_service._tasks.set_status(task.task_id, TaskStatus.RUNNING)
+        assignment = WorkAssignment(
+            task=task, queue_id="", api_key="", assigned_at=time.time()
+        )
+        result = await self._execute(assignment)
+        self._record_result(result)
+        return result
+
     async def _register(self) -> None:
         """Register worker with registry and start heartbeat."""
         from .worker_registry import AsyncHeartbeatManager
@@ -231,6 +348,7 @@ class ExecutionWorker:
     def stop(self) -> None:
         """Stop the worker."""
         self._running = False
+        self._stop_requested = True
 
     async def _execute(self, assignment: WorkAssignment) -> ExecutionResult:
         """Execute a single task using the actual model object."""
@@ -660,6 +778,12 @@ class ExecutionWorkerPool:
     """
     Pool of execution workers with autoscaling.
 
+    With ``adaptive=True`` the pool starts ``min_workers`` workers and an
+    AdaptiveConcurrencyController resizes it between ``min_workers`` and
+    ``max_workers`` from queue depth, token bucket waits, call latency and
+    429 rates. Otherwise it runs a fixed ``min_workers`` workers.
+    ``batch_size`` is passed to each worker (tasks taken per request).
+
     Supports distributed execution via worker registry for:
     - Worker registration and discovery
     - Heartbeat monitoring
@@ -675,8 +799,12 @@ class ExecutionWorkerPool:
         cache: any = None,
         worker_registry: "WorkerRegistry | None" = None,
         heartbeat_interval: float = 10.0,
+        adaptive: bool = False,
+        control_interval: float = 0.25,
+        batch_size: int = 1,
     ):
         self._coordinator = coordinator
+        self._batch_size = batch_size
         self._job_service = job_service
         self._min_workers = min_workers
         self._max_workers = max_workers
@@ -685,8 +813,21 @@ class ExecutionWorkerPool:
         self._heartbeat_interval = heartbeat_interval
         self._workers: list[asyncio.Task] = []
         self._worker_instances: list[ExecutionWorker] = []
+        self._retired: set[ExecutionWorker] = set()  # stopping, not yet exited
         self._running = False
 
+        self._controller: AdaptiveConcurrencyController | None = None
+        self._control_task: asyncio.Task | None = None
+        if adaptive:
+            self._controller = AdaptiveConcurrencyController(
+                coordinator,
+                min_workers=min_workers,
+                max_workers=max_workers,
+                interval=control_interval,
+            )
+            # A 429 shrinks the pool immediately, not at the next control step
+            self._controller.on_target_change = self._resize
+
     async def start(self) -> None:
         """Start the worker pool."""
         self._running = True
@@ -695,10 +836,18 @@ class ExecutionWorkerPool:
         for _ in range(self._min_workers):
             self._spawn_worker()
 
+        if self._controller is not None:
+            self._control_task = asyncio.create_task(self._control_loop())
+
     async def stop(self) -> None:
         """Stop all workers."""
         self._running = False
 
+        if self._control_task is not None:
+            self._control_task.cancel()
+            await asyncio.gather(self._control_task, return_exceptions=True)
+            self._control_task = None
+
         # Cancel all worker tasks
         for task in self._workers:
             task.cancel()
@@ -708,10 +857,28 @@ class ExecutionWorkerPool:
             await asyncio.gather(*self._workers, return_exceptions=True)
 
         self._workers.clear()
+        self._worker_instances.clear()
+        self._retired.clear()
+
+    async def _control_loop(self) -> None:
+        """Apply the controller's target worker count every control interval."""
+        while self._running:
+            await asyncio.sleep(self._controller.interval)
+            self._resize(self._controller.step().target)
+
+    def _resize(self, target: int) -> None:
+        """Spawn or retire workers until ``target`` are active."""
+        active = [w for w in self._worker_instances if w not in self._retired]
+        for _ in range(target - len(active)):
+            self._spawn_worker()
+        # Retired workers finish the task they hold (if any) and then exit
+        for worker in reversed(active[target:]):
+            worker.stop()
+            self._retired.add(worker)
 
     def _spawn_worker(self) -> None:
         """Spawn a new worker."""
-        if len(self._workers) >= self._max_workers:
+        if self.worker_count >= self._max_workers:
             return
 
         worker = ExecutionWorker(
@@ -720,15 +887,46 @@ class ExecutionWorkerPool:
             cache=self._cache,
             worker_registry=self._worker_registry,
             heartbeat_interval=self._heartbeat_interval,
+            controller=self._controller,
+            batch_size=self._batch_size,
         )
 
         task = asyncio.create_task(worker.run())
         self._workers.append(task)
         self._worker_instances.append(worker)
+        task.add_done_callback(lambda t, w=worker: self._forget(t, w))
+
+    def _forget(self, task: asyncio.Task, worker: ExecutionWorker) -> None:
+        """Drop a worker that has exited from the pool's bookkeeping."""
+        if task in self._workers:
+            self._workers.remove(task)
+        if worker in self._worker_instances:
+            self._worker_instances.remove(worker)
+        self._retired.discard(worker)
+
+    @property
+    def controller(self) -> AdaptiveConcurrencyController | None:
+        return self._controller
+
+    def concurrency_stats(self) -> dict:
+        """Return the controller's statistics, or the fixed pool size."""
+        if self._controller is None:
+            return {"target": self.worker_count, "adaptive": False}
+        return {**self._controller.get_stats(), "adaptive": True}
+
+    async def execute_directly(self, tasks: list[RenderedPrompt]) -> None:
+        """Execute ``tasks`` concurrently, bypassing the coordinator's queues."""
+        worker = ExecutionWorker(
+            coordinator=self._coordinator,
+            job_service=self._job_service,
+            cache=self._cache,
+        )
+        await asyncio.gather(*(worker.execute_directly(task) for task in tasks))
 
     @property
     def worker_count(self) -> int:
-        return len(self._workers)
+        """Number of workers that have not been told to stop."""
+        return len(self._worker_instances) - len(self._retired)
 
     def get_worker_ids(self) -> list[str]:
         """Get IDs of all workers in this pool."""
@@ -8,6 +8,7 @@ Defines the core domain objects:
 - Answer: The result of executing a task
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -163,6 +164,15 @@ class JobDefinition:
     # Iterations - number of times to run each interview
     n_iterations: int = 1
 
+    # Streamed jobs materialize interviews in windows of this size. Their
+    # interview_ids are derived from the materialization cursor (see
+    # StreamedInterviewIds) and are not stored in the definition.
+    interview_window: int | None = None
+
+    @property
+    def is_streamed(self) -> bool:
+        return self.interview_window is not None
+
     def storage_key(self) -> str:
         return f"job:{self.job_id}:meta"
 
@@ -171,7 +181,8 @@ class JobDefinition:
             "user_id": self.user_id,
             "created_at": self.created_at.isoformat(),
             "total_interviews": self.total_interviews,
-            "interview_ids": self.interview_ids,
+            "interview_ids": [] if self.is_streamed else self.interview_ids,
+            "interview_window": self.interview_window,
             "retry_policies": {k: v.to_dict() for k, v in self.retry_policies.items()},
             "dag": {k: list(v) for k, v in self.dag.items()},
             "scenario_ids": self.scenario_ids,
@@ -198,9 +209,50 @@ class JobDefinition:
             model_ids=data["model_ids"],
             question_ids=data["question_ids"],
             n_iterations=data.get("n_iterations", 1),
+            interview_window=data.get("interview_window"),
         )
 
 
+def streamed_interview_id(job_id: str, index: int) -> str:
+    """ID of the interview at ``index`` in a streamed job's cross product."""
+    return f"{job_id}-i{index}"
+
+
+class StreamedInterviewIds(Sequence):
+    """
+    Interview IDs of a streamed job's first ``count`` (materialized) interviews.
+
+    Computed on access rather than stored, so reading the job definition of a
+    million-interview job does not load a million IDs.
+    """
+
+    def __init__(self, job_id: str, count: int):
+        self._job_id = job_id
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                streamed_interview_id(self._job_id, i)
+                for i in range(*index.indices(self._count))
+            ]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("interview index out of range")
+        return streamed_interview_id(self._job_id, index)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield streamed_interview_id(self._job_id, i)
+
+    def __repr__(self) -> str:
+        return f"StreamedInterviewIds(job_id={self._job_id!r}, count={self._count})"
+
+
 @dataclass
 class JobStatus:
     """
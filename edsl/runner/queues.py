@@ -9,6 +9,7 @@ Components:
 """
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 import time
 import heapq
 import threading
@@ -16,6 +17,9 @@ import logging
 
 from .models import generate_id
 
+if TYPE_CHECKING:
+    from ..inference_services.rate_limit_headers import RateLimitHeaders
+
 # Configure logging for queue operations
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,29 @@ class TokenBucket:
         delta = estimated - actual
         self.tokens = min(self.capacity, self.tokens + delta)
 
+    def constrain(
+        self, limit: float | None = None, remaining: float | None = None
+    ) -> None:
+        """
+        Apply a quota reported by the provider.
+
+        A per-minute ``limit`` below the bucket's capacity lowers the capacity
+        and refill rate to match. ``remaining`` caps the current balance: the
+        provider also counts traffic this bucket never saw, such as other
+        processes using the same key. Neither ever raises the bucket.
+        """
+        if limit is not None and 0 < limit < self.capacity:
+            self.capacity = float(limit)
+            self.rate = limit / 60.0
+        self.refill()
+        if remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+
+    def hold(self, seconds: float) -> None:
+        """Grant nothing for the next ``seconds`` (e.g. a 429's retry-after)."""
+        self.refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
 
 @dataclass
 class QueueMeta:
@@ -172,6 +199,29 @@ class Queue:
                 return task
             return None
 
+    def peek_many(self, n: int) -> list[dict]:
+        """Look at up to n tasks from the front without removing them."""
+        with self._lock:
+            return self._tasks[:n]
+
+    def dequeue_many(self, n: int) -> list[dict]:
+        """Remove and return up to n tasks from the front in one pass."""
+        with self._lock:
+            tasks = self._tasks[:n]
+            if not tasks:
+                return []
+            del self._tasks[:n]
+            logger.debug(
+                f"[QUEUE DEQUEUE] queue={self.queue_id[:8]}... service={self.service} "
+                f"model={self.model} tasks={len(tasks)} depth_after={len(self._tasks)}"
+            )
+            # Freeze stats when queue becomes empty
+            if len(self._tasks) == 0 and self._start_time is not None:
+                with self._stats_lock:
+                    if self._end_time is None:
+                        self._end_time = time.time()
+            return tasks
+
     def try_acquire(self, estimated_tokens: int) -> bool:
         """Try to acquire capacity for a request (thread-safe)."""
         with self._stats_lock:
@@ -193,6 +243,35 @@ class Queue:
 
             return True
 
+    def try_acquire_batch(self, estimated_tokens: list[int]) -> int:
+        """
+        Acquire capacity for as many leading requests as possible (thread-safe).
+
+        Takes the lock and refills the buckets once, then grants requests in
+        order until the next one would not fit. Returns how many were granted.
+        """
+        with self._stats_lock:
+            self.rpm_bucket.refill()
+            self.tpm_bucket.refill()
+            granted = 0
+            tokens = 0
+            for estimate in estimated_tokens:
+                if self.rpm_bucket.tokens < granted + 1:
+                    break
+                if self.tpm_bucket.tokens < tokens + estimate:
+                    break
+                granted += 1
+                tokens += estimate
+            if granted:
+                self.rpm_bucket.tokens -= granted
+                self.tpm_bucket.tokens -= tokens
+                if self._start_time is None:
+                    self._start_time = time.time()
+                self._end_time = None
+                self._request_count += granted
+                self._token_count += tokens
+            return granted
+
     def time_until_available(self, estimated_tokens: int) -> float:
         """Calculate when the next task can execute (thread-safe)."""
         with self._stats_lock:
@@ -218,6 +297,14 @@ class Queue:
             if output_tokens is not None:
                 self._output_token_count += output_tokens
 
+    def apply_rate_limits(self, limits: "RateLimitHeaders") -> None:
+        """Bring both buckets in line with a provider's rate-limit headers (thread-safe)."""
+        with self._stats_lock:
+            self.rpm_bucket.constrain(limits.limit_requests, limits.remaining_requests)
+            self.tpm_bucket.constrain(limits.limit_tokens, limits.remaining_tokens)
+            if limits.retry_after:
+                self.rpm_bucket.hold(limits.retry_after)
+
     def get_throughput_stats(self) -> dict:
         """
         Get current throughput statistics.
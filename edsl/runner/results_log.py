@@ -0,0 +1,244 @@
+"""Incremental results assembly for the Runner.
+
+Instead of building every Result at the end of a job, the
+``IncrementalResultsBuilder`` registers itself as an interview-completion
+callback on JobService and turns each finished interview into a Result
+while the job is still running. Finished rows are appended to a
+``ResultsLog``, a JSONL spill file with a small in-memory index, so
+``JobHandle.results()`` only has to read the log back and consumers that
+never need the whole Results in memory can stream it row by row.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from ..results import Result, Results
+    from ..surveys import Survey
+    from .service import JobService
+
+logger = logging.getLogger(__name__)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ResultsLog:
+    """Append-only, spill-to-disk log of finished Result rows.
+
+    Each Result is serialized as one JSON line (with cache information, so
+    ``cache_used_dict`` survives the round trip). Only the byte offset and
+    sort key of each row are held in memory.
+
+    Args:
+        path: File to write. Defaults to a temporary file that is removed
+              when the log is closed or garbage collected.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="edsl_results_", suffix=".jsonl")
+            os.close(fd)
+            self._finalizer = weakref.finalize(self, _remove_file, path)
+        else:
+            self._finalizer = None
+        self._path = path
+        self._file = open(path, "w+b")
+        self._lock = threading.Lock()
+        self._index: list[tuple[tuple, int]] = []  # (sort_key, offset)
+        self._end = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, result: "Result", sort_key: tuple = ()) -> None:
+        """Serialize a Result and append it to the log."""
+        line = json.dumps(
+            result.to_dict(add_edsl_version=False, include_cache_info=True)
+        ).encode("utf-8")
+        with self._lock:
+            self._file.seek(self._end)
+            self._file.write(line)
+            self._file.write(b"\n")
+            self._index.append((sort_key, self._end))
+            self._end += len(line) + 1
+
+    def _read_at(self, offset: int) -> "Result":
+        from ..results import Result
+
+        with self._lock:
+            self._file.seek(offset)
+            line = self._file.readline()
+        return Result.from_dict(json.loads(line))
+
+    def __iter__(self) -> Iterator["Result"]:
+        """Iterate Results in the order they were appended."""
+        for _, offset in list(self._index):
+            yield self._read_at(offset)
+
+    def iter_sorted(self) -> Iterator["Result"]:
+        """Iterate Results ordered by their sort key."""
+        for _, offset in sorted(self._index, key=lambda entry: entry[0]):
+            yield self._read_at(offset)
+
+    def to_results(
+        self, survey: "Survey | None" = None, columnar: bool = False
+    ) -> "Results":
+        """Load the whole log into a Results object, in sort-key order.
+
+        With ``columnar=True`` rows are streamed into a columnar store, so
+        the full list of Result objects is never held in memory.
+        """
+        from ..results import Results
+        from ..results.results_columnar import ColumnarResultList
+
+        with self._lock:
+            self._file.flush()
+        if columnar:
+            return Results(survey=survey, data=ColumnarResultList(self.iter_sorted()))
+        return Results(survey=survey, data=list(self.iter_sorted()))
+
+    def close(self) -> None:
+        """Close the file (and remove it if it is a temporary file)."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+class IncrementalResultsBuilder:
+    """Builds a job's Results as its interviews finish.
+
+    Registers itself as an interview-completion callback on JobService.
+    Finished interview IDs are buffered and built in batches of
+    ``batch_size`` (one batched read for definitions and answers per
+    batch); survey, questions and agent/scenario/model data are fetched
+    once per job and reused.
+
+    If a Result cannot be written to the log (e.g. an answer that does not
+    serialize to JSON), the builder stops and ``failed`` is set; callers
+    should then fall back to ``JobService.build_edsl_results``.
+
+    Args:
+        job_id: The runner job ID.
+        service: The JobService to register the callback on.
+        log: The ResultsLog to append to. Defaults to a temporary log.
+        batch_size: Number of finished interviews to accumulate before
+                    building their Results.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        service: "JobService",
+        log: Optional[ResultsLog] = None,
+        batch_size: int = 50,
+    ):
+        self._job_id = job_id
+        self._service = service
+        self._log = log if log is not None else ResultsLog()
+        self._batch_size = max(1, batch_size)
+        self._pending_ids: list[str] = []
+        self._seen: set[str] = set()
+        self._context: dict[str, Any] | None = None
+        self._failed = False
+        self._lock = threading.RLock()
+
+        service.register_interview_callback(job_id, self._on_interview_complete)
+
+    @property
+    def log(self) -> ResultsLog:
+        return self._log
+
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    @property
+    def n_results(self) -> int:
+        return len(self._log)
+
+    @property
+    def survey(self) -> "Survey | None":
+        return self._get_context()["survey"]
+
+    def _get_context(self) -> dict[str, Any]:
+        if self._context is None:
+            self._context = self._service.get_results_context(self._job_id)
+        return self._context
+
+    def _on_interview_complete(self, job_id: str, interview_id: str) -> None:
+        """Called by JobService when an interview finishes."""
+        with self._lock:
+            if self._failed or interview_id in self._seen:
+                return
+            self._seen.add(interview_id)
+            self._pending_ids.append(interview_id)
+            if len(self._pending_ids) >= self._batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Build and append Results for all buffered interviews."""
+        with self._lock:
+            if not self._pending_ids or self._failed:
+                self._pending_ids.clear()
+                return
+            pending, self._pending_ids = self._pending_ids, []
+            try:
+                results = self._service.build_edsl_results_for_interviews(
+                    self._job_id, pending, self._get_context()
+                )
+                for result in results:
+                    self._log.append(result, self._service.result_sort_key(result))
+            except Exception:
+                logger.exception(
+                    "Incremental results: failed to build results for job %s",
+                    self._job_id[:8],
+                )
+                self._failed = True
+
+    def finalize(self) -> None:
+        """Flush buffered interviews and pick up any the callbacks missed."""
+        with self._lock:
+            self.flush()
+            if self._failed:
+                return
+            finished = self._service.get_finished_interview_ids(self._job_id)
+            for interview_id in finished:
+                if interview_id not in self._seen:
+                    self._seen.add(interview_id)
+                    self._pending_ids.append(interview_id)
+            self.flush()
+
+    def results(self, columnar: bool = False) -> "Results":
+        """Finalize and load the full Results from the log."""
+        self.finalize()
+        return self._log.to_results(self.survey, columnar=columnar)
+
+    def __iter__(self) -> Iterator["Result"]:
+        """Finalize and stream Results from the log, in Results order."""
+        self.finalize()
+        return self._log.iter_sorted()
+
+    def close(self) -> None:
+        """Stop listening for finished interviews and close the log."""
+        self._service.unregister_interview_callback(
+            self._job_id, self._on_interview_complete
+        )
+        self._log.close()
@@ -44,6 +44,7 @@ class TimingStats:
     waiting_for_workers: float = 0.0  # Time spent in asyncio.sleep waiting for workers
     results_assembly: float = 0.0
     loop_overhead: float = 0.0
+    prefetch: float = 0.0  # Bulk cache load and direct execution of cached tasks
     total: float = 0.0
 
     # Counts
@@ -52,8 +53,28 @@ class TimingStats:
     enqueue_calls: int = 0
     loop_iterations: int = 0
 
+    # Cache prefetch of the first wave
+    prefetch_keys: int = 0
+    prefetch_hits: int = 0
+    # Estimated point-lookup time avoided; only measured in debug runs
+    prefetch_time_saved: float | None = None
+
+    # Adaptive concurrency controller
+    concurrency_peak: int = 0
+    concurrency_final: int = 0
+    concurrency_increases: int = 0
+    concurrency_decreases: int = 0
+    rate_limited_calls: int = 0
+
+    @property
+    def prefetch_hit_rate(self) -> float:
+        return self.prefetch_hits / self.prefetch_keys if self.prefetch_keys else 0.0
+
     def report(self) -> str:
         """Generate a timing report."""
+        saved = ""
+        if self.prefetch_time_saved is not None:
+            saved = f"; ~{self.prefetch_time_saved*1000:.1f} ms of lookups saved"
         lines = [
             "=" * 50,
             "TIMING BREAKDOWN",
@@ -64,6 +85,8 @@ class TimingStats:
             f"Waiting for workers: {self.waiting_for_workers*1000:8.1f} ms ({self.loop_iterations} iterations)",
             f"Results assembly:    {self.results_assembly*1000:8.1f} ms",
             f"Loop overhead:       {self.loop_overhead*1000:8.1f} ms",
+            f"Cache prefetch:      {self.prefetch*1000:8.1f} ms ({self.prefetch_hits}/{self.prefetch_keys} hits, {self.prefetch_hit_rate:.0%}{saved})",
+            f"Concurrency:         {self.concurrency_final:8d} workers (peak {self.concurrency_peak}; {self.concurrency_increases} increases, {self.concurrency_decreases} decreases, {self.rate_limited_calls} rate-limited calls)",
             "-" * 50,
             f"TOTAL:               {self.total*1000:8.1f} ms",
             "=" * 50,
@@ -113,6 +136,7 @@ class JobHandle:
 
         Returns dict with:
         - total_interviews, completed_interviews, failed_interviews, running_interviews
+        - unmaterialized_interviews (streamed jobs not yet fully built)
         - total_tasks, completed_tasks, skipped_tasks, failed_tasks, blocked_tasks
         - pending_tasks, ready_tasks, running_tasks
         """
@@ -155,6 +179,7 @@ class JobHandle:
         timing: bool = False,
         stop_on_exception: bool | None = None,
         show_progress: bool = False,
+        columnar: bool = False,
     ) -> Any:
         """
         Execute all tasks and return EDSL Results object.
@@ -167,6 +192,8 @@ class JobHandle:
                               If None, uses the setting from submit().
                               If True, cancels job and raises TaskExecutionError on first failure.
             show_progress: Show live progress visualization during execution.
+            columnar: Return Results backed by a columnar store, which uses
+                      much less memory for large jobs.
 
         Returns:
             An edsl.results.Results object containing all completed interviews.
@@ -195,9 +222,23 @@ class JobHandle:
         if cas is not None:
             cas.finalize()
 
-        # Time results assembly
+        # Time results assembly: read back the incrementally built log, or
+        # build everything now if the job was submitted without one
         t0 = time.time()
-        results = self._service.build_edsl_results(self._job_id)
+        builder = self._runner._job_results.pop(self._job_id, None)
+        try:
+            if builder is not None:
+                builder.finalize()
+            if builder is None or builder.failed:
+                results = self._service.build_edsl_results(self._job_id)
+                if columnar:
+                    results = results.to_columnar()
+            else:
+                results = builder.results(columnar=columnar)
+        finally:
+            # The log has been read into Results; drop its temp file
+            if builder is not None:
+                builder.close()
         if stats:
             stats.results_assembly = time.time() - t0
             stats.total = (
@@ -207,11 +248,55 @@ class JobHandle:
                 + stats.waiting_for_workers
                 + stats.results_assembly
                 + stats.loop_overhead
+                + stats.prefetch
             )
             print(stats.report())
 
         return results
 
+    def iter_results(
+        self,
+        stop_on_exception: bool | None = None,
+        show_progress: bool = False,
+    ) -> Any:
+        """
+        Execute all tasks and yield each EDSL Result, in Results order.
+
+        Results are streamed from the job's results log one at a time, so
+        the full Results object is never held in memory when the job was
+        submitted with ``incremental_results=True``; other jobs fall back to
+        building Results at the end.
+
+        Raises:
+            RuntimeError: If job was cancelled.
+            TaskExecutionError: If stop_on_exception is True and a task fails.
+        """
+        self._runner.execute_job(
+            self._job_id,
+            stop_on_exception=stop_on_exception,
+            show_progress=show_progress,
+        )
+
+        state = self._service.jobs.get_state(self._job_id)
+        if state == JobState.CANCELLED:
+            raise RuntimeError(f"Job {self._job_id} was cancelled")
+
+        cas = self._runner._job_cas.get(self._job_id)
+        if cas is not None:
+            cas.finalize()
+
+        builder = self._runner._job_results.pop(self._job_id, None)
+        try:
+            if builder is not None:
+                builder.finalize()
+            if builder is None or builder.failed:
+                yield from self._service.build_edsl_results(self._job_id)
+            else:
+                yield from builder.log.iter_sorted()
+        finally:
+            if builder is not None:
+                builder.close()
+
     def cancel(self) -> None:
         """Cancel the job. In-flight tasks will complete; pending tasks are dropped."""
         self._service.jobs.set_state(self._job_id, JobState.CANCELLED)
@@ -346,6 +431,9 @@ class Runner:
         heartbeat_interval: float = 10.0,
         dead_worker_timeout: int = 60,
         max_workers: int = 400,
+        adaptive_concurrency: bool = False,
+        min_workers: int = 8,
+        worker_batch_size: int = 1,
     ):
         """
         Initialize a Runner for local execution.
@@ -360,11 +448,23 @@ class Runner:
             heartbeat_interval: Seconds between worker heartbeats.
             dead_worker_timeout: Seconds after which a worker is considered dead.
             max_workers: Maximum number of concurrent execution workers.
+            adaptive_concurrency: If True, start with ``min_workers`` workers and
+                     let an AIMD controller scale between ``min_workers`` and
+                     ``max_workers`` from backlog, rate-limit waits, latency and
+                     429s. If False (the default), always run ``max_workers``
+                     workers.
+            min_workers: Initial and minimum worker count in adaptive mode.
+            worker_batch_size: Tasks each worker takes from the coordinator per
+                     request and runs concurrently. Values above 1 amortize
+                     coordinator and bookkeeping overhead when calls are cheap.
         """
         self._distributed = distributed
         self._heartbeat_interval = heartbeat_interval
         self._dead_worker_timeout = dead_worker_timeout
         self._max_workers = max_workers
+        self._adaptive_concurrency = adaptive_concurrency
+        self._min_workers = min(min_workers, max_workers)
+        self._worker_batch_size = max(1, worker_batch_size)
 
         # Initialize storage
         self._storage = self._create_storage(storage)
@@ -376,6 +476,10 @@ class Runner:
         # Track stop_on_exception setting per job
         self._job_stop_on_exception: dict[str, bool] = {}
 
+        # Track execution mode ("live" or "batch") and batch options per job
+        self._job_execution_mode: dict[str, str] = {}
+        self._job_batch_options: dict[str, dict] = {}
+
         # Worker registry for distributed execution
         self._worker_registry: "WorkerRegistry | None" = None
         if distributed:
@@ -402,6 +506,13 @@ class Runner:
         # CAS streaming integrations per job
         self._job_cas: dict[str, Any] = {}
 
+        # Incremental results builders per job
+        self._job_results: dict[str, Any] = {}
+
+        # Keys each job loaded into its cache's hot tier; the cache may be
+        # shared with other jobs, so each job clears only its own
+        self._job_prefetched: dict[str, set[str]] = {}
+
     def _create_storage(self, storage: StorageProtocol | str | None) -> StorageProtocol:
         """Create storage from URL string or return existing protocol."""
         if storage is None:
@@ -435,6 +546,11 @@ class Runner:
         stop_on_exception: bool = False,
         stream_to_cas: bool = False,
         cas_batch_size: int = 1,
+        execution_mode: str = "live",
+        batch_poll_interval: float = 30.0,
+        batch_timeout: float | None = None,
+        interview_window: int | None = None,
+        incremental_results: bool = False,
     ) -> JobHandle:
         """
         Submit a job for execution.
@@ -452,30 +568,42 @@ class Runner:
                            as each interview completes.
             cas_batch_size: Number of completed interviews to accumulate
                            before writing a CAS commit (default 1).
+            execution_mode: "live" calls the model APIs directly; "batch"
+                           sends each wave of prompts through the provider's
+                           batch API (see edsl.runner.batch).
+            batch_poll_interval: Seconds between batch status polls.
+            batch_timeout: Seconds to wait for a batch before failing
+                           (None waits indefinitely).
+            interview_window: Stream the job's interviews: materialize this
+                           many up front and more as they finish, instead of
+                           building every interview and task before the first
+                           model call. Useful for very large jobs.
+            incremental_results: Build each Result as its interview finishes
+                           and spill it to a results log on disk, instead of
+                           assembling all Results after the job completes
+                           (the default).
 
         Returns:
             JobHandle to track and retrieve results.
         """
+        if execution_mode not in ("live", "batch"):
+            raise ValueError(
+                f"Unknown execution_mode: {execution_mode!r}. Use 'live' or 'batch'"
+            )
+
         job_id, direct_task_info, _job_data = self._service.submit_job(
-            job, user_id=user_id, n=n, stop_on_exception=stop_on_exception
+            job,
+            user_id=user_id,
+            n=n,
+            stop_on_exception=stop_on_exception,
+            interview_window=interview_window,
         )
 
         # Register queues for models used in this job
         self._ensure_queues_for_job(job)
 
         # Build client-side registry for direct answer tasks
-        for info in direct_task_info:
-            entry = DirectAnswerEntry(
-                task_id=info["task_id"],
-                execution_type=info["execution_type"],
-                agent=info["agent"],
-                question=info["question"],
-                scenario=info["scenario"],
-                job_id=job_id,
-                interview_id=info.get("interview_id"),
-                item_randomization_seed=info.get("item_randomization_seed"),
-            )
-            self._direct_registry.register(info["task_id"], entry)
+        self._register_direct_tasks(job_id, direct_task_info)
 
         # Store cache setting for this job
         if cache is not None:
@@ -484,6 +612,20 @@ class Runner:
         # Store stop_on_exception setting
         self._job_stop_on_exception[job_id] = stop_on_exception
 
+        self._job_execution_mode[job_id] = execution_mode
+        if execution_mode == "batch":
+            self._job_batch_options[job_id] = {
+                "poll_interval": batch_poll_interval,
+                "timeout": batch_timeout,
+            }
+
+        if incremental_results:
+            from .results_log import IncrementalResultsBuilder
+
+            self._job_results[job_id] = IncrementalResultsBuilder(
+                job_id, self._service
+            )
+
         # Opt-in CAS streaming
         if stream_to_cas:
             from .cas_integration import RunnerCASIntegration
@@ -498,6 +640,21 @@ class Runner:
 
         return JobHandle(job_id, self)
 
+    def _register_direct_tasks(self, job_id: str, direct_task_info: list[dict]) -> None:
+        """Add direct-answer tasks to the client-side registry."""
+        for info in direct_task_info:
+            entry = DirectAnswerEntry(
+                task_id=info["task_id"],
+                execution_type=info["execution_type"],
+                agent=info["agent"],
+                question=info["question"],
+                scenario=info["scenario"],
+                job_id=job_id,
+                interview_id=info.get("interview_id"),
+                item_randomization_seed=info.get("item_randomization_seed"),
+            )
+            self._direct_registry.register(info["task_id"], entry)
+
     @staticmethod
     def _clear_async_clients() -> None:
         """Clear cached async HTTP clients that are bound to a now-closed event loop.
@@ -596,6 +753,7 @@ class Runner:
             stats=stats,
             stop_on_exception=effective_stop_on_exception,
             show_progress=show_progress,
+            execution_mode=self._job_execution_mode.get(job_id, "live"),
         )
 
         try:
@@ -626,16 +784,26 @@ class Runner:
         stats: TimingStats | None = None,
         stop_on_exception: bool = False,
         show_progress: bool = False,
+        execution_mode: str = "live",
     ) -> None:
-        """Async implementation of job execution with parallel workers."""
+        """Async implementation of job execution with parallel workers.
+
+        In batch mode, rendering waits for each wave of tasks to finish so the
+        next wave (the next level of the dependency graph) can be collected and
+        sent through the provider batch APIs in one go.
+        """
         import sys
         import shutil
 
         pool = ExecutionWorkerPool(
             coordinator=self._coordinator,
             job_service=self._service,
-            min_workers=self._max_workers,
+            min_workers=(
+                self._min_workers if self._adaptive_concurrency else self._max_workers
+            ),
             max_workers=self._max_workers,
+            adaptive=self._adaptive_concurrency,
+            batch_size=self._worker_batch_size,
             cache=cache,
             worker_registry=self._worker_registry,
             heartbeat_interval=self._heartbeat_interval,
@@ -663,10 +831,18 @@ class Runner:
                 sys.stderr.write("\033[?25l")  # Hide cursor
                 sys.stderr.flush()
 
+        prefetch_cache = execution_mode == "live" and hasattr(cache, "prefetch")
+        first_wave = prefetch_cache
+
         try:
             while True:
                 loop_start = time.time()
 
+                # 0. Streamed jobs: build the next interviews as earlier ones finish
+                self._register_direct_tasks(
+                    job_id, self._service.materialize_interviews(job_id)
+                )
+
                 # 1. Execute any ready direct-answer tasks first (no LLM needed)
                 await self._execute_ready_direct_answers(
                     job_id, debug=debug, stop_on_exception=stop_on_exception
@@ -674,14 +850,23 @@ class Runner:
 
                 # 2. Render all ready LLM tasks
                 t0 = time.time()
-                rendered = self._render_worker.render_ready_tasks(
-                    job_id, max_tasks=1000, debug=debug
-                )
+                if execution_mode == "batch":
+                    rendered = await self._render_batch_wave(job_id, cache, debug)
+                else:
+                    rendered = self._render_worker.render_ready_tasks(
+                        job_id, max_tasks=1000, debug=debug
+                    )
                 if stats:
                     stats.rendering += time.time() - t0
                     stats.render_calls += 1
                     stats.tasks_rendered += len(rendered) if rendered else 0
 
+                if first_wave and rendered:
+                    first_wave = False
+                    rendered = await self._prefetch_first_wave(
+                        job_id, rendered, cache, pool, stats, debug=debug
+                    )
+
                 if rendered:
                     # Enqueue all rendered tasks for LLM execution
                     t0 = time.time()
@@ -733,6 +918,10 @@ class Runner:
                     progress["ready_tasks"] == 0
                     and progress["pending_tasks"] == 0
                     and progress["running_tasks"] == 0
+                    and (
+                        progress["unmaterialized_interviews"] == 0
+                        or progress["state"] != JobState.RUNNING.value
+                    )
                 ):
                     break
 
@@ -781,10 +970,204 @@ class Runner:
                     sys.stderr.write("\033[?25h")  # Restore cursor
                     sys.stderr.flush()
 
+            prefetched = self._job_prefetched.pop(job_id, None)
+            if prefetched:
+                cache.clear_prefetched(prefetched)
+
+            if execution_mode == "batch":
+                for model in self._service._original_models.get(job_id, {}).values():
+                    if hasattr(model, "clear_prefetched_responses"):
+                        model.clear_prefetched_responses()
+
+            if stats and pool.controller is not None:
+                concurrency = pool.concurrency_stats()
+                stats.concurrency_peak = concurrency["peak_target"]
+                stats.concurrency_final = concurrency["target"]
+                stats.concurrency_increases = concurrency["increases"]
+                stats.concurrency_decreases = concurrency["decreases"]
+                stats.rate_limited_calls = concurrency["rate_limited"]
+
             if self._distributed:
                 await self._coordinator.stop_cleanup_loop()
             await pool.stop()
 
+    async def _prefetch_first_wave(
+        self,
+        job_id: str,
+        rendered: list,
+        cache: Any,
+        pool: ExecutionWorkerPool,
+        stats: TimingStats | None = None,
+        debug: bool = False,
+    ) -> list:
+        """Bulk-load the first wave's cached responses and run those tasks now.
+
+        Renders every remaining ready task, computes their cache keys and loads
+        them into the cache's hot tier in bulk. Tasks whose responses are cached
+        are executed directly rather than enqueued, so fully cached interviews
+        never wait on queue slots or rate limits. Returns the tasks that still
+        need a model call.
+        """
+        from ..caching import CacheEntry
+
+        t0 = time.time()
+        n_first = len(rendered)  # already counted by the caller
+        while True:
+            more = self._render_worker.render_ready_tasks(
+                job_id, max_tasks=1000, debug=debug
+            )
+            if not more:
+                break
+            rendered.extend(more)
+        if stats:
+            stats.rendering += time.time() - t0
+            stats.tasks_rendered += len(rendered) - n_first
+
+        t0 = time.time()
+        keys = {}
+        for rp in rendered:
+            # Interview-type questions make their own calls through an invigilator
+            if rp.question_type == "interview":
+                continue
+            model = self._service.get_model_for_task(job_id, rp.model_id)
+            if model is None:
+                continue
+            keys[rp.task_id] = CacheEntry.gen_key(
+                **model._cache_call_params(
+                    rp.user_prompt, rp.system_prompt, rp.iteration, rp.files_list
+                )
+            )
+        hits = self._prefetch(job_id, cache, keys.values())
+        cached = [rp for rp in rendered if cache.is_prefetched(keys.get(rp.task_id))]
+        load_time = time.time() - t0
+
+        if stats:
+            stats.prefetch_keys += len(set(keys.values()))
+            stats.prefetch_hits += hits
+        if stats and debug:
+            # Estimate the point lookups avoided from a small sample of them.
+            # The sample runs blocking lookups on the loop, so debug runs only
+            sample = [keys[rp.task_id] for rp in cached[:20]]
+            if sample:
+                t1 = time.time()
+                for key in sample:
+                    cache.data.get(key, None)
+                per_lookup = (time.time() - t1) / len(sample)
+                saved = max(0.0, per_lookup * hits - load_time)
+                stats.prefetch_time_saved = (stats.prefetch_time_saved or 0.0) + saved
+        if debug:
+            print(f"[prefetch] {hits}/{len(keys)} first-wave prompts cached")
+
+        if cached:
+            await pool.execute_directly(cached)
+        if stats:
+            stats.prefetch += time.time() - t0
+
+        cached_ids = {rp.task_id for rp in cached}
+        return [rp for rp in rendered if rp.task_id not in cached_ids]
+
+    def _prefetch(self, job_id: str, cache: Any, keys) -> int:
+        """Load ``keys`` into the cache's hot tier on behalf of ``job_id``."""
+        keys = list(keys)
+        self._job_prefetched.setdefault(job_id, set()).update(keys)
+        return cache.prefetch(keys)
+
+    async def _render_batch_wave(
+        self, job_id: str, cache: Any, debug: bool = False
+    ) -> list:
+        """Render the next wave of tasks and fetch their responses in batches.
+
+        Returns an empty list while the previous wave is still running. Once it
+        has finished, renders every ready task, submits the prompts that miss
+        the cache to the provider batch APIs and registers the responses on
+        the models, so enqueuing the wave resolves each call without an API
+        request.
+        """
+        from ..caching import CacheEntry
+        from .batch import BatchRequest, get_batch_backend
+
+        if self._service.get_progress(job_id)["running_tasks"] > 0:
+            return []
+
+        rendered = []
+        while True:
+            chunk = self._render_worker.render_ready_tasks(
+                job_id, max_tasks=1000, debug=debug
+            )
+            if not chunk:
+                break
+            rendered.extend(chunk)
+
+        options = self._job_batch_options.get(job_id, {})
+        groups: dict[str, tuple[Any, Any, dict]] = {}
+        candidates = []
+        for rp in rendered:
+            # Files and interview-type questions are not batched; run them live
+            if rp.files_list or rp.question_type == "interview":
+                continue
+            model = self._service.get_model_for_task(job_id, rp.model_id)
+            if model is None:
+                continue
+            if rp.model_id not in groups:
+                groups[rp.model_id] = (model, get_batch_backend(model, **options), {})
+            if groups[rp.model_id][1] is None:
+                continue
+            key = CacheEntry.gen_key(
+                **model._cache_call_params(
+                    rp.user_prompt, rp.system_prompt, rp.iteration
+                )
+            )
+            candidates.append((rp, key))
+
+        # One bulk cache read for the wave; the hot tier also serves the
+        # cached tasks' fetches when they are enqueued
+        has_hot_tier = hasattr(cache, "prefetch")
+        if has_hot_tier:
+            self._prefetch(job_id, cache, [key for _, key in candidates])
+
+        schemas: dict[str, dict] = {}
+        for rp, key in candidates:
+            model, backend, requests = groups[rp.model_id]
+            if key in requests or (has_hot_tier and cache.is_prefetched(key)):
+                continue
+            if rp.question_id not in schemas:
+                schemas[rp.question_id] = self._response_schema_params(
+                    job_id, rp.question_id
+                )
+            requests[key] = BatchRequest(
+                key,
+                model.batch_request_body(
+                    rp.user_prompt, rp.system_prompt, **schemas[rp.question_id]
+                ),
+            )
+
+        for model, backend, requests in groups.values():
+            if backend is None or not requests:
+                continue
+            responses = await asyncio.to_thread(backend.run, list(requests.values()))
+            if debug:
+                print(
+                    f"[batch] {backend.service}: {len(responses)}/{len(requests)} "
+                    "requests succeeded"
+                )
+            model.add_prefetched_responses(responses)
+
+        return rendered
+
+    def _response_schema_params(self, job_id: str, question_id: str | None) -> dict:
+        """Structured-output arguments for a question that declares a schema.
+
+        QuestionPydantic stores its model's JSON schema with the question;
+        other questions have none and get an empty dict.
+        """
+        question_data = (
+            self._service.jobs.get_question(job_id, question_id) if question_id else None
+        )
+        schema = (question_data or {}).get("pydantic_model_schema")
+        if schema is None:
+            return {}
+        return {"response_schema": schema, "response_schema_name": schema.get("title")}
+
     @staticmethod
     def _draw_progress(
         visualizer: "JobVisualizer",
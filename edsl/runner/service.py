@@ -9,9 +9,9 @@ Handles:
 
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
-import itertools
 import random
 
 logger = logging.getLogger(__name__)
@@ -43,6 +43,7 @@ from .models import (
     RetryPolicy,
     DEFAULT_RETRY_POLICIES,
     generate_id,
+    streamed_interview_id,
 )
 
 # EDSL imports - relative since this module lives inside edsl package
@@ -58,6 +59,50 @@ if TYPE_CHECKING:
     pass
 
 
+@dataclass
+class _InterviewSource:
+    """
+    Everything needed to materialize any interview of a job.
+
+    Interview ``index`` enumerates scenarios x agents x models x iterations
+    in ``itertools.product`` order with iterations innermost, the order
+    submit_job has always created interviews in.
+    """
+
+    scenarios: list[tuple[str, Any]]  # (scenario_id, Scenario)
+    agents: list[tuple[str, Any]]  # (agent_id, Agent)
+    model_ids: list[str]
+    n_iterations: int
+    questions: list
+    question_name_to_id: dict[str, str]
+    dag: dict[str, set[str]]
+    question_model_overrides: dict[str, str]
+    questions_to_randomize: list
+    interview_window: int = 0
+    next_index: int = 0  # first interview of the cross product not yet built
+
+    @property
+    def total(self) -> int:
+        return (
+            len(self.scenarios)
+            * len(self.agents)
+            * len(self.model_ids)
+            * self.n_iterations
+        )
+
+    def combination(self, index: int) -> tuple:
+        """Return ((scenario_id, scenario), (agent_id, agent), model_id, iteration)."""
+        rest, iteration = divmod(index, self.n_iterations)
+        rest, model_index = divmod(rest, len(self.model_ids))
+        scenario_index, agent_index = divmod(rest, len(self.agents))
+        return (
+            self.scenarios[scenario_index],
+            self.agents[agent_index],
+            self.model_ids[model_index],
+            iteration,
+        )
+
+
 class JobService:
     """
     Top-level orchestrator for job execution.
@@ -79,9 +124,13 @@ class JobService:
         self._original_key_lookups: dict[str, Any] = (
             {}
         )  # job_id -> run_config.environment.key_lookup
-        self._interview_callbacks: dict[str, Any] = (
+        self._interview_callbacks: dict[str, list] = (
             {}
-        )  # job_id -> callable(job_id, interview_id)
+        )  # job_id -> [callable(job_id, interview_id), ...]
+        self._interview_sources: dict[str, _InterviewSource | None] = (
+            {}
+        )  # job_id -> cross product of a streamed job still being materialized,
+        # or None once the job has nothing (left) to materialize
 
     @property
     def jobs(self) -> JobStore:
@@ -104,9 +153,27 @@ class JobService:
 
         The callback receives ``(job_id, interview_id)`` and is called
         from ``on_task_completed`` / ``on_tasks_completed_batch`` once
-        all tasks for the interview are done.
+        all tasks for the interview are done. Several callbacks may be
+        registered for the same job; they run in registration order.
         """
-        self._interview_callbacks[job_id] = callback
+        self._interview_callbacks.setdefault(job_id, []).append(callback)
+
+    def unregister_interview_callback(self, job_id: str, callback) -> None:
+        """Remove a callback added with ``register_interview_callback``."""
+        callbacks = self._interview_callbacks.get(job_id, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._interview_callbacks.pop(job_id, None)
+
+    def _notify_interview_completed(self, job_id: str, interview_ids) -> None:
+        """Invoke the registered interview callbacks for finished interviews."""
+        callbacks = self._interview_callbacks.get(job_id)
+        if not callbacks:
+            return
+        for interview_id in interview_ids:
+            for cb in callbacks:
+                cb(job_id, interview_id)
 
     def get_model_for_task(self, job_id: str, model_id: str) -> Any:
         """
@@ -143,6 +210,7 @@ class JobService:
         n: int = 1,  # Number of iterations to run each interview
         job_id: str | None = None,  # Pre-generated job ID (for GCS upload flow)
         stop_on_exception: bool = False,  # Compatibility parameter (not used yet)
+        interview_window: int | None = None,
     ) -> str:
         """
         Submit an EDSL Job for execution.
@@ -159,6 +227,11 @@ class JobService:
                with different cache keys.
             job_id: Optional pre-generated job ID (for GCS upload flow)
             stop_on_exception: Whether to stop on first exception (reserved for future use)
+            interview_window: If set, stream the job: only this many interviews
+               (and their tasks) are materialized now, and
+               materialize_interviews() adds more as earlier ones finish, so
+               the first task can run without building the whole cross
+               product. A persisted cursor lets recover_job continue it.
 
         Returns the job_id.
         """
@@ -302,118 +375,38 @@ class JobService:
         # Get questions to randomize (if any)
         questions_to_randomize = getattr(survey, "questions_to_randomize", []) or []
 
-        # Generate interviews as cross-product x iterations
-        # For n_iterations > 1, we create n copies of each (scenario, agent, model) combination
-        t0 = time.time()
-        interview_ids = []
-        interview_definitions = []  # Collect for batch creation
-        all_task_definitions = []  # Collect for job_data cache
-        all_direct_task_info = []  # Collect all direct-answer task info
-        total_tasks_created = 0
-
-        for scenario, agent, model in itertools.product(
-            scenario_map.items(), agent_map.items(), model_map.items()
-        ):
-            scenario_id, scenario_obj = scenario
-            agent_id, agent_obj = agent
-            model_id, _ = model
-
-            # Create n_iterations interviews for this combination
-            for iteration in range(n_iterations):
-                interview_id = generate_id()
-                interview_ids.append(interview_id)
-
-                # Generate randomized question options for this interview
-                question_option_permutations = self._generate_question_permutations(
-                    questions, questions_to_randomize
-                )
-                question_item_randomization_seeds = {
-                    self._get_question_name(question): random.getrandbits(64)
-                    for question in questions
-                    if self._to_dict(question).get("randomize_items")
-                }
-
-                # Create tasks for this interview
-                # Pass agent and scenario objects for direct answer detection
-                (
-                    task_ids,
-                    direct_task_info,
-                    task_defs,
-                ) = self._create_tasks_for_interview(
-                    job_id=job_id,
-                    interview_id=interview_id,
-                    scenario_id=scenario_id,
-                    agent_id=agent_id,
-                    model_id=model_id,
-                    questions=questions,
-                    question_name_to_id=question_name_to_id,
-                    dag=dag,
-                    iteration=iteration,
-                    agent=agent_obj,
-                    scenario=scenario_obj,
-                    question_model_overrides=question_model_overrides,
-                )
-                total_tasks_created += len(task_ids)
-                all_task_definitions.extend(task_defs)
-
-                # Collect direct task info with context for registry building
-                for info in direct_task_info:
-                    all_direct_task_info.append(
-                        {
-                            **info,
-                            "interview_id": interview_id,
-                            "agent": agent_obj,
-                            "scenario": scenario_obj,
-                            "question": questions[info["question_index"]],
-                            "item_randomization_seed": question_item_randomization_seeds.get(
-                                self._get_question_name(
-                                    questions[info["question_index"]]
-                                )
-                            ),
-                        }
-                    )
-
-                # Collect interview definition for batch creation
-                interview_def = InterviewDefinition(
-                    interview_id=interview_id,
-                    job_id=job_id,
-                    scenario_id=scenario_id,
-                    agent_id=agent_id,
-                    model_id=model_id,
-                    total_tasks=len(task_ids),
-                    task_ids=task_ids,
-                    iteration=iteration,
-                    question_option_permutations=question_option_permutations,
-                    question_item_randomization_seeds=question_item_randomization_seeds,
-                )
-                interview_definitions.append(interview_def)
-
-        tasks_prep_time = (time.time() - t0) * 1000
-        logger.info(
-            f"[SUBMIT {job_id[:8]}] prepare_tasks_for_interviews: {tasks_prep_time:.1f}ms "
-            f"(interviews={len(interview_definitions)}, tasks={total_tasks_created})"
-        )
-
-        # Batch create all tasks (in chunks of 1000 for efficiency)
-        t0 = time.time()
-        TASK_BATCH_SIZE = 1000
-        for i in range(0, len(all_task_definitions), TASK_BATCH_SIZE):
-            batch = all_task_definitions[i : i + TASK_BATCH_SIZE]
-            self._tasks.create_batch(batch)
-        tasks_create_time = (time.time() - t0) * 1000
-
-        batch_stats = TaskStore.get_batch_stats()
-        logger.info(
-            f"[SUBMIT {job_id[:8]}] tasks.create_batch: {tasks_create_time:.1f}ms "
-            f"(calls={batch_stats['calls']}, tasks={batch_stats['total_tasks']})"
+        source = _InterviewSource(
+            scenarios=list(scenario_map.items()),
+            agents=list(agent_map.items()),
+            model_ids=list(model_map.keys()),
+            n_iterations=n_iterations,
+            questions=questions,
+            question_name_to_id=question_name_to_id,
+            dag=dag,
+            question_model_overrides=question_model_overrides,
+            questions_to_randomize=questions_to_randomize,
         )
-
-        # Batch create all interviews (much faster than individual creates)
-        t0 = time.time()
-        self._interviews.create_batch(interview_definitions)
-        logger.info(
-            f"[SUBMIT {job_id[:8]}] interviews.create_batch ({len(interview_definitions)}): {(time.time() - t0)*1000:.1f}ms"
+        total_interviews = source.total
+        if interview_window is not None:
+            # Streamed: materialize the first window now, the rest as it drains
+            interview_window = max(1, interview_window)
+            first_window = min(interview_window, total_interviews)
+            source.interview_window = interview_window
+            source.next_index = first_window
+            self._interview_sources[job_id] = source
+        else:
+            first_window = total_interviews
+            self._interview_sources[job_id] = None
+
+        (
+            interview_definitions,
+            all_task_definitions,
+            all_direct_task_info,
+        ) = self._materialize_interviews(
+            job_id, source, 0, first_window, streamed=interview_window is not None
         )
+        interview_ids = [idef.interview_id for idef in interview_definitions]
+        total_tasks_created = len(all_task_definitions)
 
         # Create job definition
         t0 = time.time()
@@ -421,7 +414,7 @@ class JobService:
             job_id=job_id,
             user_id=user_id,
             created_at=datetime.utcnow(),
-            total_interviews=len(interview_ids),
+            total_interviews=total_interviews,
             interview_ids=interview_ids,
             retry_policies=effective_policies,
             dag=dag,
@@ -430,8 +423,17 @@ class JobService:
             model_ids=list(model_map.keys()),
             question_ids=list(question_map.keys()),
             n_iterations=n_iterations,
+            interview_window=interview_window,
         )
         self._jobs.create(job_def)
+        if interview_window is not None:
+            self._jobs.write_interview_cursor(
+                job_id,
+                {
+                    "next_index": first_window,
+                    "question_model_overrides": question_model_overrides,
+                },
+            )
         logger.info(
             f"[SUBMIT {job_id[:8]}] jobs.create: {(time.time() - t0)*1000:.1f}ms"
         )
@@ -442,7 +444,8 @@ class JobService:
         db_stats = get_db_stats()
         logger.info(
             f"[SUBMIT {job_id[:8]}] TOTAL submit_job: {total_submit_time:.1f}ms "
-            f"(interviews={len(interview_ids)}, tasks={total_tasks_created}, "
+            f"(interviews={len(interview_ids)}/{total_interviews}, "
+            f"tasks={total_tasks_created}, "
             f"DB_CALLS={db_stats['calls']}, db_time={db_stats['elapsed_ms']:.1f}ms)"
         )
 
@@ -464,6 +467,226 @@ class JobService:
 
         return job_id, all_direct_task_info, job_data
 
+    def _materialize_interviews(
+        self,
+        job_id: str,
+        source: "_InterviewSource",
+        start: int,
+        stop: int,
+        streamed: bool = False,
+    ) -> tuple[list[InterviewDefinition], list[TaskDefinition], list[dict]]:
+        """
+        Build and store interviews ``start``..``stop`` of the cross product.
+
+        Streamed jobs use IDs derived from the interview's index, so the job
+        definition does not have to list them. Returns the interview
+        definitions, task definitions and direct-answer task info created.
+        """
+        t0 = time.time()
+        questions = source.questions
+        item_randomized_questions = [
+            self._get_question_name(question)
+            for question in questions
+            if self._to_dict(question).get("randomize_items")
+        ]
+        interview_definitions = []
+        all_task_definitions = []
+        all_direct_task_info = []
+
+        for index in range(start, stop):
+            (
+                (scenario_id, scenario_obj),
+                (agent_id, agent_obj),
+                model_id,
+                iteration,
+            ) = source.combination(index)
+            interview_id = (
+                streamed_interview_id(job_id, index) if streamed else generate_id()
+            )
+
+            # Generate randomized question options for this interview
+            question_option_permutations = self._generate_question_permutations(
+                questions, source.questions_to_randomize
+            )
+            question_item_randomization_seeds = {
+                q_name: random.getrandbits(64) for q_name in item_randomized_questions
+            }
+
+            # Create tasks for this interview
+            # Pass agent and scenario objects for direct answer detection
+            task_ids, direct_task_info, task_defs = self._create_tasks_for_interview(
+                job_id=job_id,
+                interview_id=interview_id,
+                scenario_id=scenario_id,
+                agent_id=agent_id,
+                model_id=model_id,
+                questions=questions,
+                question_name_to_id=source.question_name_to_id,
+                dag=source.dag,
+                iteration=iteration,
+                agent=agent_obj,
+                scenario=scenario_obj,
+                question_model_overrides=source.question_model_overrides,
+            )
+            all_task_definitions.extend(task_defs)
+
+            # Collect direct task info with context for registry building
+            for info in direct_task_info:
+                question = questions[info["question_index"]]
+                all_direct_task_info.append(
+                    {
+                        **info,
+                        "interview_id": interview_id,
+                        "agent": agent_obj,
+                        "scenario": scenario_obj,
+                        "question": question,
+                        "item_randomization_seed": question_item_randomization_seeds.get(
+                            self._get_question_name(question)
+                        ),
+                    }
+                )
+
+            interview_definitions.append(
+                InterviewDefinition(
+                    interview_id=interview_id,
+                    job_id=job_id,
+                    scenario_id=scenario_id,
+                    agent_id=agent_id,
+                    model_id=model_id,
+                    total_tasks=len(task_ids),
+                    task_ids=task_ids,
+                    iteration=iteration,
+                    question_option_permutations=question_option_permutations,
+                    question_item_randomization_seeds=question_item_randomization_seeds,
+                )
+            )
+
+        logger.info(
+            f"[SUBMIT {job_id[:8]}] prepare_tasks_for_interviews [{start}, {stop}): "
+            f"{(time.time() - t0)*1000:.1f}ms "
+            f"(interviews={len(interview_definitions)}, tasks={len(all_task_definitions)})"
+        )
+
+        # Batch create all tasks (in chunks of 1000 for efficiency)
+        t0 = time.time()
+        TASK_BATCH_SIZE = 1000
+        for i in range(0, len(all_task_definitions), TASK_BATCH_SIZE):
+            batch = all_task_definitions[i : i + TASK_BATCH_SIZE]
+            self._tasks.create_batch(batch)
+
+        batch_stats = TaskStore.get_batch_stats()
+        logger.info(
+            f"[SUBMIT {job_id[:8]}] tasks.create_batch: {(time.time() - t0)*1000:.1f}ms "
+            f"(calls={batch_stats['calls']}, tasks={batch_stats['total_tasks']})"
+        )
+
+        # Batch create all interviews (much faster than individual creates)
+        t0 = time.time()
+        self._interviews.create_batch(interview_definitions)
+        logger.info(
+            f"[SUBMIT {job_id[:8]}] interviews.create_batch ({len(interview_definitions)}): {(time.time() - t0)*1000:.1f}ms"
+        )
+
+        return interview_definitions, all_task_definitions, all_direct_task_info
+
+    def materialize_interviews(self, job_id: str) -> list[dict]:
+        """
+        Top up a streamed job's materialized interviews.
+
+        Once at least half of the job's interview window has finished, the
+        next interviews of the cross product (enough to refill the window)
+        are built and stored, and the persisted cursor is advanced. Does
+        nothing for jobs that are not streamed, fully materialized or no
+        longer running. Called on every pass of the Runner's loop, so the
+        job's definition is read at most once per process; the cursor and
+        window are kept on the job's interview source.
+
+        Returns direct-answer task info for the new tasks, in the same form
+        as submit_job.
+        """
+        if job_id in self._interview_sources:
+            source = self._interview_sources[job_id]
+        else:
+            # First call in this process for a job submitted elsewhere
+            # (recovery): read its definition once and keep what's needed
+            job_def = self._jobs.get_definition(job_id)
+            if job_def is None:
+                return []
+            source = None
+            if job_def.is_streamed:
+                source = self._load_interview_source(job_id, job_def)
+            self._interview_sources[job_id] = source
+        if source is None:
+            return []
+        cursor = source.next_index
+        if cursor >= source.total:
+            self._interview_sources[job_id] = None
+            return []
+        if self._jobs.get_state(job_id) != JobState.RUNNING:
+            return []
+
+        active = cursor - self._jobs.get_status(job_id).finished_count
+        room = source.interview_window - active
+        if room < max(1, source.interview_window // 2):
+            return []
+
+        stop = min(source.total, cursor + room)
+        _, _, direct_task_info = self._materialize_interviews(
+            job_id, source, cursor, stop, streamed=True
+        )
+        source.next_index = stop
+        self._jobs.write_interview_cursor(
+            job_id,
+            {
+                "next_index": stop,
+                "question_model_overrides": source.question_model_overrides,
+            },
+        )
+        return direct_task_info
+
+    def _load_interview_source(
+        self, job_id: str, job_def: JobDefinition
+    ) -> "_InterviewSource":
+        """
+        Rebuild a streamed job's interview source from storage.
+
+        Used when the process that submitted the job is gone (recovery).
+        Agents are rebuilt from their stored dicts, so direct-answer methods
+        that do not serialize are not detected for interviews built this way.
+        """
+        cursor = self._jobs.get_interview_cursor(job_id) or {}
+        survey = Survey.from_dict(self._jobs.get_survey(job_id))
+        question_name_to_id = {}
+        for q_id in job_def.question_ids:
+            q_data = self._jobs.get_question(job_id, q_id)
+            if q_data:
+                question_name_to_id[self._get_question_name(q_data)] = q_id
+
+        scenarios = []
+        for s_id in job_def.scenario_ids:
+            scenario_data = self.get_scenario_with_files(job_id, s_id)
+            scenarios.append(
+                (s_id, Scenario.from_dict(scenario_data) if scenario_data else Scenario())
+            )
+        agents = []
+        for a_id in job_def.agent_ids:
+            agent_data = self._jobs.get_agent(job_id, a_id)
+            agents.append((a_id, Agent.from_dict(agent_data) if agent_data else Agent()))
+
+        return _InterviewSource(
+            scenarios=scenarios,
+            agents=agents,
+            model_ids=list(job_def.model_ids),
+            n_iterations=job_def.n_iterations,
+            questions=self._extract_questions(survey),
+            question_name_to_id=question_name_to_id,
+            dag=job_def.dag,
+            question_model_overrides=cursor.get("question_model_overrides", {}),
+            questions_to_randomize=getattr(survey, "questions_to_randomize", []) or [],
+            interview_window=job_def.interview_window,
+            next_index=cursor.get("next_index", len(job_def.interview_ids)),
+        )
+
     def _create_tasks_for_interview(
         self,
         job_id: str,
@@ -916,10 +1139,8 @@ class JobService:
         if interview_state != InterviewState.RUNNING:
             had_failures = interview_state == InterviewState.COMPLETED_WITH_FAILURES
             self._jobs.mark_interview_completed(job_id, interview_id, had_failures)
-            # Notify CAS streaming callback (if registered)
-            cb = self._interview_callbacks.get(job_id)
-            if cb:
-                cb(job_id, interview_id)
+            # Notify interview callbacks (CAS streaming, incremental results)
+            self._notify_interview_completed(job_id, [interview_id])
         _dt_finalize = (_time.monotonic() - _t) * 1000
 
         _dt_total = (_time.monotonic() - _t_total) * 1000
@@ -935,14 +1156,16 @@ class JobService:
         job_id: str,
         tasks: list[dict],
     ) -> None:
-        """Batch version of on_task_completed for processing many cache hits at once.
-
-        Each dict in tasks must have:
-            interview_id, task_id, answer_value, and optionally:
-            comment, input_tokens, output_tokens, raw_model_response,
-            generated_tokens, cached, system_prompt, user_prompt,
-            input_price_per_million_tokens, output_price_per_million_tokens,
-            cache_key, validated, reasoning_summary
+        """Batch version of on_task_completed for many tasks of one job.
+
+        Used by execution workers that take several assignments at once and
+        for processing many cache hits together. Each dict in tasks must have:
+            interview_id, task_id, answer_value, and optionally any of the
+            other keyword arguments of on_task_completed (comment,
+            input_tokens, output_tokens, raw_model_response, generated_tokens,
+            cached, system_prompt, user_prompt, input/output prices,
+            thinking_tokens, cache_key, validated, reasoning_summary,
+            distribution, resolution_draw, resolution_seed, resolution_method)
         """
         if not tasks:
             return
@@ -984,6 +1207,7 @@ class JobService:
                     cached=task_info.get("cached", False),
                     input_tokens=task_info.get("input_tokens"),
                     output_tokens=task_info.get("output_tokens"),
+                    thinking_tokens=task_info.get("thinking_tokens"),
                     raw_model_response=task_info.get("raw_model_response"),
                     generated_tokens=task_info.get("generated_tokens"),
                     model_id=task_def.model_id,
@@ -996,6 +1220,10 @@ class JobService:
                     cache_key=task_info.get("cache_key"),
                     validated=task_info.get("validated"),
                     reasoning_summary=task_info.get("reasoning_summary"),
+                    distribution=task_info.get("distribution"),
+                    resolution_draw=task_info.get("resolution_draw"),
+                    resolution_seed=task_info.get("resolution_seed"),
+                    resolution_method=task_info.get("resolution_method"),
                 )
             )
         self._answers.store_batch(answers)
@@ -1038,31 +1266,29 @@ class JobService:
         interview_states = self._interviews.get_states_batch(interview_ids)
         completed_iids = []
         had_failures_iids: set[str] = set()
-        cb = self._interview_callbacks.get(job_id)
         for iid, state in interview_states.items():
             if state != InterviewState.RUNNING:
                 completed_iids.append(iid)
                 if state == InterviewState.COMPLETED_WITH_FAILURES:
                     had_failures_iids.add(iid)
-                if cb:
-                    cb(job_id, iid)
 
         if completed_iids:
             self._jobs.mark_interviews_completed_batch(
                 job_id, completed_iids, had_failures_iids
             )
+            # Notify interview callbacks, as on_task_completed does
+            self._notify_interview_completed(job_id, completed_iids)
         _t_finalize = (_t.time() - _t0) * 1000
 
         _total = (_t.time() - _batch_t0) * 1000
-        print(
-            f"[on_tasks_completed_batch] {len(tasks)} tasks, "
+        logger.info(
+            f"[OTC_BATCH_TIMING] {len(tasks)} tasks, "
             f"{len(interview_counts)} interviews, "
             f"{len(completed_iids)} finalized: "
             f"defs={_t_defs:.0f}ms, answers={_t_answers:.0f}ms, "
             f"status={_t_status:.0f}ms, deps={_t_deps:.0f}ms, "
             f"incr={_t_incr:.0f}ms, finalize={_t_finalize:.0f}ms, "
-            f"total={_total:.0f}ms",
-            flush=True,
+            f"total={_total:.0f}ms"
         )
 
     def on_task_skipped(
@@ -1092,9 +1318,7 @@ class JobService:
         if interview_state != InterviewState.RUNNING:
             had_failures = interview_state == InterviewState.COMPLETED_WITH_FAILURES
             self._jobs.mark_interview_completed(job_id, interview_id, had_failures)
-            cb = self._interview_callbacks.get(job_id)
-            if cb:
-                cb(job_id, interview_id)
+            self._notify_interview_completed(job_id, [interview_id])
 
     def on_task_failed(
         self,
@@ -1145,9 +1369,7 @@ class JobService:
         if interview_state != InterviewState.RUNNING:
             had_failures = True  # We just had a failure
             self._jobs.mark_interview_completed(job_id, interview_id, had_failures)
-            cb = self._interview_callbacks.get(job_id)
-            if cb:
-                cb(job_id, interview_id)
+            self._notify_interview_completed(job_id, [interview_id])
 
     def _propagate_failure(
         self, job_id: str, interview_id: str, dependent_ids: list[str]
@@ -1269,6 +1491,8 @@ class JobService:
             "completed_interviews": job_status.completed_interviews,
             "failed_interviews": job_status.failed_interviews,
             "running_interviews": job_def.total_interviews - job_status.finished_count,
+            "unmaterialized_interviews": job_def.total_interviews
+            - len(job_def.interview_ids),
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
             "skipped_tasks": skipped_tasks,
@@ -1331,6 +1555,8 @@ class JobService:
             "completed_interviews": job_status.completed_interviews,
             "failed_interviews": job_status.failed_interviews,
             "running_interviews": job_def.total_interviews - job_status.finished_count,
+            "unmaterialized_interviews": job_def.total_interviews
+            - len(job_def.interview_ids),
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
             "skipped_tasks": skipped_tasks,
@@ -1466,6 +1692,8 @@ class JobService:
                 "failed_interviews": job_status.failed_interviews,
                 "running_interviews": job_def.total_interviews
                 - job_status.finished_count,
+                "unmaterialized_interviews": job_def.total_interviews
+                - len(job_def.interview_ids),
                 "total_tasks": total_tasks,
                 "completed_tasks": completed_tasks,
                 "skipped_tasks": skipped_tasks,
@@ -2288,14 +2516,7 @@ class JobService:
 
         # Sort results to match the old system's ordering:
         # agent-major, then scenario, then model, then iteration.
-        result_list.sort(
-            key=lambda r: (
-                r.indices.get("agent", 0) if r.indices else 0,
-                r.indices.get("scenario", 0) if r.indices else 0,
-                r.indices.get("model", 0) if r.indices else 0,
-                r.data.get("iteration", 0),
-            )
-        )
+        result_list.sort(key=self.result_sort_key)
 
         # Create the Results object
         _t = _time.time()
@@ -2308,6 +2529,146 @@ class JobService:
 
         return results
 
+    @staticmethod
+    def result_sort_key(result: Any) -> tuple[int, int, int, int]:
+        """Ordering of Results: agent-major, then scenario, model, iteration."""
+        indices = result.indices or {}
+        return (
+            indices.get("agent", 0),
+            indices.get("scenario", 0),
+            indices.get("model", 0),
+            result.data.get("iteration", 0),
+        )
+
+    def get_results_context(
+        self, job_id: str, job_def: "JobDefinition | None" = None
+    ) -> dict[str, Any]:
+        """
+        Fetch the per-job data shared by every Result of a job.
+
+        Returns a dict with the job definition, survey, questions data and
+        question names, plus an ``object_data`` cache that
+        ``build_edsl_results_for_interviews`` fills with agent, scenario and
+        model dicts as it meets them.
+        """
+        if job_def is None:
+            job_def = self._jobs.get_definition(job_id)
+        if job_def is None:
+            raise ValueError(f"Job {job_id} not found")
+
+        question_ids = list(job_def.question_ids or [])
+        keys = [f"job:{job_id}:survey"]
+        keys.extend(f"job:{job_id}:question:{qid}" for qid in question_ids)
+        data = self._storage.batch_read_persistent(keys)
+
+        survey_data = data.get(f"job:{job_id}:survey")
+        questions_data = {
+            qid: data.get(f"job:{job_id}:question:{qid}") for qid in question_ids
+        }
+        question_names = [
+            q_data.get("question_name", qid)
+            for qid, q_data in questions_data.items()
+            if q_data
+        ]
+        return {
+            "job_def": job_def,
+            "survey": Survey.from_dict(survey_data) if survey_data else None,
+            "questions_data": questions_data,
+            "question_names": question_names,
+            "agent_index": {aid: i for i, aid in enumerate(job_def.agent_ids)},
+            "scenario_index": {sid: i for i, sid in enumerate(job_def.scenario_ids)},
+            "model_index": {mid: i for i, mid in enumerate(job_def.model_ids)},
+            "object_data": {},
+        }
+
+    def build_edsl_results_for_interviews(
+        self,
+        job_id: str,
+        interview_ids: list[str],
+        context: dict[str, Any] | None = None,
+    ) -> list[Any]:
+        """
+        Build Result objects for a subset of a job's finished interviews.
+
+        Used to assemble results incrementally while the job is still
+        running. The caller is responsible for passing only interviews that
+        have finished. Passing the same ``context`` (from
+        ``get_results_context``) across calls avoids re-reading the survey
+        and re-fetching agents, scenarios and models already seen.
+
+        Returns a list of edsl.results.Result objects, in the order of
+        ``interview_ids`` (interviews whose definition is missing are skipped).
+        """
+        if not interview_ids:
+            return []
+        if context is None:
+            context = self.get_results_context(job_id)
+
+        interview_defs = self._interviews.get_definitions_batch(job_id, interview_ids)
+
+        object_data = context["object_data"]
+        missing = set()
+        for interview_def in interview_defs.values():
+            if interview_def is None:
+                continue
+            for key in (
+                f"job:{job_id}:agent:{interview_def.agent_id}",
+                f"job:{job_id}:scenario:{interview_def.scenario_id}",
+                f"job:{job_id}:model:{interview_def.model_id}",
+            ):
+                if key not in object_data:
+                    missing.add(key)
+        if missing:
+            object_data.update(self._storage.batch_read_persistent(list(missing)))
+
+        all_answers = {}
+        if context["question_names"]:
+            all_answers = self._answers.get_for_interviews_batch(
+                job_id, list(interview_ids), context["question_names"]
+            )
+
+        result_list = []
+        for interview_id in interview_ids:
+            interview_def = interview_defs.get(interview_id)
+            if interview_def is None:
+                continue
+            result_list.append(
+                self.build_edsl_result(
+                    job_id,
+                    interview_id,
+                    job_def=context["job_def"],
+                    survey=context["survey"],
+                    interview_def=interview_def,
+                    all_object_data=object_data,
+                    questions_data=context["questions_data"],
+                    prefetched_answers=all_answers.get(interview_id, {}),
+                    indices={
+                        "agent": context["agent_index"].get(interview_def.agent_id, 0),
+                        "scenario": context["scenario_index"].get(
+                            interview_def.scenario_id, 0
+                        ),
+                        "model": context["model_index"].get(interview_def.model_id, 0),
+                    },
+                )
+            )
+        return result_list
+
+    def get_finished_interview_ids(
+        self, job_id: str, job_def: "JobDefinition | None" = None
+    ) -> list[str]:
+        """Interview IDs of a job that have completed (with or without failures)."""
+        if job_def is None:
+            job_def = self._jobs.get_definition(job_id)
+        if job_def is None:
+            raise ValueError(f"Job {job_id} not found")
+        states = self._interviews.get_states_batch(list(job_def.interview_ids))
+        return [
+            iid
+            for iid, state in states.items()
+            if state
+            in (InterviewState.COMPLETED, InterviewState.COMPLETED_WITH_FAILURES)
+        ]
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
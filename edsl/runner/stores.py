@@ -23,6 +23,7 @@ from .models import (
     TaskState,
     TaskStatus,
     Answer,
+    StreamedInterviewIds,
 )
 
 
@@ -101,6 +102,26 @@ class JobStore:
         }
         self._storage.batch_write_persistent(items)
 
+    def write_interview_cursor(self, job_id: str, cursor: dict) -> None:
+        """Persist a streamed job's position in its interview cross product.
+
+        ``cursor["next_index"]`` is the number of interviews materialized so
+        far; the rest of the dict holds what is needed to materialize more.
+        """
+        self._storage.write_persistent(f"job:{job_id}:interview_cursor", cursor)
+
+    def get_interview_cursor(self, job_id: str) -> dict | None:
+        return self._storage.read_persistent(f"job:{job_id}:interview_cursor")
+
+    def _with_streamed_ids(self, definition: JobDefinition) -> JobDefinition:
+        """Fill in a streamed job's interview IDs from its cursor."""
+        if definition.is_streamed:
+            cursor = self.get_interview_cursor(definition.job_id) or {}
+            definition.interview_ids = StreamedInterviewIds(
+                definition.job_id, cursor.get("next_index", 0)
+            )
+        return definition
+
     def increment_completed_interviews(self, job_id: str) -> int:
         return self._storage.increment_volatile(f"job:{job_id}:completed_interviews")
 
@@ -116,7 +137,7 @@ class JobStore:
         data = self._storage.read_persistent(f"job:{job_id}:meta")
         if data is None:
             return None
-        return JobDefinition.from_dict(job_id, data)
+        return self._with_streamed_ids(JobDefinition.from_dict(job_id, data))
 
     def get_status(self, job_id: str) -> JobStatus:
         return JobStatus(
@@ -162,7 +183,9 @@ class JobStore:
             key = f"job:{job_id}:meta"
             data = values.get(key)
             if data:
-                result[job_id] = JobDefinition.from_dict(job_id, data)
+                result[job_id] = self._with_streamed_ids(
+                    JobDefinition.from_dict(job_id, data)
+                )
             else:
                 result[job_id] = None
         return result
@@ -661,25 +661,32 @@ class Scenario(Base, UserDict):
 
         return ScenarioSerializer(self).to_dict(add_edsl_version, offload_base64)
 
-    def __hash__(self) -> int:
+    def _compute_hash(self) -> int:
         """Return a hash of the scenario.
 
+        The hash is cached by ``Base.__hash__`` and invalidated whenever a key is
+        set or deleted.
+
         Example:
 
         >>> s = Scenario({"food": "wood chips"})
         >>> hash(s)
         1153210385458344214
+        >>> s["food"] = "bark"
+        >>> hash(s) == 1153210385458344214
+        False
         """
-        # Use cached hash if already computed
-        if hasattr(self, "_cached_hash"):
-            return self._cached_hash
-
-        # Compute hash for first time and cache it in the object
         from edsl.scenarios.serialization.scenario_serializer import ScenarioSerializer
 
-        serializer = ScenarioSerializer(self)
-        self._cached_hash = serializer.compute_hash()
-        return self._cached_hash
+        return ScenarioSerializer(self).compute_hash()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._invalidate_hash()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._invalidate_hash()
+        super().__delitem__(key)
 
     def _eval_repr_(self) -> str:
         """Return an eval-able string representation of the Scenario.
@@ -796,9 +796,12 @@ class ScenarioList(MutableSequence, Base, ScenarioListOperationsMixin):
         if len(self) == 0:
             return set()
 
+        # The scenarios' own keys: Scenario.keys() serializes the scenario
         params = set()
         for scenario in self:
-            params.update(scenario.keys())
+            params.update(scenario.data)
+        params.discard("edsl_version")
+        params.discard("edsl_class_name")
         return params
 
     def __original_hash__(self) -> int:
@@ -16,7 +16,8 @@ class FilterMixin:
 
         Mirrors ScenarioList.filter behavior and errors.
         """
-        from simpleeval import EvalWithCompoundTypes, NameNotDefined
+        from simpleeval import NameNotDefined
+        from ...utilities import CompiledExpression
         from ..exceptions import ScenarioError
         import warnings as _warnings
         import re
@@ -43,36 +44,72 @@ class FilterMixin:
 
         new_sl = ScenarioList(data=[], codebook=getattr(self._scenario_list, "codebook", {}))
 
-        def create_evaluator(scenario):
+        def rewrite_dot_fields(keys):
             # Handle field names containing dots by creating safe aliases
-            scenario_names = dict(scenario)
             modified_expression = expression
+            aliases = {}
 
             # Find all field names with dots that exist in the scenario
-            dot_fields = [key for key in scenario.keys() if "." in key]
-
-            if dot_fields:
-                # Create safe aliases for fields with dots
-                field_mapping = {}
-                for field in dot_fields:
-                    # Create a safe alias by replacing dots with underscores and adding prefix
-                    safe_alias = f"__dot_field_{field.replace('.', '_dot_')}"
-                    field_mapping[field] = safe_alias
-                    scenario_names[safe_alias] = scenario[field]
-
-                    # Replace field references in the expression with safe aliases
-                    # Use word boundaries to avoid partial replacements
-                    pattern = r"\b" + re.escape(field) + r"\b"
-                    modified_expression = re.sub(
-                        pattern, safe_alias, modified_expression
-                    )
-
-            return EvalWithCompoundTypes(names=scenario_names), modified_expression
+            dot_fields = [key for key in keys if "." in key]
+
+            for field in dot_fields:
+                # Create a safe alias by replacing dots with underscores and adding prefix
+                safe_alias = f"__dot_field_{field.replace('.', '_dot_')}"
+                aliases[safe_alias] = field
+
+                # Replace field references in the expression with safe aliases
+                # Use word boundaries to avoid partial replacements
+                pattern = r"\b" + re.escape(field) + r"\b"
+                modified_expression = re.sub(pattern, safe_alias, modified_expression)
+
+            return modified_expression, aliases
+
+        # Expressions are parsed once per distinct set of dotted field names
+        compiled_expressions = {}
+
+        def compile_for(keys):
+            dot_fields = tuple(key for key in keys if "." in key)
+            if dot_fields not in compiled_expressions:
+                eval_expression, aliases = rewrite_dot_fields(dot_fields)
+                compiled_expressions[dot_fields] = (
+                    CompiledExpression(eval_expression),
+                    aliases,
+                )
+            return compiled_expressions[dot_fields]
+
+        def row_names(scenario, aliases):
+            scenario_names = dict(scenario)
+            for safe_alias, field in aliases.items():
+                scenario_names[safe_alias] = scenario[field]
+            return scenario_names
+
+        def column_mask(scenarios):
+            # Column-at-a-time evaluation needs every scenario to have the
+            # same fields, so that the expression rewrite is the same for all
+            keys = tuple(scenarios[0].keys())
+            if any(tuple(scenario.keys()) != keys for scenario in scenarios):
+                return None
+            compiled, aliases = compile_for(keys)
+            field_names = set(keys)
+
+            def resolve(name, attr):
+                field = aliases.get(name, name)
+                if attr is not None or field not in field_names:
+                    return None
+                return [scenario[field] for scenario in scenarios]
+
+            return compiled.evaluate_columns(resolve, len(scenarios))
 
         try:
-            for scenario in self._scenario_list:
-                evaluator, eval_expression = create_evaluator(scenario)
-                if evaluator.eval(eval_expression):
+            scenarios = list(self._scenario_list)
+            mask = column_mask(scenarios) if scenarios else None
+            if mask is None:
+                mask = []
+                for scenario in scenarios:
+                    compiled, aliases = compile_for(scenario.keys())
+                    mask.append(compiled.evaluate(row_names(scenario, aliases)))
+            for scenario, keep in zip(scenarios, mask):
+                if keep:
                     scenario_copy = scenario.copy()
                     new_sl.append(scenario_copy)
                     del scenario_copy
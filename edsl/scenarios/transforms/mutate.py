@@ -102,8 +102,7 @@ class MutateMixin:
         """Return a new ScenarioList with a new variable added via expression eval."""
         from ..scenario_list import ScenarioList  # type: ignore
         from ..exceptions import ScenarioError
-        from ...utilities import is_valid_variable_name
-        from simpleeval import EvalWithCompoundTypes
+        from ...utilities import CompiledExpression, is_valid_variable_name
 
         if "=" not in new_var_string:
             raise ScenarioError(
@@ -115,20 +114,27 @@ class MutateMixin:
         if not is_valid_variable_name(var_name):
             raise ScenarioError(f"{var_name} is not a valid variable name.")
 
-        functions_dict = functions_dict or {}
+        compiled = CompiledExpression(expression, functions=dict(functions_dict or {}))
 
-        def create_evaluator(scenario) -> EvalWithCompoundTypes:
-            return EvalWithCompoundTypes(names=scenario, functions=functions_dict)
-
-        def _new_scenario(old_scenario, var_name: str):
-            evaluator = create_evaluator(old_scenario)
-            value = evaluator.eval(expression)
+        def _new_scenario(old_scenario, value):
             new_s = old_scenario.copy()
             new_s[var_name] = value
             return new_s
 
+        def resolve(name, attr):
+            if attr is not None:
+                return None
+            try:
+                return [scenario[name] for scenario in scenarios]
+            except KeyError:
+                return None
+
         try:
-            new_data = [_new_scenario(s, var_name) for s in self._scenario_list]
+            scenarios = list(self._scenario_list)
+            values = compiled.evaluate_columns(resolve, len(scenarios))
+            if values is None:
+                values = [compiled.evaluate(s) for s in scenarios]
+            new_data = [_new_scenario(s, value) for s, value in zip(scenarios, values)]
         except Exception as e:
             raise ScenarioError(f"Error in mutate. Exception:{e}")
 
@@ -23,6 +23,7 @@ class BaseDescriptor(ABC):
         """Set the value of the attribute."""
         self.validate(value, instance)
         instance.__dict__[self.name] = value
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
@@ -76,6 +77,7 @@ class QuestionsDescriptor(BaseDescriptor):
 
         # Set all questions at once - O(n)
         instance.__dict__[self.name] = list(value) if value else []
+        instance._invalidate_hash()
 
         # Build pseudo_indices - preserve existing instruction indices (floats)
         # but update question indices (integers)
@@ -189,6 +191,7 @@ class QuestionsToRandomizeDescriptor(BaseDescriptor):
 
         self.validate(value, instance)
         instance.__dict__[self.name] = value
+        instance._invalidate_hash()
 
     def __set_name__(self, owner, name: str) -> None:
         """Set the name of the attribute."""
@@ -130,6 +130,7 @@ class EditSurvey:
         if hasattr(self.survey, "memory_plan"):
             self.survey.memory_plan.add_question(question, index=index)
 
+        self.survey._invalidate_hash()
         return self.survey
 
     def delete_question(self, identifier: Union[str, int]) -> "Survey":
@@ -208,6 +209,7 @@ class EditSurvey:
         if hasattr(self.survey, "memory_plan"):
             self.survey.memory_plan.remove_question(deleted_question.question_name)
 
+        self.survey._invalidate_hash()
         return self.survey
 
     def add_instruction(
@@ -248,6 +250,7 @@ class EditSurvey:
             pseudo_index = self.survey._pseudo_indices.max_pseudo_index + 1.0 / 2.0
         self.survey._pseudo_indices[instruction.name] = pseudo_index
 
+        self.survey._invalidate_hash()
         return self.survey
 
 
@@ -19,6 +19,7 @@ class MemoryManagement:
                 focal_question=question_name,
                 prior_questions=prior_questions_func(i),
             )
+        self.survey._invalidate_hash()
 
     def add_targeted_memory(
         self,
@@ -44,6 +45,7 @@ class MemoryManagement:
             prior_question=prior_question_name,
         )
 
+        self.survey._invalidate_hash()
         return self.survey
 
     def add_memory_collection(
@@ -70,4 +72,5 @@ class MemoryManagement:
         self.survey.memory_plan.add_memory_collection(
             focal_question=focal_question_name, prior_questions=prior_question_names
         )
+        self.survey._invalidate_hash()
         return self.survey
@@ -126,6 +126,7 @@ class RuleManager:
             )
         )
 
+        self.survey._invalidate_hash()
         return self.survey
 
     def add_stop_rule(
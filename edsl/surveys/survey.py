@@ -9,6 +9,7 @@ Surveys can include skip logic, memory management, and question groups.
 
 from __future__ import annotations
 import re
+import copy
 import random
 from uuid import uuid4
 from pathlib import Path
@@ -603,37 +604,121 @@ class Survey(Base):
             for q in self.questions
         }
 
+    def __hash__(self) -> int:
+        """Return the cached content hash of the survey.
+
+        Editing a question in place changes its hash without going through the
+        survey. Questions advance ``QuestionBase._hash_generation`` when that
+        happens, and only then does the survey compare its questions' (cached)
+        hashes with the ones it last saw, dropping its own hash if they differ.
+
+        >>> s = Survey.example()
+        >>> h = hash(s)
+        >>> s.questions[0].question_text = "Do you like homework?"
+        >>> hash(s) == h
+        False
+        """
+        from ..questions import QuestionBase
+
+        generation = QuestionBase._hash_generation
+        if self.__dict__.get("_question_hash_generation") != generation:
+            question_hashes = tuple(hash(q) for q in self.questions)
+            if self.__dict__.get("_cached_question_hashes") != question_hashes:
+                self._invalidate_hash()
+                self._cached_question_hashes = question_hashes
+            self._question_hash_generation = generation
+        return super().__hash__()
+
     def draw(self) -> "Survey":
-        """Return a new survey with a randomly selected permutation of the options."""
+        """Return a survey with a randomly selected permutation of the options.
+
+        The returned survey shares everything it can with this one. Only questions
+        that are randomized, or that an interview writes back to while it runs
+        (dynamic options or bounds, jinja parameters, probabilistic responses), get
+        their own copy; all other questions and the rules, memory plan and
+        instructions are shared. When no question needs its own copy, the survey
+        itself is returned.
+
+        >>> s = Survey.example()
+        >>> s.draw() is s
+        True
+        >>> s2 = Survey(s.questions, questions_to_randomize=["q0"])
+        >>> d = s2.draw()
+        >>> d is s2, d.questions[0] is s2.questions[0], d.questions[1] is s2.questions[1]
+        (False, False, True)
+        """
         if self._seed is None:  # only set once
             self._seed = hash(self)
             random.seed(self._seed)  # type: ignore
 
-        # Always create new questions to avoid sharing state between interviews
-        # This is necessary even when there's no randomization because:
-        # 1. Piping might require each interview to have its own survey instance
-        # 2. Different agents/scenarios need independent survey instances
-        new_questions = []
-        for question in self.questions:
+        per_interview = self._per_interview_question_indices()
+        if not per_interview:
+            return self
+
+        replacements = {}
+        for index in per_interview:
+            question = self.questions[index]
             if question.question_name in self.questions_to_randomize:
                 pin = self.options_to_pin.get(question.question_name, None)
-                new_questions.append(question.draw(pin_options=pin))
+                replacements[index] = question.draw(pin_options=pin)
             else:
-                new_questions.append(question.duplicate())
+                replacements[index] = copy.deepcopy(question)
 
-        d = self.to_dict()
-        d["questions"] = [q.to_dict() for q in new_questions]
-        new_survey = Survey.from_dict(d, _internal_copy=True)
+        return self._overlay(replacements)
 
-        # Preserve any non-serialized attributes from the new_questions
-        for i, new_question in enumerate(new_questions):
-            survey_question = new_survey.questions[i]
-            if hasattr(new_question, "exception_to_throw"):
-                survey_question.exception_to_throw = new_question.exception_to_throw
-            if hasattr(new_question, "override_answer"):
-                survey_question.override_answer = new_question.override_answer
+    def _per_interview_question_indices(self) -> Tuple[int, ...]:
+        """Return the indices of questions each drawn survey needs its own copy of.
 
-        return new_survey
+        The answer only depends on the questions themselves, so it is cached and
+        recomputed whenever the question list or the randomization list changes.
+        """
+        key = (
+            tuple(id(q) for q in self.questions),
+            tuple(self.questions_to_randomize),
+        )
+        cached = self.__dict__.get("_cached_draw_plan")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        indices = tuple(
+            index
+            for index, question in enumerate(self.questions)
+            if question.question_name in self.questions_to_randomize
+            or self._has_per_interview_state(question)
+        )
+        self._cached_draw_plan = (key, indices)
+        return indices
+
+    @staticmethod
+    def _has_per_interview_state(question: "QuestionBase") -> bool:
+        """Return True if running an interview writes state back onto the question."""
+        if getattr(question, "probabilistic_response", None) is not None:
+            return True
+        data = getattr(question, "data", {}) or {}
+        if isinstance(data.get("question_options"), (str, dict)):
+            return True
+        if any(isinstance(data.get(key), str) for key in ("min_value", "max_value")):
+            return True
+        return bool(question.parameters)
+
+    def _overlay(self, replacements: Dict[int, "QuestionBase"]) -> "Survey":
+        """Return a shallow copy of the survey with some questions swapped out.
+
+        The replacements must keep their question names, so rules, memory plan,
+        pseudo-indices and instructions are shared with this survey.
+        """
+        overlay = copy.copy(self)
+        questions = list(self._questions)
+        for index, question in replacements.items():
+            questions[index] = question
+        overlay.__dict__["_questions"] = questions
+        overlay.__dict__.pop("_cached_qname_to_q", None)
+        # Swapped-in questions may hash differently; recheck them on next hash()
+        overlay.__dict__.pop("_question_hash_generation", None)
+        overlay._exporter = SurveyExport(overlay)
+        overlay._navigator = SurveyNavigator(overlay)
+        overlay._editor = EditSurvey(overlay)
+        return overlay
 
     def _process_raw_questions(self, questions: Optional[List["QuestionType"]]) -> list:
         """Process the raw questions passed to the survey."""
@@ -2150,6 +2235,7 @@ class Survey(Base):
         self._validate_group_dependencies(start_index, end_index, group_name)
 
         self.question_groups[group_name] = (start_index, end_index)
+        self._invalidate_hash()
         return self
 
     def _validate_group_dependencies(
@@ -2,6 +2,7 @@
 from .template_loader import TemplateLoader
 from .restricted_python import create_restricted_function
 from .ast_utilities import extract_variable_names
+from .compiled_expression import CompiledExpression
 from .local_results_cache import object_disk_cache
 
 # Functions from utilities.py
@@ -34,6 +35,7 @@ __all__ = [
     "create_restricted_function",
     "remove_edsl_version",
     "extract_variable_names",
+    "CompiledExpression",
     "clean_json",
     "dict_hash",
     "hash_value",
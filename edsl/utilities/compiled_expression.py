@@ -0,0 +1,386 @@
+"""Expressions that are parsed once and evaluated against many rows.
+
+``filter`` and ``mutate`` on Results, ScenarioList and Dataset evaluate one
+user expression per row with simpleeval's ``EvalWithCompoundTypes``.
+``CompiledExpression`` parses the expression once and reuses a single
+evaluator for every row. Where the expression only uses names, constants,
+operators, comparisons, boolean logic, conditionals, subscripts and calls to
+registered functions, it can also be evaluated a column at a time over the
+columns it references.
+"""
+
+import ast
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+_MISSING = object()
+
+# Node types an expression can contain and still be folded to a constant
+_LITERAL_NODES = (
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Dict,
+    ast.UnaryOp,
+    ast.BinOp,
+    ast.operator,
+    ast.unaryop,
+    ast.expr_context,
+)
+
+_IMMUTABLE = (str, bytes, int, float, complex, bool, type(None))
+
+
+class _NotLowerable(Exception):
+    """The expression has no column-at-a-time form."""
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE)
+
+
+class CompiledExpression:
+    """A simpleeval expression parsed once and evaluated against many rows.
+
+    Evaluation goes through the same ``EvalWithCompoundTypes`` evaluator (and
+    therefore the same operators, functions, safety checks and error
+    messages) as evaluating the expression string directly. The instance
+    holds one evaluator, so it must not be shared between threads.
+
+    Args:
+        expression: The expression to evaluate.
+        functions: Functions available to the expression, as for
+                   ``EvalWithCompoundTypes``. ``None`` means simpleeval's
+                   defaults.
+
+    Examples:
+        >>> expr = CompiledExpression("age > 30 and mood == 'OK'")
+        >>> [expr.evaluate(row) for row in [{'age': 40, 'mood': 'OK'}, {'age': 20, 'mood': 'OK'}]]
+        [True, False]
+
+        >>> columns = {'age': [40, 20, 35], 'mood': ['OK', 'OK', 'Bad']}
+        >>> expr.evaluate_columns(lambda name, attr: columns.get(name) if attr is None else None, 3)
+        [True, False, False]
+    """
+
+    def __init__(self, expression: str, functions: Optional[dict] = None):
+        from simpleeval import EvalWithCompoundTypes
+
+        self.expression = expression
+        self._evaluator = EvalWithCompoundTypes(names={}, functions=functions)
+        self._parsed = None
+
+    @property
+    def functions(self) -> dict:
+        return self._evaluator.functions
+
+    @property
+    def parsed(self) -> ast.AST:
+        """The parsed expression (parsed on first use)."""
+        if self._parsed is None:
+            self._parsed = self._evaluator.parse(self.expression)
+        return self._parsed
+
+    def evaluate(self, names: Mapping[str, Any]) -> Any:
+        """Evaluate the expression for one row of names."""
+        self._evaluator.names = names
+        return self._evaluator.eval(self.expression, previously_parsed=self.parsed)
+
+    def evaluate_columns(
+        self,
+        resolve: Callable[[str, Optional[str]], Optional[Sequence]],
+        n_rows: int,
+    ) -> Optional[list]:
+        """Evaluate the expression a column at a time.
+
+        ``resolve(name, None)`` must return the column of values the name
+        ``name`` takes in each row, and ``resolve(name, attr)`` the column of
+        ``name.attr`` where ``name`` is a dict-valued name. Either returns
+        ``None`` if the name is not defined in every row.
+
+        Sub-expressions are only evaluated for the rows row-at-a-time
+        evaluation would evaluate them for (``and``, ``or``, chained
+        comparisons and conditionals short-circuit per row).
+
+        Returns:
+            One value per row, or ``None`` if the expression has no
+            column-at-a-time form or raised while being evaluated. Callers
+            then evaluate row by row with ``evaluate``, which raises the same
+            error the row-at-a-time code always raised.
+        """
+        if n_rows == 0:
+            return []
+        try:
+            lowering = _Lowering(self, resolve, n_rows)
+            values = lowering.values(self.parsed)(None)
+        except Exception:
+            return None
+        if any(values is column for column in lowering.columns.values()):
+            values = list(values)
+        return values
+
+
+class _Lowering:
+    """Turns a parsed expression into functions over row positions.
+
+    Each lowered node is a function taking ``rows`` (``None`` for all rows,
+    otherwise a list of row positions) and returning the node's value for
+    each of those rows.
+    """
+
+    def __init__(self, compiled: CompiledExpression, resolve, n_rows: int):
+        from simpleeval import DISALLOW_FUNCTIONS, DISALLOW_METHODS, DISALLOW_PREFIXES
+
+        self.compiled = compiled
+        self.evaluator = compiled._evaluator
+        self.resolve = resolve
+        self.n_rows = n_rows
+        self.columns: dict[tuple, Sequence] = {}
+        self.disallowed_functions = DISALLOW_FUNCTIONS
+        self.disallowed_methods = DISALLOW_METHODS
+        self.disallowed_prefixes = tuple(DISALLOW_PREFIXES)
+
+    def size(self, rows) -> int:
+        return self.n_rows if rows is None else len(rows)
+
+    @staticmethod
+    def subset(rows, positions: list) -> list:
+        return positions if rows is None else [rows[p] for p in positions]
+
+    def column(self, name: str, attr: Optional[str] = None):
+        key = (name, attr)
+        if key not in self.columns:
+            column = self.resolve(name, attr)
+            if column is None:
+                raise _NotLowerable(name if attr is None else f"{name}.{attr}")
+            self.columns[key] = column
+        column = self.columns[key]
+        return lambda rows: column if rows is None else [column[i] for i in rows]
+
+    def operator(self, op: ast.AST) -> Callable:
+        try:
+            return self.evaluator.operators[type(op)]
+        except KeyError:
+            raise _NotLowerable(type(op).__name__)
+
+    def literal(self, node: ast.AST) -> Any:
+        """Fold a constant sub-expression, or return ``_MISSING``."""
+        if not all(isinstance(child, _LITERAL_NODES) for child in ast.walk(node)):
+            return _MISSING
+        return self.evaluator.eval(self.compiled.expression, previously_parsed=node)
+
+    def operand(self, node: ast.AST) -> tuple[Any, Callable]:
+        """Lower an operand that is only read, e.g. a comparison's right side.
+
+        Returns ``(constant, function)``; ``constant`` is ``_MISSING`` unless
+        the operand is a constant, which is then shared between rows.
+        """
+        constant = self.literal(node)
+        if constant is _MISSING:
+            return _MISSING, self.values(node)
+        return constant, lambda rows: [constant] * self.size(rows)
+
+    def values(self, node: ast.AST) -> Callable:
+        constant = self.literal(node)
+        if constant is not _MISSING:
+            # A list or dict literal must be a fresh object in every row
+            if not _is_immutable(constant):
+                raise _NotLowerable(type(node).__name__)
+            return lambda rows: [constant] * self.size(rows)
+        handler = getattr(self, f"lower_{type(node).__name__}", None)
+        if handler is None:
+            raise _NotLowerable(type(node).__name__)
+        return handler(node)
+
+    def lower_Expr(self, node: ast.Expr) -> Callable:
+        return self.values(node.value)
+
+    def lower_Name(self, node: ast.Name) -> Callable:
+        return self.column(node.id)
+
+    def lower_Attribute(self, node: ast.Attribute) -> Callable:
+        attr = node.attr
+        if (
+            attr.startswith(self.disallowed_prefixes)
+            or attr in self.disallowed_methods
+            or getattr(self.evaluator, "allowed_attrs", None) is not None
+            # simpleeval tries getattr before indexing, so dict methods win
+            or hasattr(dict, attr)
+        ):
+            raise _NotLowerable(attr)
+        if isinstance(node.value, ast.Name):
+            try:
+                return self.column(node.value.id, attr)
+            except _NotLowerable:
+                pass
+        inner = self.values(node.value)
+
+        def attribute(rows):
+            out = []
+            for value in inner(rows):
+                if type(value) is not dict:
+                    raise _NotLowerable(attr)
+                out.append(value[attr])
+            return out
+
+        return attribute
+
+    def lower_Subscript(self, node: ast.Subscript) -> Callable:
+        if isinstance(node.slice, ast.Slice):
+            raise _NotLowerable("Slice")
+        container = self.values(node.value)
+        key, keys = self.operand(node.slice)
+        if key is not _MISSING:
+            return lambda rows: [value[key] for value in container(rows)]
+        return lambda rows: [
+            value[k] for value, k in zip(container(rows), keys(rows))
+        ]
+
+    def lower_UnaryOp(self, node: ast.UnaryOp) -> Callable:
+        operator = self.operator(node.op)
+        operand = self.values(node.operand)
+        return lambda rows: [operator(value) for value in operand(rows)]
+
+    def lower_BinOp(self, node: ast.BinOp) -> Callable:
+        operator = self.operator(node.op)
+        left_constant, left = self.operand(node.left)
+        right_constant, right = self.operand(node.right)
+        if right_constant is not _MISSING:
+            return lambda rows: [operator(a, right_constant) for a in left(rows)]
+        if left_constant is not _MISSING:
+            return lambda rows: [operator(left_constant, b) for b in right(rows)]
+        return lambda rows: list(map(operator, left(rows), right(rows)))
+
+    def lower_BoolOp(self, node: ast.BoolOp) -> Callable:
+        is_and = isinstance(node.op, ast.And)
+        first, *rest = [self.values(value) for value in node.values]
+
+        def boolop(rows):
+            out = list(first(rows))
+            # Rows whose value does not decide the result yet
+            positions = [p for p, v in enumerate(out) if (bool(v) is is_and)]
+            for evaluate in rest:
+                if not positions:
+                    break
+                undecided = []
+                for p, v in zip(positions, evaluate(self.subset(rows, positions))):
+                    out[p] = v
+                    if bool(v) is is_and:
+                        undecided.append(p)
+                positions = undecided
+            return out
+
+        return boolop
+
+    def lower_Compare(self, node: ast.Compare) -> Callable:
+        operators = [self.operator(op) for op in node.ops]
+        operands = [self.operand(n) for n in (node.left, *node.comparators)]
+        if len(operators) == 1:
+            return self._compare_pair(node.ops[0], operators[0], *operands)
+
+        def compare(rows):
+            out = [True] * self.size(rows)
+            positions = list(range(len(out)))
+            lefts = operands[0][1](rows)
+            for operator, (_, right) in zip(operators, operands[1:]):
+                if not positions:
+                    break
+                rights = right(self.subset(rows, positions))
+                undecided, next_lefts = [], []
+                for p, a, b in zip(positions, lefts, rights):
+                    result = out[p] = operator(a, b)
+                    if result:
+                        undecided.append(p)
+                        next_lefts.append(b)
+                positions, lefts = undecided, next_lefts
+            return out
+
+        return compare
+
+    def _compare_pair(self, op, operator, left_operand, right_operand) -> Callable:
+        left_constant, left = left_operand
+        right_constant, right = right_operand
+        if right_constant is _MISSING:
+            if left_constant is not _MISSING:
+                return lambda rows: [operator(left_constant, b) for b in right(rows)]
+            return lambda rows: list(map(operator, left(rows), right(rows)))
+
+        if isinstance(op, (ast.In, ast.NotIn)) and isinstance(
+            right_constant, (list, tuple, set, frozenset)
+        ):
+            try:
+                members = frozenset(right_constant)
+            except TypeError:
+                members = None
+            if members is not None:
+                negate = isinstance(op, ast.NotIn)
+
+                def membership(rows):
+                    out = []
+                    for value in left(rows):
+                        try:
+                            out.append((value in members) is not negate)
+                        except TypeError:  # unhashable value
+                            out.append(operator(value, right_constant))
+                    return out
+
+                return membership
+
+        return lambda rows: [operator(a, right_constant) for a in left(rows)]
+
+    def lower_IfExp(self, node: ast.IfExp) -> Callable:
+        test = self.values(node.test)
+        body = self.values(node.body)
+        orelse = self.values(node.orelse)
+
+        def ifexp(rows):
+            tests = test(rows)
+            out = [None] * len(tests)
+            true_positions, false_positions = [], []
+            for p, t in enumerate(tests):
+                (true_positions if t else false_positions).append(p)
+            for positions, branch in ((true_positions, body), (false_positions, orelse)):
+                if positions:
+                    for p, v in zip(positions, branch(self.subset(rows, positions))):
+                        out[p] = v
+            return out
+
+        return ifexp
+
+    def lower_Call(self, node: ast.Call) -> Callable:
+        if not isinstance(node.func, ast.Name):
+            raise _NotLowerable("method call")
+        function = self.evaluator.functions.get(node.func.id, _MISSING)
+        if function is _MISSING or function in self.disallowed_functions:
+            raise _NotLowerable(node.func.id)
+        if any(isinstance(arg, ast.Starred) for arg in node.args) or any(
+            keyword.arg is None for keyword in node.keywords
+        ):
+            raise _NotLowerable("argument unpacking")
+        args = [self.values(arg) for arg in node.args]
+        keywords = [(keyword.arg, self.values(keyword.value)) for keyword in node.keywords]
+
+        def call(rows):
+            arg_columns = [arg(rows) for arg in args]
+            if not keywords:
+                if not arg_columns:
+                    return [function() for _ in range(self.size(rows))]
+                return [function(*values) for values in zip(*arg_columns)]
+            names = [name for name, _ in keywords]
+            keyword_rows = zip(*(value(rows) for _, value in keywords))
+            if not arg_columns:
+                return [function(**dict(zip(names, kw))) for kw in keyword_rows]
+            return [
+                function(*values, **dict(zip(names, kw)))
+                for values, kw in zip(zip(*arg_columns), keyword_rows)
+            ]
+
+        return call
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
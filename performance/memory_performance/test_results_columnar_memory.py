@@ -0,0 +1,56 @@
+import gc
+import time
+import tracemalloc
+
+from edsl.results import Result, Results
+
+
+NUM_ROWS = 5000
+
+
+def make_rows(n):
+    """Copies of the example Results rows, each with its own objects."""
+    example = Results.example()
+    rows = []
+    for i in range(n):
+        rows.append(Result.from_dict(example[i % len(example)].to_dict()))
+    return example.survey, rows
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    results = build()
+    results.select("how_feeling", "agent.status")
+    elapsed = time.time() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, elapsed, current / (1024 * 1024)
+
+
+def test_columnar_results_use_less_memory():
+    """
+    Row-backed Results keep every agent, scenario, model and question
+    attribute dict once per row, and each Result caches its own
+    sub-dictionaries on select. The columnar store keeps each distinct
+    payload once and each column once.
+    """
+    survey, rows = make_rows(NUM_ROWS)
+    row_results, row_time, row_mb = measure(
+        lambda: Results(survey=survey, data=[Result.from_dict(r.to_dict()) for r in rows])
+    )
+    columnar, col_time, col_mb = measure(
+        lambda: Results(
+            survey=survey,
+            data=[Result.from_dict(r.to_dict()) for r in rows],
+            columnar=True,
+        )
+    )
+
+    print(f"\n{NUM_ROWS} rows")
+    print(f"  row-backed: {row_mb:8.1f} MB, build + select {row_time:.2f}s")
+    print(f"  columnar:   {col_mb:8.1f} MB, build + select {col_time:.2f}s")
+
+    assert columnar.select("how_feeling") == row_results.select("how_feeling")
+    assert col_mb < row_mb / 2
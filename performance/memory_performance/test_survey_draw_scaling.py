@@ -0,0 +1,84 @@
+import gc
+import time
+import tracemalloc
+
+from edsl import QuestionFreeText, QuestionMultipleChoice, Survey
+
+
+NUM_QUESTIONS = 40
+NUM_DRAWS = 2000
+
+
+def build_survey(randomize_every=None):
+    """Build a survey of multiple choice questions, optionally randomizing some."""
+    questions = [
+        QuestionMultipleChoice(
+            question_name=f"q{i}",
+            question_text=f"How do you feel about topic {i}?",
+            question_options=["Love it", "Like it", "Neutral", "Dislike it", "Hate it"],
+        )
+        for i in range(NUM_QUESTIONS - 1)
+    ]
+    questions.append(
+        QuestionFreeText(question_name="comments", question_text="Any comments?")
+    )
+    to_randomize = []
+    if randomize_every is not None:
+        to_randomize = [
+            q.question_name for i, q in enumerate(questions) if i % randomize_every == 0
+        ]
+    return Survey(questions, questions_to_randomize=to_randomize)
+
+
+def measure(draw, num_draws):
+    """Return (seconds, peak MB) for holding ``num_draws`` results of ``draw``."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    drawn = [draw() for _ in range(num_draws)]
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del drawn
+    return elapsed, peak / (1024 * 1024)
+
+
+def full_copy(survey):
+    """The pre-overlay cost of a draw: a full serialize/deserialize round trip."""
+    return Survey.from_dict(survey.to_dict(), _internal_copy=True)
+
+
+def test_unrandomized_survey_is_shared():
+    survey = build_survey()
+    drawn = [survey.draw() for _ in range(NUM_DRAWS)]
+    assert all(d is survey for d in drawn)
+
+
+def test_randomized_draw_is_cheaper_than_full_copy():
+    """
+    Drawing a survey with a few randomized questions should only copy those
+    questions, so it must be much cheaper in both time and memory than the
+    full serialize/deserialize copy each interview used to get.
+    """
+    survey = build_survey(randomize_every=10)
+    num_randomized = len(survey.questions_to_randomize)
+
+    copy_time, copy_mb = measure(lambda: full_copy(survey), NUM_DRAWS)
+    draw_time, draw_mb = measure(survey.draw, NUM_DRAWS)
+
+    drawn = survey.draw()
+    shared = sum(a is b for a, b in zip(drawn.questions, survey.questions))
+    assert shared == NUM_QUESTIONS - num_randomized
+
+    print(f"\nSurvey draw scaling ({NUM_QUESTIONS} questions, {NUM_DRAWS} draws):")
+    print(f"  Full copy: {copy_time:.3f}s, peak {copy_mb:.2f} MB")
+    print(f"  Overlay draw: {draw_time:.3f}s, peak {draw_mb:.2f} MB")
+
+    assert draw_time < copy_time * 0.5, (
+        f"Expected overlay draws to take under half the time of full copies, "
+        f"got {draw_time:.3f}s vs {copy_time:.3f}s"
+    )
+    assert draw_mb < copy_mb * 0.5, (
+        f"Expected overlay draws to use under half the memory of full copies, "
+        f"got {draw_mb:.2f} MB vs {copy_mb:.2f} MB"
+    )
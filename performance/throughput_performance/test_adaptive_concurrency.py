@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.runner import Runner
+
+
+PROVIDER_LIMIT = 25  # concurrent requests the simulated provider accepts
+LATENCY = 0.05
+JOB_SIZE = 1500
+
+
+def run_against_limited_provider(adaptive):
+    """Run a job whose test model rejects calls beyond PROVIDER_LIMIT in flight."""
+    m = Model(
+        "test",
+        canned_response="Yes",
+        latency=LATENCY,
+        rpm=10_000_000,
+        tpm=10_000_000_000,
+    )
+    provider = {"active": 0, "peak": 0, "calls": 0, "rejected": 0, "samples": []}
+    original = m.async_execute_model_call
+
+    async def limited_call(*args, **kwargs):
+        provider["calls"] += 1
+        provider["active"] += 1
+        provider["samples"].append(provider["active"])
+        try:
+            if provider["active"] > PROVIDER_LIMIT:
+                provider["rejected"] += 1
+                await asyncio.sleep(0.005)
+                raise Exception("429 Too Many Requests")
+            return await original(*args, **kwargs)
+        finally:
+            provider["active"] -= 1
+
+    m.async_execute_model_call = limited_call
+
+    numbers = ScenarioList.from_list("number", range(JOB_SIZE))
+    q = QuestionFreeText(
+        question_text="Is {{ number }} prime?", question_name="prime_question"
+    )
+    jobs = q.by(numbers).by(m)
+
+    runner = Runner(max_workers=400, adaptive_concurrency=adaptive)
+    start = time.time()
+    results = runner.submit(jobs, cache=Cache()).results()
+    elapsed = time.time() - start
+
+    accepted = [s for s in provider["samples"] if s <= PROVIDER_LIMIT]
+    return {
+        "results": results,
+        "elapsed": elapsed,
+        "calls": provider["calls"],
+        "rejected_fraction": provider["rejected"] / provider["calls"],
+        "mean_concurrency": sum(accepted) / len(accepted),
+    }
+
+
+def test_adaptive_concurrency_converges_near_provider_limit():
+    """
+    With a fixed pool of 400 workers almost every call beyond the provider's
+    limit is rejected, and tasks burn through their retries. The AIMD
+    controller settles into a sawtooth just below the limit: few 429s, and
+    accepted calls run at a good fraction of the allowed concurrency.
+    """
+    adaptive = run_against_limited_provider(adaptive=True)
+    fixed = run_against_limited_provider(adaptive=False)
+
+    ideal = JOB_SIZE * LATENCY / PROVIDER_LIMIT
+    print("\nAdaptive concurrency against a provider limit of", PROVIDER_LIMIT)
+    for name, stats in (("adaptive", adaptive), ("fixed 400", fixed)):
+        print(
+            f"  {name:10s} elapsed {stats['elapsed']:.2f}s (ideal {ideal:.2f}s), "
+            f"{stats['calls']} calls, {stats['rejected_fraction']:.1%} rejected, "
+            f"mean accepted concurrency {stats['mean_concurrency']:.1f}"
+        )
+
+    assert len(adaptive["results"]) == JOB_SIZE
+    assert adaptive["rejected_fraction"] < 0.1
+    assert adaptive["rejected_fraction"] < fixed["rejected_fraction"] / 4
+    assert adaptive["mean_concurrency"] >= 0.5 * PROVIDER_LIMIT
@@ -0,0 +1,67 @@
+import asyncio
+import time
+import tracemalloc
+
+from edsl.buckets import TokenBucket
+
+
+ACQUISITIONS = 200_000
+
+
+def acquire_many(log_size):
+    """Take ACQUISITIONS single tokens and report time and retained log memory."""
+    bucket = TokenBucket(
+        bucket_name="bench",
+        bucket_type="requests",
+        capacity=ACQUISITIONS * 2,
+        refill_rate=ACQUISITIONS,
+        log_size=log_size,
+    )
+
+    async def run():
+        for _ in range(ACQUISITIONS):
+            await bucket.get_tokens(1)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        bucket.metrics()
+    metrics_time = (time.perf_counter() - start) / 1000
+    return {
+        "elapsed": elapsed,
+        "retained": retained,
+        "log_entries": len(bucket.log),
+        "metrics_us": metrics_time * 1e6,
+        "released": bucket.metrics()["num_released"],
+    }
+
+
+def test_bounded_bucket_log():
+    """
+    Every refill and acquisition appends a (timestamp, tokens) entry to the
+    bucket's log, and buckets live as long as the Results that reference
+    them. With an unbounded log (log_size=None, the previous behaviour) a
+    long job retains two entries per call; the bounded log keeps the last
+    1000, so memory stays flat while the counters in metrics() still cover
+    every call.
+    """
+    unbounded = acquire_many(log_size=None)
+    bounded = acquire_many(log_size=1000)
+
+    print(f"\n{ACQUISITIONS} token acquisitions")
+    for name, stats in (("unbounded", unbounded), ("bounded", bounded)):
+        print(
+            f"  {name:10s} {stats['elapsed']:.2f}s, {stats['log_entries']} log entries, "
+            f"{stats['retained'] / 1e6:.2f} MB retained, "
+            f"metrics() {stats['metrics_us']:.1f}us"
+        )
+
+    assert bounded["released"] == unbounded["released"] == ACQUISITIONS
+    assert bounded["log_entries"] == 1000
+    assert bounded["retained"] < unbounded["retained"] / 20
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pytest
+
+from edsl.caching import CacheEntry
+from edsl.caching.async_sql_dict import AsyncSQLiteDict
+from edsl.caching.sql_dict import SQLiteDict
+
+
+CONCURRENCY_LEVELS = [1_000, 10_000, 100_000]
+TICK = 0.001
+
+
+def make_entries(n):
+    return [
+        CacheEntry(
+            model="test",
+            parameters={"temperature": 0.5},
+            system_prompt="system",
+            user_prompt=f"prompt {i}",
+            output=f'{{"answer": {i}}}',
+            iteration=1,
+        )
+        for i in range(n)
+    ]
+
+
+async def run_with_heartbeat(coros):
+    """Run ``coros`` concurrently; return (seconds, worst event-loop stall)."""
+    worst_stall = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal worst_stall
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(TICK)
+            worst_stall = max(worst_stall, time.perf_counter() - before - TICK)
+
+    beat = asyncio.ensure_future(heartbeat())
+    start = time.perf_counter()
+    await asyncio.gather(*coros)
+    elapsed = time.perf_counter() - start
+    done = True
+    await beat
+    return elapsed, worst_stall
+
+
+def blocking_fetches(d, keys):
+    """The pre-async path: synchronous lookups made from inside coroutines."""
+
+    async def fetch(key):
+        return d.get(key)
+
+    return [fetch(k) for k in keys]
+
+
+@pytest.mark.parametrize("n", CONCURRENCY_LEVELS)
+def test_concurrent_fetches(n, tmp_path):
+    """
+    Fetch ``n`` keys concurrently through the blocking SQLiteDict and through
+    AsyncSQLiteDict, reporting throughput and the longest time the event loop
+    was unable to run other coroutines.
+    """
+    items = make_entries(n)
+    path = str(tmp_path / "cache.db")
+
+    async_dict = AsyncSQLiteDict(path)
+    store_start = time.perf_counter()
+
+    async def store_all():
+        await asyncio.gather(*(async_dict.async_set(e.key, e) for e in items))
+
+    asyncio.run(store_all())
+    store_time = time.perf_counter() - store_start
+    stats = async_dict.write_stats()
+    assert stats["writes"] == n
+    keys = [e.key for e in items]
+
+    async_time, async_stall = asyncio.run(
+        run_with_heartbeat([async_dict.async_get(k) for k in keys])
+    )
+    async_dict.close()
+
+    sync_dict = SQLiteDict(path)
+    sync_time, sync_stall = asyncio.run(
+        run_with_heartbeat(blocking_fetches(sync_dict, keys))
+    )
+    sync_dict.close()
+
+    print(f"\n{n:,} concurrent fetches:")
+    print(
+        f"  Async stores: {store_time:.3f}s in {stats['commits']} commits "
+        f"({n / max(stats['commits'], 1):.0f} writes per commit)"
+    )
+    print(f"  SQLiteDict:      {sync_time:.3f}s, worst loop stall {sync_stall * 1000:.1f} ms")
+    print(f"  AsyncSQLiteDict: {async_time:.3f}s, worst loop stall {async_stall * 1000:.1f} ms")
+
+    assert stats["commits"] < n, "Expected concurrent stores to be group-committed"
+    assert async_stall < sync_stall, (
+        f"Expected async fetches to stall the event loop less than blocking "
+        f"fetches, got {async_stall * 1000:.1f} ms vs {sync_stall * 1000:.1f} ms"
+    )
@@ -0,0 +1,82 @@
+import json
+import tempfile
+import time
+
+from edsl.object_store.cas_repository import CASRepository
+from edsl.object_store.fs_backend import FileSystemBackend
+
+
+N_ROWS = 2_000
+LATENCY = 0.001
+
+
+class RemoteLikeBackend:
+    """A filesystem store where every call costs one simulated round trip."""
+
+    def __init__(self, root):
+        self.root = root
+        self.fs = FileSystemBackend(root)
+        self.round_trips = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        time.sleep(LATENCY)
+
+    def read(self, key):
+        self._round_trip()
+        return self.fs.read(key)
+
+    def write(self, key, content):
+        self._round_trip()
+        self.fs.write(key, content)
+
+    def exists(self, key):
+        self._round_trip()
+        return self.fs.exists(key)
+
+
+class BatchingBackend(RemoteLikeBackend):
+    """The same store with one round trip per batch call."""
+
+    def missing_keys(self, keys):
+        self._round_trip()
+        return {key for key in keys if not self.fs.exists(key)}
+
+    def write_many(self, items):
+        self._round_trip()
+        self.fs.write_many(items)
+
+
+def make_rows(n, offset=0):
+    return [json.dumps({"answer": {"q": i + offset}}) for i in range(n)]
+
+
+def timed_saves(backend):
+    repo = CASRepository(backend.root, backend=backend)
+    start = time.perf_counter()
+    repo.save(make_rows(N_ROWS), message="first")
+    # A second save that shares most rows with the first
+    repo.save(make_rows(N_ROWS, offset=N_ROWS // 10), message="second")
+    elapsed = time.perf_counter() - start
+    return elapsed, backend.round_trips, repo.load()
+
+
+def test_batched_blob_checks_and_writes():
+    """
+    Saving through a backend with batch existence checks and writes should
+    take a handful of round trips instead of two per row, and store the
+    same content.
+    """
+    per_key_time, per_key_trips, per_key_content = timed_saves(
+        RemoteLikeBackend(tempfile.mkdtemp())
+    )
+    batched_time, batched_trips, batched_content = timed_saves(
+        BatchingBackend(tempfile.mkdtemp())
+    )
+
+    print(f"\nTwo saves of {N_ROWS} rows, {LATENCY * 1000:.0f}ms per round trip")
+    print(f"  per-key calls  {per_key_time:6.2f}s  {per_key_trips:5d} round trips")
+    print(f"  batched calls  {batched_time:6.2f}s  {batched_trips:5d} round trips")
+    assert batched_content == per_key_content
+    assert batched_trips < 30
+    assert batched_time < per_key_time
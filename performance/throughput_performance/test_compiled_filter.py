@@ -0,0 +1,63 @@
+import time
+
+from simpleeval import EvalWithCompoundTypes
+
+from edsl.dataset import Dataset
+from edsl.utilities import CompiledExpression
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+FILTER = "age > 30 and how_feeling == 'OK'"
+MUTATE = "age * 2 + 1"
+FEELINGS = ["OK", "Great", "Terrible"]
+
+
+def make_rows(n):
+    return {"age": [i % 60 for i in range(n)], "how_feeling": [FEELINGS[i % 3] for i in range(n)]}
+
+
+def per_row(expression, columns, n):
+    """The previous approach: one evaluator and one parse per row."""
+    names = list(columns)
+    return [
+        EvalWithCompoundTypes(names={k: columns[k][i] for k in names}).eval(expression)
+        for i in range(n)
+    ]
+
+
+def compiled(expression, columns, n):
+    expr = CompiledExpression(expression)
+    return expr.evaluate_columns(lambda name, attr: columns.get(name), n)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return time.perf_counter() - start, value
+
+
+def test_compiled_expressions():
+    """
+    Parsing the expression once and evaluating it column-at-a-time should
+    beat a fresh per-row evaluator by a wide margin, with identical output.
+    """
+    print(f"\n{'rows':>10s} {'expression':>10s} {'per-row':>9s} {'compiled':>9s} {'speedup':>8s}")
+    for n in SIZES:
+        columns = make_rows(n)
+        for label, expression in (("filter", FILTER), ("mutate", MUTATE)):
+            new_time, new = timed(compiled, expression, columns, n)
+            old_time, old = timed(per_row, expression, columns, n)
+            assert new == old
+            print(f"{n:10d} {label:>10s} {old_time:8.2f}s {new_time:8.2f}s {old_time / new_time:7.1f}x")
+            assert new_time < old_time
+
+
+def test_dataset_filter_end_to_end():
+    """Dataset.filter at the largest size, including building the result."""
+    n = SIZES[-1]
+    d = Dataset([{"age": make_rows(n)["age"]}, {"how_feeling": make_rows(n)["how_feeling"]}])
+    elapsed, filtered = timed(d.filter, FILTER)
+    print(f"\nDataset.filter over {n} rows: {elapsed:.2f}s, {len(filtered)} rows kept")
+    assert len(filtered) == sum(
+        1 for i in range(n) if i % 60 > 30 and i % 3 == 0
+    )
@@ -0,0 +1,60 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from edsl.coop.http_transport import CoopTransport
+
+
+N_REQUESTS = 300
+LATENCY = 0.005
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def test_pooled_and_parallel_coop_requests():
+    """
+    A pooled session saves the connection setup on every request, and map()
+    overlaps the server latency of independent requests.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    transport = CoopTransport(pool_size=16)
+    calls = [("GET", f"{url}/{i}", {}) for i in range(N_REQUESTS)]
+    try:
+        unpooled = timed(lambda: [requests.get(u) for _, u, _ in calls])
+        pooled = timed(lambda: [transport.get(u) for _, u, _ in calls])
+        parallel = timed(lambda: transport.map(calls))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"\n{N_REQUESTS} GET requests with {LATENCY * 1000:.0f}ms server latency")
+    print(f"  requests.get per call  {unpooled:6.2f}s")
+    print(f"  pooled session         {pooled:6.2f}s")
+    print(f"  pooled + map (16)      {parallel:6.2f}s")
+    assert parallel < pooled
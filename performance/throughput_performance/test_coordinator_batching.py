@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.runner import Runner
+from edsl.runner.coordinator import ExecutionCoordinator, WorkCompletion
+from edsl.runner.queues import QueueRegistry
+from edsl.runner.render import RenderedPrompt
+
+
+NUM_TASKS = 20_000
+NUM_WORKERS = 50
+BATCH_SIZES = (1, 8, 32)
+
+
+def filled_coordinator(n):
+    registry = QueueRegistry(auto_register=False)
+    registry.register_queue(
+        "test", "test", "key", rpm_limit=10**9, tpm_limit=10**12
+    )
+    coordinator = ExecutionCoordinator(registry)
+    for i in range(n):
+        coordinator.enqueue(
+            RenderedPrompt(
+                task_id=f"task-{i}",
+                job_id="job",
+                interview_id=f"interview-{i}",
+                system_prompt="",
+                user_prompt="prompt",
+                estimated_tokens=100,
+                cache_key=f"key-{i}",
+                model_name="test",
+                service_name="test",
+            )
+        )
+    return coordinator
+
+
+def coordinator_throughput(batch_size):
+    """Tasks/s through assign + complete when the model call takes no time."""
+    coordinator = filled_coordinator(NUM_TASKS)
+    done = 0
+
+    async def worker():
+        nonlocal done
+        while done < NUM_TASKS:
+            assignments = await coordinator.async_request_work_batch(
+                batch_size, timeout=0.01
+            )
+            if not assignments:
+                continue
+            await asyncio.sleep(0)  # a zero-latency model call
+            coordinator.complete_work_batch(
+                [
+                    WorkCompletion(
+                        task_id=a.task.task_id,
+                        queue_id=a.queue_id,
+                        success=True,
+                        actual_tokens=100,
+                    )
+                    for a in assignments
+                ]
+            )
+            done += len(assignments)
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(NUM_WORKERS)))
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return NUM_TASKS / (time.perf_counter() - start)
+
+
+def runner_throughput(batch_size, job_size=2000):
+    """Tasks/s for a whole job against the zero-latency test model."""
+    m = Model("test", canned_response="Yes", latency=0, rpm=10**9, tpm=10**12)
+    numbers = ScenarioList.from_list("number", range(job_size))
+    q = QuestionFreeText(
+        question_text="Is {{ number }} prime?", question_name="prime_question"
+    )
+    runner = Runner(worker_batch_size=batch_size)
+    start = time.perf_counter()
+    results = runner.submit(q.by(numbers).by(m), cache=Cache()).results()
+    elapsed = time.perf_counter() - start
+    assert len(results) == job_size
+    return job_size / elapsed
+
+
+def test_batched_assignment_throughput():
+    """
+    With zero-latency calls the coordinator's per-assignment work (heap pop,
+    token acquisition, dequeue, in-flight tracking, reconciliation) is the
+    bottleneck. Taking several tasks per request amortizes it.
+    """
+    rates = {size: coordinator_throughput(size) for size in BATCH_SIZES}
+    print(f"\nCoordinator throughput, {NUM_TASKS} tasks, {NUM_WORKERS} workers")
+    for size, rate in rates.items():
+        print(f"  batch {size:3d}: {rate:10,.0f} tasks/s")
+
+    end_to_end = {size: runner_throughput(size) for size in (1, 16)}
+    print("Runner throughput with the zero-latency test model")
+    for size, rate in end_to_end.items():
+        print(f"  worker_batch_size {size:3d}: {rate:10,.0f} tasks/s")
+
+    assert rates[8] > 2 * rates[1]
@@ -0,0 +1,110 @@
+import time
+
+from edsl import Agent, AgentList
+from edsl.dataset import Dataset
+
+
+N_AGENTS = 2_000
+N_ROWS = 200_000
+
+
+def nested_loop_inner_join(left, right):
+    """The previous AgentList join: compare every pair of agents."""
+    joined = []
+    for agent in left.data:
+        for other_agent in right.data:
+            if agent.name == other_agent.name:
+                joined.append(agent + other_agent)
+    return AgentList(joined)
+
+
+def row_at_a_time_merge(d1, d2, by_x, by_y):
+    """The previous Dataset.merge: build row dicts and a dict of row dicts."""
+    left_keys = [list(d.keys())[0] for d in d1.data]
+    n_left = len(d1.data[0][left_keys[0]])
+    left_rows = [
+        {k: d1.data[j][k][i] for j, k in enumerate(left_keys)} for i in range(n_left)
+    ]
+    right_keys = [list(d.keys())[0] for d in d2.data]
+    n_right = len(d2.data[0][right_keys[0]])
+    right_lookup = {}
+    for i in range(n_right):
+        key_val = d2.data[right_keys.index(by_y)][by_y][i]
+        right_lookup[key_val] = {
+            k: d2.data[j][k][i] for j, k in enumerate(right_keys) if k != by_y
+        }
+    result_keys = left_keys + [k for k in right_keys if k != by_y]
+    result = {k: [] for k in result_keys}
+    for row in left_rows:
+        match = right_lookup.get(row[by_x], {})
+        for k in left_keys:
+            result[k].append(row[k])
+        for k in right_keys:
+            if k != by_y:
+                result[k].append(match.get(k))
+    return Dataset([{k: result[k]} for k in result_keys])
+
+
+def test_agent_list_hash_join():
+    """
+    Joining two AgentLists by name should index one side instead of
+    comparing every pair, and give the same agents.
+    """
+    left = AgentList(
+        [Agent(name=f"agent_{i}", traits={"age": i}) for i in range(N_AGENTS)]
+    )
+    right = AgentList(
+        [
+            Agent(name=f"agent_{i}", traits={"score": i * 2})
+            for i in reversed(range(N_AGENTS))
+        ]
+    )
+
+    start = time.perf_counter()
+    old = nested_loop_inner_join(left, right)
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = left.join(right)
+    new_time = time.perf_counter() - start
+
+    print(f"\nInner join of two {N_AGENTS}-agent lists")
+    print(f"  nested loop  {old_time:6.2f}s")
+    print(f"  hash join    {new_time:6.2f}s ({old_time / new_time:.1f}x)")
+    assert [a.traits for a in new] == [a.traits for a in old]
+    assert new_time < old_time
+
+
+def test_dataset_hash_merge():
+    """
+    Merging column-at-a-time through a key index should beat building
+    row dicts, and give the same columns.
+    """
+    d1 = Dataset(
+        [
+            {"id": list(range(N_ROWS))},
+            {"name": [f"n{i}" for i in range(N_ROWS)]},
+            {"group": [i % 7 for i in range(N_ROWS)]},
+        ]
+    )
+    d2 = Dataset(
+        [
+            {"pid": list(range(0, 2 * N_ROWS, 2))},
+            {"age": [i % 90 for i in range(N_ROWS)]},
+            {"city": [f"c{i % 50}" for i in range(N_ROWS)]},
+        ]
+    )
+
+    start = time.perf_counter()
+    old = row_at_a_time_merge(d1, d2, "id", "pid")
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = d1.merge(d2, "id", "pid")
+    new_time = time.perf_counter() - start
+
+    print(f"\nLeft merge of two {N_ROWS}-row datasets")
+    print(f"  row at a time    {old_time:6.2f}s")
+    print(f"  column hash join {new_time:6.2f}s ({old_time / new_time:.1f}x)")
+    assert new.data == old.data
+    assert new_time < old_time
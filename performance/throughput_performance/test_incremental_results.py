@@ -0,0 +1,39 @@
+import time
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.runner import Runner
+
+
+JOB_SIZE = 3000
+
+
+def run(incremental):
+    """Return (job wall time, time spent in results() after the job finished)."""
+    m = Model("test", canned_response="Yes", latency=0.01, rpm=10**9, tpm=10**12)
+    numbers = ScenarioList.from_list("number", range(JOB_SIZE))
+    q = QuestionFreeText(
+        question_text="Is {{ number }} prime?", question_name="prime_question"
+    )
+    runner = Runner()
+    handle = runner.submit(
+        q.by(numbers).by(m), cache=Cache(), incremental_results=incremental
+    )
+    start = time.perf_counter()
+    runner.execute_job(handle.job_id)
+    executed = time.perf_counter()
+    results = handle.results()
+    done = time.perf_counter()
+    assert len(results) == JOB_SIZE
+    return executed - start, done - executed
+
+
+def test_incremental_results_assembly():
+    """
+    Building each Result as its interview finishes moves the work into the
+    job's run time, where it overlaps with model calls, so results() after
+    completion only reads the spilled log back.
+    """
+    timings = {name: run(flag) for name, flag in (("end of job", False), ("incremental", True))}
+    print(f"\nResults assembly for {JOB_SIZE} interviews")
+    for name, (execution, assembly) in timings.items():
+        print(f"  {name:12s} execution {execution:6.2f}s  results() {assembly:6.2f}s")
@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.jobs.async_interview_runner import AsyncInterviewRunner
+
+
+WINDOW = 10
+FAST_LATENCY = 0.02
+SLOW_LATENCY = 1.0
+SAMPLE_INTERVAL = 0.01
+
+
+def skewed_latency(user_prompt):
+    """Every tenth interview is slow, the rest are fast."""
+    number = int(user_prompt.split("#")[1].split()[0])
+    return SLOW_LATENCY if number % WINDOW == 0 else FAST_LATENCY
+
+
+def run_skewed_job(job_size, monkeypatch):
+    """Run a job against the skewed test model and sample in-flight interviews."""
+    monkeypatch.setattr(AsyncInterviewRunner, "MAX_CONCURRENT", WINDOW)
+
+    active = 0
+    admitted = 0
+    original = AsyncInterviewRunner._run_single_interview
+
+    async def counting_run_single_interview(self, interview, idx):
+        nonlocal active, admitted
+        active += 1
+        admitted += 1
+        try:
+            return await original(self, interview, idx)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(
+        AsyncInterviewRunner, "_run_single_interview", counting_run_single_interview
+    )
+
+    numbers = ScenarioList.from_list("number", range(1, job_size + 1))
+    # Lift the test model's rate limit so the scheduler is the only constraint
+    m = Model(
+        "test",
+        canned_response="Yes",
+        latency=skewed_latency,
+        rpm=10_000_000,
+        tpm=10_000_000_000,
+    )
+    q = QuestionFreeText(
+        question_text="Is #{{ number }} prime?", question_name="prime_question"
+    )
+    jobs = q.by(numbers).by(m)
+
+    samples = []
+
+    async def sample_concurrency():
+        while True:
+            # Steady state lasts until the last interview has been admitted
+            if WINDOW <= admitted < job_size:
+                samples.append(active)
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+    async def run_with_sampler():
+        sampler = asyncio.create_task(sample_concurrency())
+        try:
+            # run_async drives interviews through AsyncInterviewRunner
+            return await jobs.run_async(
+                disable_remote_inference=True,
+                disable_remote_cache=True,
+                cache=Cache(),
+                stop_on_exception=True,
+            )
+        finally:
+            sampler.cancel()
+
+    start_time = time.time()
+    results = asyncio.run(run_with_sampler())
+    elapsed = time.time() - start_time
+
+    return {
+        "results": results,
+        "elapsed": elapsed,
+        "mean_concurrency": sum(samples) / len(samples),
+        "min_concurrency": min(samples),
+    }
+
+
+def test_sliding_window_keeps_concurrency_steady_under_latency_skew(monkeypatch):
+    """
+    A chunked scheduler waits for the slowest interview of every chunk, so with
+    one slow interview per chunk it needs roughly job_size / WINDOW * SLOW_LATENCY
+    seconds and its concurrency decays towards one at the end of every chunk.
+    A sliding window keeps WINDOW interviews in flight until the generator is
+    exhausted and finishes in a fraction of that time.
+    """
+    job_size = 100
+    stats = run_skewed_job(job_size, monkeypatch)
+
+    chunked_lower_bound = job_size / WINDOW * SLOW_LATENCY
+
+    print("\nSliding-window scheduling under latency skew:")
+    print(f"  Interviews: {job_size} (window {WINDOW})")
+    print(f"  Elapsed: {stats['elapsed']:.2f}s")
+    print(f"  Chunked scheduler lower bound: {chunked_lower_bound:.2f}s")
+    print(f"  Mean steady-state concurrency: {stats['mean_concurrency']:.2f}")
+    print(f"  Min steady-state concurrency: {stats['min_concurrency']}")
+
+    assert len(stats["results"]) == job_size
+    assert stats["mean_concurrency"] >= 0.75 * WINDOW
+    assert stats["elapsed"] < chunked_lower_bound / 2
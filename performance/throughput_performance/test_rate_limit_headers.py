@@ -0,0 +1,102 @@
+import time
+from types import SimpleNamespace
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.inference_services.rate_limit_headers import create_with_rate_limits
+from edsl.runner import Runner
+
+
+PROVIDER_RPM = 3000  # the simulated provider's limit: 50 requests per second
+PROVIDER_BURST = 25  # requests it accepts at once before rejecting
+JOB_SIZE = 600
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(headers=headers)
+
+
+def run_against_provider(send_headers):
+    """Run a job against a test model that enforces a provider-side token bucket."""
+    m = Model("test", canned_response="Yes", rpm=10_000, tpm=10_000_000)
+    rate = PROVIDER_RPM / 60.0
+    provider = {"tokens": float(PROVIDER_BURST), "last": time.monotonic()}
+    counts = {"calls": 0, "rejected": 0}
+    original = m.async_execute_model_call
+
+    async def raw_create(**kwargs):
+        now = time.monotonic()
+        provider["tokens"] = min(
+            PROVIDER_BURST, provider["tokens"] + (now - provider["last"]) * rate
+        )
+        provider["last"] = now
+        counts["calls"] += 1
+        if provider["tokens"] < 1:
+            counts["rejected"] += 1
+            wait_ms = (1 - provider["tokens"]) / rate * 1000
+            raise RateLimitError(
+                {"retry-after-ms": f"{wait_ms:.0f}"} if send_headers else {}
+            )
+        provider["tokens"] -= 1
+        response = await original(**kwargs)
+        headers = {
+            "x-ratelimit-limit-requests": str(PROVIDER_RPM),
+            "x-ratelimit-remaining-requests": str(int(provider["tokens"])),
+        }
+        return SimpleNamespace(
+            headers=headers if send_headers else {}, parse=lambda: response
+        )
+
+    resource = SimpleNamespace(with_raw_response=SimpleNamespace(create=raw_create))
+
+    async def limited_call(**kwargs):
+        return await create_with_rate_limits(resource, **kwargs)
+
+    m.async_execute_model_call = limited_call
+
+    numbers = ScenarioList.from_list("number", range(JOB_SIZE))
+    q = QuestionFreeText(
+        question_text="Is {{ number }} prime?", question_name="prime_question"
+    )
+    jobs = q.by(numbers).by(m)
+
+    runner = Runner(max_workers=400, adaptive_concurrency=False)
+    start = time.time()
+    results = runner.submit(jobs, cache=Cache()).results()
+    elapsed = time.time() - start
+
+    answered = sum(1 for a in results.select("answer.prime_question").to_list() if a)
+    return {
+        "elapsed": elapsed,
+        "calls": counts["calls"],
+        "rejected": counts["rejected"],
+        "answered": answered,
+    }
+
+
+def test_rate_limit_headers_avoid_429s():
+    """
+    The local queue defaults to 10k requests per minute, so without feedback
+    the Runner fires far more requests than the provider's burst allows, and
+    rejected tasks burn through their retries. With rate-limit headers the
+    queue's bucket is capped at what the provider reports is left and held
+    for the retry-after of each 429. Only the first wave, sent before any
+    response has come back, overshoots the provider's burst.
+    """
+    with_headers = run_against_provider(send_headers=True)
+    without_headers = run_against_provider(send_headers=False)
+
+    ideal = (JOB_SIZE - PROVIDER_BURST) / (PROVIDER_RPM / 60.0)
+    print(
+        f"\nProvider limit {PROVIDER_RPM} rpm, burst {PROVIDER_BURST}, {JOB_SIZE} tasks"
+    )
+    for name, stats in (("headers", with_headers), ("no headers", without_headers)):
+        print(
+            f"  {name:10s} elapsed {stats['elapsed']:.2f}s (ideal {ideal:.2f}s), "
+            f"{stats['calls']} calls, {stats['rejected']} rejected, "
+            f"{stats['answered']}/{JOB_SIZE} answered"
+        )
+
+    assert with_headers["answered"] == JOB_SIZE
+    assert with_headers["rejected"] < without_headers["rejected"] / 4
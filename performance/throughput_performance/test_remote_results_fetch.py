@@ -0,0 +1,84 @@
+import time
+from unittest.mock import patch
+
+from edsl import Agent, Jobs, Model, Scenario
+from edsl.coop import Coop
+from edsl.jobs.remote_inference import JobsRemoteInferenceHandler, _InternedObjects
+
+
+PAGE_COUNT = 40
+PAGE_SIZE = 100
+PAGE_LATENCY = 0.05
+
+
+def make_page(page):
+    agents = [Agent(traits={"persona": f"p{i}", "age": i}).to_dict() for i in range(10)]
+    model = Model("test").to_dict()
+    return {
+        "interviews": [
+            {
+                "agent": agents[n % 10],
+                "scenario": Scenario({"topic": f"t{n % 25}"}).to_dict(),
+                "model": model,
+                "answers": [
+                    {"question_name": f"q{k}", "answer": n, "user_prompt": "Hi"}
+                    for k in range(3)
+                ],
+            }
+            for n in range(page * PAGE_SIZE, (page + 1) * PAGE_SIZE)
+        ]
+    }
+
+
+def test_parallel_paginated_fetch_with_interning():
+    """
+    Fetching pages in parallel hides the per-page latency, and interning
+    deserializes each distinct agent, scenario and model once instead of
+    once per interview.
+    """
+    pages = {page: make_page(page) for page in range(PAGE_COUNT)}
+
+    def fake_page(self, job_uuid, page=0, page_size=100):
+        time.sleep(PAGE_LATENCY)
+        return pages[page]
+
+    handler = JobsRemoteInferenceHandler(Jobs.example())
+    coop = Coop(api_key="k")
+
+    class NoInterning:
+        def get(self, kind, data, from_dict):
+            return from_dict(data)
+
+    def build(page_iter, interned):
+        return [
+            handler._result_from_interview(interview, None, interned)
+            for page in page_iter
+            for interview in page["interviews"]
+        ]
+
+    with patch.object(Coop, "remote_inference_results_page", fake_page):
+        start = time.perf_counter()
+        sequential = build(
+            (
+                coop.remote_inference_results_page("job", page=p)
+                for p in range(PAGE_COUNT)
+            ),
+            NoInterning(),
+        )
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = build(
+            coop.iter_remote_inference_results_pages("job", PAGE_COUNT),
+            _InternedObjects(),
+        )
+        parallel_time = time.perf_counter() - start
+
+    n = PAGE_COUNT * PAGE_SIZE
+    print(
+        f"\nFetching {n} interviews in {PAGE_COUNT} pages ({PAGE_LATENCY * 1000:.0f}ms each)"
+    )
+    print(f"  sequential, no interning   {sequential_time:6.2f}s")
+    print(f"  parallel, interned         {parallel_time:6.2f}s")
+    assert [r.answer for r in parallel] == [r.answer for r in sequential]
+    assert parallel_time < sequential_time
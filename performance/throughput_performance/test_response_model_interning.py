@@ -0,0 +1,51 @@
+import time
+
+from edsl.questions import QuestionCheckBox, QuestionMultipleChoice, QuestionNumerical
+from edsl.questions.question_base_prompts_mixin import response_model_cache
+
+
+N_INTERVIEWS = 1_000
+
+
+def rendered_questions(i):
+    """The copies of each question an interview renders for scenario *i*."""
+    mc = QuestionMultipleChoice.example()
+    mc.question_text = f"How are you feeling about item {i}?"
+    num = QuestionNumerical.example()
+    num.question_text = f"How old is person {i}?"
+    cb = QuestionCheckBox.example()
+    cb.question_text = f"Which days suit person {i}?"
+    return [
+        (mc, {"answer": "Great"}),
+        (num, {"answer": 45}),
+        (cb, {"answer": ["rare snails", "mouldy bread"]}),
+    ]
+
+
+def validate_all(clear_each_time):
+    answers = []
+    start = time.perf_counter()
+    for i in range(N_INTERVIEWS):
+        for question, raw in rendered_questions(i):
+            if clear_each_time:
+                response_model_cache.clear()
+            answers.append(question._validate_answer(raw)["answer"])
+    return time.perf_counter() - start, answers
+
+
+def test_response_models_are_reused_across_interviews():
+    """
+    Validating answers for rendered copies of the same questions should
+    reuse one response model per question instead of rebuilding it.
+    """
+    rebuilt_time, rebuilt = validate_all(clear_each_time=True)
+    interned_time, interned = validate_all(clear_each_time=False)
+
+    print(f"\nValidating {3 * N_INTERVIEWS} answers from {N_INTERVIEWS} interviews")
+    print(f"  model rebuilt per answer  {rebuilt_time:6.2f}s")
+    print(
+        f"  interned models           {interned_time:6.2f}s "
+        f"({rebuilt_time / interned_time:.1f}x)"
+    )
+    assert interned == rebuilt
+    assert interned_time < rebuilt_time
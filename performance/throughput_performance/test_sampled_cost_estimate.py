@@ -0,0 +1,64 @@
+import time
+
+from edsl import Agent, AgentList, Model, QuestionFreeText, QuestionMultipleChoice
+from edsl import Scenario, ScenarioList, Survey
+
+
+N_AGENTS = 10
+N_SCENARIOS = 500
+SAMPLE_SIZE = 300
+
+PRICE = {"one_usd_buys": 1e6, "service_stated_token_qty": 1e6}
+PRICE_LOOKUP = {
+    ("test", "test"): {
+        "input": {**PRICE, "service_stated_token_price": 1},
+        "output": {**PRICE, "service_stated_token_price": 4},
+    }
+}
+
+
+def make_job():
+    q1 = QuestionFreeText(
+        question_name="describe",
+        question_text="Describe {{ scenario.topic }} in a few sentences.",
+    )
+    q2 = QuestionMultipleChoice(
+        question_name="like",
+        question_text="Do you like {{ scenario.topic }}?",
+        question_options=["yes", "no"],
+    )
+    scenarios = ScenarioList(
+        [Scenario({"topic": "topic " * (i % 40 + 1)}) for i in range(N_SCENARIOS)]
+    )
+    agents = AgentList([Agent(traits={"age": 20 + i}) for i in range(N_AGENTS)])
+    return Survey([q1, q2]).by(scenarios).by(agents).by(Model("test"))
+
+
+def test_sampled_cost_estimate():
+    """
+    Estimating cost from a stratified sample of interviews should be much
+    faster than rendering every interview's prompts, and close to the
+    exact estimate.
+    """
+    start = time.perf_counter()
+    exact = make_job().estimate_job_cost_from_external_prices(PRICE_LOOKUP)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sampled = make_job().estimate_job_cost_from_external_prices(
+        PRICE_LOOKUP, sample_size=SAMPLE_SIZE
+    )
+    sampled_time = time.perf_counter() - start
+
+    exact_cost = exact["estimated_total_cost_usd"]
+    sampled_cost = sampled["estimated_total_cost_usd"]
+    error = abs(sampled_cost - exact_cost) / exact_cost
+    print(f"\nCost estimate for {N_AGENTS * N_SCENARIOS} interviews")
+    print(f"  every interview   {exact_time:6.2f}s  ${exact_cost:.4f}")
+    print(
+        f"  {SAMPLE_SIZE} sampled      {sampled_time:6.2f}s  ${sampled_cost:.4f} "
+        f"({exact_time / sampled_time:.1f}x, {error:.2%} off)"
+    )
+    assert sampled["total_interviews"] == N_AGENTS * N_SCENARIOS
+    assert error < 0.05
+    assert sampled_time < exact_time
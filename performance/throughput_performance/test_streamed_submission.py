@@ -0,0 +1,45 @@
+import time
+
+from edsl import Agent, AgentList, Model, QuestionFreeText, ScenarioList
+from edsl.runner.service import JobService
+from edsl.runner.storage import InMemoryStorage
+
+
+N_SCENARIOS = 200
+N_AGENTS = 100
+JOB_SIZE = N_SCENARIOS * N_AGENTS
+WINDOW = 500
+
+
+def submit_time(interview_window):
+    q = QuestionFreeText(question_name="q", question_text="Is {{ number }} prime?")
+    agents = AgentList([Agent(traits={"persona": i}) for i in range(N_AGENTS)])
+    job = (
+        q.by(ScenarioList.from_list("number", range(N_SCENARIOS)))
+        .by(agents)
+        .by(Model("test", canned_response="Yes"))
+    )
+    service = JobService(InMemoryStorage())
+    start = time.perf_counter()
+    job_id, _, _ = service.submit_job(job, interview_window=interview_window)
+    elapsed = time.perf_counter() - start
+    return elapsed, service.tasks.get_ready_count(job_id)
+
+
+def test_streamed_submission_time_does_not_grow_with_job_size():
+    """
+    Eager submission builds and stores every interview and task before the
+    first one can be dispatched; streamed submission builds one window, so
+    the time until the first task is ready is roughly independent of job size.
+    Scenarios and agents are still stored up front, so the job is a cross
+    product much larger than either list.
+    """
+    eager, eager_ready = submit_time(None)
+    streamed, streamed_ready = submit_time(WINDOW)
+    print(f"\nSubmitting a {JOB_SIZE}-interview job")
+    print(f"  eager:            {eager:.2f}s ({eager_ready} tasks ready)")
+    print(f"  window of {WINDOW}: {streamed:.2f}s ({streamed_ready} tasks ready)")
+
+    assert eager_ready == JOB_SIZE
+    assert streamed_ready == WINDOW
+    assert streamed < eager / 5
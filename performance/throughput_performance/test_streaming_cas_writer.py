@@ -0,0 +1,53 @@
+import json
+import tempfile
+import time
+
+from edsl.object_store.cas_repository import CASRepository
+from edsl.object_store.fs_backend import FileSystemBackend
+from edsl.object_store.streaming_writer import StreamingCASWriter
+
+
+N_ROWS = 5_000
+WINDOW = 500
+
+
+def row(i):
+    return json.dumps({"answer": {"how_feeling": "OK"}, "iteration": i})
+
+
+def test_append_cost_does_not_grow_with_rows_written():
+    """
+    Each append should cost about the same whether it is the 1st or the
+    5000th row: trees are chunked and current.jsonl is appended to, so
+    neither is rewritten in full on every commit. finalize() then ends
+    the object on a flat tree that readers not following chunk links load
+    in full.
+    """
+    root = tempfile.mkdtemp()
+    writer = StreamingCASWriter(FileSystemBackend(root))
+    writer.write_preamble([json.dumps({"__header__": True})])
+
+    timings = []
+    for i in range(N_ROWS):
+        start = time.perf_counter()
+        writer.append_result(row(i))
+        timings.append(time.perf_counter() - start)
+
+    early = sum(timings[:WINDOW])
+    late = sum(timings[-WINDOW:])
+    print(f"\n{WINDOW} appends after 0 rows     {early:6.3f}s")
+    print(f"{WINDOW} appends after {N_ROWS - WINDOW} rows  {late:6.3f}s")
+    print(f"total for {N_ROWS} appends      {sum(timings):6.3f}s")
+
+    start = time.perf_counter()
+    writer.finalize()
+    print(f"finalize                     {time.perf_counter() - start:6.3f}s")
+
+    lines = CASRepository(root).load().splitlines()
+    assert lines[1:] == [row(i) for i in range(N_ROWS)]
+    assert late < 3 * early
+
+    backend = FileSystemBackend(root)
+    tip = json.loads(backend.read(f"commits/{writer.tip}.json"))
+    tree = json.loads(backend.read(f"trees/{tip['tree']}.json"))
+    assert "base" not in tree and len(tree["blobs"]) == N_ROWS + 1
@@ -0,0 +1,86 @@
+import warnings
+
+import pytest
+
+from edsl import Agent, AgentList
+
+
+def names_and_traits(agent_list):
+    return [(a.name, a.traits) for a in agent_list]
+
+
+@pytest.fixture
+def left():
+    return AgentList(
+        [
+            Agent(name="a", traits={"x": 1}),
+            Agent(name="b", traits={"x": 2}),
+            Agent(name="c", traits={"x": 3}),
+        ]
+    )
+
+
+@pytest.fixture
+def right():
+    return AgentList(
+        [
+            Agent(name="c", traits={"y": 30}),
+            Agent(name="a", traits={"y": 10}),
+            Agent(name="d", traits={"y": 40}),
+        ]
+    )
+
+
+def test_inner_join_keeps_left_order_and_warns_about_dropped_agents(left, right):
+    with pytest.warns(UserWarning, match="1 agent\\(s\\) in the left list and 1"):
+        joined = left.join(right)
+    assert [a.traits for a in joined] == [{"x": 1, "y": 10}, {"x": 3, "y": 30}]
+
+
+def test_inner_join_of_matching_lists_does_not_warn(left):
+    other = AgentList([Agent(name=a.name, traits={"z": 0}) for a in left])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        joined = left.join(other)
+    assert len(joined) == 3
+
+
+def test_left_join(left, right):
+    joined = left.join(right, join_type="left")
+    assert [a.traits for a in joined] == [
+        {"x": 1, "y": 10},
+        {"x": 2},
+        {"x": 3, "y": 30},
+    ]
+
+
+def test_right_join(left, right):
+    joined = left.join(right, join_type="right")
+    assert [a.traits for a in joined] == [
+        {"x": 3, "y": 30},
+        {"x": 1, "y": 10},
+        {"y": 40},
+    ]
+
+
+def test_duplicate_names_produce_every_pair(left):
+    other = AgentList(
+        [Agent(name="a", traits={"y": 1}), Agent(name="a", traits={"z": 2})]
+    )
+    joined = left.join(other, join_type="left")
+    assert [a.traits for a in joined] == [
+        {"x": 1, "y": 1},
+        {"x": 1, "z": 2},
+        {"x": 2},
+        {"x": 3},
+    ]
+
+
+def test_invalid_join_type(left, right):
+    with pytest.raises(ValueError, match="Invalid join type"):
+        left.join(right, join_type="outer")
+
+
+def test_agents_need_names(left):
+    with pytest.raises(AssertionError):
+        left.join(AgentList([Agent(traits={"y": 1})]))
@@ -0,0 +1,146 @@
+import pytest
+
+from edsl.agents import Agent
+from edsl.base import BaseStaleHashError, HashingMixin
+from edsl.questions import QuestionBase, QuestionFreeText, QuestionMultipleChoice
+from edsl.scenarios import Scenario
+from edsl.surveys import Survey
+
+
+@pytest.fixture
+def verify_hashes(monkeypatch):
+    monkeypatch.setattr(HashingMixin, "verify_cached_hashes", True)
+
+
+def test_hash_is_cached_until_mutation():
+    s = Scenario({"food": "wood chips"})
+    h = hash(s)
+    assert s.__dict__["_cached_hash"] == h
+
+    s["food"] = "bark"
+    assert "_cached_hash" not in s.__dict__
+    assert hash(s) == hash(Scenario({"food": "bark"}))
+
+    del s["food"]
+    assert hash(s) == hash(Scenario({}))
+
+
+def test_scenario_update_invalidates():
+    s = Scenario({"a": 1})
+    hash(s)
+    s.update({"b": 2})
+    assert hash(s) == hash(Scenario({"a": 1, "b": 2}))
+
+
+def test_agent_trait_edits_invalidate():
+    a = Agent(traits={"age": 10})
+    hash(a)
+    a.traits["age"] = 11
+    assert hash(a) == hash(Agent(traits={"age": 11}))
+
+    a.traits = {"age": 12}
+    assert hash(a) == hash(Agent(traits={"age": 12}))
+
+    a.instruction = "Answer briefly."
+    assert hash(a) != hash(Agent(traits={"age": 12}))
+
+
+def test_question_descriptor_invalidates():
+    q = QuestionMultipleChoice.example()
+    hash(q)
+    q.question_options = ["a", "b"]
+    expected = QuestionMultipleChoice.example()
+    expected.question_options = ["a", "b"]
+    assert hash(q) == hash(expected)
+    assert "cached_hash" not in q.data
+
+
+def test_survey_edits_invalidate():
+    s = Survey.example()
+    h = hash(s)
+    s.add_question(QuestionFreeText(question_text="Why?", question_name="why"))
+    assert hash(s) != h
+
+    h = hash(s)
+    s.add_rule("q0", "{{ q0.answer }} == 'no'", "why")
+    assert hash(s) != h
+
+    h = hash(s)
+    s.set_full_memory_mode()
+    assert hash(s) != h
+
+
+def test_survey_sees_question_edits():
+    s = Survey.example()
+    h = hash(s)
+    s.questions[1].question_text = "Why not, really?"
+    assert hash(s) != h
+
+    # Same edit on a survey that was never hashed
+    fresh = Survey.example()
+    fresh.questions[1].question_text = "Why not, really?"
+    assert hash(s) == hash(fresh)
+
+
+def test_cached_survey_hash_does_not_rehash_questions(monkeypatch):
+    s = Survey.example()
+    h = hash(s)
+    rehashed = []
+    original = QuestionBase.__hash__
+
+    def counting_hash(q):
+        rehashed.append(q.question_name)
+        return original(q)
+
+    monkeypatch.setattr(QuestionBase, "__hash__", counting_hash)
+    assert hash(s) == h
+    assert rehashed == []
+
+    s.questions[0].question_text = "Do you like homework?"
+    assert hash(s) != h
+    assert len(rehashed) == len(s.questions)
+
+
+def test_debug_mode_detects_missed_invalidation(verify_hashes):
+    s = Scenario({"items": [1, 2]})
+    hash(s)
+    s["items"].append(3)
+    with pytest.raises(BaseStaleHashError):
+        hash(s)
+
+
+def test_debug_mode_passes_when_hooks_fire(verify_hashes):
+    s = Scenario({"items": [1, 2]})
+    hash(s)
+    s["items"] = [1, 2, 3]
+    assert hash(s) == hash(s)
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("model_instructions", {"gpt-4o": "Answer in French."}),
+        ("use_code", True),
+        ("include_comment", True),
+        ("answering_instructions", "Pick one."),
+        ("question_presentation", "{{ question_text }}"),
+    ],
+)
+def test_question_prompt_setters_invalidate(attribute, value):
+    q = QuestionMultipleChoice.example()
+    hash(q)
+    setattr(q, attribute, value)
+
+    expected = QuestionMultipleChoice.example()
+    setattr(expected, attribute, value)
+    assert hash(q) == hash(expected)
+    assert (q == QuestionMultipleChoice.example()) == (
+        expected == QuestionMultipleChoice.example()
+    )
+
+
+def test_answering_instructions_edit_changes_equality():
+    q = QuestionMultipleChoice.example()
+    hash(q)
+    q.answering_instructions = "x"
+    assert not q == QuestionMultipleChoice.example()
@@ -0,0 +1,162 @@
+import asyncio
+import gc
+import sqlite3
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from edsl.caching import Cache, CacheEntry
+from edsl.caching.async_sql_dict import AsyncSQLiteDict
+from edsl.caching.exceptions import CacheKeyError, CacheValueError
+from edsl.caching.sql_dict import SQLiteDict
+
+
+@pytest.fixture
+def async_dict(tmp_path):
+    d = AsyncSQLiteDict(str(tmp_path / "cache.db"))
+    yield d
+    d.close()
+
+
+def entries(n):
+    return [
+        CacheEntry(
+            model="gpt-4o",
+            parameters={"temperature": 0.5},
+            system_prompt="system",
+            user_prompt=f"prompt {i}",
+            output=f'{{"answer": {i}}}',
+            iteration=1,
+        )
+        for i in range(n)
+    ]
+
+
+def test_set_is_visible_before_commit(async_dict):
+    entry = entries(1)[0]
+    async_dict[entry.key] = entry
+    assert entry.key in async_dict
+    assert async_dict[entry.key] == entry
+    with pytest.raises(CacheKeyError):
+        async_dict["missing"]
+
+
+def test_concurrent_stores_share_commits(async_dict):
+    items = entries(500)
+
+    async def main():
+        await asyncio.gather(*(async_dict.async_set(e.key, e) for e in items))
+        return await asyncio.gather(*(async_dict.async_get(e.key) for e in items))
+
+    assert asyncio.run(main()) == items
+    stats = async_dict.write_stats()
+    assert stats["writes"] == 500
+    assert stats["pending"] == 0
+    assert stats["commits"] < 500
+
+
+def test_writes_persist_after_close(tmp_path):
+    path = str(tmp_path / "cache.db")
+    d = AsyncSQLiteDict(path)
+    items = entries(20)
+    for e in items:
+        d[e.key] = e
+    d.close()
+
+    reopened = SQLiteDict(path)
+    assert len(reopened) == 20
+    assert reopened[items[0].key] == items[0]
+
+
+def test_bulk_reads_include_queued_writes(async_dict):
+    items = entries(10)
+    for e in items:
+        async_dict[e.key] = e
+    assert len(async_dict) == 10
+    assert set(async_dict.keys()) == {e.key for e in items}
+    del async_dict[items[0].key]
+    assert len(async_dict) == 9
+
+
+def test_in_memory_database_is_rejected():
+    with pytest.raises(CacheValueError):
+        AsyncSQLiteDict("sqlite:///:memory:")
+
+
+def test_cache_async_fetch_and_store(async_dict):
+    cache = Cache(data=async_dict)
+    params = dict(
+        model="gpt-4o",
+        parameters={"temperature": 0.5},
+        system_prompt="system",
+        user_prompt="hello",
+        iteration=1,
+    )
+
+    async def main():
+        missing, key = await cache.async_fetch(**params)
+        stored_key = await cache.async_store(
+            **params, response={"answer": "hi"}, service="openai"
+        )
+        found, _ = await cache.async_fetch(**params)
+        return missing, key, stored_key, found
+
+    missing, key, stored_key, found = asyncio.run(main())
+    assert missing is None
+    assert key == stored_key
+    assert found == '{"answer": "hi"}'
+    assert key in cache.fetched_data
+
+
+def test_writes_are_committed_when_the_dict_is_dropped(tmp_path):
+    path = str(tmp_path / "cache.db")
+    d = AsyncSQLiteDict(path)
+    items = entries(200)
+    for e in items:
+        d[e.key] = e
+    del d
+    gc.collect()
+
+    assert len(SQLiteDict(path)) == 200
+
+
+def test_writes_are_committed_at_interpreter_exit(tmp_path):
+    path = str(tmp_path / "cache.db")
+    script = textwrap.dedent(
+        f"""
+        from edsl.caching import CacheEntry
+        from edsl.caching.async_sql_dict import AsyncSQLiteDict
+
+        d = AsyncSQLiteDict({path!r})
+        for i in range(5000):
+            e = CacheEntry(
+                model="gpt-4o", parameters={{}}, system_prompt="",
+                user_prompt=f"prompt {{i}}", output="{{}}", iteration=1,
+            )
+            d[e.key] = e
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    assert len(SQLiteDict(path)) == 5000
+
+
+def test_failed_commit_is_raised_and_dropped(async_dict):
+    first, second = entries(2)
+    conn = sqlite3.connect(async_dict._raw_path)
+    conn.execute("DROP TABLE data")
+    conn.commit()
+    conn.close()
+
+    async_dict[first.key] = first
+    with pytest.raises(sqlite3.OperationalError):
+        async_dict.flush()
+    assert async_dict.write_stats()["pending"] == 0
+
+    # The error is reported once
+    async_dict.flush()
+    async_dict[second.key] = second
+    with pytest.raises(sqlite3.OperationalError):
+        async_dict.close()
@@ -0,0 +1,117 @@
+import pytest
+
+from edsl.caching import Cache, CacheEntry
+from edsl.caching.cache_file import (
+    CacheFile,
+    CacheFileWriter,
+    merge_cache_files,
+    write_cache_file,
+)
+from edsl.caching.exceptions import CacheKeyError, CacheValueError
+from edsl.caching.sql_dict import SQLiteDict
+
+
+def entries(n, tag="a"):
+    out = {}
+    for i in range(n):
+        e = CacheEntry(
+            model="gpt-4o",
+            parameters={"temperature": 0.5},
+            system_prompt="You are a helpful survey respondent. " * 50,
+            user_prompt=f"Question {i % 10}: " + "context " * 100,
+            output=f'{{"answer": "{tag} {i}"}}',
+            iteration=i,
+        )
+        out[e.key] = e
+    return out
+
+
+def test_round_trip_and_lookup(tmp_path):
+    data = entries(250)
+    path = tmp_path / "cache.edslcache"
+    write_cache_file(path, data, block_size=32)
+
+    with CacheFile(path) as f:
+        assert len(f) == 250
+        assert list(f.keys()) == sorted(data)
+        assert dict(f.items()) == data
+        key = sorted(data)[100]
+        assert f[key] == data[key]
+        assert "missing" not in f
+        assert f.get("missing") is None
+        with pytest.raises(CacheKeyError):
+            f["missing"]
+
+
+def test_prompts_are_deduplicated(tmp_path):
+    data = entries(500)
+    path = tmp_path / "cache.edslcache"
+    write_cache_file(path, data, codec="zlib")
+    jsonl = tmp_path / "cache.jsonl"
+    Cache(data=data).write_jsonl(str(jsonl))
+    assert path.stat().st_size * 20 < jsonl.stat().st_size
+
+
+def test_get_many_and_subset_read_only_requested_blocks(tmp_path):
+    data = entries(300)
+    path = tmp_path / "cache.edslcache"
+    write_cache_file(path, data, block_size=10)
+    wanted = sorted(data)[5:8]
+
+    with CacheFile(path) as f:
+        subset = f.subset(wanted + ["missing"])
+        entry_blocks_read = [i for kind, i in f._block_cache if kind == "e"]
+    assert entry_blocks_read == [0]
+    assert set(subset.keys()) == set(wanted)
+
+
+def test_writer_rejects_unsorted_keys(tmp_path):
+    a, b = sorted(entries(2).items())
+    with pytest.raises(CacheValueError):
+        with CacheFileWriter(tmp_path / "bad.edslcache") as writer:
+            writer.add(*b)
+            writer.add(*a)
+    assert not (tmp_path / "bad.edslcache").exists()
+
+
+def test_not_a_cache_file(tmp_path):
+    path = tmp_path / "junk.edslcache"
+    path.write_bytes(b"not a cache file at all, just some bytes")
+    with pytest.raises(CacheValueError):
+        CacheFile(path)
+
+
+def test_merge_last_source_wins(tmp_path):
+    first, second = entries(100, "first"), entries(60, "second")
+    write_cache_file(tmp_path / "a.edslcache", first)
+    write_cache_file(tmp_path / "b.edslcache", second, block_size=7)
+
+    written = merge_cache_files(
+        [tmp_path / "a.edslcache", tmp_path / "b.edslcache"],
+        tmp_path / "merged.edslcache",
+    )
+
+    expected = {**first, **second}
+    assert written == len(expected) == 100
+    with CacheFile(tmp_path / "merged.edslcache") as merged:
+        assert dict(merged.items()) == expected
+        assert merged[sorted(second)[0]].output == second[sorted(second)[0]].output
+
+
+def test_cache_reads_and_writes_cache_files(tmp_path):
+    data = entries(20)
+    path = str(tmp_path / "cache.edslcache")
+    Cache(data=data).write(path)
+
+    assert Cache.from_cache_file(path).data == data
+    assert Cache(filename=path).data == data
+
+
+def test_write_from_sqlite_backend(tmp_path):
+    data = entries(20)
+    db = SQLiteDict(f"sqlite:///{tmp_path / 'cache.db'}")
+    db.update(data)
+    path = tmp_path / "cache.edslcache"
+    Cache(data=db).write_cache_file(str(path))
+    with CacheFile(path) as f:
+        assert dict(f.items()) == data
@@ -0,0 +1,161 @@
+import asyncio
+import time
+
+import pytest
+
+from edsl.caching import Cache, CacheEntry
+from edsl.caching.async_sql_dict import AsyncSQLiteDict
+from edsl.caching.exceptions import CacheKeyError
+from edsl.caching.lru_dict import LRUCacheDict
+from edsl.caching.sql_dict import SQLiteDict
+
+
+def entries(n):
+    return [
+        CacheEntry(
+            model="gpt-4o",
+            parameters={"temperature": 0.5},
+            system_prompt="system",
+            user_prompt=f"prompt {i}",
+            output=f'{{"answer": {i}}}',
+            iteration=1,
+        )
+        for i in range(n)
+    ]
+
+
+class CountingSQLiteDict(SQLiteDict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+        self.batches = []
+
+    def get(self, key, default=None):
+        self.reads += 1
+        return super().get(key, default)
+
+    def set_many(self, entries):
+        self.batches.append(len(entries))
+        super().set_many(entries)
+
+
+def test_memory_tier_is_bounded_by_entries():
+    backing = CountingSQLiteDict("sqlite:///:memory:")
+    d = LRUCacheDict(backing, max_entries=10, write_batch_size=1000)
+    items = entries(25)
+    for e in items:
+        d[e.key] = e
+
+    stats = d.stats()
+    assert stats["memory_entries"] == 10
+    assert stats["evictions"] == 15
+    # Nothing evicted is lost, and it was written in batches
+    assert all(d[e.key] == e for e in items)
+    assert sum(backing.batches) == 25
+    assert len(backing.batches) < 25
+
+
+def test_memory_tier_is_bounded_by_bytes():
+    d = LRUCacheDict(SQLiteDict("sqlite:///:memory:"), max_entries=None, max_bytes=2000)
+    for e in entries(50):
+        d[e.key] = e
+    assert 0 < d.stats()["memory_bytes"] <= 2000
+    assert len(d) == 50
+
+
+def test_hits_are_served_from_memory():
+    backing = CountingSQLiteDict("sqlite:///:memory:")
+    e = entries(1)[0]
+    backing[e.key] = e
+    d = LRUCacheDict(backing, max_entries=10)
+
+    for _ in range(5):
+        assert d.get(e.key) == e
+    assert d.get("missing") is None
+    with pytest.raises(CacheKeyError):
+        d["missing"]
+
+    stats = d.stats()
+    assert (stats["hits"], stats["misses"]) == (4, 3)
+    assert backing.reads == 3
+
+
+def test_least_recently_used_entry_is_evicted():
+    d = LRUCacheDict(SQLiteDict("sqlite:///:memory:"), max_entries=2)
+    a, b, c = entries(3)
+    d[a.key] = a
+    d[b.key] = b
+    d.get(a.key)
+    d[c.key] = c
+    assert set(d._memory) == {a.key, c.key}
+
+
+def test_writes_are_batched_and_flushed_on_close(tmp_path):
+    path = str(tmp_path / "cache.db")
+    d = LRUCacheDict(AsyncSQLiteDict(path), write_batch_size=10)
+    items = entries(25)
+
+    async def store():
+        for e in items:
+            await d.async_set(e.key, e)
+
+    asyncio.run(store())
+    assert d.stats()["write_backs"] == 2
+    assert d.stats()["pending_writes"] == 5
+    d.close()
+
+    reopened = SQLiteDict(f"sqlite:///{path}")
+    assert len(reopened) == 25
+    reopened.close()
+
+
+def test_get_many_loads_misses_in_one_call():
+    backing = SQLiteDict("sqlite:///:memory:")
+    items = entries(5)
+    backing.update({e.key: e for e in items})
+    d = LRUCacheDict(backing)
+    d.get(items[0].key)
+
+    found = d.get_many([e.key for e in items] + ["missing"])
+    assert found == {e.key: e for e in items}
+    assert d.stats()["memory_entries"] == 5
+
+
+def test_cache_info_reports_tier_counters():
+    cache = Cache(data=LRUCacheDict(SQLiteDict("sqlite:///:memory:"), max_entries=1))
+    for e in entries(3):
+        cache.data[e.key] = e
+    tier = dict(cache.info())["Memory tier"]
+    stats = dict(zip(tier[0]["statistic"], tier[1]["value"]))
+    assert stats["evictions"] == "2"
+    assert stats["memory_entries"] == "1"
+
+
+def test_write_back_awaits_group_commit_without_blocking_the_loop(tmp_path):
+    backing = AsyncSQLiteDict(str(tmp_path / "cache.db"))
+    d = LRUCacheDict(backing, write_batch_size=5)
+    commit_batch = backing._writer._commit_batch
+
+    def slow_commit(conn, batch):
+        time.sleep(0.3)
+        commit_batch(conn, batch)
+
+    backing._writer._commit_batch = slow_commit
+    backing.set_many = None  # the blocking write-back path must not be taken
+    items = entries(5)
+
+    async def run():
+        ticks = 0
+        stored = asyncio.gather(*(d.async_set(e.key, e) for e in items))
+        while not stored.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        await stored
+        return ticks
+
+    ticks = asyncio.run(run())
+    assert ticks > 10
+    assert d.stats()["write_backs"] == 1
+    # The flush returned only once its batch had been committed
+    assert backing.write_stats() == {"writes": 5, "commits": 1, "pending": 0}
+    d.close()
@@ -0,0 +1,106 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from edsl.coop import Coop
+from edsl.coop.http_transport import CoopTransport, get_transport
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._reply({"path": self.path})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        encoding = self.headers.get("Content-Encoding")
+        self._reply({"payload": json.loads(body), "encoding": encoding})
+
+    def _reply(self, data):
+        data["port"] = self.client_address[1]
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_pooled_connections(server_url):
+    transport = CoopTransport(pool_size=2)
+    ports = {transport.get(f"{server_url}/x").json()["port"] for _ in range(5)}
+    assert len(ports) == 1
+    transport.close()
+
+
+def test_large_json_bodies_are_compressed(server_url):
+    transport = CoopTransport(compress_min_bytes=100)
+    small = transport.post(server_url, json={"a": 1}).json()
+    large = transport.post(server_url, json={"a": "x" * 200}).json()
+    assert small == {"payload": {"a": 1}, "encoding": None, "port": small["port"]}
+    assert large["payload"] == {"a": "x" * 200}
+    assert large["encoding"] == "gzip"
+
+
+def test_map_keeps_input_order(server_url):
+    transport = CoopTransport(pool_size=4)
+    calls = [("GET", f"{server_url}/{i}", {"timeout": 5}) for i in range(10)]
+    assert [r.json()["path"] for r in transport.map(calls)] == [
+        f"/{i}" for i in range(10)
+    ]
+
+
+def test_imap_bounds_calls_in_flight_and_stops_on_error():
+    transport = CoopTransport(pool_size=8)
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, peak
+    started = []
+
+    def call(i):
+        with lock:
+            started.append(i)
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        if i == 5:
+            raise ValueError(i)
+        return i
+
+    results = transport.imap(call, range(100), max_in_flight=3)
+    assert [next(results) for _ in range(5)] == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        next(results)
+    assert in_flight[1] <= 3
+    assert len(started) < 100
+
+
+def test_coop_sends_server_requests_through_the_shared_transport(server_url):
+    coop = Coop(api_key="key", url=server_url)
+    assert coop._transport is get_transport() is Coop()._transport
+    response = coop._send_server_request(
+        uri="api/v0/x", method="POST", payload={"a": 1}
+    )
+    assert response.json()["payload"] == {"a": 1}
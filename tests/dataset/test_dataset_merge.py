@@ -0,0 +1,27 @@
+from edsl.dataset import Dataset
+
+
+def test_merge_is_a_left_join():
+    d1 = Dataset([{"id": [1, 2, 3]}, {"name": ["a", "b", "c"]}])
+    d2 = Dataset([{"pid": [3, 1, 9]}, {"age": [30, 10, 90]}, {"city": ["x", "y", "z"]}])
+    merged = d1.merge(d2, "id", "pid")
+    assert merged.data == [
+        {"id": [1, 2, 3]},
+        {"name": ["a", "b", "c"]},
+        {"age": [10, None, 30]},
+        {"city": ["y", None, "x"]},
+    ]
+
+
+def test_merge_uses_the_last_duplicate_right_key():
+    d1 = Dataset([{"id": [1]}])
+    d2 = Dataset([{"id": [1, 1]}, {"v": ["first", "last"]}])
+    assert d1.merge(d2, "id", "id").data == [{"id": [1]}, {"v": ["last"]}]
+
+
+def test_merge_does_not_share_columns_with_the_input():
+    d1 = Dataset([{"id": [1, 2]}])
+    d2 = Dataset([{"id": [2]}, {"v": ["x"]}])
+    merged = d1.merge(d2, "id", "id")
+    merged.data[0]["id"].append(3)
+    assert d1.data == [{"id": [1, 2]}]
@@ -0,0 +1,68 @@
+import sqlite3
+
+from edsl.dataset import Dataset
+from edsl.results import Results
+
+
+def test_sql_keeps_python_types():
+    d = Dataset(
+        [
+            {"a.code": ["007", "1e5", ""]},
+            {"a.n": [1, 2.5, None]},
+            {"a.flag": [True, False, None]},
+            {"a.items": [[1, 2], {"k": 1}, None]},
+        ]
+    )
+    out = d.sql("SELECT * FROM self")
+    assert out.data == [
+        {"code": ["007", "1e5", None]},
+        {"n": [1, 2.5, None]},
+        {"flag": [True, False, None]},
+        {"items": ["[1, 2]", "{'k': 1}", None]},
+    ]
+    assert d.sql("SELECT code FROM self WHERE n > 2").data == [{"code": ["1e5"]}]
+    assert d.sql("SELECT COUNT(*) AS c FROM self WHERE flag").data == [{"c": [1]}]
+
+
+def test_sql_prefix_and_long_shape():
+    d = Dataset([{"answer.q": ["x", "y"]}, {"scenario.n": [1, 2]}])
+    assert d.sql("SELECT * FROM self", remove_prefix=False).keys() == [
+        "answer.q",
+        "scenario.n",
+    ]
+    long = d.sql("SELECT * FROM self", shape="long")
+    assert long.data == [
+        {"row_number": [1, 2, 3, 4]},
+        {"key": ["q", "q", "n", "n"]},
+        {"value": ["x", "y", "1", "2"]},
+        {"data_type": ["answer", "answer", "scenario", "scenario"]},
+    ]
+
+
+def test_results_sql_matches_select():
+    r = Results.example()
+    out = r.sql("SELECT how_feeling, agent_index FROM self")
+    assert out.data == [
+        {"how_feeling": r.select("how_feeling").to_list()},
+        {"agent_index": r.select("agent_index").to_list()},
+    ]
+    assert r.sql("SELECT * FROM self WHERE 0").keys()[:1] == ["agent_index"]
+
+
+def test_sql_leaves_the_global_boolean_converter_alone():
+    sqlite3.register_converter("BOOLEAN", lambda raw: "mine")
+    try:
+        assert Dataset([{"a.flag": [True]}]).sql("SELECT * FROM self").data == [
+            {"flag": [True]}
+        ]
+        conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        conn.execute("CREATE TABLE t (b BOOLEAN)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        assert conn.execute("SELECT b FROM t").fetchall() == [("mine",)]
+    finally:
+        sqlite3.converters.pop("BOOLEAN", None)
+
+
+def test_sql_mixed_bool_and_int_column_reads_back_as_ints():
+    d = Dataset([{"a.mixed": [True, 2, None]}])
+    assert d.sql("SELECT * FROM self").data == [{"mixed": [1, 2, None]}]
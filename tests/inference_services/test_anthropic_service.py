@@ -126,3 +126,15 @@ def test_anthropic_request_preserves_temperature_for_legacy_models(monkeypatch):
     asyncio.run(model.async_execute_model_call("hello"))
 
     assert captured_kwargs["temperature"] == 0.2
+
+
+def test_batch_request_carries_the_response_schema():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    model = AnthropicService.create_model("claude-opus-4-6")(skip_api_key_check=True)
+
+    body = model.batch_request_body(
+        "Name someone.", response_schema=schema, response_schema_name="Person"
+    )
+
+    assert body["output_config"]["format"] == {"type": "json_schema", "schema": schema}
+    assert "output_config" not in model.batch_request_body("Name someone.")
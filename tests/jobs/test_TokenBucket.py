@@ -63,3 +63,47 @@ async def test_no_overflow():
     bucket.last_refill = time.monotonic() - 1000
     bucket.refill()
     assert bucket.tokens == 5, "Token count should not exceed capacity"
+
+
+@pytest.mark.asyncio
+async def test_log_is_bounded():
+    bucket = TokenBucket(
+        bucket_name="test",
+        bucket_type="requests",
+        capacity=1000,
+        refill_rate=1000,
+        log_size=10,
+    )
+    for _ in range(100):
+        await bucket.get_tokens(1)
+    log = bucket.get_log()
+    assert len(log) == 10
+    assert log[-1][1] == bucket.tokens
+
+
+@pytest.mark.asyncio
+async def test_metrics_count_waits():
+    bucket = TokenBucket(
+        bucket_name="test", bucket_type="requests", capacity=5, refill_rate=20
+    )
+    bucket.tokens = 0
+    await bucket.get_tokens(1)
+    await bucket.get_tokens(1)
+    metrics = bucket.metrics()
+    assert metrics["num_requests"] == metrics["num_released"] == 2
+    assert metrics["num_waits"] >= 1
+    assert metrics["wait_seconds"] > 0
+
+
+def test_metrics_do_not_wait_for_the_bucket_lock():
+    import threading
+
+    bucket = TokenBucket(
+        bucket_name="test", bucket_type="requests", capacity=5, refill_rate=1
+    )
+    snapshots = []
+    with bucket._lock:
+        reader = threading.Thread(target=lambda: snapshots.append(bucket.metrics()))
+        reader.start()
+        reader.join(timeout=2)
+    assert snapshots and snapshots[0]["capacity"] == 5
@@ -247,3 +247,64 @@ def test_prompt_cost_estimation_with_fallback_to_default_price():
     assert estimated_cost_dct["output_tokens"] == 2
     # Cost should be (2 * 0.000001) + (2 * 0.000001) = 0.000004
     assert estimated_cost_dct["cost_usd"] == pytest.approx(0.000004)
+
+
+def _uniform_job(n_scenarios, n_models=1):
+    from edsl.scenarios import Scenario, ScenarioList
+
+    q = QuestionFreeText(
+        question_name="fav", question_text="What do you think of {{ scenario.item }}?"
+    )
+    scenarios = ScenarioList([Scenario({"item": "tea"}) for _ in range(n_scenarios)])
+    models = [Model("test") for _ in range(n_models)]
+    return Survey([q]).by(scenarios).by(*models)
+
+
+def test_sampled_job_cost_matches_exact_cost_for_uniform_prompts():
+    job = _uniform_job(40)
+    exact = job.estimate_job_cost_from_external_prices(price_lookup=price_lookup)
+    sampled = job.estimate_job_cost_from_external_prices(
+        price_lookup=price_lookup, sample_size=5
+    )
+    assert sampled["sampled_interviews"] == 5
+    assert sampled["total_interviews"] == 40
+    assert sampled["estimated_total_cost_usd"] == pytest.approx(
+        exact["estimated_total_cost_usd"]
+    )
+    assert (
+        sampled["estimated_total_input_tokens"] == exact["estimated_total_input_tokens"]
+    )
+
+
+def test_sampled_job_cost_is_stratified_by_model():
+    job = _uniform_job(10, n_models=2)
+    jp = JobsPrompts.from_jobs(job, sample_size=4)
+    assert len(jp.interviews) == 4
+    assert jp.interview_weights == [5.0] * 4
+    assert sorted(i.indices["model"] for i in jp.interviews) == [0, 0, 1, 1]
+
+
+def test_small_jobs_are_not_sampled():
+    job = _uniform_job(3)
+    jp = JobsPrompts.from_jobs(job, sample_size=10)
+    assert jp.interview_weights is None
+    estimate = job.estimate_job_cost_from_external_prices(
+        price_lookup=price_lookup, sample_size=10
+    )
+    assert "sampled_interviews" not in estimate
+
+
+def test_filtered_jobs_are_not_sampled():
+    job = _uniform_job(20).include_when("{{ scenario.item == 'tea' }}")
+    jp = JobsPrompts.from_jobs(job, sample_size=2)
+    assert jp.interview_weights is None
+    assert len(jp.interviews) == 20
+
+
+def test_sample_is_deterministic_for_a_seed():
+    job = _uniform_job(50)
+    first = JobsPrompts.from_jobs(job, sample_size=5, seed=1)
+    second = JobsPrompts.from_jobs(job, sample_size=5, seed=1)
+    assert [i.indices for i in first.interviews] == [
+        i.indices for i in second.interviews
+    ]
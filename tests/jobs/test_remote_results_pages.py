@@ -0,0 +1,68 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from edsl import Agent, Jobs, Model, Scenario
+from edsl.coop import Coop
+from edsl.jobs.remote_inference import JobsRemoteInferenceHandler, _InternedObjects
+
+
+def test_pages_are_fetched_in_parallel_and_yielded_in_order():
+    in_flight = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_page(self, job_uuid, page=0, page_size=100):
+        with lock:
+            in_flight.append(page)
+            peak[0] = max(peak[0], len(in_flight))
+        time.sleep(0.01 * (7 - page % 7))
+        with lock:
+            in_flight.remove(page)
+        return {"page": page}
+
+    with patch.object(Coop, "remote_inference_results_page", fake_page):
+        pages = Coop(api_key="k").iter_remote_inference_results_pages(
+            "job", 20, max_workers=4
+        )
+        assert [p["page"] for p in pages] == list(range(20))
+    assert 1 < peak[0] <= 4
+
+
+def test_page_errors_are_raised_in_order():
+    def fake_page(self, job_uuid, page=0, page_size=100):
+        if page == 2:
+            raise RuntimeError("page 2 failed")
+        return {"page": page}
+
+    with patch.object(Coop, "remote_inference_results_page", fake_page):
+        pages = Coop(api_key="k").iter_remote_inference_results_pages("job", 5)
+        assert next(pages)["page"] == 0
+        assert next(pages)["page"] == 1
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            next(pages)
+    assert list(Coop(api_key="k").iter_remote_inference_results_pages("job", 0)) == []
+
+
+def test_interviews_share_interned_agents_scenarios_and_models():
+    handler = JobsRemoteInferenceHandler(Jobs.example())
+    agent = Agent(traits={"age": 30}).to_dict()
+    model = Model("test").to_dict()
+    interviews = [
+        {
+            "agent": agent,
+            "scenario": Scenario({"n": n % 2}).to_dict(),
+            "model": model,
+            "answers": [{"question_name": "q", "answer": n}],
+        }
+        for n in range(4)
+    ]
+    interned = _InternedObjects()
+    results = [handler._result_from_interview(i, None, interned) for i in interviews]
+    assert [r.answer["q"] for r in results] == [0, 1, 2, 3]
+    assert len({id(r.agent) for r in results}) == 1
+    assert len({id(r.model) for r in results}) == 1
+    assert results[0].scenario is results[2].scenario
+    assert results[0].scenario is not results[1].scenario
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from edsl.caching import Cache
+from edsl.language_models import LanguageModel
+from edsl.language_models.single_flight import (
+    get_single_flight_stats,
+    reset_single_flight_stats,
+    single_flight,
+)
+
+
+def run_concurrently(coros):
+    async def main():
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    return asyncio.run(main())
+
+
+def count_calls(m):
+    calls = []
+    original = m.async_execute_model_call
+
+    async def counting_call(*args, **kwargs):
+        calls.append(1)
+        return await original(*args, **kwargs)
+
+    m.async_execute_model_call = counting_call
+    return calls
+
+
+def test_identical_calls_share_one_api_call():
+    reset_single_flight_stats()
+    cache = Cache()
+    m = LanguageModel.example(test_model=True, canned_response="Hello")
+    calls = count_calls(m)
+
+    outcomes = run_concurrently(
+        m._async_get_intended_model_call_outcome(
+            user_prompt="Hello world", system_prompt="Be nice", cache=cache
+        )
+        for _ in range(5)
+    )
+
+    assert len(calls) == 1
+    assert len(cache) == 1
+    assert sum(not o.cache_used for o in outcomes) == 1
+    assert sum(o.cache_used for o in outcomes) == 4
+    assert len({o.cache_key for o in outcomes}) == 1
+    assert all(o.response == outcomes[0].response for o in outcomes)
+    assert get_single_flight_stats()["deduplicated"] == 4
+
+
+def test_calls_on_other_caches_are_not_shared():
+    m = LanguageModel.example(test_model=True, canned_response="Hello")
+    calls = count_calls(m)
+    caches = (Cache(), Cache())
+
+    outcomes = run_concurrently(
+        m._async_get_intended_model_call_outcome(
+            user_prompt="Hello world", system_prompt="Be nice", cache=c
+        )
+        for c in caches
+    )
+
+    assert len(calls) == 2
+    assert not any(o.cache_used for o in outcomes)
+    assert all(len(c) == 1 for c in caches)
+
+
+def test_calls_are_not_shared_when_caching_is_off():
+    # Jobs.run(cache=False) hands the model a cache that defers every write
+    cache = Cache(immediate_write=False)
+    m = LanguageModel.example(test_model=True, canned_response="Hello")
+    calls = count_calls(m)
+
+    outcomes = run_concurrently(
+        m._async_get_intended_model_call_outcome(
+            user_prompt="Hello world", system_prompt="Be nice", cache=cache
+        )
+        for _ in range(3)
+    )
+
+    assert len(calls) == 3
+    assert not any(o.cache_used for o in outcomes)
+
+
+def test_scripted_agents_with_identical_prompts_get_their_own_answers():
+    m = LanguageModel.from_scripted_responses(
+        {"alice": {"q": "blue"}, "bob": {"q": "red"}}
+    )
+    calls = count_calls(m)
+
+    outcomes = run_concurrently(
+        m._async_get_intended_model_call_outcome(
+            user_prompt="Favorite color?",
+            system_prompt="",
+            cache=Cache(),
+            agent_name=name,
+            question_name="q",
+        )
+        for name in ("alice", "bob")
+    )
+
+    assert len(calls) == 2
+    assert not any(o.cache_used for o in outcomes)
+    assert [o.response["message"][0]["text"] for o in outcomes] == ["blue", "red"]
+
+
+def test_failures_propagate_to_followers():
+    reset_single_flight_stats()
+
+    async def failing_call():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = run_concurrently(single_flight("key", failing_call) for _ in range(3))
+
+    assert all(isinstance(r, ValueError) for r in results)
+    stats = get_single_flight_stats()
+    assert stats["calls"] == 1
+    assert stats["shared_failures"] == 2
+
+
+def test_sequential_calls_are_not_deduplicated():
+    async def call():
+        return "answer"
+
+    async def main():
+        first = await single_flight("key", call)
+        second = await single_flight("key", call)
+        return first, second
+
+    assert asyncio.run(main()) == (("answer", False), ("answer", False))
+
+
+def test_cancelled_leader_hands_off_to_follower():
+    async def slow_call():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def main():
+        leader = asyncio.ensure_future(single_flight("key", slow_call))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight("key", slow_call))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == ("answer", False)
@@ -0,0 +1,128 @@
+import hashlib
+from urllib.error import HTTPError
+
+from edsl.object_store.cas_repository import CASRepository, missing_keys, write_many
+from edsl.object_store.http_backend import HttpBackend
+
+
+class DictBackend:
+    """In-memory backend with only the required methods, counting calls."""
+
+    def __init__(self):
+        self.data = {}
+        self.exists_calls = []
+        self.reads = []
+        self.writes = []
+
+    def read(self, key):
+        self.reads.append(key)
+        if key not in self.data:
+            raise KeyError(key)
+        return self.data[key]
+
+    def write(self, key, content):
+        self.writes.append(key)
+        self.data[key] = content
+
+    def exists(self, key):
+        self.exists_calls.append(key)
+        return key in self.data
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def list_prefix(self, prefix):
+        return [key for key in self.data if key.startswith(prefix)]
+
+    def delete_tree(self, prefix):
+        for key in self.list_prefix(prefix):
+            del self.data[key]
+
+
+class BatchDictBackend(DictBackend):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def missing_keys(self, keys):
+        self.batches.append(("missing_keys", list(keys)))
+        return {key for key in keys if key not in self.data}
+
+    def write_many(self, items):
+        self.batches.append(("write_many", dict(items)))
+        self.data.update(items)
+
+
+def blob_key(row):
+    return f"blobs/{hashlib.sha256(row.encode()).hexdigest()}.json"
+
+
+def test_missing_keys_falls_back_to_exists_per_key():
+    b = DictBackend()
+    b.data["blobs/a.json"] = "a"
+    keys = ["blobs/a.json", "blobs/b.json", "blobs/b.json"]
+    assert missing_keys(b, keys) == {"blobs/b.json"}
+    assert b.exists_calls == ["blobs/a.json", "blobs/b.json"]
+
+
+def test_missing_keys_and_write_many_use_batch_methods():
+    b = BatchDictBackend()
+    b.data["blobs/a.json"] = "a"
+    assert missing_keys(b, ["blobs/a.json", "blobs/b.json"]) == {"blobs/b.json"}
+    write_many(b, {"blobs/b.json": "b"})
+    write_many(b, {})
+    assert b.exists_calls == [] and b.writes == []
+    assert [name for name, _ in b.batches] == ["missing_keys", "write_many"]
+
+
+def test_write_many_falls_back_to_write_per_key():
+    b = DictBackend()
+    write_many(b, {"blobs/a.json": "a", "blobs/b.json": "b"})
+    assert b.writes == ["blobs/a.json", "blobs/b.json"]
+
+
+def test_save_writes_only_new_blobs_in_one_batch():
+    b = BatchDictBackend()
+    repo = CASRepository("unused", backend=b)
+    repo.save(["a", "b"], message="first")
+    b.batches.clear()
+
+    repo.save(["a", "b", "c", "c"], message="second")
+
+    (_, checked), (_, written) = b.batches
+    assert sorted(checked) == sorted({blob_key(r) for r in "abc"})
+    assert list(written) == [blob_key("c")]
+    assert repo.load() == "a\nb\nc\nc\n"
+
+
+def test_save_writes_the_snapshot_from_rows():
+    b = DictBackend()
+    repo = CASRepository("unused", backend=b)
+    repo.save(["x", "y", "x"])
+    assert b.data["current.jsonl"] == "x\ny\nx\n"
+    assert not any(key.startswith("blobs/") for key in b.reads)
+
+
+def test_http_missing_keys_counts_buffered_objects_as_present(monkeypatch):
+    backend = HttpBackend("http://cas.invalid", "uuid")
+    remote = {f"{backend._prefix}/blobs/aa": {"content": "a"}}
+    requested = []
+
+    def fake_get(url):
+        requested.append(url)
+        if url not in remote:
+            raise HTTPError(url, 404, "Not Found", {}, None)
+        return remote[url]
+
+    monkeypatch.setattr(backend, "_get", fake_get)
+    backend.write("blobs/bb.json", "b")
+    backend.write("trees/cc.json", "{}")
+
+    missing = backend.missing_keys(
+        ["blobs/aa.json", "blobs/bb.json", "trees/cc.json", "blobs/dd.json"]
+    )
+    assert missing == {"blobs/dd.json"}
+    assert sorted(requested) == [
+        f"{backend._prefix}/blobs/aa",
+        f"{backend._prefix}/blobs/dd",
+    ]
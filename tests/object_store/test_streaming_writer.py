@@ -0,0 +1,124 @@
+import json
+
+from edsl.object_store import ObjectStore
+from edsl.object_store.cas_repository import (
+    CASRepository,
+    tree_blob_hashes,
+    tree_chain,
+)
+from edsl.object_store.fs_backend import FileSystemBackend
+from edsl.object_store.streaming_writer import StreamingCASWriter
+
+
+class DictBackend:
+    """In-memory backend without ``append``, recording snapshot traffic."""
+
+    def __init__(self):
+        self.data = {}
+        self.snapshot_reads = 0
+        self.snapshot_writes = 0
+
+    def read(self, key):
+        if key == "current.jsonl":
+            self.snapshot_reads += 1
+        if key not in self.data:
+            raise KeyError(key)
+        return self.data[key]
+
+    def write(self, key, content):
+        if key == "current.jsonl":
+            self.snapshot_writes += 1
+        self.data[key] = content
+
+    def exists(self, key):
+        return key in self.data
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def list_prefix(self, prefix):
+        return [key for key in self.data if key.startswith(prefix)]
+
+    def delete_tree(self, prefix):
+        for key in self.list_prefix(prefix):
+            del self.data[key]
+
+
+class DerivedSnapshotBackend(DictBackend):
+    derives_snapshot = True
+
+
+PREAMBLE = ['{"__header__": true}', '{"n_survey_lines": 0}']
+ROWS = [json.dumps({"answer": i}) for i in range(7)]
+
+
+def stream(backend, finalize=False):
+    w = StreamingCASWriter(backend, chunk_size=3)
+    w.write_preamble(PREAMBLE)
+    for row in ROWS:
+        w.append_result(row)
+    if finalize:
+        w.finalize()
+    return w
+
+
+def tip_tree(backend, writer):
+    commit = json.loads(backend.read(f"commits/{writer.tip}.json"))
+    return commit["tree"], json.loads(backend.read(f"trees/{commit['tree']}.json"))
+
+
+def test_chunked_tree_loads_every_row(tmp_path):
+    backend = FileSystemBackend(tmp_path)
+    w = stream(backend)
+
+    tree_hash, tree = tip_tree(backend, w)
+    assert "base" in tree
+    assert len(tree_chain(backend, tree_hash)) == 3
+    hashes = tree_blob_hashes(backend, tree)
+    assert [backend.read(f"blobs/{h}.json") for h in hashes] == PREAMBLE + ROWS
+
+    expected = "\n".join(PREAMBLE + ROWS) + "\n"
+    assert CASRepository(tmp_path, backend=backend).load() == expected
+    assert backend.read("current.jsonl") == expected
+
+
+def test_sync_copies_base_trees_of_a_chunked_tree(tmp_path):
+    source = FileSystemBackend(tmp_path / "source")
+    dest = FileSystemBackend(tmp_path / "dest")
+    w = stream(source)
+
+    result = ObjectStore.sync(source, dest)
+    assert result["commit"] == w.tip
+    assert result["commits"] == len(ROWS) + 1
+
+    tree_hash, _ = tip_tree(source, w)
+    for chunk in tree_chain(source, tree_hash):
+        assert dest.exists(f"trees/{chunk}.json")
+    expected = "\n".join(PREAMBLE + ROWS) + "\n"
+    assert CASRepository(tmp_path / "dest", backend=dest).load() == expected
+    assert dest.read("current.jsonl") == expected
+
+
+def test_finalized_object_ends_on_a_flat_tree(tmp_path):
+    backend = FileSystemBackend(tmp_path)
+    w = stream(backend, finalize=True)
+    _, tree = tip_tree(backend, w)
+    assert "base" not in tree
+    assert len(tree["blobs"]) == len(PREAMBLE + ROWS)
+
+
+def test_snapshot_is_never_read_back_without_append():
+    backend = DictBackend()
+    stream(backend, finalize=True)
+    assert backend.snapshot_reads == 0
+    assert backend.data["current.jsonl"] == "\n".join(PREAMBLE + ROWS) + "\n"
+
+
+def test_no_snapshot_for_backends_that_derive_it():
+    backend = DerivedSnapshotBackend()
+    w = stream(backend, finalize=True)
+    assert backend.snapshot_writes == 0
+    assert w._snapshot_rows == []
+    assert CASRepository("unused", backend=backend).load().splitlines() == (
+        PREAMBLE + ROWS
+    )
@@ -0,0 +1,63 @@
+import pytest
+
+from edsl.questions import (
+    QuestionCheckBox,
+    QuestionDropdown,
+    QuestionMultipleChoice,
+    QuestionNumerical,
+)
+from edsl.questions.exceptions import QuestionAnswerValidationError
+from edsl.questions.question_base_prompts_mixin import (
+    ResponseModelCache,
+    response_model_cache,
+)
+
+
+def test_rendered_copies_share_one_model():
+    q1 = QuestionMultipleChoice.example()
+    q2 = QuestionMultipleChoice.example()
+    q2.question_text = "How are you today?"
+    assert q1.response_model is q2.response_model
+    assert q1.response_validator.response_model is q1.response_model
+
+
+def test_model_relevant_changes_get_a_new_model():
+    q1 = QuestionNumerical.example()
+    q2 = QuestionNumerical.example()
+    q2.max_value = 10
+    assert q1.response_model is not q2.response_model
+    q2._validate_answer({"answer": 5})
+    with pytest.raises(QuestionAnswerValidationError):
+        q2._validate_answer({"answer": 50})
+    assert q1._validate_answer({"answer": 50})["answer"] == 50
+
+
+def test_permissive_is_part_of_the_key():
+    strict = QuestionCheckBox.example()
+    permissive = QuestionCheckBox.example()
+    permissive.permissive = True
+    assert strict.response_model is not permissive.response_model
+
+
+def test_mutating_a_question_after_use():
+    q = QuestionMultipleChoice.example()
+    before = q.response_model
+    q.question_options = ["Yes", "No"]
+    assert q.response_model is not before
+    assert q._validate_answer({"answer": "Yes"})["answer"] == "Yes"
+
+
+def test_unserializable_questions_are_not_interned():
+    q = QuestionDropdown.example()
+    assert response_model_cache.key(q) is None
+    assert q.response_model is not None
+
+
+def test_cache_is_bounded():
+    cache = ResponseModelCache(maxsize=2)
+    questions = [QuestionNumerical.example() for _ in range(3)]
+    for i, q in enumerate(questions):
+        q.max_value = 100 + i
+        cache.get(q)
+    assert len(cache._models) == 2
+    assert cache.key(questions[0]) not in cache._models
@@ -0,0 +1,90 @@
+import pytest
+from simpleeval import EvalWithCompoundTypes
+
+from edsl.dataset import Dataset
+from edsl.results import Results
+from edsl.results.exceptions import ResultsFilterError, ResultsMutateError
+from edsl.results.results_columnar import ColumnarResultList
+from edsl.scenarios import Scenario, ScenarioList
+from edsl.utilities import CompiledExpression
+
+
+ROWS = [
+    {"age": 40, "mood": "OK", "score": 1.5, "tags": {"a": 1}},
+    {"age": 20, "mood": "Great", "score": None, "tags": {"a": 2}},
+    {"age": 35, "mood": "Bad", "score": 3.0, "tags": {"a": 3}},
+]
+
+EXPRESSIONS = [
+    "age > 30 and mood == 'OK'",
+    "age > 30 or mood == 'Great'",
+    "not (age < 30)",
+    "score is not None and score > 2",
+    "mood in ['OK', 'Bad']",
+    "mood not in ('OK',)",
+    "20 <= age < 40",
+    "age * 2 + 1",
+    "'yes' if age > 30 else 'no'",
+    "tags['a'] + age",
+    "tags.a",
+    "int(score or 0) % 2",
+    "mood + '!'",
+]
+
+
+def columns(name, attr):
+    if attr is not None or name not in ROWS[0]:
+        return None
+    return [row[name] for row in ROWS]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_columns_match_row_evaluation(expression):
+    compiled = CompiledExpression(expression)
+    expected = [EvalWithCompoundTypes(names=row).eval(expression) for row in ROWS]
+    assert [compiled.evaluate(row) for row in ROWS] == expected
+    assert compiled.evaluate_columns(columns, len(ROWS)) == expected
+
+
+def test_unsupported_or_failing_expressions_fall_back():
+    # Method calls, unknown names and row errors have no column form
+    for expression in ["mood.upper()", "missing > 1", "age / 0", "tags.keys"]:
+        assert CompiledExpression(expression).evaluate_columns(columns, 3) is None
+    assert CompiledExpression("age > 1").evaluate_columns(columns, 0) == []
+
+
+def test_results_filter_and_mutate_match_across_stores():
+    r = Results.example()
+    columnar = Results(survey=r.survey, data=ColumnarResultList(r.data))
+    for results in (r, columnar):
+        filtered = results.filter("how_feeling == 'OK' or how_feeling == 'Great'")
+        assert filtered.select("how_feeling").to_list() == ["OK", "Great", "OK"]
+        mutated = results.mutate("loud = how_feeling + '!'")
+        assert mutated.select("loud").to_list() == ["OK!", "Great!", "Terrible!", "OK!"]
+        assert results.filter("agent.status == 'Joyful'").select("how_feeling").to_list() == ["OK", "Great"]
+
+
+def test_results_errors_are_unchanged():
+    r = Results.example()
+    with pytest.raises(ResultsFilterError, match="'nope' is not defined"):
+        r.filter("nope == 1")
+    with pytest.raises(ResultsMutateError, match="division by zero"):
+        r.mutate("x = 1 / 0")
+
+
+def test_scenario_list_filter_and_mutate():
+    sl = ScenarioList([Scenario(row) for row in ROWS])
+    assert sl.filter("age > 30 and mood == 'OK'") == ScenarioList([Scenario(ROWS[0])])
+    assert [s["older"] for s in sl.mutate("older = age + 1")] == [41, 21, 36]
+
+    ragged = ScenarioList([Scenario({"a": 1}), Scenario({"a": 2, "b": 3})])
+    assert [s["a"] for s in ragged.filter("a > 1")] == [2]
+
+    dotted = ScenarioList([Scenario({"x.y": 1}), Scenario({"x.y": 5})])
+    assert [s["x.y"] for s in dotted.filter("x.y > 2")] == [5]
+
+
+def test_dataset_filter_and_mutate():
+    d = Dataset([{"a.age": [40, 20, 35]}, {"b.mood": ["OK", "OK", "Bad"]}])
+    assert d.filter("age > 30 and mood == 'OK'") == Dataset([{"age": [40]}, {"mood": ["OK"]}])
+    assert d.mutate("older = age + 1").to_dicts(remove_prefix=False)[0]["older"] == 41
@@ -0,0 +1,77 @@
+import pytest
+
+from edsl.results import Results
+from edsl.results.results_columnar import (
+    ColumnarResultList,
+    ResultsColumnStore,
+    ResultView,
+)
+
+
+@pytest.fixture
+def results():
+    return Results.example()
+
+
+@pytest.fixture
+def columnar(results):
+    return results.to_columnar()
+
+
+def test_columns_match_row_results(results, columnar):
+    assert columnar.is_columnar and not results.is_columnar
+    assert columnar.columns == results.columns
+    assert columnar.select() == results.select()
+    for column in results.columns:
+        assert columnar.select(column) == results.select(column)
+
+
+def test_rows_are_result_views(results, columnar):
+    assert isinstance(columnar[0], ResultView)
+    assert [hash(r) for r in columnar] == [hash(r) for r in results]
+    assert columnar[0]["answer"] == results[0]["answer"]
+    assert columnar[0].indices == results[0].indices
+    assert hash(columnar) == hash(results)
+
+
+def test_payloads_are_stored_once(results):
+    store = ResultsColumnStore()
+    for _ in range(50):
+        for result in results:
+            store.append(result)
+    assert len(store) == 50 * len(results)
+    for field in ("agent", "scenario", "model", "question_to_attributes"):
+        assert len(store._payloads[field]) <= len(results)
+    prompts = store._columns["prompt"]["how_feeling_user_prompt"]
+    assert len({id(p) for p in prompts}) <= len(results)
+
+
+def test_filter_and_slice_share_the_store(results, columnar):
+    expression = "how_feeling == 'OK' or agent.status == 'Joyful'"
+    filtered = columnar.filter(expression)
+    assert filtered.is_columnar
+    assert filtered.data.store is columnar.data.store
+    assert filtered.select("how_feeling") == results.filter(expression).select(
+        "how_feeling"
+    )
+    assert columnar[1:3].data.store is columnar.data.store
+    assert len(columnar[1:3]) == 2
+
+
+def test_tally_and_pandas_match(results, columnar):
+    assert columnar.tally("how_feeling") == results.tally("how_feeling")
+    assert columnar.to_pandas().equals(results.to_pandas())
+
+
+def test_writes_copy_a_shared_store(results, columnar):
+    subset = columnar[:2]
+    subset.append(results[3])
+    assert subset.data.store is not columnar.data.store
+    assert subset.select("how_feeling").to_list() == ["OK", "Great", "OK"]
+    assert len(columnar) == 4
+
+
+def test_empty_columnar_list():
+    rows = ColumnarResultList()
+    assert len(rows) == 0
+    assert rows.key_to_data_type() == {}
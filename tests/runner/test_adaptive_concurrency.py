@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from edsl.runner.concurrency import AdaptiveConcurrencyController
+from edsl.runner.queues import Queue
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.queues = {}
+
+    def list_queues(self):
+        return [q.meta for q in self.queues.values()]
+
+    def get_queue(self, queue_id):
+        return self.queues[queue_id]
+
+
+class FakeCoordinator:
+    def __init__(self, depth=0, in_flight=0):
+        self.registry = FakeRegistry()
+        self.depth = depth
+        self.in_flight = in_flight
+
+    def get_stats(self):
+        return {"total_depth": self.depth, "in_flight_tasks": self.in_flight}
+
+
+def busy_controller(target=8, **kwargs):
+    coordinator = FakeCoordinator(depth=1000, in_flight=target)
+    controller = AdaptiveConcurrencyController(
+        coordinator, min_workers=1, max_workers=400, initial_workers=target, **kwargs
+    )
+    return coordinator, controller
+
+
+def test_slow_start_doubles_until_congestion_then_adds():
+    coordinator, controller = busy_controller()
+    targets = []
+    for _ in range(3):
+        coordinator.in_flight = controller.target
+        targets.append(controller.step().target)
+    assert targets == [16, 32, 64]
+
+    changes = []
+    controller.on_target_change = changes.append
+    controller.observe(time.time(), 0.01, "rate_limit")
+    assert controller.target == int(64 * controller.decrease_factor)
+    assert changes == [controller.target]
+
+    coordinator.in_flight = controller.target
+    controller.step()  # holds for one interval after a 429
+    before = controller.target
+    controller.step()
+    assert controller.target == before + controller.additive_step
+
+
+def test_in_flight_429s_cause_one_decrease():
+    _, controller = busy_controller(target=100)
+    started = time.time() - 1
+    for _ in range(10):
+        controller.observe(started, 0.01, "rate_limit")
+    assert controller.target == 70
+    assert controller.get_stats()["decreases"] == 1
+    assert controller.get_stats()["rate_limited"] == 10
+
+
+def test_latency_increase_is_congestion():
+    coordinator, controller = busy_controller(target=20)
+    for _ in range(5):
+        controller.observe(time.time(), 0.1)
+    controller.step()
+    for _ in range(5):
+        controller.observe(time.time(), 1.0)
+    decision = controller.step()
+    assert decision.action == "decrease"
+    assert "latency" in decision.reason
+
+
+def test_latency_baseline_follows_a_lasting_shift():
+    coordinator, controller = busy_controller(target=20, latency_window=3)
+    controller.observe(time.time(), 0.1)
+    controller.step()
+    controller.observe(time.time(), 1.0)
+    assert controller.step().action == "decrease"
+
+    # Once the fast interval has left the window, the slower latency is the
+    # new baseline and stops counting as congestion
+    for _ in range(3):
+        coordinator.in_flight = controller.target
+        controller.observe(time.time(), 1.0)
+        decision = controller.step()
+    assert decision.action == "increase"
+    assert controller.get_stats()["base_latency"] == 1.0
+
+
+def test_holds_without_backlog_or_when_token_bucket_is_binding():
+    coordinator, controller = busy_controller()
+    coordinator.depth = 0
+    assert controller.step().reason == "no backlog"
+
+    queue = Queue("q", "test", "test", "key", rpm_limit=1, tpm_limit=1000)
+    queue.rpm_bucket.tokens = 0
+    queue.enqueue({"task_id": "t", "estimated_tokens": 10})
+    coordinator.registry.queues["q"] = queue
+    coordinator.depth = 1
+    decision = controller.step()
+    assert decision.action == "hold"
+    assert decision.bucket_wait > 0
+
+
+def test_never_exceeds_max_workers_or_backlog():
+    coordinator = FakeCoordinator(depth=5, in_flight=8)
+    controller = AdaptiveConcurrencyController(coordinator, min_workers=8, max_workers=10)
+    assert controller.step().target == 10
+    coordinator.depth, coordinator.in_flight = 1, 10
+    assert controller.step().target == 10
+
+
+def test_rejects_invalid_decrease_factor():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyController(FakeCoordinator(), decrease_factor=1.5)
@@ -0,0 +1,232 @@
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pydantic import BaseModel
+
+from edsl import Agent, QuestionFreeText, QuestionPydantic, Survey
+from edsl.caching import Cache
+from edsl.inference_services.services.open_ai_service import OpenAIService
+from edsl.runner import Runner
+from edsl.runner.batch import BatchRequest, OpenAIBatchBackend
+
+
+def completion(content):
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+def answer_for(body):
+    """The stub model echoes the last line of the user prompt."""
+    prompt = body["messages"][-1]["content"]
+    if "fail" in prompt:
+        return None
+    return "Batched: " + prompt.strip().splitlines()[-1]
+
+
+class StubBatchServer(ThreadingHTTPServer):
+    """In-memory implementation of the OpenAI files/batches endpoints."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubBatchHandler)
+        self.files = {}
+        self.batches = {}
+        self.submitted = []
+        self.live_calls = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class StubBatchHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload, content_type="application/json"):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        server = self.server
+        if self.path == "/v1/files":
+            raw = self._body()
+            start = raw.index(b"\r\n\r\n", raw.index(b'name="file"')) + 4
+            content = raw[start : raw.index(b"\r\n--", start)]
+            file_id = f"file-{uuid.uuid4().hex}"
+            server.files[file_id] = content.decode()
+            self._send({"id": file_id, "object": "file", "purpose": "batch"})
+        elif self.path == "/v1/batches":
+            request = json.loads(self._body())
+            lines = [
+                json.loads(line)
+                for line in server.files[request["input_file_id"]].splitlines()
+            ]
+            server.submitted.append(lines)
+            output = []
+            for line in lines:
+                content = answer_for(line["body"])
+                if content is None:
+                    output.append(
+                        {
+                            "custom_id": line["custom_id"],
+                            "response": None,
+                            "error": {"code": "server_error", "message": "fail"},
+                        }
+                    )
+                else:
+                    output.append(
+                        {
+                            "custom_id": line["custom_id"],
+                            "response": {
+                                "status_code": 200,
+                                "body": completion(content),
+                            },
+                            "error": None,
+                        }
+                    )
+            output_id = f"file-{uuid.uuid4().hex}"
+            server.files[output_id] = "\n".join(json.dumps(o) for o in output)
+            batch_id = f"batch_{uuid.uuid4().hex}"
+            server.batches[batch_id] = {
+                "id": batch_id,
+                "status": "validating",
+                "output_file_id": output_id,
+                "polls": 0,
+            }
+            self._send({"id": batch_id, "status": "validating"})
+        elif self.path == "/v1/chat/completions":
+            server.live_calls += 1
+            body = json.loads(self._body())
+            self._send(completion(answer_for(body) or "live"))
+        else:
+            self.send_error(404)
+
+    def do_GET(self):
+        server = self.server
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"]:
+            batch = server.batches[parts[2]]
+            batch["polls"] += 1
+            # Report in progress once before completing
+            status = "completed" if batch["polls"] > 1 else "in_progress"
+            self._send({**batch, "status": status})
+        elif parts[:2] == ["v1", "files"] and parts[-1] == "content":
+            self._send(server.files[parts[2]].encode(), "application/jsonl")
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = StubBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+    monkeypatch.setenv("OPENAI_BASE_URL", server.url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_backend_round_trip_skips_failed_items(stub_server, tmp_path):
+    backend = OpenAIBatchBackend(api_key="sk-stub", poll_interval=0, work_dir=tmp_path)
+    body = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]}
+    failing = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "fail"}],
+    }
+
+    responses = backend.run([BatchRequest("a", body), BatchRequest("b", failing)])
+
+    assert list(responses) == ["a"]
+    assert responses["a"]["choices"][0]["message"]["content"] == "Batched: hi"
+    assert len(list(tmp_path.glob("openai_*.jsonl"))) == 1
+
+
+def test_batch_mode_runs_one_batch_per_dependency_level(stub_server):
+    q1 = QuestionFreeText(question_name="q1", question_text="What is your name?")
+    q2 = QuestionFreeText(
+        question_name="q2", question_text="Say hello to {{ q1.answer }}"
+    )
+    model = OpenAIService.create_model("gpt-4o-mini")(skip_api_key_check=True)
+    agents = [Agent(traits={"id": i}) for i in range(3)]
+    job = Survey([q1, q2]).by(agents).by(model)
+    cache = Cache()
+
+    runner = Runner(max_workers=4)
+    handle = runner.submit(
+        job, cache=cache, execution_mode="batch", batch_poll_interval=0
+    )
+    results = handle.results()
+
+    assert len(stub_server.submitted) == 2
+    # Each agent's traits are in its system prompt, so every prompt is distinct
+    assert [len(batch) for batch in stub_server.submitted] == [3, 3]
+    assert stub_server.live_calls == 0
+    assert len(cache) == 6
+    for answer in results.select("answer.q2").to_list():
+        assert answer.startswith("Batched: Say hello to Batched:")
+
+
+def test_cached_prompts_are_not_resubmitted(stub_server):
+    q = QuestionFreeText(question_name="q1", question_text="What is your name?")
+    model = OpenAIService.create_model("gpt-4o-mini")(skip_api_key_check=True)
+    job = Survey([q]).by([Agent(traits={"id": i}) for i in range(3)]).by(model)
+    cache = Cache()
+
+    for _ in range(2):
+        Runner(max_workers=4).submit(
+            job, cache=cache, execution_mode="batch", batch_poll_interval=0
+        ).results()
+
+    assert len(stub_server.submitted) == 1
+    assert stub_server.live_calls == 0
+
+
+class Person(BaseModel):
+    name: str
+
+
+def test_batch_requests_carry_the_response_schema():
+    q = QuestionPydantic(
+        question_name="person", question_text="Name someone.", pydantic_model=Person
+    )
+    model = OpenAIService.create_model("gpt-4o-mini")(skip_api_key_check=True)
+    runner = Runner()
+    handle = runner.submit(Survey([q]).by(model), execution_mode="batch")
+    rp = runner._render_worker.render_ready_tasks(handle.job_id)[0]
+
+    body = model.batch_request_body(
+        rp.user_prompt,
+        rp.system_prompt,
+        **runner._response_schema_params(handle.job_id, rp.question_id),
+    )
+
+    assert body["response_format"]["json_schema"]["name"] == "Person"
+    assert body["response_format"]["json_schema"]["schema"] == q.get_response_schema()
+
+
+def test_unknown_execution_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Runner().submit(Survey.example().to_jobs(), execution_mode="offline")
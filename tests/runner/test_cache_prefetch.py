@@ -0,0 +1,82 @@
+from edsl import Agent, QuestionFreeText, Survey
+from edsl.caching import Cache
+from edsl.inference_services.services.test_service import TestService
+from edsl.runner import Runner
+
+
+def build_job(num_agents=5):
+    q1 = QuestionFreeText(question_name="q1", question_text="What is your name?")
+    q2 = QuestionFreeText(question_name="q2", question_text="Say hi to {{ q1.answer }}")
+    model = TestService.create_model("test")(
+        skip_api_key_check=True, canned_response="Hello"
+    )
+    agents = [Agent(traits={"id": i}) for i in range(num_agents)]
+    return Survey([q1, q2]).by(agents).by(model)
+
+
+def run_job(job, cache):
+    runner = Runner(max_workers=4)
+    enqueued = []
+    original_enqueue = runner._coordinator.enqueue
+
+    def counting_enqueue(rp):
+        enqueued.append(rp.question_name)
+        return original_enqueue(rp)
+
+    runner._coordinator.enqueue = counting_enqueue
+    handle = runner.submit(job, cache=cache)
+    stats = runner.execute_job(handle.job_id, timing=True)
+    results = runner.service.build_edsl_results(handle.job_id)
+    return results, stats, enqueued
+
+
+def test_cold_cache_enqueues_everything():
+    cache = Cache()
+    results, stats, enqueued = run_job(build_job(), cache)
+
+    assert len(results) == 5
+    assert stats.prefetch_keys == 5
+    assert stats.prefetch_hits == 0
+    assert sorted(enqueued) == ["q1"] * 5 + ["q2"] * 5
+    # Each task is counted once, first wave included
+    assert stats.tasks_rendered == 10
+
+
+def test_cached_first_wave_skips_the_queues():
+    cache = Cache()
+    run_job(build_job(), cache)
+
+    results, stats, enqueued = run_job(build_job(), cache)
+
+    assert stats.prefetch_hits == 5
+    assert stats.prefetch_hit_rate == 1.0
+    # First-wave tasks ran directly; only the piped second wave was enqueued
+    assert enqueued == ["q2"] * 5
+    assert all(results.select("answer.q1").to_list())
+    assert "Cache prefetch" in stats.report()
+    # Time saved is only estimated in debug runs
+    assert "lookups saved" not in stats.report()
+    assert not cache.is_prefetched(next(iter(cache.keys())))
+
+
+def test_a_job_clears_only_its_own_prefetched_keys():
+    cache = Cache()
+    run_job(build_job(), cache)
+    other_key = "loaded by another job"
+    cache._hot[other_key] = next(iter(cache.data.values()))
+
+    run_job(build_job(), cache)
+
+    assert cache.is_prefetched(other_key)
+    assert not any(cache.is_prefetched(key) for key in cache.keys())
+
+
+def test_partially_cached_first_wave():
+    cache = Cache()
+    run_job(build_job(num_agents=2), cache)
+
+    _, stats, enqueued = run_job(build_job(num_agents=4), cache)
+
+    assert stats.prefetch_keys == 4
+    assert stats.prefetch_hits == 2
+    assert enqueued.count("q1") == 2
@@ -0,0 +1,87 @@
+from edsl.runner.coordinator import ExecutionCoordinator, WorkCompletion
+from edsl.runner.queues import Queue, QueueRegistry
+from edsl.runner.render import RenderedPrompt
+
+
+def make_coordinator(n_tasks, rpm=10_000, tpm=10_000_000, estimated_tokens=100):
+    registry = QueueRegistry(auto_register=False)
+    registry.register_queue("test", "test", "key", rpm_limit=rpm, tpm_limit=tpm)
+    coordinator = ExecutionCoordinator(registry)
+    for i in range(n_tasks):
+        coordinator.enqueue(
+            RenderedPrompt(
+                task_id=f"task-{i:04d}",
+                job_id="job",
+                interview_id=f"interview-{i}",
+                system_prompt="",
+                user_prompt=f"prompt {i}",
+                estimated_tokens=estimated_tokens,
+                cache_key=f"key-{i}",
+                model_name="test",
+                service_name="test",
+            )
+        )
+    return coordinator
+
+
+def test_try_acquire_batch_grants_leading_requests_that_fit():
+    queue = Queue("q", "test", "test", "key", rpm_limit=3, tpm_limit=1000)
+    assert queue.try_acquire_batch([100, 100, 100, 100]) == 3
+    assert queue.try_acquire_batch([100]) == 0
+    assert queue.get_throughput_stats()["request_count"] == 3
+
+    queue = Queue("q", "test", "test", "key", rpm_limit=100, tpm_limit=250)
+    assert queue.try_acquire_batch([100, 100, 100]) == 2
+
+
+def test_request_work_batch_assigns_in_fifo_order():
+    coordinator = make_coordinator(10)
+    first = coordinator.request_work_batch(4, timeout=0.1)
+    assert [a.task.task_id for a in first] == [f"task-{i:04d}" for i in range(4)]
+    assert len({a.queue_id for a in first}) == 1
+    assert coordinator.get_stats()["in_flight_tasks"] == 4
+
+    single = coordinator.request_work(timeout=0.1)
+    assert single.task.task_id == "task-0004"
+    rest = coordinator.request_work_batch(100, timeout=0.1)
+    assert len(rest) == 5
+    assert coordinator.request_work_batch(10, timeout=0.05) == []
+
+
+def test_batch_is_capped_by_token_budget_and_rate_limit():
+    coordinator = make_coordinator(10, estimated_tokens=100)
+    assert len(coordinator.request_work_batch(10, token_budget=350, timeout=0.1)) == 3
+    # A task larger than the budget is still handed out on its own
+    assert len(coordinator.request_work_batch(10, token_budget=50, timeout=0.1)) == 1
+
+    coordinator = make_coordinator(10, rpm=4)
+    assert len(coordinator.request_work_batch(10, timeout=0.1)) == 4
+    assert coordinator.request_work_batch(10, timeout=0.05) == []
+
+
+def test_complete_work_batch_untracks_and_reconciles():
+    coordinator = make_coordinator(5, estimated_tokens=100)
+    assignments = coordinator.request_work_batch(5, timeout=0.1)
+    queue = coordinator.registry.get_queue(assignments[0].queue_id)
+    tokens_before = queue.tpm_bucket.tokens
+
+    coordinator.complete_work_batch(
+        [
+            WorkCompletion(
+                task_id=a.task.task_id,
+                queue_id=a.queue_id,
+                success=True,
+                actual_tokens=40,
+                input_tokens=30,
+                output_tokens=10,
+            )
+            for a in assignments
+        ]
+    )
+
+    assert coordinator.get_in_flight_tasks() == []
+    assert queue.tpm_bucket.tokens >= tokens_before + 5 * 60
+    stats = queue.get_throughput_stats()
+    assert stats["token_count"] == 200
+    assert stats["input_token_count"] == 150
+    assert stats["output_token_count"] == 50
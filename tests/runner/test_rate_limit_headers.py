@@ -0,0 +1,171 @@
+import asyncio
+
+from edsl import Cache, Model
+from edsl.inference_services.rate_limit_headers import (
+    RateLimitHeaders,
+    collect_rate_limits,
+    create_with_rate_limits,
+    parse_rate_limit_headers,
+    record_rate_limit_headers,
+)
+from edsl.runner.coordinator import ExecutionCoordinator, WorkCompletion
+from edsl.runner.queues import Queue, QueueRegistry
+from edsl.runner.render import RenderedPrompt
+
+
+def test_parses_anthropic_headers_and_retry_after():
+    limits = parse_rate_limit_headers(
+        {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-tokens-limit": "40000",
+            "anthropic-ratelimit-tokens-remaining": "not a number",
+            "retry-after": "3",
+        }
+    )
+    assert limits == RateLimitHeaders(
+        limit_requests=50, remaining_requests=0, limit_tokens=40000, retry_after=3
+    )
+
+
+def test_provider_limits_lower_the_queue_but_never_raise_it():
+    queue = Queue("q", "openai", "gpt-4o", "key", rpm_limit=10_000, tpm_limit=1_000_000)
+    queue.apply_rate_limits(
+        RateLimitHeaders(
+            limit_requests=600, remaining_requests=5, remaining_tokens=2_000
+        )
+    )
+    assert queue.meta.rpm_limit == 600
+    assert queue.rpm_bucket.rate == 10
+    assert queue.rpm_bucket.tokens <= 5.1
+    assert queue.tpm_bucket.tokens <= 2_000.1
+    assert queue.meta.tpm_limit == 1_000_000
+
+    queue.apply_rate_limits(
+        RateLimitHeaders(limit_requests=50_000, remaining_requests=50_000)
+    )
+    assert queue.meta.rpm_limit == 600
+    assert queue.rpm_bucket.tokens < 600
+
+
+def test_retry_after_holds_the_queue():
+    queue = Queue("q", "openai", "gpt-4o", "key", rpm_limit=600, tpm_limit=100_000)
+    queue.apply_rate_limits(RateLimitHeaders(retry_after=2.0))
+    assert not queue.try_acquire(10)
+    assert queue.time_until_available(10) >= 2.0
+
+
+def test_coordinator_applies_headers_from_completions():
+    registry = QueueRegistry(auto_register=False)
+    queue_id = registry.register_queue("openai", "gpt-4o", "key", rpm_limit=10_000)
+    coordinator = ExecutionCoordinator(registry)
+    coordinator.enqueue(
+        RenderedPrompt(
+            task_id="task",
+            job_id="job",
+            interview_id="interview",
+            system_prompt="",
+            user_prompt="prompt",
+            estimated_tokens=100,
+            cache_key="key",
+            model_name="gpt-4o",
+            service_name="openai",
+        )
+    )
+    assignment = coordinator.request_work(timeout=0.1)
+    coordinator.complete_work(
+        WorkCompletion(
+            task_id=assignment.task.task_id,
+            queue_id=assignment.queue_id,
+            success=True,
+            rate_limits=RateLimitHeaders(limit_requests=120, remaining_requests=1),
+        )
+    )
+    queue = registry.get_queue(queue_id)
+    assert queue.meta.rpm_limit == 120
+    assert queue.rpm_bucket.tokens < 1.1
+
+
+def test_headers_recorded_by_a_model_call_reach_the_collector():
+    m = Model("test", canned_response="Hi")
+    original = m.async_execute_model_call
+
+    async def call(*args, **kwargs):
+        record_rate_limit_headers({"x-ratelimit-remaining-requests": "42"})
+        return await original(*args, **kwargs)
+
+    m.async_execute_model_call = call
+
+    async def run():
+        with collect_rate_limits() as observed:
+            await m.async_get_response(
+                user_prompt="Hello", system_prompt="", cache=Cache()
+            )
+        return observed
+
+    observed = asyncio.run(run())
+    assert [limits.remaining_requests for limits in observed] == [42]
+
+
+class FakeRawResponse:
+    headers = {"x-ratelimit-remaining-requests": "9"}
+
+    async def parse(self):
+        return "parsed"
+
+
+class FakeRawMessages:
+    def __init__(self, error=None):
+        self.error = error
+
+    async def create(self, **params):
+        if self.error is not None:
+            raise self.error
+        return FakeRawResponse()
+
+
+class FakeMessages:
+    def __init__(self, error=None):
+        self.with_raw_response = FakeRawMessages(error)
+
+
+def call_recording(resource):
+    async def run():
+        with collect_rate_limits() as observed:
+            try:
+                response = await create_with_rate_limits(resource, model="gpt-4o")
+            except Exception as e:
+                response = e
+        return response, observed
+
+    return asyncio.run(run())
+
+
+def test_raw_responses_are_parsed_and_recorded():
+    response, observed = call_recording(FakeMessages())
+    assert response == "parsed"
+    assert observed[0].remaining_requests == 9
+
+
+def test_error_response_headers_are_recorded():
+    class Response:
+        headers = {"retry-after-ms": "250"}
+
+    class RateLimitError(Exception):
+        response = Response()
+
+    response, observed = call_recording(
+        FakeMessages(RateLimitError("429 Too Many Requests"))
+    )
+    assert isinstance(response, RateLimitError)
+    assert observed[0].retry_after == 0.25
+
+
+def test_resources_without_raw_responses_are_called_directly():
+    class PlainMessages:
+        async def create(self, **params):
+            return params["model"]
+
+    response, observed = call_recording(PlainMessages())
+    assert response == "gpt-4o"
+    assert observed == []
@@ -0,0 +1,88 @@
+import os
+
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.results import Result
+from edsl.runner import Runner
+from edsl.runner.results_log import IncrementalResultsBuilder, ResultsLog
+from edsl.runner.service import JobService
+from edsl.runner.storage import InMemoryStorage
+
+
+def make_job(n_scenarios=10):
+    q = QuestionFreeText(question_name="q", question_text="Say {{ number }}")
+    model = Model("test", canned_response="Hello")
+    return q.by(ScenarioList.from_list("number", range(n_scenarios))).by(model)
+
+
+def test_results_log_round_trips_and_sorts():
+    log = ResultsLog()
+    example = Result.example()
+    for key in [(2,), (0,), (1,)]:
+        log.append(example, key)
+
+    assert len(log) == 3
+    restored = list(log.iter_sorted())
+    assert restored[0].answer == example.answer
+    assert restored[0].data["cache_used_dict"] == example.data["cache_used_dict"]
+    assert len(log.to_results()) == 3
+
+    path = log.path
+    log.close()
+    assert not os.path.exists(path)
+
+
+def test_builder_builds_results_as_interviews_finish():
+    service = JobService(InMemoryStorage())
+    job_id, _, _ = service.submit_job(make_job(6), job_id="job")
+    builder = IncrementalResultsBuilder(job_id, service, batch_size=2)
+
+    interview_ids = list(service.jobs.get_definition(job_id).interview_ids)
+    for interview_id in reversed(interview_ids[:3]):
+        interview = service.interviews.get_definition(job_id, interview_id)
+        for task_id in interview.task_ids:
+            service.on_task_completed(job_id, interview_id, task_id, answer_value="x")
+
+    # Two interviews form a full batch; the third waits for the next flush
+    assert builder.n_results == 2
+    builder.finalize()
+    assert builder.n_results == 3
+    assert [r.scenario["number"] for r in builder] == [0, 1, 2]
+
+
+def test_incremental_results_match_end_of_job_build():
+    runner = Runner()
+    handle = runner.submit(make_job(20), cache=Cache(), incremental_results=True)
+    results = handle.results()
+    rebuilt = runner.service.build_edsl_results(handle.job_id)
+
+    assert len(results) == 20
+    assert results.select("scenario.number", "answer.q").to_list() == rebuilt.select(
+        "scenario.number", "answer.q"
+    ).to_list()
+    assert [r.indices for r in results] == [r.indices for r in rebuilt]
+
+
+def test_results_log_is_released_once_results_are_built():
+    runner = Runner()
+    for read in (lambda h: h.results(), lambda h: list(h.iter_results())):
+        handle = runner.submit(make_job(4), cache=Cache(), incremental_results=True)
+        path = runner._job_results[handle.job_id].log.path
+        assert len(read(handle)) == 4
+        assert handle.job_id not in runner._job_results
+        assert handle.job_id not in runner.service._interview_callbacks
+        assert not os.path.exists(path)
+
+
+def test_iter_results_streams_in_results_order():
+    handle = Runner().submit(
+        make_job(8), cache=Cache(), interview_window=3, incremental_results=True
+    )
+    numbers = [result.scenario["number"] for result in handle.iter_results()]
+    assert numbers == list(range(8))
+
+
+def test_incremental_results_are_opt_in():
+    runner = Runner()
+    handle = runner.submit(make_job(5), cache=Cache())
+    assert handle.job_id not in runner._job_results
+    assert len(handle.results()) == 5
@@ -0,0 +1,74 @@
+from edsl import Cache, Model, QuestionFreeText, ScenarioList
+from edsl.runner import Runner
+from edsl.runner.models import streamed_interview_id
+from edsl.runner.service import JobService
+from edsl.runner.storage import InMemoryStorage
+
+
+def make_job(n_scenarios=10):
+    q = QuestionFreeText(question_name="q", question_text="Say {{ number }}")
+    model = Model("test", canned_response="Hello")
+    return q.by(ScenarioList.from_list("number", range(n_scenarios))).by(model)
+
+
+def finish_interview(service, job_id, interview_id):
+    interview = service.interviews.get_definition(job_id, interview_id)
+    for task_id in interview.task_ids:
+        service.on_task_completed(job_id, interview_id, task_id, answer_value="x")
+
+
+def test_streamed_job_materializes_first_window_only():
+    service = JobService(InMemoryStorage())
+    job_id, _, _ = service.submit_job(make_job(), job_id="job", interview_window=4)
+
+    job_def = service.jobs.get_definition(job_id)
+    assert job_def.total_interviews == 10
+    assert list(job_def.interview_ids) == [
+        streamed_interview_id(job_id, i) for i in range(4)
+    ]
+    assert service.get_progress(job_id)["unmaterialized_interviews"] == 6
+    assert service.tasks.get_ready_count(job_id) == 4
+
+    # Nothing is added until half of the window has finished
+    service.materialize_interviews(job_id)
+    finish_interview(service, job_id, job_def.interview_ids[0])
+    service.materialize_interviews(job_id)
+    assert len(service.jobs.get_definition(job_id).interview_ids) == 4
+
+    finish_interview(service, job_id, job_def.interview_ids[1])
+    service.materialize_interviews(job_id)
+    job_def = service.jobs.get_definition(job_id)
+    assert len(job_def.interview_ids) == 6
+    interviews = [
+        service.interviews.get_definition(job_id, iid) for iid in job_def.interview_ids
+    ]
+    assert [i.scenario_id for i in interviews] == job_def.scenario_ids[:6]
+
+
+def test_streamed_job_continues_from_persisted_cursor():
+    storage = InMemoryStorage()
+    service = JobService(storage)
+    job_id, _, _ = service.submit_job(make_job(), job_id="job", interview_window=4)
+    for interview_id in list(service.jobs.get_definition(job_id).interview_ids):
+        finish_interview(service, job_id, interview_id)
+
+    # A new service (e.g. after a restart) rebuilds the cross product from storage
+    restarted = JobService(storage)
+    assert len(restarted.recover_job(job_id).interview_ids) == 4
+    restarted.materialize_interviews(job_id)
+    job_def = restarted.jobs.get_definition(job_id)
+    assert len(job_def.interview_ids) == 8
+    assert restarted.interviews.get_definition(
+        job_id, job_def.interview_ids[7]
+    ).scenario_id == job_def.scenario_ids[7]
+
+
+def test_streamed_results_match_eager_results():
+    eager = Runner().submit(make_job(25), cache=Cache()).results()
+    streamed = (
+        Runner().submit(make_job(25), cache=Cache(), interview_window=4).results()
+    )
+    assert len(streamed) == 25
+    assert streamed.select("scenario.number").to_list() == eager.select(
+        "scenario.number"
+    ).to_list()